@@ -30,6 +30,7 @@ from pkg_resources import DistributionNotFound, get_distribution
 
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
+    CACHE_DIR,
     DEMISTO_SDK_MARKETPLACE_XSOAR_DIST_DEV,
     ENV_DEMISTO_SDK_MARKETPLACE,
     INTEGRATIONS_README_FILE_NAME,
@@ -44,6 +45,7 @@ from demisto_sdk.commands.common.content_constant_paths import (
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
+from demisto_sdk.commands.common.parse_pool import parse_pool_session
 from demisto_sdk.commands.common.tools import (
     convert_path_to_str,
     find_type,
@@ -61,6 +63,7 @@ from demisto_sdk.commands.content_graph.commands.get_relationships import (
     get_relationships,
 )
 from demisto_sdk.commands.content_graph.commands.update import update
+from demisto_sdk.commands.content_graph.content_graph_builder import PACKS_PER_BATCH
 from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
 from demisto_sdk.commands.generate_modeling_rules import generate_modeling_rules
 from demisto_sdk.commands.prepare_content.prepare_upload_manager import (
@@ -209,6 +212,8 @@ def logging_setup_decorator(func, *args, **kwargs):
 @logging_setup_decorator
 def main(ctx, config, version, release_notes, **kwargs):
     config.configuration = Configuration()
+    # the parse pool is shared by all the parsing of the command, and closed once it exits
+    ctx.with_resource(parse_pool_session())
     import dotenv
 
     dotenv.load_dotenv(
@@ -795,6 +800,15 @@ def zip_packs(ctx, **kwargs) -> int:
     multiple=True,
     help="An error code to not run. Must be listed under `ignorable_errors`. To ignore more than one error, repeate this option (e.g. `--ignore AA123 --ignore BC321`)",
 )
+@click.option(
+    "-w",
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="The number of workers to run the validations with. Graph and docker validations run in threads, "
+    "the rest run in processes. Ignored when the --fix flag is given.",
+)
 @click.argument("file_paths", nargs=-1, type=click.Path(exists=True, resolve_path=True))
 @pass_config
 @click.pass_context
@@ -940,6 +954,7 @@ def validate(ctx, config, file_paths: str, **kwargs):
                 allow_autofix=kwargs.get("fix"),
                 ignore_support_level=kwargs.get("ignore_support_level"),
                 ignore=kwargs.get("ignore"),
+                workers=kwargs.get("workers") or 1,
             )
             exit_code += validator_v2.run_validations()
         return exit_code
@@ -1106,6 +1121,14 @@ def create_content_artifacts(ctx, **kwargs) -> int:
     help='Full path to whitelist file, file name should be "secrets_white_list.json"',
 )
 @click.option("--prev-ver", help="The branch against which to run secrets validation.")
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="The number of processes scanning files in parallel, 0 for a process per CPU.",
+)
 @click.argument("file_paths", nargs=-1, type=click.Path(exists=True, resolve_path=True))
 @pass_config
 @click.pass_context
@@ -1128,6 +1151,7 @@ def secrets(ctx, config, file_paths: str, **kwargs):
         ignore_entropy=kwargs["ignore_entropy"],
         white_list_path=kwargs["whitelist"],
         input_path=kwargs.get("input"),
+        workers=kwargs["workers"],
     )
     return secrets_validator.run()
 
@@ -1587,6 +1611,21 @@ def format(ctx, **kwargs):
     "attempting to upload a content pack that is already installed on the Cortex XSOAR server. This allows the upload "
     "command to be used within non-interactive shells.",
 )
+@click.option(
+    "--delta",
+    is_flag=True,
+    help="Skip uploading content which is identical to the content last uploaded to the server. "
+    "A pack is compared as a whole when --zip is used, and item by item otherwise. "
+    "Content which changed on the server since it was uploaded is uploaded again.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    help="The maximal number of content items uploaded concurrently, "
+    "this argument is relevant only for packs and in case the --no-zip flag is used. "
+    "Defaults to 1, uploading the content items one at a time.",
+    required=False,
+)
 @click.pass_context
 @logging_setup_decorator
 def upload(ctx, **kwargs):
@@ -2449,6 +2488,20 @@ def _generate_docs_for_file(kwargs: Dict[str, Any]):
     "each pack. Default is all packs exists in the content repository.",
     default="",
 )
+@click.option(
+    "-pi",
+    "--previous-id-set",
+    help="A previously created id set. When given, only the packs changed since it was created are parsed, "
+    "and their items are updated in it, instead of creating the id set from scratch. "
+    "Id sets of a specific marketplace are always created from scratch.",
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--prev-ver",
+    help="The commit the previous id set was created from, which the changed packs are found by. "
+    "Required with --previous-id-set.",
+    default="",
+)
 @click.pass_context
 @logging_setup_decorator
 def create_id_set(ctx, **kwargs):
@@ -2459,6 +2512,12 @@ def create_id_set(ctx, **kwargs):
     )
 
     update_command_args_from_config_file("create-id-set", kwargs)
+    if kwargs.get("previous_id_set") and not kwargs.get("prev_ver"):
+        logger.info(
+            "<red>The --prev-ver argument, the commit the previous id set was created from, "
+            "is required with --previous-id-set</red>"
+        )
+        sys.exit(1)
     id_set_creator = IDSetCreator(**kwargs)
     (
         id_set,
@@ -3086,6 +3145,26 @@ def openapi_codegen(ctx, **kwargs):
     help="Path to the machine assignment file.",
     default="./machine_assignment.json",
 )
+@click.option(
+    "--max-parallel-tests",
+    type=click.IntRange(min=1),
+    help="The maximal number of test playbooks to run concurrently on each server. Tests sharing a locked "
+    "integration, mockable tests and tests setting server keys never run concurrently. "
+    "When greater than 1, tests with longer timeouts are started first.",
+    default=1,
+)
+@click.option(
+    "--shard-tests",
+    is_flag=True,
+    help="Split the tests between the servers by their durations in previous builds, instead of running all the "
+    "tests on every server. Valid only for XSOAR on-prem servers.",
+    default=False,
+)
+@click.option(
+    "--durations-history",
+    help="Path to the file in which the durations of the test playbooks are kept between builds.",
+    default=str(CACHE_DIR / "test_playbooks_durations.json"),
+)
 @click.pass_context
 @logging_setup_decorator
 def test_content(ctx, **kwargs):
@@ -3466,6 +3545,8 @@ def create_content_graph(
         marketplace=marketplace,
         no_dependencies=no_dependencies,
         output_path=output_path,
+        stream=False,
+        batch_size=PACKS_PER_BATCH,
         **kwargs,
     )
 
@@ -3548,6 +3629,9 @@ def update_content_graph(
         packs_to_update=packs,
         no_dependencies=no_dependencies,
         output_path=output_path,
+        file_granular=False,
+        stream=False,
+        batch_size=PACKS_PER_BATCH,
         **kwargs,
     )
 
@@ -3765,6 +3849,17 @@ def pre_commit(
         envvar="PRE_COMMIT_TEMPLATE_PATH",
         help="A custom path for pre-defined pre-commit template, if not provided will use the default template.",
     ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Whether to skip docker hooks which already passed with the same docker image, configuration and files. "
+        "Do not use in CI, as the cache does not cover everything a hook may depend on.",
+    ),
+    warm_containers: bool = typer.Option(
+        False,
+        "--warm-containers",
+        help="Whether to run the docker hooks in one long-running container per docker image, instead of a new container for every hook.",
+    ),
 ):
     logging_setup(
         console_threshold=console_log_threshold,
@@ -3795,6 +3890,8 @@ def pre_commit(
         dry_run=dry_run,
         run_hook=run_hook,
         pre_commit_template_path=pre_commit_template_path,
+        use_cache=cache,
+        warm_containers=warm_containers,
     )
     if return_code:
         raise typer.Exit(1)
@@ -16,6 +16,7 @@ PROJECT_DATA_DIR = Path.home() / ".demisto-sdk"
 CACHE_DIR = PROJECT_DATA_DIR / "cache"
 LOGS_DIR = PROJECT_DATA_DIR / "logs"
 NEO4J_DIR = PROJECT_DATA_DIR / "neo4j"
+NATIVE_GRAPH_DIR = PROJECT_DATA_DIR / "native_graph"
 
 LOG_FILE_NAME = "demisto_sdk_debug.log"
 
@@ -62,6 +63,11 @@ DEMISTO_SDK_NEO4J_DATABASE_HTTP = "DEMISTO_SDK_NEO4J_DATABASE_HTTP"
 DEMISTO_SDK_NEO4J_DATABASE_URL = "DEMISTO_SDK_NEO4J_DATABASE_URL"
 DEMISTO_SDK_NEO4J_USERNAME = "DEMISTO_SDK_NEO4J_USERNAME"
 DEMISTO_SDK_NEO4J_PASSWORD = "DEMISTO_SDK_NEO4J_PASSWORD"
+DEMISTO_SDK_FILE_CACHE_MAX_ENTRIES = "DEMISTO_SDK_FILE_CACHE_MAX_ENTRIES"
+DEMISTO_SDK_FILE_CACHE_MAX_MB = "DEMISTO_SDK_FILE_CACHE_MAX_MB"
+# Content graph
+DEMISTO_SDK_GRAPH_PARSE_CACHE = "DEMISTO_SDK_GRAPH_PARSE_CACHE"
+DEMISTO_SDK_GRAPH_BACKEND = "DEMISTO_SDK_GRAPH_BACKEND"
 # --- Environment Variables ---
 
 
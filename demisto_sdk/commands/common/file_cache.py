@@ -0,0 +1,288 @@
+import inspect
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
+from demisto_sdk.commands.common.constants import (
+    DEMISTO_SDK_FILE_CACHE_MAX_ENTRIES,
+    DEMISTO_SDK_FILE_CACHE_MAX_MB,
+)
+from demisto_sdk.commands.common.logger import logger
+
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_MAX_MB = 1024
+# as the lru_cache(maxsize=128) the file-less cached functions used before
+DEFAULT_MAX_UNSTAMPED_ENTRIES = 128
+
+FileStamp = Optional[Tuple[int, int]]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    invalidations: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    stamp: FileStamp
+    size_bytes: int
+
+
+class CachedFunction(Protocol):
+    """A function cached by the file_cache decorator."""
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
+
+    def cache_clear(self) -> None: ...
+
+    def cache_info(self) -> CacheInfo: ...
+
+
+def get_file_stamp(path: Optional[Path]) -> FileStamp:
+    """Returns the (mtime, size) of the given path, or None if it does not exist.
+
+    The stamp of a directory is the latest mtime and the total size of all the files and directories under it,
+    as the mtime of a directory does not change when a file in it is edited.
+    """
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    if not os.path.isdir(path):
+        return stat.st_mtime_ns, stat.st_size
+    mtime, size = stat.st_mtime_ns, 0
+    for root, dir_names, file_names in os.walk(path):
+        for name in dir_names + file_names:
+            try:
+                entry_stat = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            mtime = max(mtime, entry_stat.st_mtime_ns)
+            if name in file_names:
+                size += entry_stat.st_size
+    return mtime, size
+
+
+def _get_int_env(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Invalid value for {name}, using the default {default}")
+        return default
+
+
+class FileCache:
+    """A bounded LRU cache of values computed from files, shared by all the file readers of the SDK.
+
+    Every entry is stored with the (mtime, size) stamp of the file it was computed from,
+    and is invalidated once the file changes. The least recently used entries are evicted
+    when the cache holds more than `max_entries` entries, or when the files it holds exceed `max_bytes`.
+    Entries without a file (e.g remote files) are not counted in `max_bytes`, so they are also bounded
+    to `max_unstamped_entries` entries per cached function.
+
+    Attributes:
+        max_entries (int): The maximal number of entries.
+        max_bytes (int): The maximal total size of the cached files.
+        max_unstamped_entries (int): The maximal number of entries without a file, per cached function.
+        hits (int): The number of values returned from the cache.
+        misses (int): The number of values which were not cached.
+        invalidations (int): The number of entries dropped since their file changed.
+        evictions (int): The number of entries dropped to keep the cache bounded.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_unstamped_entries: int = DEFAULT_MAX_UNSTAMPED_ENTRIES,
+    ) -> None:
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else _get_int_env(DEMISTO_SDK_FILE_CACHE_MAX_ENTRIES, DEFAULT_MAX_ENTRIES)
+        )
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else _get_int_env(DEMISTO_SDK_FILE_CACHE_MAX_MB, DEFAULT_MAX_MB)
+            * 1024
+            * 1024
+        )
+        self.max_unstamped_entries = max_unstamped_entries
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        # the keys of the entries without a file by their namespace, from the least recently used
+        self._unstamped: "Dict[Hashable, OrderedDict[Hashable, None]]" = {}
+        self._lock = threading.RLock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, stamp: FileStamp) -> Tuple[bool, Any]:
+        """Returns whether the key is cached with the given file stamp, and its value."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp != stamp:
+                self._remove(key)
+                self.invalidations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            if entry.stamp is None:
+                self._unstamped[_get_namespace(key)].move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def set(self, key: Hashable, value: Any, stamp: FileStamp) -> None:
+        size_bytes = stamp[1] if stamp else 0
+        if self.max_entries <= 0 or size_bytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(value, stamp, size_bytes)
+            self.size_bytes += size_bytes
+            if stamp is None:
+                unstamped = self._unstamped.setdefault(
+                    _get_namespace(key), OrderedDict()
+                )
+                unstamped[key] = None
+                while len(unstamped) > self.max_unstamped_entries:
+                    self._remove(next(iter(unstamped)))
+                    self.evictions += 1
+            while (
+                len(self._entries) > self.max_entries
+                or self.size_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self.size_bytes -= entry.size_bytes
+        if entry.stamp is None:
+            namespace = _get_namespace(key)
+            self._unstamped[namespace].pop(key)
+            if not self._unstamped[namespace]:
+                del self._unstamped[namespace]
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Removes all the entries, or only the entries of the given namespace (the cached function name)."""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._unstamped.clear()
+                self.size_bytes = 0
+                return
+            for key in [
+                key for key in self._entries if _get_namespace(key) == namespace
+            ]:
+                self._remove(key)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                invalidations=self.invalidations,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                size_bytes=self.size_bytes,
+            )
+
+
+def _get_namespace(key: Hashable) -> Hashable:
+    """The namespace of a key set by file_cache, the cached function name."""
+    return key[0] if isinstance(key, tuple) and key else None
+
+
+FILE_CACHE = FileCache()
+
+
+def file_cache(
+    path_argument: Optional[str] = None,
+    cache: Optional[FileCache] = None,
+    get_stamp: Callable[[Path], FileStamp] = get_file_stamp,
+) -> Callable[[Callable], CachedFunction]:
+    """A decorator caching the function results in the shared file cache.
+
+    The results are keyed by the function arguments (as `functools.lru_cache` does, so they must be hashable),
+    and are invalidated when the file given in `path_argument` changes.
+    The decorated function has `cache_clear` and `cache_info` methods, like an lru-cached function.
+
+    Args:
+        path_argument (Optional[str]): The name of the argument holding the file path.
+            Results of functions without a path argument (e.g remote files) are never invalidated, only evicted.
+            A directory path is invalidated when any file under it changes.
+        cache (Optional[FileCache]): The cache to use, the shared FILE_CACHE by default.
+        get_stamp (Callable[[Path], FileStamp]): Returns the stamp of the path argument, for functions reading
+            more files than the given one. The stamp of the path itself by default.
+    """
+
+    def decorator(func: Callable) -> CachedFunction:
+        signature = inspect.signature(func)
+        namespace = f"{func.__module__}.{func.__qualname__}"
+
+        def get_cache() -> FileCache:
+            return cache if cache is not None else FILE_CACHE
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound_arguments = signature.bind(*args, **kwargs)
+            bound_arguments.apply_defaults()
+            key = (namespace, tuple(bound_arguments.arguments.items()))
+            stamp = None
+            if path_argument and (path := bound_arguments.arguments.get(path_argument)):
+                stamp = get_stamp(Path(path))
+            file_cache_ = get_cache()
+            try:
+                is_cached, value = file_cache_.get(key, stamp)
+            except TypeError:  # unhashable arguments
+                return func(*args, **kwargs)
+            if is_cached:
+                return value
+            value = func(*args, **kwargs)
+            file_cache_.set(key, value, stamp)
+            return value
+
+        def cache_clear() -> None:
+            get_cache().clear(namespace)
+
+        def cache_info() -> CacheInfo:
+            return get_cache().info()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def clear_file_cache() -> None:
+    """Removes all the entries of the shared file cache."""
+    FILE_CACHE.clear()
+
+
+def get_file_cache_info() -> CacheInfo:
+    return FILE_CACHE.info()
@@ -0,0 +1,281 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+)
+
+from demisto_sdk.commands.common.constants import (
+    MODELING_RULES_DIR,
+    FileType,
+)
+
+
+class FileTypeRule(NamedTuple):
+    """A rule classifying a content file by its content.
+
+    Attributes:
+        file_type (FileType): The file type of the files matching the rule.
+        match (Callable): Whether a file matches the rule, given its content, path and file type (yml/json).
+        keys (Optional[FrozenSet[str]]): Top level keys one of which the content must have in order to match,
+            or None if the rule does not depend on the keys of the content.
+        suffix (Optional[str]): The suffix the path must have in order to match, or None for any suffix.
+        is_sub_category (bool): Whether the rule is skipped when ignoring sub categories.
+    """
+
+    file_type: FileType
+    match: Callable[[Any, Path, Optional[str]], bool]
+    keys: Optional[FrozenSet[str]] = None
+    suffix: Optional[str] = None
+    is_sub_category: bool = False
+
+
+def _is_yml(path: Path, file_type: Optional[str]) -> bool:
+    return file_type == "yml" or str(path).lower().endswith(".yml")
+
+
+def _is_json(path: Path, file_type: Optional[str]) -> bool:
+    return file_type == "json" or str(path).lower().endswith(".json")
+
+
+def _model_rule(
+    file_type: FileType,
+    model: Any,
+    keys: Optional[Set[str]],
+    suffix: Optional[str] = None,
+    is_sub_category: bool = False,
+) -> FileTypeRule:
+    return FileTypeRule(
+        file_type=file_type,
+        match=lambda _dict, path, _: model.match(_dict, path),
+        keys=frozenset(keys) if keys is not None else None,
+        suffix=suffix,
+        is_sub_category=is_sub_category,
+    )
+
+
+def build_file_type_rules() -> List[FileTypeRule]:
+    """Builds the content rules of `find_type`, by their precedence.
+
+    The `keys` and `suffix` of every rule are necessary conditions of its `match`,
+    so they are used to skip rules without changing the classification.
+    """
+    from demisto_sdk.commands.common.tools import LAYOUT_CONTAINER_FIELDS
+    from demisto_sdk.commands.content_graph.objects import (
+        CaseField,
+        CaseLayout,
+        CaseLayoutRule,
+        Classifier,
+        CorrelationRule,
+        Dashboard,
+        GenericDefinition,
+        GenericField,
+        GenericModule,
+        GenericType,
+        IncidentField,
+        IncidentType,
+        IndicatorField,
+        IndicatorType,
+        Integration,
+        Job,
+        Layout,
+        LayoutRule,
+        Mapper,
+        ModelingRule,
+        ParsingRule,
+        Playbook,
+        PreProcessRule,
+        Report,
+        Script,
+        TestPlaybook,
+        TestScript,
+        Trigger,
+        Widget,
+        Wizard,
+        XDRCTemplate,
+        XSIAMDashboard,
+        XSIAMReport,
+    )
+    from demisto_sdk.commands.content_graph.objects import List as ListObject
+
+    return [
+        FileTypeRule(
+            FileType.UNIFIED_YML,
+            lambda _dict, path, file_type: _is_yml(path, file_type)
+            and str(path).lower().endswith("_unified.yml"),
+        ),
+        FileTypeRule(
+            FileType.BETA_INTEGRATION,
+            lambda _dict, path, file_type: _is_yml(path, file_type)
+            and "category" in _dict
+            and bool(_dict.get("beta")),
+            keys=frozenset({"category"}),
+            is_sub_category=True,
+        ),
+        _model_rule(FileType.INTEGRATION, Integration, {"category"}, ".yml"),
+        _model_rule(
+            FileType.TEST_SCRIPT, TestScript, {"script"}, ".yml", is_sub_category=True
+        ),
+        _model_rule(FileType.SCRIPT, Script, {"script"}, ".yml"),
+        _model_rule(FileType.TEST_PLAYBOOK, TestPlaybook, {"tasks"}, ".yml"),
+        _model_rule(FileType.PLAYBOOK, Playbook, {"tasks"}, ".yml"),
+        _model_rule(FileType.PARSING_RULE, ParsingRule, {"rules"}, ".yml"),
+        FileTypeRule(
+            FileType.MODELING_RULE,
+            lambda _dict, path, _: MODELING_RULES_DIR in path.parts
+            and ModelingRule.match(_dict, path),
+            keys=frozenset({"rules"}),
+            suffix=".yml",
+        ),
+        FileTypeRule(
+            FileType.CORRELATION_RULE,
+            lambda _dict, path, _: CorrelationRule.match(_dict, path),
+            # correlation rules may be a list, which are never skipped by their keys
+            keys=frozenset({"global_rule_id"}),
+            suffix=".yml",
+        ),
+        FileTypeRule(
+            FileType.MODELING_RULE_SCHEMA,
+            lambda _dict, path, file_type: _is_json(path, file_type)
+            and str(path).lower().endswith("_schema.json")
+            and MODELING_RULES_DIR in path.parts,
+        ),
+        _model_rule(FileType.WIDGET, Widget, {"widgetType"}, ".json"),
+        _model_rule(FileType.REPORT, Report, {"orientation"}, ".json"),
+        _model_rule(FileType.GENERIC_TYPE, GenericType, {"color"}, ".json"),
+        _model_rule(FileType.INCIDENT_TYPE, IncidentType, {"color"}, ".json"),
+        # 'regex' key can be found in new reputations files while 'reputations' key is for the old reputations
+        # located in reputations.json file.
+        _model_rule(FileType.REPUTATION, IndicatorType, {"regex", "reputations"}),
+        FileTypeRule(
+            FileType.OLD_CLASSIFIER,
+            lambda _dict, path, file_type: _is_json(path, file_type)
+            and "brandName" in _dict
+            and "transformer" in _dict,
+            keys=frozenset({"brandName"}),
+        ),
+        _model_rule(
+            FileType.CLASSIFIER, Classifier, {"transformer", "mapping"}, ".json"
+        ),
+        _model_rule(FileType.MAPPER, Mapper, {"transformer", "mapping"}),
+        FileTypeRule(
+            FileType.LAYOUT,
+            lambda _dict, path, _: ("layout" in _dict or "kind" in _dict)
+            and ("kind" in _dict or "typeId" in _dict),
+            keys=frozenset({"layout", "kind"}),
+            suffix=".json",
+        ),
+        FileTypeRule(
+            FileType.LAYOUTS_CONTAINER,
+            lambda _dict, path, _: isinstance(_dict, dict)
+            and bool(LAYOUT_CONTAINER_FIELDS.intersection(_dict))
+            and Layout.match(_dict, path),
+            keys=frozenset({"group"}),
+            suffix=".json",
+        ),
+        _model_rule(FileType.DASHBOARD, Dashboard, {"layout", "kind"}, ".json"),
+        _model_rule(
+            FileType.PRE_PROCESS_RULES, PreProcessRule, {"scriptName"}, ".json"
+        ),
+        _model_rule(FileType.GENERIC_MODULE, GenericModule, {"definitionIds"}, ".json"),
+        _model_rule(
+            FileType.GENERIC_DEFINITION, GenericDefinition, {"auditable"}, ".json"
+        ),
+        _model_rule(FileType.JOB, Job, {"isFeed"}, ".json"),
+        _model_rule(FileType.WIZARD, Wizard, {"wizard"}, ".json"),
+        _model_rule(
+            FileType.XSIAM_DASHBOARD, XSIAMDashboard, {"dashboards_data"}, ".json"
+        ),
+        _model_rule(FileType.XSIAM_REPORT, XSIAMReport, {"templates_data"}, ".json"),
+        _model_rule(FileType.TRIGGER, Trigger, {"trigger_id"}, ".json"),
+        _model_rule(FileType.XDRC_TEMPLATE, XDRCTemplate, {"profile_type"}, ".json"),
+        _model_rule(FileType.LAYOUT_RULE, LayoutRule, {"rule_id"}, ".json"),
+        _model_rule(FileType.CASE_FIELD, CaseField, {"id"}),
+        _model_rule(FileType.CASE_LAYOUT, CaseLayout, {"group"}, ".json"),
+        _model_rule(FileType.CASE_LAYOUT_RULE, CaseLayoutRule, {"rule_id"}, ".json"),
+        _model_rule(
+            FileType.LISTS, ListObject, {"data", "allRead", "truncated"}, ".json"
+        ),
+        # When using it for all files validation- sometimes 'id' can be integer
+        _model_rule(FileType.GENERIC_FIELD, GenericField, {"id"}, ".json"),
+        _model_rule(FileType.INCIDENT_FIELD, IncidentField, {"id"}),
+        _model_rule(FileType.INDICATOR_FIELD, IndicatorField, {"id"}),
+    ]
+
+
+class FileTypeIndex:
+    """An index of the content rules of `find_type`, routing every file to the few rules it may match.
+
+    The rules are indexed once by the path suffix they require and by the top level keys they require,
+    so classifying a file sniffs its content once, and checks only the rules of its suffix and keys, by their precedence.
+    """
+
+    def __init__(self, rules: List[FileTypeRule]):
+        self.rules = rules
+        self._rules_by_suffix: Dict[str, List[int]] = {}
+        self._keyless_rules_by_suffix: Dict[str, List[int]] = {}
+        self._rules_by_suffix_and_key: Dict[str, Dict[str, List[int]]] = {}
+
+    def _index_suffix(self, suffix: str) -> None:
+        rules_by_key: Dict[str, List[int]] = {}
+        keyless_rules: List[int] = []
+        rules: List[int] = []
+        for i, rule in enumerate(self.rules):
+            if rule.suffix and rule.suffix != suffix:
+                continue
+            rules.append(i)
+            if rule.keys is None:
+                keyless_rules.append(i)
+                continue
+            for key in rule.keys:
+                rules_by_key.setdefault(key, []).append(i)
+        self._rules_by_suffix[suffix] = rules
+        self._keyless_rules_by_suffix[suffix] = keyless_rules
+        self._rules_by_suffix_and_key[suffix] = rules_by_key
+
+    def get_rules(self, _dict: Any, path: Path) -> List[FileTypeRule]:
+        """Returns the rules the file may match, by their precedence."""
+        suffix = path.suffix
+        if suffix not in self._rules_by_suffix:
+            self._index_suffix(suffix)
+        if not isinstance(_dict, dict):
+            # key lookups of non-dict contents (e.g lists) don't check the top level keys
+            return [self.rules[i] for i in self._rules_by_suffix[suffix]]
+        rules_by_key = self._rules_by_suffix_and_key[suffix]
+        indices = set(self._keyless_rules_by_suffix[suffix])
+        for key in _dict:
+            indices.update(rules_by_key.get(key, ()))
+        return [self.rules[i] for i in sorted(indices)]
+
+    def classify(
+        self,
+        _dict: Any,
+        path: Path,
+        file_type: Optional[str] = None,
+        ignore_sub_categories: bool = False,
+    ) -> Optional[FileType]:
+        """Returns the file type of a content file by its content, or None if it matches no rule.
+
+        Args:
+            _dict (Any): The file content.
+            path (Path): The file path.
+            file_type (Optional[str]): The file format (yml/json), if known.
+            ignore_sub_categories (bool): Whether to ignore the sub categories (beta integrations and test scripts).
+        """
+        for rule in self.get_rules(_dict, path):
+            if ignore_sub_categories and rule.is_sub_category:
+                continue
+            if rule.match(_dict, path, file_type):
+                return rule.file_type
+        return None
+
+
+@lru_cache
+def get_file_type_index() -> FileTypeIndex:
+    return FileTypeIndex(build_file_type_rules())
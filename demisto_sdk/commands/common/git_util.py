@@ -693,13 +693,50 @@ class GitUtil:
 
         return all_renamed_files
 
-    def get_all_changed_pack_ids(self, prev_ver: str) -> Set[str]:
+    def get_all_changed_pack_files(self, prev_ver: str) -> Set[Path]:
         return {
-            file.parts[1]
+            file
             for file in self._get_all_changed_files(prev_ver) | self._get_staged_files()
             if file.parts[0] == PACKS_FOLDER
         }
 
+    def get_all_changed_pack_ids(self, prev_ver: str) -> Set[str]:
+        return {file.parts[1] for file in self.get_all_changed_pack_files(prev_ver)}
+
+    def get_changed_pack_ids_since_commit(self, prev_ver: str) -> Set[str]:
+        """Returns the packs changed between a commit and HEAD, including the staged changes.
+
+        The commit is compared directly to HEAD rather than to their merge base, so it does not have to be
+        an ancestor of HEAD. Renamed files are reported by both their old and new paths,
+        so the pack a file was moved from counts as changed as well.
+
+        Args:
+            prev_ver (str): The commit (or branch) to compare HEAD to. Default is the remote default branch.
+
+        Returns:
+            Set[str]: The names of the changed packs.
+        """
+        try:
+            commit = self.repo.commit(prev_ver).hexsha if prev_ver else ""
+        except (ValueError, gitdb.exc.BadName):
+            commit = ""
+        if not commit:
+            remote, branch = self.handle_prev_ver(prev_ver)
+            commit = f"{remote}/{branch}" if remote else branch
+
+        changed_files: Set[Path] = set()
+        for diff_args in ((commit, "HEAD"), ("--cached",)):
+            for line in self.repo.git.diff(
+                "--name-status", "--find-renames", *diff_args
+            ).splitlines():
+                # "<status>\t<path>", or "<status>\t<old path>\t<new path>" for renamed and copied files
+                changed_files.update(Path(path) for path in line.split("\t")[1:])
+        return {
+            file.parts[1]
+            for file in changed_files
+            if len(file.parts) > 1 and file.parts[0] == PACKS_FOLDER
+        }
+
     def _get_untracked_files(self, requested_status: str) -> set:
         """return all untracked files of the given requested status.
         Args:
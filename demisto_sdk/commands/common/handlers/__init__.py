@@ -13,4 +13,7 @@ DEFAULT_JSON_HANDLER = (
 DEFAULT_YAML_HANDLER = (
     YAML_Handler()
 )  # use this when additional arguments are not necessary
+DEFAULT_READ_ONLY_YAML_HANDLER = YAML_Handler(
+    typ="safe"
+)  # use this when the loaded data is only read and never written back, it is much faster
 DEFAULT_JSON5_HANDLER = JSON5_Handler()
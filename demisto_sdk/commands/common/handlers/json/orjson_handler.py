@@ -15,6 +15,9 @@ class OrJSON_Handler(XSOAR_Handler):
         data = fp.read()
         return orjson.loads(data)
 
+    def loads(self, data):
+        return orjson.loads(data)
+
     def dump(self, data, fp: IO[str], indent=None, sort_keys=False, **kwargs):
         data = self.dumps(data, sort_keys=sort_keys, indent=indent, **kwargs)
         fp.write(data)
@@ -31,8 +34,8 @@ class OrJSON_Handler(XSOAR_Handler):
     def _indent_level(indent: Optional[int] = None):
         if indent == 4:
             return orjson.OPT_INDENT_2
-        return None
+        return 0
 
     @staticmethod
     def _sort_keys(sort_keys: bool):
-        return orjson.OPT_SORT_KEYS if sort_keys else None
+        return orjson.OPT_SORT_KEYS if sort_keys else 0
@@ -3,6 +3,7 @@ from io import StringIO
 from ruamel.yaml import YAML  # noqa: TID251
 
 from demisto_sdk.commands.common.handlers.yaml.ruamel_handler import RUAMEL_Handler
+from demisto_sdk.tests.constants_test import VALID_INTEGRATION_TEST_PATH
 
 
 class TestYAMLHandler:
@@ -38,3 +39,27 @@ class TestYAMLHandler:
 
         assert yaml_dump.yaml.indent.call_count == 1
         yaml_dump.yaml.indent.assert_called_with(sequence=4)
+
+    def test_read_only_yaml_handler(self):
+        """
+        Given:
+            - A read-only RUAMEL_Handler object and a round-trip RUAMEL_Handler object
+        When:
+            - Loading an integration yml
+        Then:
+            - Ensure the read-only handler loads plain python objects, equal to the ones loaded by the round-trip handler
+            - Ensure the read-only loader is created once, while a round-trip loader is created for each load
+        """
+        read_only_yaml = RUAMEL_Handler(typ="safe")
+        round_trip_yaml = RUAMEL_Handler()
+        with open(VALID_INTEGRATION_TEST_PATH) as f:
+            content = f.read()
+
+        read_only_data = read_only_yaml.load(content)
+
+        assert read_only_yaml.is_read_only
+        assert not round_trip_yaml.is_read_only
+        assert type(read_only_data) is dict
+        assert read_only_data == round_trip_yaml.load(content)
+        assert read_only_yaml.loader is read_only_yaml.loader
+        assert round_trip_yaml.loader is not round_trip_yaml.loader
@@ -1,3 +1,4 @@
+import threading
 from io import StringIO
 
 from ruamel.yaml import YAML  # noqa:TID251 - this is the handler
@@ -5,6 +6,9 @@ from ruamel.yaml import YAML  # noqa:TID251 - this is the handler
 from demisto_sdk.commands.common.handlers.handlers_utils import order_dict
 from demisto_sdk.commands.common.handlers.xsoar_handler import XSOAR_Handler
 
+# The read-only loaders of every thread, by the handler configuration
+_read_only_loaders = threading.local()
+
 
 class RUAMEL_Handler(XSOAR_Handler):
     """
@@ -23,7 +27,8 @@ class RUAMEL_Handler(XSOAR_Handler):
     ):
         """
         typ: 'rt'/None -> RoundTripLoader/RoundTripDumper,  (default, preserves order, comments and formatting. slower then the rest))
-             'safe'    -> SafeLoader/SafeDumper,
+             'safe'    -> SafeLoader/SafeDumper, (backed by the libyaml C parser when available, much faster than 'rt'.
+                          use it for read-only consumers, which never write the loaded data back)
              'unsafe'  -> normal/unsafe Loader/Dumper
              'base'    -> baseloader
 
@@ -35,18 +40,45 @@ class RUAMEL_Handler(XSOAR_Handler):
         self._allow_unicode = not ensure_ascii
         self.indent = indent
 
+    @property
+    def is_read_only(self) -> bool:
+        """Whether the loaded data is plain python objects, without the round-trip formatting information"""
+        return self._typ == "safe"
+
     @property
     def yaml(self) -> YAML:
         """Creating an instance of ruamel for each command. Best practice by ruamel"""
-        yaml = YAML(typ=self._typ)
+        yaml = YAML(typ=self._typ, pure=False)
         yaml.allow_duplicate_keys = self._allow_duplicate_keys
         yaml.preserve_quotes = self._preserve_quotes
         yaml.width = self._width
         yaml.allow_unicode = self._allow_unicode
         return yaml
 
+    @property
+    def loader(self) -> YAML:
+        """
+        The ruamel instance to load with.
+        The round-trip loader keeps state between loads, so a new instance is created for each load.
+        A read-only loader is created once per thread, as creating it costs about as much as loading a small file.
+        """
+        if not self.is_read_only:
+            return self.yaml
+        if not hasattr(_read_only_loaders, "loaders"):
+            _read_only_loaders.loaders = {}
+        key = (
+            self._typ,
+            self._preserve_quotes,
+            self._allow_duplicate_keys,
+            self._width,
+            self._allow_unicode,
+        )
+        if key not in _read_only_loaders.loaders:
+            _read_only_loaders.loaders[key] = self.yaml
+        return _read_only_loaders.loaders[key]
+
     def load(self, stream):
-        return self.yaml.load(stream)
+        return self.loader.load(stream)
 
     def dump(self, data, stream, indent=None, sort_keys=False, **kwargs):
         if sort_keys:
@@ -2,7 +2,7 @@ import os
 import platform
 import sys
 from pathlib import Path
-from typing import Iterable, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Union
 
 import loguru  # noqa: TID251 # This is the only place where we allow it
 
@@ -34,6 +34,9 @@ global logger
 logger = loguru.logger  # all SDK modules should import from this file, not from loguru
 logger.disable(None)  # enabled at setup_logging()
 
+# the thresholds of the last logging setup, to set up the logging of worker processes the same way
+logging_thresholds: Dict[str, Any] = {}
+
 
 def _setup_neo4j_logger():
     import logging  # noqa: TID251 # special case, to control the neo4j logging
@@ -100,6 +103,9 @@ def logging_setup(
     """
     global logger
     _setup_neo4j_logger()
+    logging_thresholds.update(
+        console_threshold=console_threshold, file_threshold=file_threshold, path=path
+    )
 
     logger.remove(None)  # Removes all pre-existing handlers
 
@@ -0,0 +1,112 @@
+"""A process pool for parsing content, shared by all the commands of a single CLI invocation.
+
+Creating a pool forks its workers, which then import whatever the tasks need before running them.
+Parsing in several short-lived pools (one per batch or per command) pays that price again for every pool,
+so while a parse pool session is open, the same warm workers are reused until the session is closed:
+
+    with parse_pool_session():
+        ...
+        with parse_pool() as pool:  # the shared pool
+            pool.map(BaseContent.from_path, paths)
+
+Outside of a session, `parse_pool()` yields a new pool which is terminated on exit, as before.
+
+The shared pool is created on first use, when the process may already run threads (e.g. of a thread pool,
+or of the neo4j driver). Forking a process with running threads may deadlock on locks they hold (e.g. of logging),
+so the workers of the shared pool are started by a fork server (or spawned, where it is not available)
+with the current environment, rather than forked from the current process.
+"""
+
+import atexit
+import multiprocessing
+import os
+from contextlib import contextmanager
+from multiprocessing.pool import Pool
+from typing import Any, Dict, Iterator, Optional
+
+from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.logger import logger, logging_setup, logging_thresholds
+
+_pool: Optional[Pool] = None
+_session_depth = 0
+_session_pid: Optional[int] = None
+
+
+def _get_start_method() -> str:
+    return (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+
+
+def _warm_up_worker(thresholds: Dict[str, Any]) -> None:
+    # the workers do not inherit the logging setup of their parent process.
+    # only the console logger is set up, so that several processes do not write and rotate the log file.
+    logging_setup(calling_function="parse_pool_worker", initial=True, **thresholds)
+    # importing the content objects and parsers once per worker, rather than in the first task of every pool
+    import demisto_sdk.commands.content_graph.objects
+    import demisto_sdk.commands.content_graph.parsers  # noqa: F401
+
+
+def is_parse_pool_session_open() -> bool:
+    # the workers of the pool inherit the session state, but must not use the pool of their parent process
+    return bool(_session_depth) and _session_pid == os.getpid()
+
+
+def get_parse_pool() -> Pool:
+    """Returns the shared parse pool, creating it on first use.
+
+    Raises:
+        RuntimeError: If no parse pool session is open.
+    """
+    global _pool
+    if not is_parse_pool_session_open():
+        raise RuntimeError("The shared parse pool is only available in a session")
+    if _pool is None:
+        logger.debug("Starting the shared parse pool")
+        _pool = multiprocessing.get_context(_get_start_method()).Pool(
+            processes=cpu_count(),
+            initializer=_warm_up_worker,
+            initargs=(dict(logging_thresholds),),
+        )
+    return _pool
+
+
+def close_parse_pool() -> None:
+    """Closes the shared parse pool, waiting for its running tasks to finish."""
+    global _pool
+    if _pool is not None and _session_pid == os.getpid():
+        logger.debug("Closing the shared parse pool")
+        _pool.close()
+        _pool.join()
+    _pool = None
+
+
+@contextmanager
+def parse_pool_session() -> Iterator[None]:
+    """Keeps the shared parse pool alive until the outermost session is closed. Sessions may be nested."""
+    global _session_depth, _session_pid
+    if not is_parse_pool_session_open():
+        _session_depth = 0
+        _session_pid = os.getpid()
+    _session_depth += 1
+    try:
+        yield
+    finally:
+        _session_depth -= 1
+        if not _session_depth:
+            close_parse_pool()
+
+
+@contextmanager
+def parse_pool() -> Iterator[Pool]:
+    """Yields the shared parse pool if a session is open, otherwise a new pool which is terminated on exit."""
+    if is_parse_pool_session_open():
+        yield get_parse_pool()
+    else:
+        with multiprocessing.Pool(processes=cpu_count()) as pool:
+            yield pool
+
+
+atexit.register(close_parse_pool)
@@ -0,0 +1,140 @@
+import os
+from pathlib import Path
+
+from demisto_sdk.commands.common.file_cache import FileCache, file_cache
+
+
+def test_file_cache_invalidates_changed_files(tmp_path: Path):
+    """
+    Given:
+        - A function reading a file, cached by the file cache.
+    When:
+        - Calling it twice, then changing the file and calling it again.
+    Then:
+        - Ensure the second call is returned from the cache.
+        - Ensure the call after the change reads the file again.
+    """
+    cache = FileCache(max_entries=10, max_bytes=1024)
+    calls = []
+
+    @file_cache(path_argument="path", cache=cache)
+    def read(path: Path, upper: bool = False) -> str:
+        calls.append(path)
+        content = path.read_text()
+        return content.upper() if upper else content
+
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("a")
+
+    assert read(file_path) == "a"
+    assert read(path=file_path, upper=False) == "a"
+    assert len(calls) == 1
+
+    file_path.write_text("bb")
+    os.utime(file_path, ns=(0, 0))
+
+    assert read(file_path) == "bb"
+    assert len(calls) == 2
+    info = read.cache_info()
+    assert (info.hits, info.misses, info.invalidations) == (1, 2, 1)
+
+
+def test_file_cache_eviction(tmp_path: Path):
+    """
+    Given:
+        - A file cache bounded to two entries and 10 bytes.
+    When:
+        - Caching the results of four files.
+    Then:
+        - Ensure the least recently used entries are evicted.
+        - Ensure clearing the function entries empties the cache.
+    """
+    cache = FileCache(max_entries=2, max_bytes=10)
+    calls = []
+
+    @file_cache(path_argument="path", cache=cache)
+    def read(path: Path) -> str:
+        calls.append(path.name)
+        return path.read_text()
+
+    paths = []
+    for name, content in (("a", "1"), ("b", "22"), ("c", "333"), ("d", "4444444")):
+        paths.append(tmp_path / name)
+        paths[-1].write_text(content)
+
+    read(paths[0])
+    read(paths[1])
+    read(paths[0])  # "a" is now the most recently used
+    read(paths[2])  # "b" is evicted
+    read(paths[0])
+    read(paths[1])  # "c" is evicted
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.info().evictions == 2
+
+    # only the bytes bound is reached: "a", "b", "c" and "d" are 13 bytes long
+    cache.max_entries = 4
+    read(paths[2])
+    read(paths[3])  # "b" and "a" are evicted
+    assert calls == ["a", "b", "c", "b", "c", "d"]
+    assert cache.info().entries == 2
+    assert cache.info().size_bytes == 10
+
+    read.cache_clear()
+    assert cache.info().entries == 0
+
+
+def test_file_cache_bounds_unstamped_entries():
+    """
+    Given:
+        - A file cache bounded to two entries without a file per function.
+    When:
+        - Caching the results of a function without a path argument for three arguments.
+    Then:
+        - Ensure the least recently used entry without a file is evicted.
+    """
+    cache = FileCache(max_entries=10, max_bytes=10, max_unstamped_entries=2)
+    calls = []
+
+    @file_cache(cache=cache)
+    def get_remote(url: str) -> str:
+        calls.append(url)
+        return url
+
+    for url in ("a", "b", "a", "c", "a", "b"):
+        get_remote(url)
+
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.info().entries == 2
+    assert cache.info().evictions == 2
+
+
+def test_file_cache_invalidates_changed_directories(tmp_path: Path):
+    """
+    Given:
+        - A function reading the files of a directory, cached by the file cache.
+    When:
+        - Editing a file in the directory, without changing the directory itself.
+    Then:
+        - Ensure the function reads the directory again.
+    """
+    cache = FileCache(max_entries=10, max_bytes=1024)
+    calls = []
+
+    @file_cache(path_argument="path", cache=cache)
+    def read_directory(path: Path) -> str:
+        calls.append(path)
+        return "".join(file.read_text() for file in sorted(path.iterdir()))
+
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    directory_times = os.stat(tmp_path).st_atime_ns, os.stat(tmp_path).st_mtime_ns
+
+    assert read_directory(tmp_path) == "ab"
+    assert read_directory(tmp_path) == "ab"
+    assert len(calls) == 1
+
+    (tmp_path / "b.txt").write_text("bb")
+    os.utime(tmp_path, ns=directory_times)
+
+    assert read_directory(tmp_path) == "abb"
+    assert len(calls) == 2
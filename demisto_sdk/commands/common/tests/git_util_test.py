@@ -144,3 +144,72 @@ def test_git_util_with_repo():
     git_util = GitUtil(repo)
     assert git_util.repo is not None
     assert git_util.repo.working_dir == repo.working_dir
+
+
+class TestGetChangedPackIdsSinceCommit:
+    @staticmethod
+    def make_file(git_repo: Repo, file_name: str, file_content: str = "lorem ipsum"):
+        Path(git_repo.path, file_name).parent.mkdir(parents=True, exist_ok=True)
+        git_repo.make_file(file_name, file_content)
+
+    def test_renamed_pack(self, git_repo: Repo):
+        """
+        Given:
+            - A git repo with the packs OldPack and OtherPack, committed.
+
+        When:
+            - Renaming OldPack to NewPack and committing.
+
+        Then:
+            - Both the old and the new pack names are returned, as the old pack no longer exists.
+        """
+        git_util = git_repo.git_util
+        assert git_util
+        self.make_file(git_repo, "Packs/OldPack/README.md")
+        self.make_file(git_repo, "Packs/OtherPack/README.md")
+        git_util.commit_files("added packs")
+        prev_commit = git_util.get_current_commit_hash()
+
+        git_util.repo.git.mv("Packs/OldPack", "Packs/NewPack")
+        git_util.commit_files("renamed OldPack")
+
+        assert git_util.get_changed_pack_ids_since_commit(prev_commit) == {
+            "OldPack",
+            "NewPack",
+        }
+
+    def test_commit_not_ancestor_of_head(self, git_repo: Repo):
+        """
+        Given:
+            - A git repo, where the previous commit is on a branch which HEAD does not contain.
+
+        When:
+            - Getting the packs changed since the previous commit.
+
+        Then:
+            - The packs are compared directly to the previous commit, including the packs changed
+              only on its branch and the staged changes.
+        """
+        git_util = git_repo.git_util
+        assert git_util
+        self.make_file(git_repo, "Packs/BasePack/README.md")
+        git_util.commit_files("added base pack")
+        repo = git_util.repo
+        base_branch = repo.active_branch
+
+        repo.git.checkout("-b", "previous")
+        self.make_file(git_repo, "Packs/PreviousPack/README.md")
+        git_util.commit_files("added previous pack")
+        prev_commit = git_util.get_current_commit_hash()
+
+        base_branch.checkout()
+        self.make_file(git_repo, "Packs/HeadPack/README.md")
+        git_util.commit_files("added head pack")
+        self.make_file(git_repo, "Packs/BasePack/README.md", "dolor sit amet")
+        git_util.stage_file(Path(git_repo.path, "Packs/BasePack/README.md"))
+
+        assert git_util.get_changed_pack_ids_since_commit(prev_commit) == {
+            "PreviousPack",
+            "HeadPack",
+            "BasePack",
+        }
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from demisto_sdk.commands.common import parse_pool as parse_pool_module
+from demisto_sdk.commands.common.parse_pool import (
+    get_parse_pool,
+    is_parse_pool_session_open,
+    parse_pool,
+    parse_pool_session,
+)
+
+
+def _get_pid(_) -> int:
+    return os.getpid()
+
+
+def _is_session_open_in_worker(_) -> bool:
+    return is_parse_pool_session_open()
+
+
+def test_parse_pool_session(mocker):
+    """
+    Given:
+        - A parse pool session, with a nested session.
+    When:
+        - Running tasks in the parse pool several times.
+    Then:
+        - Ensure the same pool and workers are reused by all the tasks of the session.
+        - Ensure the workers are not forked from the current process, which may run threads.
+        - Ensure the workers can't use the pool of their parent process.
+        - Ensure the pool is closed once the outermost session is closed.
+    """
+    mocker.patch.object(parse_pool_module, "cpu_count", return_value=2)
+    with parse_pool_session():
+        with parse_pool() as first_pool:
+            first_pool.map(_get_pid, range(4))
+            first_workers = {worker.pid for worker in first_pool._pool}
+        assert first_pool._ctx.get_start_method() != "fork"
+        with parse_pool_session(), parse_pool() as nested_pool:
+            assert nested_pool is first_pool
+            assert not any(nested_pool.map(_is_session_open_in_worker, range(4)))
+        with parse_pool() as pool:
+            assert pool is first_pool
+            assert get_parse_pool() is first_pool
+            pool.map(_get_pid, range(4))
+            assert {worker.pid for worker in pool._pool} == first_workers
+
+    assert parse_pool_module._pool is None
+    assert not is_parse_pool_session_open()
+    with pytest.raises(RuntimeError):
+        get_parse_pool()
+
+
+def test_parse_pool_without_session(mocker):
+    """
+    Given:
+        - No parse pool session.
+    When:
+        - Running tasks in the parse pool.
+    Then:
+        - Ensure a new pool is used, and it is not kept after it is used.
+    """
+    mocker.patch.object(parse_pool_module, "cpu_count", return_value=2)
+    with parse_pool() as pool:
+        assert pool.map(_get_pid, range(2))
+    assert parse_pool_module._pool is None
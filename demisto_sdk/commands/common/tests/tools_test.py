@@ -2,6 +2,7 @@ import glob
 import os
 import shutil
 from configparser import ConfigParser
+from itertools import chain
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from typing import Callable, List, Optional, Tuple, Union
@@ -56,6 +57,7 @@ from demisto_sdk.commands.common.content import Content
 from demisto_sdk.commands.common.content.tests.objects.pack_objects.pack_ignore.pack_ignore_test import (
     PACK_IGNORE,
 )
+from demisto_sdk.commands.common.file_type_index import get_file_type_index
 from demisto_sdk.commands.common.git_content_config import (
     GitContentConfig,
     GitCredentials,
@@ -80,6 +82,7 @@ from demisto_sdk.commands.common.tools import (
     filter_packagify_changes,
     find_type,
     find_type_by_path,
+    find_types,
     generate_xsiam_normalized_name,
     get_code_lang,
     get_current_repo,
@@ -422,6 +425,57 @@ class TestGenericFunctions:
         output = find_type(madeup_path)
         assert not output
 
+    def test_find_types(self):
+        """
+        Given
+        - The paths of many files, some of them repeating.
+
+        When
+        - Running find_types.
+
+        Then
+        - Ensure every path is classified as it is by find_type.
+        """
+        paths = [str(path) for path, _ in self.data_test_find_type] * 2
+        assert find_types(paths) == {
+            str(path): _type for path, _type in self.data_test_find_type
+        }
+
+    def test_file_type_index_equivalent_to_all_rules(self):
+        """
+        Given
+        - All the yml and json test files.
+
+        When
+        - Classifying them by the file type index.
+
+        Then
+        - Ensure every file is classified as by checking all the rules by their precedence.
+        """
+        index = get_file_type_index()
+        test_files = Path(GIT_ROOT) / "demisto_sdk/tests/test_files"
+        for path in chain(test_files.rglob("*.yml"), test_files.rglob("*.json")):
+            try:
+                _dict, file_type = get_dict_from_file(str(path), keep_order=False)
+            except Exception:
+                continue
+            if not isinstance(_dict, (dict, list)):
+                continue
+            for ignore_sub_categories in (False, True):
+                expected = next(
+                    (
+                        rule.file_type
+                        for rule in index.rules
+                        if not (ignore_sub_categories and rule.is_sub_category)
+                        and rule.match(_dict, path, file_type)
+                    ),
+                    None,
+                )
+                assert (
+                    index.classify(_dict, path, file_type, ignore_sub_categories)
+                    == expected
+                ), path
+
     test_path_md = [VALID_MD]
 
     @pytest.mark.parametrize("path", test_path_md)
@@ -130,14 +130,18 @@ from demisto_sdk.commands.common.constants import (
     urljoin,
 )
 from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.file_cache import file_cache
+from demisto_sdk.commands.common.file_type_index import get_file_type_index
 from demisto_sdk.commands.common.git_content_config import GitContentConfig, GitProvider
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON5_HANDLER as json5
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.handlers import (
+    DEFAULT_READ_ONLY_YAML_HANDLER as yaml_safe_load,
+)
 from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
 from demisto_sdk.commands.common.handlers import (
     XSOAR_Handler,
-    YAML_Handler,
 )
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.string_to_bool import (
@@ -150,8 +154,6 @@ DEMISTO_SDK_REPO = "demisto/demisto-sdk"
 if TYPE_CHECKING:
     from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
 
-yaml_safe_load = YAML_Handler(typ="safe")
-
 urllib3.disable_warnings()
 
 GRAPH_SUPPORTED_FILE_TYPES = ["yml", "json"]
@@ -471,7 +473,7 @@ def get_local_remote_file(
         if file_content:
             return file_content.encode()
         return file_content
-    return get_file_details(file_content, full_file_path)
+    return get_file_details(file_content, full_file_path, keep_order=False)
 
 
 def get_remote_file_from_api(
@@ -563,17 +565,32 @@ def get_remote_file_from_api(
     if encoding:
         file_content = file_content.decode(encoding)  # type: ignore[assignment]
 
-    return get_file_details(file_content, full_file_path)
+    return get_file_details(file_content, full_file_path, keep_order=False)
+
+
+def quote_equal_sign_values(yml_content: str) -> str:
+    """A bare `=` value is a YAML 1.1 value tag the safe loader fails on, so it is quoted before loading"""
+    return re.sub(r"(simple: \s*\n*)(=)(\s*\n)", r'\1"\2"\3', yml_content)
 
 
 def get_file_details(
     file_content,
     full_file_path: str,
+    keep_order: bool = True,
 ) -> Dict:
+    """
+    Load the content of a file by its type.
+    keep_order=False loads yml files with the fast read-only loader, use it only if the data is not written back.
+    """
     if full_file_path.endswith("json"):
         file_details = json.loads(file_content)
     elif full_file_path.endswith(("yml", "yaml")):
-        file_details = yaml.load(file_content)
+        if keep_order:
+            file_details = yaml.load(file_content)
+        else:
+            if isinstance(file_content, bytes):
+                file_content = safe_read_unicode(file_content)
+            file_details = yaml_safe_load.load(quote_equal_sign_values(file_content))
     elif full_file_path.endswith(".pack-ignore"):
         return file_content
     # if neither yml nor json then probably a CHANGELOG or README file.
@@ -582,7 +599,7 @@ def get_file_details(
     return file_details
 
 
-@lru_cache(maxsize=128)
+@file_cache()
 def get_remote_file(
     full_file_path: str,
     tag: str = DEMISTO_GIT_PRIMARY_BRANCH,
@@ -851,7 +868,7 @@ def safe_write_unicode(
         _write()  # recreates the file
 
 
-@lru_cache
+@file_cache(path_argument="file_path")
 def get_file(
     file_path: str | Path,
     clear_cache: bool = False,
@@ -890,9 +907,7 @@ def get_file(
         return {}
     try:
         if type_of_file.lstrip(".") in {"yml", "yaml"}:
-            replaced = StringIO(
-                re.sub(r"(simple: \s*\n*)(=)(\s*\n)", r'\1"\2"\3', file_content)
-            )
+            replaced = StringIO(quote_equal_sign_values(file_content))
             return yaml.load(replaced) if keep_order else yaml_safe_load.load(replaced)
         elif type_of_file.lstrip(".") in {"svg"}:
             return ET.fromstring(file_content)
@@ -1633,10 +1648,10 @@ def get_dict_from_file(
     return {}, None
 
 
-@lru_cache
+@file_cache()
 def find_type_by_path(path: Union[str, Path] = "") -> Optional[FileType]:
     """Find FileType value of a path, without accessing the file.
-    This function is here as we want to implement lru_cache and we can do it on `find_type`
+    This function is here as we want to cache the result and we can't do it on `find_type`
     as dict is not hashable.
 
     It's also theoretically faster, as files are not opened.
@@ -1821,43 +1836,6 @@ def find_type(
     Returns:
         FileType | None: Enum representation of the content file type, None otherwise.
     """
-    from demisto_sdk.commands.content_graph.objects import (
-        CaseField,
-        CaseLayout,
-        CaseLayoutRule,
-        Classifier,
-        CorrelationRule,
-        Dashboard,
-        GenericDefinition,
-        GenericField,
-        GenericModule,
-        GenericType,
-        IncidentField,
-        IncidentType,
-        IndicatorField,
-        IndicatorType,
-        Integration,
-        Job,
-        Layout,
-        LayoutRule,
-        Mapper,
-        ModelingRule,
-        ParsingRule,
-        Playbook,
-        PreProcessRule,
-        Report,
-        Script,
-        TestPlaybook,
-        TestScript,
-        Trigger,
-        Widget,
-        Wizard,
-        XDRCTemplate,
-        XSIAMDashboard,
-        XSIAMReport,
-    )
-    from demisto_sdk.commands.content_graph.objects import List as ListObject
-
     type_by_path = find_type_by_path(path)
     if type_by_path:
         return type_by_path
@@ -1877,146 +1855,47 @@ def find_type(
             return None
         raise err
 
-    if (file_type == "yml" or path.lower().endswith(".yml")) and path.lower().endswith(
-        "_unified.yml"
-    ):
-        return FileType.UNIFIED_YML
-
-    if (
-        (file_type == "yml" or path.lower().endswith(".yml"))
-        and "category" in _dict
-        and _dict.get("beta")
-        and not ignore_sub_categories
-    ):
-        return FileType.BETA_INTEGRATION
-
-    if Integration.match(_dict, Path(path)):
-        return FileType.INTEGRATION
-
-    if TestScript.match(_dict, Path(path)) and not ignore_sub_categories:
-        return FileType.TEST_SCRIPT
-
-    if Script.match(_dict, Path(path)):
-        return FileType.SCRIPT
-
-    if TestPlaybook.match(_dict, Path(path)):
-        return FileType.TEST_PLAYBOOK
-
-    if Playbook.match(_dict, Path(path)):
-        return FileType.PLAYBOOK
-
-    if ParsingRule.match(_dict, Path(path)):
-        return FileType.PARSING_RULE
-
-    if MODELING_RULES_DIR in Path(path).parts:
-        if ModelingRule.match(_dict, Path(path)):
-            return FileType.MODELING_RULE
-
-    if CorrelationRule.match(_dict, Path(path)):
-        return FileType.CORRELATION_RULE
-
-    if (file_type == "json" or path.lower().endswith(".json")) and (
-        path.lower().endswith("_schema.json") and MODELING_RULES_DIR in Path(path).parts
-    ):
-        return FileType.MODELING_RULE_SCHEMA
-
-    if Widget.match(_dict, Path(path)):
-        return FileType.WIDGET
-
-    if Report.match(_dict, Path(path)):
-        return FileType.REPORT
-
-    if GenericType.match(_dict, Path(path)):
-        return FileType.GENERIC_TYPE
-
-    if IncidentType.match(_dict, Path(path)):
-        return FileType.INCIDENT_TYPE
-
-    # 'regex' key can be found in new reputations files while 'reputations' key is for the old reputations
-    # located in reputations.json file.
-    if IndicatorType.match(_dict, Path(path)):
-        return FileType.REPUTATION
-
-    if (
-        (file_type == "json" or path.lower().endswith(".json"))
-        and "brandName" in _dict
-        and "transformer" in _dict
-    ):
-        return FileType.OLD_CLASSIFIER
-
-    if Classifier.match(_dict, Path(path)):
-        return FileType.CLASSIFIER
-
-    if Mapper.match(_dict, Path(path)):
-        return FileType.MAPPER
-
-    if (
-        ("layout" in _dict or "kind" in _dict)
-        and ("kind" in _dict or "typeId" in _dict)
-        and Path(path).suffix == ".json"
-    ):
-        return FileType.LAYOUT
-
-    if isinstance(_dict, dict) and LAYOUT_CONTAINER_FIELDS.intersection(_dict):
-        if Layout.match(_dict, Path(path)):
-            return FileType.LAYOUTS_CONTAINER
-
-    if Dashboard.match(_dict, Path(path)):
-        return FileType.DASHBOARD
-
-    if PreProcessRule.match(_dict, Path(path)):
-        return FileType.PRE_PROCESS_RULES
-
-    if GenericModule.match(_dict, Path(path)):
-        return FileType.GENERIC_MODULE
-
-    if GenericDefinition.match(_dict, Path(path)):
-        return FileType.GENERIC_DEFINITION
-
-    if Job.match(_dict, Path(path)):
-        return FileType.JOB
-
-    if Wizard.match(_dict, Path(path)):
-        return FileType.WIZARD
-
-    if XSIAMDashboard.match(_dict, Path(path)):
-        return FileType.XSIAM_DASHBOARD
-
-    if XSIAMReport.match(_dict, Path(path)):
-        return FileType.XSIAM_REPORT
-
-    if Trigger.match(_dict, Path(path)):
-        return FileType.TRIGGER
-
-    if XDRCTemplate.match(_dict, Path(path)):
-        return FileType.XDRC_TEMPLATE
-
-    if LayoutRule.match(_dict, Path(path)):
-        return FileType.LAYOUT_RULE
-
-    if CaseField.match(_dict, Path(path)):
-        return FileType.CASE_FIELD
-
-    if CaseLayout.match(_dict, Path(path)):
-        return FileType.CASE_LAYOUT
-
-    if CaseLayoutRule.match(_dict, Path(path)):
-        return FileType.CASE_LAYOUT_RULE
-
-    if ListObject.match(_dict, Path(path)):
-        return FileType.LISTS
+    return get_file_type_index().classify(
+        _dict,
+        Path(path),
+        file_type=file_type,
+        ignore_sub_categories=ignore_sub_categories,
+    )
 
-    # When using it for all files validation- sometimes 'id' can be integer
-    if GenericField.match(_dict, Path(path)):
-        return FileType.GENERIC_FIELD
 
-    if IncidentField.match(_dict, Path(path)):
-        return FileType.INCIDENT_FIELD
+def find_types(
+    paths: Iterable[Union[str, Path]],
+    ignore_sub_categories: bool = False,
+    ignore_invalid_schema_file: bool = False,
+) -> Dict[str, Optional[FileType]]:
+    """
+    Returns the content file types of many files at once.
+    The paths are classified by their path rules first, and only the rest of them are read and classified by their content.
 
-    if IndicatorField.match(_dict, Path(path)):
-        return FileType.INDICATOR_FIELD
+    Arguments:
+        paths (Iterable[Union[str, Path]]): the paths of the files.
+        ignore_sub_categories (bool): ignore the sub categories, True to ignore, False otherwise.
+        ignore_invalid_schema_file (bool): whether to ignore raising error on invalid schema files,
+            True to ignore, False otherwise.
 
-    return None
+    Returns:
+        Dict[str, Optional[FileType]]: the file type of every path (None if unknown), by the path.
+    """
+    file_types: Dict[str, Optional[FileType]] = {}
+    paths_to_read = []
+    for path in map(str, paths):
+        if path in file_types:
+            continue
+        file_types[path] = find_type_by_path(path)
+        if not file_types[path]:
+            paths_to_read.append(path)
+    for path in paths_to_read:
+        file_types[path] = find_type(
+            path,
+            ignore_sub_categories=ignore_sub_categories,
+            ignore_invalid_schema_file=ignore_invalid_schema_file,
+        )
+    return file_types
 
 
 def get_common_server_path(env_dir):
@@ -3938,6 +3817,30 @@ def sha1_dir(directory: Union[str, Path]) -> str:
     return str(sha1_update_from_dir(directory, sha1()).hexdigest())
 
 
+def prune_cache_dir(cache_dir: Path, max_entries: int, max_age_days: int) -> None:
+    """
+    Removes the files of a cache directory (and its subdirectories) which were not used in the last
+    `max_age_days` days, and then the least recently used files beyond `max_entries`.
+    The modification time of a file is the time it was last used, so caches should touch the files they use.
+    """
+    try:
+        entries = sorted(
+            (
+                (path.stat().st_mtime, path)
+                for path in cache_dir.rglob("*")
+                if path.is_file()
+            ),
+            reverse=True,
+        )
+    except OSError:
+        return
+    oldest_time = time.time() - max_age_days * 24 * 60 * 60
+    for index, (modified_time, path) in enumerate(entries):
+        if index >= max_entries or modified_time < oldest_time:
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
 def is_epoch_datetime(string: str) -> bool:
     # Check if the input string contains only digits
     if not string.isdigit():
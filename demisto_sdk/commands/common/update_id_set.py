@@ -10,7 +10,7 @@ from enum import Enum
 from functools import partial
 from multiprocessing import Pool
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import click
 import networkx
@@ -38,6 +38,7 @@ from demisto_sdk.commands.common.constants import (
     LISTS_DIR,
     MAPPERS_DIR,
     MODELING_RULES_DIR,
+    PACKS_DIR,
     PARSING_RULES_DIR,
     REPORTS_DIR,
     SCRIPTS_DIR,
@@ -2233,9 +2234,20 @@ def process_test_playbook_path(
     return playbook, script
 
 
+def get_packs_to_create(pack_to_create) -> list:
+    """The pack paths to create the id_set from, either a single path or a list of them."""
+    if not pack_to_create:
+        return []
+    if isinstance(pack_to_create, (str, Path)):
+        return [pack_to_create]
+    return list(pack_to_create)
+
+
 def get_integrations_paths(pack_to_create):
     if pack_to_create:
-        path_list = [[pack_to_create, "Integrations", "*"]]
+        path_list = [
+            [pack, "Integrations", "*"] for pack in get_packs_to_create(pack_to_create)
+        ]
 
     else:
         path_list = [["Packs", "*", "Integrations", "*"]]
@@ -2249,7 +2261,9 @@ def get_integrations_paths(pack_to_create):
 
 def get_playbooks_paths(pack_to_create):
     if pack_to_create:
-        path_list = [[pack_to_create, "Playbooks", "*.yml"]]
+        path_list = [
+            [pack, "Playbooks", "*.yml"] for pack in get_packs_to_create(pack_to_create)
+        ]
 
     else:
         path_list = [["Packs", "*", "Playbooks", "*.yml"]]
@@ -2263,17 +2277,23 @@ def get_playbooks_paths(pack_to_create):
 
 def get_pack_metadata_paths(pack_to_create):
     if pack_to_create:
-        path_list = [pack_to_create, "pack_metadata.json"]
+        path_list = [
+            [pack, "pack_metadata.json"] for pack in get_packs_to_create(pack_to_create)
+        ]
 
     else:
-        path_list = ["Packs", "*", "pack_metadata.json"]
+        path_list = [["Packs", "*", "pack_metadata.json"]]
 
-    return glob.glob(os.path.join(*path_list))
+    files = list()
+    for path in path_list:
+        files.extend(glob.glob(os.path.join(*path)))
+
+    return files
 
 
 def get_general_paths(path, pack_to_create):
     if pack_to_create:
-        path_list = [[pack_to_create, path, "*"]]
+        path_list = [[pack, path, "*"] for pack in get_packs_to_create(pack_to_create)]
 
     else:
         path_list = [[path, "*"], ["Packs", "*", path, "*"]]
@@ -2291,7 +2311,9 @@ def get_generic_entities_paths(path, pack_to_create):
 
     """
     if pack_to_create:
-        path_list = [[pack_to_create, path, "*", "*.json"]]
+        path_list = [
+            [pack, path, "*", "*.json"] for pack in get_packs_to_create(pack_to_create)
+        ]
 
     else:
         path_list = [[path, "*"], ["Packs", "*", path, "*", "*.json"]]
@@ -2635,18 +2657,20 @@ def re_create_id_set(  # noqa: C901
     print_logs: bool = True,
     fail_on_duplicates: bool = False,
     marketplace: str = "",
+    check_duplicates: bool = True,
 ):
     """Re create the id-set
 
     Args:
         id_set_path: If passed an empty string will use default path (dependeing on mp type).
             Pass in None to avoid saving the id-set.
-        pack_to_create: The input path. the default is the content repo.
+        pack_to_create: The input path, or a list of pack paths. the default is the content repo.
         objects_to_create: The content items this id set will contain. Defaults are set
             depending on the mp type.
         print_logs: Whether to print logs or not
         fail_on_duplicates: If value is True an error will be raised if duplicates are found
         marketplace: The marketplace the id set is created for.
+        check_duplicates: Whether to look for duplicates in the created id set.
 
     Returns: id-set object
     """
@@ -3638,16 +3662,99 @@ def re_create_id_set(  # noqa: C901
         f"<green>Finished the creation of the id_set. Total time: {exec_time} seconds</green>"
     )
 
-    duplicates = find_duplicates(new_ids_dict, print_logs, marketplace)
+    if check_duplicates:
+        duplicates = find_duplicates(new_ids_dict, print_logs, marketplace)
+        if any(duplicates) and fail_on_duplicates:
+            raise Exception(
+                f"The following ids were found duplicates\n{json.dumps(duplicates, indent=4)}\n"
+            )
+
+    return new_ids_dict, excluded_items_by_pack, excluded_items_by_type
+
+
+def update_id_set_incrementally(
+    id_set: dict,
+    changed_packs: Iterable[str],
+    print_logs: bool = True,
+    fail_on_duplicates: bool = False,
+    marketplace: str = "",
+):
+    """Updates a previously created id-set in place, with the changes made to the given packs.
+
+    Only the changed packs are parsed, using the same processing as re_create_id_set.
+    Their items replace the ones in every section of the id-set (packs which no longer exist are removed),
+    and only the ids of their items are checked for duplicates.
+
+    Args:
+        id_set: The previously created id-set.
+        changed_packs: The names of the packs which changed since the id-set was created.
+        print_logs: Whether to print logs or not
+        fail_on_duplicates: If value is True an error will be raised if duplicates are found
+        marketplace: The marketplace the id set is created for.
+
+    Returns: The updated id-set, and the items excluded from the changed packs aggregated by pack and by type.
+    """
+    changed_packs = set(changed_packs)
+    existing_packs = sorted(
+        pack for pack in changed_packs if Path(PACKS_DIR, pack).is_dir()
+    )
+    logger.info(
+        f"<green>Updating the id_set with the changes of {len(changed_packs)} packs</green>"
+    )
+
+    changed_ids_dict: dict = {}
+    excluded_items_by_pack: Dict[str, set] = {}
+    excluded_items_by_type: Dict[str, set] = {}
+    if existing_packs:
+        (
+            changed_ids_dict,
+            excluded_items_by_pack,
+            excluded_items_by_type,
+        ) = re_create_id_set(
+            id_set_path=None,
+            pack_to_create=[os.path.join(PACKS_DIR, pack) for pack in existing_packs],
+            print_logs=print_logs,
+            marketplace=marketplace,
+            check_duplicates=False,
+        )
+
+    packs_section = id_set.setdefault("Packs", {})
+    for pack in changed_packs:
+        packs_section.pop(pack, None)
+    packs_section.update(changed_ids_dict.get("Packs", {}))
+
+    ids_to_check: Dict[str, set] = {}
+    for object_type in {**id_set, **changed_ids_dict}:
+        if object_type == "Packs":
+            continue
+        changed_items = changed_ids_dict.get(object_type, [])
+        id_set[object_type] = sort(
+            [
+                item
+                for item in id_set.get(object_type, [])
+                if list(item.values())[0].get("pack") not in changed_packs
+            ]
+            + changed_items
+        )
+        ids_to_check[object_type] = {list(item.keys())[0] for item in changed_items}
+
+    duplicates = find_duplicates(id_set, print_logs, marketplace, ids_to_check)
     if any(duplicates) and fail_on_duplicates:
         raise Exception(
             f"The following ids were found duplicates\n{json.dumps(duplicates, indent=4)}\n"
         )
 
-    return new_ids_dict, excluded_items_by_pack, excluded_items_by_type
+    return id_set, excluded_items_by_pack, excluded_items_by_type
 
 
-def find_duplicates(id_set, print_logs, marketplace):
+def find_duplicates(
+    id_set, print_logs, marketplace, ids_to_check: Optional[Dict[str, set]] = None
+):
+    """
+    Finds the ids which have duplicates in every section of the id-set.
+
+    Pass `ids_to_check` (the ids to check, by section) to check only some of the ids, otherwise all of them are checked.
+    """
     lists_to_return = []
     entities = {
         MarketplaceVersions.MarketplaceV2.value: ID_SET_MP_V2_ENTITIES,
@@ -3658,7 +3765,10 @@ def find_duplicates(id_set, print_logs, marketplace):
         if print_logs:
             logger.info(f"<green>Checking diff for {object_type}</green>")
         objects = id_set.get(object_type)
-        ids = {list(specific_item.keys())[0] for specific_item in objects}
+        if ids_to_check is None:
+            ids = {list(specific_item.keys())[0] for specific_item in objects}
+        else:
+            ids = ids_to_check.get(object_type, set())
 
         dup_list = []
         for id_to_check in ids:
@@ -3672,7 +3782,12 @@ def find_duplicates(id_set, print_logs, marketplace):
         logger.info("<green>Checking diff for Incident and Indicator Fields</green>")
 
     fields = id_set["IncidentFields"] + id_set["IndicatorFields"]
-    field_ids = {list(field.keys())[0] for field in fields}
+    if ids_to_check is None:
+        field_ids = {list(field.keys())[0] for field in fields}
+    else:
+        field_ids = ids_to_check.get("IncidentFields", set()) | ids_to_check.get(
+            "IndicatorFields", set()
+        )
 
     field_list = []
     for field_to_check in field_ids:
@@ -15,6 +15,7 @@ from demisto_sdk.commands.content_graph.common import (
     NEO4J_USERNAME,
 )
 from demisto_sdk.commands.content_graph.content_graph_builder import (
+    PACKS_PER_BATCH,
     ContentGraphBuilder,
 )
 from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
@@ -28,6 +29,7 @@ def create_content_graph(
     marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
     dependencies: bool = True,
     output_path: Optional[Path] = None,
+    packs_per_batch: Optional[int] = None,
 ) -> None:
     """This function creates a new content graph database in neo4j from the content path
 
@@ -36,8 +38,9 @@ def create_content_graph(
         marketplace (MarketplaceVersions): The marketplace to update.
         dependencies (bool): Whether to create the dependencies.
         output_path (Path): The path to export the graph zip to.
+        packs_per_batch (Optional[int]): If provided, streams the packs into the graph in batches of this size.
     """
-    builder = ContentGraphBuilder(content_graph_interface)
+    builder = ContentGraphBuilder(content_graph_interface, packs_per_batch)
     builder.init_database()
     builder.create_graph()
     if dependencies:
@@ -83,6 +86,19 @@ def create(
         resolve_path=True,
         help="Output folder to locate the zip file of the graph exported file.",
     ),
+    stream: bool = typer.Option(
+        False,
+        "-s",
+        "--stream",
+        is_flag=True,
+        help="Whether to stream the parsed packs into the graph in batches, to keep the memory usage bounded.",
+    ),
+    batch_size: int = typer.Option(
+        PACKS_PER_BATCH,
+        "-bs",
+        "--batch-size",
+        help="The number of packs to write to the graph in each batch when streaming.",
+    ),
     console_log_threshold: str = typer.Option(
         "INFO",
         "-clt",
@@ -119,6 +135,7 @@ def create(
             marketplace=marketplace,
             dependencies=not no_dependencies,
             output_path=output_path,
+            packs_per_batch=batch_size if stream else None,
         )
 
 
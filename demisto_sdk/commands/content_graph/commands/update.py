@@ -20,6 +20,7 @@ from demisto_sdk.commands.content_graph.common import (
     NEO4J_USERNAME,
 )
 from demisto_sdk.commands.content_graph.content_graph_builder import (
+    PACKS_PER_BATCH,
     ContentGraphBuilder,
 )
 from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
@@ -72,6 +73,8 @@ def update_content_graph(
     packs_to_update: Optional[List[str]] = None,
     dependencies: bool = True,
     output_path: Optional[Path] = None,
+    packs_per_batch: Optional[int] = None,
+    file_granular: bool = False,
 ) -> None:
     """This function updates a new content graph database in neo4j from the content path
     Args:
@@ -82,6 +85,8 @@ def update_content_graph(
         packs_to_update (List[str]): The packs to update.
         dependencies (bool): Whether to create the dependencies.
         output_path (Path): The path to export the graph zip to.
+        packs_per_batch (Optional[int]): If provided, streams the packs into the graph in batches of this size.
+        file_granular (bool): Whether to update only the changed content items rather than their whole packs, when using git.
     """
     force_create_graph = os.getenv("DEMISTO_SDK_GRAPH_FORCE_CREATE")
     logger.debug(f"DEMISTO_SDK_GRAPH_FORCE_CREATE = {force_create_graph}")
@@ -89,7 +94,11 @@ def update_content_graph(
     if string_to_bool(force_create_graph, False):
         logger.info("DEMISTO_SDK_GRAPH_FORCE_CREATE is set. Will create a new graph")
         create_content_graph(
-            content_graph_interface, marketplace, dependencies, output_path
+            content_graph_interface,
+            marketplace,
+            dependencies,
+            output_path,
+            packs_per_batch,
         )
         return
 
@@ -103,7 +112,7 @@ def update_content_graph(
     if is_external_repo:
         packs_to_update = get_all_repo_pack_ids()
     packs_to_update = list(packs_to_update) if packs_to_update else []
-    builder = ContentGraphBuilder(content_graph_interface)
+    builder = ContentGraphBuilder(content_graph_interface, packs_per_batch)
     if not should_update_graph(
         content_graph_interface, use_git, git_util, imported_path, packs_to_update
     ):
@@ -142,7 +151,11 @@ def update_content_graph(
                     "Importing graph from bucket failed. Creating from scratch"
                 )
                 create_content_graph(
-                    content_graph_interface, marketplace, dependencies, output_path
+                    content_graph_interface,
+                    marketplace,
+                    dependencies,
+                    output_path,
+                    packs_per_batch,
                 )
                 return
     if use_git and (commit := content_graph_interface.commit) and not is_external_repo:
@@ -153,10 +166,22 @@ def update_content_graph(
                 f"Failed to get changed packs from git. Creating from scratch. Error: {e}"
             )
             create_content_graph(
-                content_graph_interface, marketplace, dependencies, output_path
+                content_graph_interface,
+                marketplace,
+                dependencies,
+                output_path,
+                packs_per_batch,
             )
             return
-        packs_to_update.extend(git_util.get_all_changed_pack_ids(commit))
+        if file_granular:
+            changed_files = {
+                file
+                for file in git_util.get_all_changed_pack_files(commit)
+                if file.parts[1] not in packs_to_update
+            }
+            packs_to_update.extend(builder.update_content_items(changed_files, commit))
+        else:
+            packs_to_update.extend(git_util.get_all_changed_pack_ids(commit))
 
     packs_str = "\n".join([f"- {p}" for p in sorted(packs_to_update)])
     logger.info(f"Updating the following packs:\n{packs_str}")
@@ -228,6 +253,26 @@ def update(
         resolve_path=True,
         help="Output folder to locate the zip file of the graph exported file.",
     ),
+    file_granular: bool = typer.Option(
+        False,
+        "-fg",
+        "--file-granular",
+        is_flag=True,
+        help="When using git, whether to update only the changed content items rather than their whole packs.",
+    ),
+    stream: bool = typer.Option(
+        False,
+        "-s",
+        "--stream",
+        is_flag=True,
+        help="Whether to stream the parsed packs into the graph in batches, to keep the memory usage bounded.",
+    ),
+    batch_size: int = typer.Option(
+        PACKS_PER_BATCH,
+        "-bs",
+        "--batch-size",
+        help="The number of packs to write to the graph in each batch when streaming.",
+    ),
     console_log_threshold: str = typer.Option(
         "INFO",
         "-clt",
@@ -267,4 +312,6 @@ def update(
             packs_to_update=list(packs_to_update) if packs_to_update else [],
             dependencies=not no_dependencies,
             output_path=output_path,
+            packs_per_batch=batch_size if stream else None,
+            file_granular=file_granular,
         )
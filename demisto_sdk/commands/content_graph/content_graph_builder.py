@@ -1,25 +1,114 @@
 import gc
-from typing import Optional, Tuple
+import pickle
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from demisto_sdk.commands.content_graph.common import Nodes, Relationships
+import tqdm
+from more_itertools import chunked
+
+from demisto_sdk.commands.common.constants import (
+    PACKS_FOLDER,
+    PACKS_PACK_IGNORE_FILE_NAME,
+    PACKS_README_FILE_NAME,
+    PACKS_WHITELIST_FILE_NAME,
+    RELEASE_NOTES_DIR,
+    MarketplaceVersions,
+)
+from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    Nodes,
+    Relationships,
+    RelationshipType,
+)
 from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInterface
+from demisto_sdk.commands.content_graph.objects.base_content import (
+    CONTENT_TYPE_TO_MODEL,
+)
+from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.objects.repository import (
     ContentDTO,
 )
+from demisto_sdk.commands.content_graph.parsers.content_item import (
+    ContentItemParser,
+)
+from demisto_sdk.commands.content_graph.parsers.pack import PackParser
+from demisto_sdk.commands.content_graph.parsers.repository import RepositoryParser
 
 PACKS_PER_BATCH = 600
+RELATIONSHIPS_PER_BATCH = 50000
+
+# Pack files which are not represented in the content graph, so changing them does not require an update.
+PACK_FILES_NOT_IN_GRAPH = (
+    PACKS_README_FILE_NAME,
+    PACKS_PACK_IGNORE_FILE_NAME,
+    PACKS_WHITELIST_FILE_NAME,
+)
+
+
+class RelationshipsSpool:
+    """Spools relationships to files on disk, one file per relationship type,
+    so they can be written to the graph in batches after all the nodes were created.
+    """
+
+    def __init__(self, spool_dir: Path) -> None:
+        self.spool_dir = spool_dir
+        self.relationship_types: set = set()
+
+    def _spool_file(self, relationship: RelationshipType) -> Path:
+        return self.spool_dir / f"{relationship}.pickle"
+
+    def add(self, relationships: Relationships) -> None:
+        for relationship, data in relationships.items():
+            if not data:
+                continue
+            self.relationship_types.add(relationship)
+            with self._spool_file(relationship).open("ab") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _iter_relationships(self, relationship: RelationshipType) -> Iterator[dict]:
+        with self._spool_file(relationship).open("rb") as f:
+            while True:
+                try:
+                    yield from pickle.load(f)
+                except EOFError:
+                    return
+
+    def iter_batches(self, batch_size: int) -> Iterator[Relationships]:
+        """Yields the spooled relationships in batches of at most `batch_size` relationships of a single type.
+        HAS_COMMAND relationships are yielded first, as the other relationships may use the command nodes.
+        """
+        relationship_types = sorted(
+            self.relationship_types,
+            key=lambda rel: (rel != RelationshipType.HAS_COMMAND, rel),
+        )
+        for relationship in relationship_types:
+            for batch in chunked(self._iter_relationships(relationship), batch_size):
+                relationships = Relationships()
+                relationships[relationship] = batch
+                yield relationships
 
 
 class ContentGraphBuilder:
-    def __init__(self, content_graph: ContentGraphInterface) -> None:
+    def __init__(
+        self,
+        content_graph: ContentGraphInterface,
+        packs_per_batch: Optional[int] = None,
+    ) -> None:
         """Given a graph DB interface:
         1. Creates a repository model
         2. Collects all nodes and relationships from the model
 
         Args:
             content_graph (ContentGraphInterface): The interface to create the graph with.
+            packs_per_batch (Optional[int]): If provided, the packs are streamed from the parser into the graph
+                in batches of this size instead of being collected in memory first.
         """
         self.content_graph = content_graph
+        self.packs_per_batch = packs_per_batch
         self.nodes: Nodes = Nodes()
         self.relationships: Relationships = Relationships()
 
@@ -34,6 +123,9 @@ class ContentGraphBuilder:
         """
         if not packs_to_update:
             return
+        if self.packs_per_batch:
+            self._stream_content_to_graph(packs_to_update)
+            return
         self._parse_and_model_content(packs_to_update)
         self._create_or_update_graph()
 
@@ -64,6 +156,9 @@ class ContentGraphBuilder:
             self.relationships.update(pack.relationships)
 
     def create_graph(self) -> None:
+        if self.packs_per_batch:
+            self._stream_content_to_graph()
+            return
         self._parse_and_model_content()
         self._create_or_update_graph()
 
@@ -74,3 +169,194 @@ class ContentGraphBuilder:
         self.content_graph.create_relationships(self.relationships)
         gc.collect()
         self.content_graph.remove_non_repo_items()
+
+    def update_content_items(
+        self, changed_files: Iterable[Path], commit: str
+    ) -> Set[str]:
+        """Updates the graph with the changed content items only, rather than with their whole packs.
+
+        Every changed content item is parsed twice: as it is now and as it was in the graph's commit.
+        Content items which were not changed in terms of the graph are skipped, content items whose node properties
+        were changed are updated in place, and only content items whose relationships were changed are re-linked.
+
+        Changes which cannot be applied per content item (e.g., added, deleted or renamed content items,
+        or changes in pack files such as the pack metadata) fall back to updating their whole pack.
+
+        Args:
+            changed_files (Iterable[Path]): The changed files, relative to the content path.
+            commit (str): The commit the graph was created from.
+
+        Returns:
+            Set[str]: The IDs of the packs which should be updated as a whole.
+        """
+        packs_to_update: Set[str] = set()
+        pack_to_content_items: Dict[str, Set[Path]] = defaultdict(set)
+        for file_path in changed_files:
+            pack_id = file_path.parts[1]
+            if self._is_pack_file_not_in_graph(file_path):
+                continue
+            if content_item_path := self._get_content_item_path(file_path):
+                pack_to_content_items[pack_id].add(content_item_path)
+            else:
+                logger.debug(f"{file_path} requires updating the pack {pack_id}")
+                packs_to_update.add(pack_id)
+
+        nodes = Nodes()
+        relationships = Relationships()
+        paths_to_relink: List[str] = []
+        for pack_id, content_item_paths in pack_to_content_items.items():
+            if pack_id in packs_to_update:
+                continue
+            try:
+                pack_nodes, pack_relationships, pack_paths_to_relink = (
+                    self._diff_content_items(pack_id, content_item_paths, commit)
+                )
+            except Exception as e:
+                logger.debug(
+                    f"Could not update the content items of {pack_id} separately, updating the whole pack. Error: {e}"
+                )
+                packs_to_update.add(pack_id)
+                continue
+            nodes.update(pack_nodes)
+            relationships.update(pack_relationships)
+            paths_to_relink.extend(pack_paths_to_relink)
+
+        if nodes:
+            logger.info(
+                f"Updating {sum(len(data) for data in nodes.values())} content items, "
+                f"{len(paths_to_relink)} of them with changed relationships"
+            )
+            self.content_graph.update_content_items(
+                nodes, relationships, paths_to_relink
+            )
+        return packs_to_update
+
+    @staticmethod
+    def _is_pack_file_not_in_graph(file_path: Path) -> bool:
+        if len(file_path.parts) == 3:
+            return file_path.name in PACK_FILES_NOT_IN_GRAPH
+        return file_path.parts[2] == RELEASE_NOTES_DIR
+
+    @staticmethod
+    def _get_content_item_path(file_path: Path) -> Optional[Path]:
+        """Returns the path of the existing content item the file belongs to.
+
+        Args:
+            file_path (Path): A file path, relative to the content path.
+
+        Returns:
+            Optional[Path]: The content item path, or None if the file is not a part of an existing content item.
+        """
+        parts = file_path.parts
+        if (
+            len(parts) < 4
+            or parts[0] != PACKS_FOLDER
+            or parts[2] not in ContentType.folders()
+            or not (CONTENT_PATH / file_path).exists()
+        ):
+            return None
+        content_item_path = CONTENT_PATH.joinpath(*parts[:4])
+        if content_item_path.is_dir() or (
+            len(parts) == 4 and ContentItemParser.is_unified_file(content_item_path)
+        ):
+            return content_item_path
+        return None
+
+    @staticmethod
+    def _parse_content_item(
+        content_item_path: Path,
+        pack_id: str,
+        pack_marketplaces: List[MarketplaceVersions],
+        git_sha: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], Relationships]:
+        """Parses a content item and returns its graph node and relationships."""
+        parser = ContentItemParser.from_path(
+            content_item_path, pack_marketplaces, git_sha=git_sha
+        )
+        parser.add_to_pack(pack_id)
+        model = CONTENT_TYPE_TO_MODEL[parser.content_type].from_orm(parser)
+        return model.to_dict(), parser.relationships
+
+    def _diff_content_items(
+        self, pack_id: str, content_item_paths: Set[Path], commit: str
+    ) -> Tuple[Nodes, Relationships, List[str]]:
+        """Diffs the current content items against their version in the graph's commit.
+
+        Returns:
+            Tuple[Nodes, Relationships, List[str]]: The nodes to update, the relationships to create,
+                and the paths of the content items to re-link.
+        """
+        pack_marketplaces = PackParser(
+            CONTENT_PATH / PACKS_FOLDER / pack_id, metadata_only=True
+        ).marketplaces
+        nodes = Nodes()
+        relationships = Relationships()
+        paths_to_relink: List[str] = []
+        for content_item_path in sorted(content_item_paths):
+            node, item_relationships = self._parse_content_item(
+                content_item_path, pack_id, pack_marketplaces
+            )
+            graph_node, graph_relationships = self._parse_content_item(
+                content_item_path, pack_id, pack_marketplaces, git_sha=commit
+            )
+            if (node["content_type"], node["object_id"], node["path"]) != (
+                graph_node["content_type"],
+                graph_node["object_id"],
+                graph_node["path"],
+            ):
+                raise ValueError(f"The identity of {content_item_path} was changed")
+            if node == graph_node and item_relationships == graph_relationships:
+                logger.debug(f"{content_item_path} was not changed in the graph")
+                continue
+            nodes.add(**node)
+            if item_relationships != graph_relationships:
+                relationships.update(item_relationships)
+                paths_to_relink.append(node["path"])
+        return nodes, relationships, paths_to_relink
+
+    def _iter_pack_batches(
+        self, packs_to_parse: Optional[Tuple[str, ...]] = None
+    ) -> Iterator[Tuple[Pack, ...]]:
+        repo_parser = RepositoryParser(CONTENT_PATH)
+        packs = tuple(repo_parser.iter_packs(packs_to_parse))
+        with tqdm.tqdm(
+            total=len(packs),
+            unit="packs",
+            desc="Parsing packs",
+            position=0,
+            leave=True,
+        ) as progress_bar:
+            pack_parsers = repo_parser.iter_parse(
+                packs_to_parse=packs, progress_bar=progress_bar
+            )
+            for batch in chunked(pack_parsers, self.packs_per_batch):
+                yield tuple(Pack.from_orm(pack_parser) for pack_parser in batch)
+
+    def _stream_content_to_graph(
+        self, packs_to_parse: Optional[Tuple[str, ...]] = None
+    ) -> None:
+        """Parses the packs and writes them to the graph in batches, so only a single batch is held in memory.
+        The nodes of every batch are created as soon as it is parsed, while its relationships are spooled to disk
+        and created only after all the nodes exist.
+
+        Args:
+            packs_to_parse (Optional[Tuple[str, ...]]): A list of packs to parse. If not provided, parses all packs.
+        """
+        with tempfile.TemporaryDirectory() as spool_dir:
+            relationships_spool = RelationshipsSpool(Path(spool_dir))
+            for packs in self._iter_pack_batches(packs_to_parse):
+                nodes = Nodes()
+                for pack in packs:
+                    nodes.update(pack.to_nodes())
+                    relationships_spool.add(pack.relationships)
+                logger.debug(f"Writing a batch of {len(packs)} packs to the graph")
+                self.content_graph.create_nodes(nodes)
+                del packs, nodes
+                gc.collect()
+
+            for relationships in relationships_spool.iter_batches(
+                RELATIONSHIPS_PER_BATCH
+            ):
+                self.content_graph.create_relationships(relationships)
+            gc.collect()
+        self.content_graph.remove_non_repo_items()
@@ -1,5 +1,16 @@
-from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
-    Neo4jContentGraphInterface as ContentGraphInterface,
-)
+import os
 
-__all__ = ["ContentGraphInterface"]
+from demisto_sdk.commands.common.constants import DEMISTO_SDK_GRAPH_BACKEND
+
+IS_NATIVE_GRAPH_BACKEND = os.getenv(DEMISTO_SDK_GRAPH_BACKEND, "").lower() == "native"
+
+if IS_NATIVE_GRAPH_BACKEND:
+    from demisto_sdk.commands.content_graph.interface.native.native_graph import (
+        NativeContentGraphInterface as ContentGraphInterface,
+    )
+else:
+    from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (  # type: ignore[assignment]
+        Neo4jContentGraphInterface as ContentGraphInterface,
+    )
+
+__all__ = ["ContentGraphInterface", "IS_NATIVE_GRAPH_BACKEND"]
@@ -14,14 +14,43 @@ from demisto_sdk.commands.common.tools import (
 )
 from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
 from demisto_sdk.commands.content_graph.objects.base_content import (
+    CONTENT_TYPE_TO_MODEL,
     BaseContent,
     BaseNode,
+    UnknownContent,
 )
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
 from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
 
 
+def _parse_node(element_id: str, node: dict) -> BaseNode:
+    """Parses nodes to content objects and adds it to mapping
+
+    Args:
+        nodes (Iterable[graph.Node]): List of nodes to parse
+
+    Raises:
+        NoModelException: If no model found to parse on
+    """
+    obj: BaseNode
+    content_type = node.get("content_type", "")
+    if node.get("not_in_repository"):
+        obj = UnknownContent.parse_obj(node)
+
+    else:
+        model = CONTENT_TYPE_TO_MODEL.get(content_type)
+        if not model:
+            raise NoModelException(f"No model for {content_type}")
+        obj = model.parse_obj(node)
+    obj.database_id = element_id
+    return obj
+
+
+class NoModelException(Exception):
+    pass
+
+
 class ContentGraphInterface(ABC):
     repo_path = CONTENT_PATH  # type: ignore
     METADATA_FILE_NAME = "metadata.json"
@@ -125,6 +154,22 @@ class ContentGraphInterface(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    def update_content_items(
+        self,
+        nodes: Dict[ContentType, List[Dict[str, Any]]],
+        relationships: Dict[RelationshipType, List[Dict[str, Any]]],
+        paths_to_relink: List[str],
+    ) -> None:
+        """Updates existing content item nodes in place.
+
+        Args:
+            nodes: The updated content item nodes, matched to the existing nodes by their path.
+            relationships: The relationships to create for the content items in `paths_to_relink`.
+            paths_to_relink: The paths of the content items whose outgoing relationships should be recreated.
+        """
+        pass
+
     @abstractmethod
     def remove_non_repo_items(self) -> None:
         pass
@@ -292,10 +337,6 @@ class ContentGraphInterface(ABC):
     @abstractmethod
     def create_pack_dependencies(self): ...
 
-    @abstractmethod
-    def run_single_query(self, query: str, **kwargs) -> Any:
-        pass
-
     @abstractmethod
     def find_mandatory_hidden_packs_dependencies(
         self, pack_ids: List[str]
@@ -0,0 +1,246 @@
+"""A compact snapshot format of the content graph, used to export and import graphs.
+
+A snapshot is a gzip compressed file of JSON lines: a header line, then batches of nodes, then batches of relationships.
+Every batch holds nodes of the same labels (or relationships of the same type) in a columnar layout,
+so the property keys are written once per batch rather than once per node:
+
+    {"format": "content-graph-snapshot", "version": 1}
+    {"nodes": {"labels": [...], "keys": [...], "ids": [...], "columns": [[...], ...]}}
+    {"relationships": {"type": "...", "keys": [...], "starts": [...], "ends": [...], "columns": [[...], ...]}}
+
+Node IDs are remapped to sequential integers when the snapshot is written, and prefixed when it is read,
+so snapshots of several repositories are loaded together without rewriting their files.
+"""
+
+import gzip
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from demisto_sdk.commands.common.handlers.json.orjson_handler import OrJSON_Handler
+
+json = OrJSON_Handler()
+
+SNAPSHOT_FILE_SUFFIX = ".snapshot"
+SNAPSHOT_FORMAT = "content-graph-snapshot"
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_BATCH_SIZE = 5000
+
+
+class InvalidGraphSnapshotException(Exception):
+    pass
+
+
+class NodesBatch(NamedTuple):
+    labels: List[str]
+    rows: List[Dict[str, Any]]  # {"id": ..., "properties": {...}}
+
+
+class RelationshipsBatch(NamedTuple):
+    type: str
+    rows: List[Dict[str, Any]]  # {"start": ..., "end": ..., "properties": {...}}
+
+
+def _to_columns(keys: List[str], properties: List[Dict[str, Any]]) -> List[list]:
+    return [[props.get(key) for props in properties] for key in keys]
+
+
+def _from_columns(keys: List[str], columns: List[list], count: int) -> Iterator[dict]:
+    for i in range(count):
+        # missing properties are written as null, and null properties don't exist in the graph
+        yield {
+            key: column[i]
+            for key, column in zip(keys, columns)
+            if column[i] is not None
+        }
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.ids: List[Any] = []
+        self.ends: List[Any] = []
+        self.properties: List[Dict[str, Any]] = []
+        self.keys: Dict[str, None] = {}  # an ordered set
+
+    def add(self, properties: Dict[str, Any], id: Any, end: Any = None) -> None:
+        self.ids.append(id)
+        self.ends.append(end)
+        self.properties.append(properties)
+        self.keys.update(dict.fromkeys(properties))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class GraphSnapshotWriter:
+    """Writes a graph snapshot as nodes and relationships are streamed into it.
+
+    All the nodes must be added before the relationships between them.
+    """
+
+    def __init__(
+        self, path: Path, batch_size: int = DEFAULT_SNAPSHOT_BATCH_SIZE
+    ) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.nodes_count = 0
+        self.relationships_count = 0
+        self._ids: Dict[Any, int] = {}
+        self._node_batches: Dict[FrozenSet[str], _Batch] = {}
+        self._relationship_batches: Dict[str, _Batch] = {}
+        self._file: Optional[gzip.GzipFile] = None
+
+    def __enter__(self) -> "GraphSnapshotWriter":
+        self._file = gzip.open(self.path, "wb")
+        self._write({"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_VERSION})
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._flush_nodes()
+        for type in list(self._relationship_batches):
+            self._flush_relationships(type)
+        if self._file:
+            self._file.close()
+
+    def _write(self, record: dict) -> None:
+        assert self._file, "The snapshot writer must be used as a context manager"
+        self._file.write(json.dumps(record))
+        self._file.write(b"\n")
+
+    def add_node(
+        self, element_id: Any, labels: Iterable[str], properties: Dict[str, Any]
+    ) -> None:
+        if element_id in self._ids:
+            return
+        self._ids[element_id] = len(self._ids)
+        key = frozenset(labels)
+        batch = self._node_batches.setdefault(key, _Batch())
+        batch.add(properties, self._ids[element_id])
+        self.nodes_count += 1
+        if len(batch) >= self.batch_size:
+            self._write_nodes(key, self._node_batches.pop(key))
+
+    def add_relationship(
+        self,
+        type: str,
+        start_element_id: Any,
+        end_element_id: Any,
+        properties: Dict[str, Any],
+    ) -> None:
+        self._flush_nodes()
+        try:
+            start, end = self._ids[start_element_id], self._ids[end_element_id]
+        except KeyError as e:
+            raise InvalidGraphSnapshotException(
+                f"The node {e} of a {type} relationship was not added to the snapshot"
+            )
+        batch = self._relationship_batches.setdefault(type, _Batch())
+        batch.add(properties, start, end)
+        self.relationships_count += 1
+        if len(batch) >= self.batch_size:
+            self._flush_relationships(type)
+
+    def _write_nodes(self, labels: FrozenSet[str], batch: _Batch) -> None:
+        keys = list(batch.keys)
+        self._write(
+            {
+                "nodes": {
+                    "labels": sorted(labels),
+                    "keys": keys,
+                    "ids": batch.ids,
+                    "columns": _to_columns(keys, batch.properties),
+                }
+            }
+        )
+
+    def _flush_nodes(self) -> None:
+        for labels in list(self._node_batches):
+            self._write_nodes(labels, self._node_batches.pop(labels))
+
+    def _flush_relationships(self, type: str) -> None:
+        batch = self._relationship_batches.pop(type)
+        keys = list(batch.keys)
+        self._write(
+            {
+                "relationships": {
+                    "type": type,
+                    "keys": keys,
+                    "starts": batch.ids,
+                    "ends": batch.ends,
+                    "columns": _to_columns(keys, batch.properties),
+                }
+            }
+        )
+
+
+def read_graph_snapshot(
+    path: Path, id_prefix: str = ""
+) -> Iterator[Union[NodesBatch, RelationshipsBatch]]:
+    """Reads the batches of a graph snapshot, in the order they were written.
+
+    Args:
+        path (Path): The snapshot path.
+        id_prefix (str): A prefix of the node IDs, to make them unique among several snapshots.
+
+    Raises:
+        InvalidGraphSnapshotException: If the file is not a graph snapshot of a supported version.
+    """
+    with gzip.open(path, "rb") as f:
+        header = json.loads(f.readline() or b"{}")
+        if (
+            header.get("format") != SNAPSHOT_FORMAT
+            or header.get("version") != SNAPSHOT_VERSION
+        ):
+            raise InvalidGraphSnapshotException(
+                f"{path} is not a content graph snapshot of version {SNAPSHOT_VERSION}"
+            )
+        for line in f:
+            record = json.loads(line)
+            if nodes := record.get("nodes"):
+                yield NodesBatch(
+                    labels=nodes["labels"],
+                    rows=[
+                        {"id": f"{id_prefix}{id}", "properties": properties}
+                        for id, properties in zip(
+                            nodes["ids"],
+                            _from_columns(
+                                nodes["keys"], nodes["columns"], len(nodes["ids"])
+                            ),
+                        )
+                    ],
+                )
+            elif relationships := record.get("relationships"):
+                yield RelationshipsBatch(
+                    type=relationships["type"],
+                    rows=[
+                        {
+                            "start": f"{id_prefix}{start}",
+                            "end": f"{id_prefix}{end}",
+                            "properties": properties,
+                        }
+                        for start, end, properties in zip(
+                            relationships["starts"],
+                            relationships["ends"],
+                            _from_columns(
+                                relationships["keys"],
+                                relationships["columns"],
+                                len(relationships["starts"]),
+                            ),
+                        )
+                    ],
+                )
+
+
+def get_snapshot_paths(import_path: Path) -> List[Path]:
+    return sorted(
+        file for file in import_path.iterdir() if file.suffix == SNAPSHOT_FILE_SUFFIX
+    )
@@ -0,0 +1,335 @@
+from collections import defaultdict
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
+
+INDEXED_PROPERTIES = ("object_id", "name", "cli_name", "path", "content_type")
+
+
+class NativeNode:
+    """A node of the native graph: its labels and properties."""
+
+    __slots__ = ("element_id", "labels", "properties")
+
+    def __init__(
+        self, element_id: str, labels: FrozenSet[str], properties: Dict[str, Any]
+    ) -> None:
+        self.element_id = element_id
+        self.labels = labels
+        self.properties = properties
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.properties.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.properties[key]
+
+    def items(self):
+        return self.properties.items()
+
+
+class NativeRelationship:
+    """A directed relationship of the native graph, between the start and end nodes."""
+
+    __slots__ = ("element_id", "type", "start_node", "end_node", "properties")
+
+    def __init__(
+        self,
+        element_id: str,
+        type: str,
+        start_node: NativeNode,
+        end_node: NativeNode,
+        properties: Dict[str, Any],
+    ) -> None:
+        self.element_id = element_id
+        self.type = type
+        self.start_node = start_node
+        self.end_node = end_node
+        self.properties = properties
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.properties.get(key, default)
+
+    def keys(self):
+        return self.properties.keys()
+
+    def set(self, key: str, value: Any) -> None:
+        """Sets the property, removing it when the value is null, as `SET r.key = value` does."""
+        if value is None:
+            self.properties.pop(key, None)
+        else:
+            self.properties[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        return self.properties[key]
+
+
+class NativeGraphStore:
+    """An in-process property graph, holding the content graph nodes and relationships in memory.
+
+    The nodes are indexed by their labels and by the properties used to match them (object_id, name, cli_name, path),
+    and every node keeps its outgoing and incoming relationships by their type, so the queries traverse
+    the graph by lookups rather than by scanning it.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: Dict[str, NativeNode] = {}
+        self.relationships: Dict[str, NativeRelationship] = {}
+        self._next_id = 0
+        self._nodes_by_label: Dict[str, Set[str]] = defaultdict(set)
+        self._nodes_by_property: Dict[str, Dict[Any, Set[str]]] = {
+            property: defaultdict(set) for property in INDEXED_PROPERTIES
+        }
+        self._outgoing: Dict[str, Dict[str, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        self._incoming: Dict[str, Dict[str, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+
+    def _new_id(self) -> str:
+        self._next_id += 1
+        return str(self._next_id)
+
+    def clear(self) -> None:
+        self.__init__()  # type: ignore[misc]
+
+    # Nodes
+
+    def _index_node(self, node: NativeNode) -> None:
+        for label in node.labels:
+            self._nodes_by_label[label].add(node.element_id)
+        for property, index in self._nodes_by_property.items():
+            if isinstance(value := node.properties.get(property), Hashable):
+                index[value].add(node.element_id)
+
+    def _unindex_node(self, node: NativeNode) -> None:
+        for label in node.labels:
+            self._nodes_by_label[label].discard(node.element_id)
+        for property, index in self._nodes_by_property.items():
+            if isinstance(value := node.properties.get(property), Hashable):
+                index[value].discard(node.element_id)
+
+    def create_node(
+        self,
+        content_type: ContentType,
+        properties: Dict[str, Any],
+        labels: Optional[Iterable[str]] = None,
+    ) -> NativeNode:
+        """Creates a node with the labels of the content type, or with the given labels."""
+        node = NativeNode(
+            self._new_id(),
+            frozenset(labels if labels is not None else content_type.labels),
+            dict(properties),
+        )
+        self.nodes[node.element_id] = node
+        self._index_node(node)
+        return node
+
+    def set_node_properties(self, node: NativeNode, properties: Dict[str, Any]) -> None:
+        """Overrides the properties of the node, as `SET n = properties` does."""
+        self._unindex_node(node)
+        node.properties = dict(properties)
+        self._index_node(node)
+
+    def update_node_properties(
+        self, node: NativeNode, properties: Dict[str, Any]
+    ) -> None:
+        """Adds the properties to the node, as `SET n += properties` does."""
+        self._unindex_node(node)
+        node.properties.update(properties)
+        self._index_node(node)
+
+    def delete_node(self, node: NativeNode) -> None:
+        """Deletes the node with its relationships, as `DETACH DELETE` does."""
+        for relationship in list(self.get_relationships(node)):
+            self.delete_relationship(relationship)
+        self._unindex_node(node)
+        self.nodes.pop(node.element_id, None)
+        self._outgoing.pop(node.element_id, None)
+        self._incoming.pop(node.element_id, None)
+
+    def merge_nodes(self, nodes: List[NativeNode], combine: bool) -> NativeNode:
+        """Merges the nodes into the first one, as `apoc.refactor.mergeNodes` does with `mergeRels: true`.
+
+        Args:
+            nodes (List[NativeNode]): The nodes to merge.
+            combine (bool): Whether to add the properties missing in the first node from the others,
+                            or to discard the properties of the others.
+
+        Returns:
+            NativeNode: The merged node.
+        """
+        merged, *others = nodes
+        for node in others:
+            if node is merged:
+                continue
+            if combine:
+                self.update_node_properties(
+                    merged, {**node.properties, **merged.properties}
+                )
+            for relationship in list(self.get_outgoing(node)):
+                end = merged if relationship.end_node is node else relationship.end_node
+                self._move_relationship(relationship, merged, end)
+            for relationship in list(self.get_incoming(node)):
+                self._move_relationship(relationship, relationship.start_node, merged)
+            self.delete_node(node)
+        return merged
+
+    def _move_relationship(
+        self, relationship: NativeRelationship, start: NativeNode, end: NativeNode
+    ) -> None:
+        """Moves the relationship between the nodes, merging it into an existing one of the same type."""
+        self.delete_relationship(relationship)
+        existing, created = self.merge_relationship(relationship.type, start, end)
+        if created:
+            existing.properties = dict(relationship.properties)
+        else:
+            existing.properties = {**relationship.properties, **existing.properties}
+
+    def find_nodes(
+        self, label: Optional[str] = None, **properties: Any
+    ) -> List[NativeNode]:
+        """Returns the nodes with the given label and property values, ordered by their creation."""
+        properties = {
+            key: str(value) if isinstance(value, Path) else value
+            for key, value in properties.items()
+        }
+        candidates: Optional[Set[str]] = None
+        if label and label != ContentType.BASE_NODE:
+            candidates = set(self._nodes_by_label.get(label, ()))
+        for property, value in properties.items():
+            if property in self._nodes_by_property and isinstance(value, Hashable):
+                ids = self._nodes_by_property[property].get(value, set())
+                candidates = ids & candidates if candidates is not None else set(ids)
+        nodes: Iterable[NativeNode] = (
+            (self.nodes[element_id] for element_id in candidates)
+            if candidates is not None
+            else self.nodes.values()
+        )
+        return sorted(
+            (
+                node
+                for node in nodes
+                if all(node.get(key) == value for key, value in properties.items())
+            ),
+            key=lambda node: int(node.element_id),
+        )
+
+    def find_node(
+        self, label: Optional[str] = None, **properties: Any
+    ) -> Optional[NativeNode]:
+        nodes = self.find_nodes(label, **properties)
+        return nodes[0] if nodes else None
+
+    # Relationships
+
+    def create_relationship(
+        self,
+        type: str,
+        start_node: NativeNode,
+        end_node: NativeNode,
+        properties: Optional[Dict[str, Any]] = None,
+    ) -> NativeRelationship:
+        """Creates a relationship between the nodes. As in Neo4j, null properties are not stored."""
+        relationship = NativeRelationship(
+            self._new_id(),
+            type,
+            start_node,
+            end_node,
+            {
+                key: value
+                for key, value in (properties or {}).items()
+                if value is not None
+            },
+        )
+        self.relationships[relationship.element_id] = relationship
+        self._outgoing[start_node.element_id][type].add(relationship.element_id)
+        self._incoming[end_node.element_id][type].add(relationship.element_id)
+        return relationship
+
+    def merge_relationship(
+        self, type: str, start_node: NativeNode, end_node: NativeNode
+    ) -> Tuple[NativeRelationship, bool]:
+        """Returns the relationship of the type between the nodes, creating it if missing, as `MERGE` does.
+
+        Returns:
+            Tuple[NativeRelationship, bool]: The relationship, and whether it was created.
+        """
+        for relationship in self.get_outgoing(start_node, type):
+            if relationship.end_node is end_node:
+                return relationship, False
+        return self.create_relationship(type, start_node, end_node), True
+
+    def delete_relationship(self, relationship: NativeRelationship) -> None:
+        if self.relationships.pop(relationship.element_id, None) is None:
+            return
+        self._outgoing[relationship.start_node.element_id][relationship.type].discard(
+            relationship.element_id
+        )
+        self._incoming[relationship.end_node.element_id][relationship.type].discard(
+            relationship.element_id
+        )
+
+    def _get_relationships(
+        self,
+        adjacency: Dict[str, Dict[str, Set[str]]],
+        node: NativeNode,
+        type: Optional[str],
+    ) -> Iterator[NativeRelationship]:
+        if node.element_id not in adjacency:
+            return
+        by_type = adjacency[node.element_id]
+        types = [type] if type else list(by_type)
+        for type_ in types:
+            for element_id in sorted(by_type.get(type_, ()), key=int):
+                yield self.relationships[element_id]
+
+    def get_outgoing(
+        self, node: NativeNode, type: Optional[str] = None
+    ) -> Iterator[NativeRelationship]:
+        return self._get_relationships(self._outgoing, node, type)
+
+    def get_incoming(
+        self, node: NativeNode, type: Optional[str] = None
+    ) -> Iterator[NativeRelationship]:
+        return self._get_relationships(self._incoming, node, type)
+
+    def get_relationships(
+        self, node: NativeNode, type: Optional[str] = None
+    ) -> Iterator[NativeRelationship]:
+        """Returns the outgoing and incoming relationships of the node."""
+        yield from self.get_outgoing(node, type)
+        yield from self.get_incoming(node, type)
+
+    def iter_relationships(
+        self, type: Optional[RelationshipType] = None
+    ) -> Iterator[NativeRelationship]:
+        for relationship in list(self.relationships.values()):
+            if type is None or relationship.type == type:
+                yield relationship
+
+    def has_relationship(
+        self,
+        type: str,
+        start_node: NativeNode,
+        end_node: NativeNode,
+        **properties: Any,
+    ) -> bool:
+        return any(
+            relationship.end_node is end_node
+            and all(relationship.get(key) == value for key, value in properties.items())
+            for relationship in self.get_outgoing(start_node, type)
+        )
@@ -0,0 +1,94 @@
+"""Reads GraphML files exported by older versions (with APOC), so the native graph can import them as Neo4j does."""
+
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.content_graph.interface.graph_snapshot import (
+    NodesBatch,
+    RelationshipsBatch,
+)
+
+GRAPHML_FILE_SUFFIX = ".graphml"
+GRAPHML_NAMESPACE = "{http://graphml.graphdrawing.org/xmlns}"
+
+# these keys hold the node labels and the relationship type, rather than properties
+LABELS_KEY = "labels"
+RELATIONSHIP_TYPE_KEY = "label"
+
+
+def get_graphml_paths(import_path: Path) -> List[Path]:
+    return sorted(
+        file for file in import_path.iterdir() if file.suffix == GRAPHML_FILE_SUFFIX
+    )
+
+
+def _parse_value(value: str, attr_type: str, is_list: bool) -> Any:
+    if is_list:
+        return json.loads(value)
+    if attr_type == "boolean":
+        return value.lower() == "true"
+    if attr_type in ("int", "long"):
+        return int(value)
+    if attr_type in ("float", "double"):
+        return float(value)
+    return value
+
+
+def _parse_data(
+    element: ET.Element, keys: Dict[str, Tuple[str, str, bool]]
+) -> Dict[str, Any]:
+    properties: Dict[str, Any] = {}
+    for data in element.iter(f"{GRAPHML_NAMESPACE}data"):
+        name, attr_type, is_list = keys[data.attrib["key"]]
+        properties[name] = _parse_value(data.text or "", attr_type, is_list)
+    return properties
+
+
+def read_graphml(
+    path: Path, id_prefix: str = ""
+) -> Iterator[Union[NodesBatch, RelationshipsBatch]]:
+    """Reads a GraphML file as batches of a graph snapshot: the nodes batches, then the relationships batches.
+
+    Args:
+        path (Path): The GraphML file path.
+        id_prefix (str): A prefix of the node IDs, to make them unique among several files.
+    """
+    root = ET.parse(path).getroot()
+    keys = {
+        key.attrib["id"]: (
+            key.attrib["attr.name"],
+            key.attrib.get("attr.type", "string"),
+            "attr.list" in key.attrib,
+        )
+        for key in root.iter(f"{GRAPHML_NAMESPACE}key")
+    }
+
+    nodes: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+    for node in root.iter(f"{GRAPHML_NAMESPACE}node"):
+        properties = _parse_data(node, keys)
+        properties.pop(LABELS_KEY, None)
+        labels = tuple(
+            sorted(label for label in node.attrib.get("labels", "").split(":") if label)
+        )
+        nodes[labels].append(
+            {"id": f"{id_prefix}{node.attrib['id']}", "properties": properties}
+        )
+    for labels, node_rows in nodes.items():
+        yield NodesBatch(labels=list(labels), rows=node_rows)
+
+    relationships: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for edge in root.iter(f"{GRAPHML_NAMESPACE}edge"):
+        properties = _parse_data(edge, keys)
+        type = properties.pop(RELATIONSHIP_TYPE_KEY, None) or edge.attrib["label"]
+        relationships[type].append(
+            {
+                "start": f"{id_prefix}{edge.attrib['source']}",
+                "end": f"{id_prefix}{edge.attrib['target']}",
+                "properties": properties,
+            }
+        )
+    for type, relationship_rows in relationships.items():
+        yield RelationshipsBatch(type=type, rows=relationship_rows)
@@ -0,0 +1,523 @@
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from zipfile import ZipFile
+
+from demisto_sdk.commands.common.constants import (
+    NATIVE_GRAPH_DIR,
+    MarketplaceVersions,
+)
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import download_content_graph
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    Neo4jRelationshipResult,
+    RelationshipType,
+)
+from demisto_sdk.commands.content_graph.interface.graph import (
+    ContentGraphInterface,
+    _parse_node,
+)
+from demisto_sdk.commands.content_graph.interface.graph_snapshot import (
+    SNAPSHOT_FILE_SUFFIX,
+    GraphSnapshotWriter,
+    NodesBatch,
+    get_snapshot_paths,
+    read_graph_snapshot,
+)
+from demisto_sdk.commands.content_graph.interface.native import queries
+from demisto_sdk.commands.content_graph.interface.native.graph_store import (
+    NativeGraphStore,
+    NativeNode,
+    NativeRelationship,
+)
+from demisto_sdk.commands.content_graph.interface.native.graphml import (
+    get_graphml_paths,
+    read_graphml,
+)
+from demisto_sdk.commands.content_graph.objects.base_content import BaseNode
+from demisto_sdk.commands.content_graph.objects.integration import Integration
+from demisto_sdk.commands.content_graph.objects.pack import Pack
+from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
+
+
+class NativeContentGraphInterface(ContentGraphInterface):
+    """A content graph interface running the graph queries in-process, without a Neo4j service.
+
+    The graph is kept in memory, and is shared by all the interfaces of the process,
+    so it lives as long as the process (e.g a validate or a pre-commit run).
+    """
+
+    _store = NativeGraphStore()
+
+    def __init__(self) -> None:
+        self._id_to_obj: Dict[str, BaseNode] = {}
+        self._rels_to_preserve: List[Dict[str, Any]] = []  # used for graph updates
+        self.import_path.mkdir(parents=True, exist_ok=True)
+        self.output_path = None
+        if artifacts_folder := os.getenv("ARTIFACTS_FOLDER"):
+            self.output_path = Path(artifacts_folder) / "content_graph"
+            self.output_path.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> "NativeContentGraphInterface":
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    @property
+    def store(self) -> NativeGraphStore:
+        return self._store
+
+    @property
+    def import_path(self) -> Path:
+        return NATIVE_GRAPH_DIR / "import"
+
+    def clean_import_dir(self) -> None:
+        for file in self.import_path.iterdir():
+            Path(file).unlink()
+
+    def move_to_import_dir(self, imported_path: Path) -> None:
+        with ZipFile(imported_path, "r") as zip_obj:
+            zip_obj.extractall(self.import_path)
+
+    def close(self) -> None:
+        pass
+
+    def _add_nodes_to_mapping(self, nodes: Iterable[NativeNode]) -> None:
+        for node in nodes:
+            if node.element_id not in self._id_to_obj:
+                self._id_to_obj[node.element_id] = _parse_node(
+                    node.element_id, dict(node.properties)
+                )
+
+    def _add_relationships(
+        self,
+        obj: BaseNode,
+        relationships: List[NativeRelationship],
+        nodes_to: List[NativeNode],
+    ) -> None:
+        for node_to, rel in zip(nodes_to, relationships):
+            obj.add_relationship(
+                RelationshipType(rel.type),
+                RelationshipData(
+                    relationship_type=rel.type,
+                    source_id=rel.start_node.element_id,
+                    target_id=rel.end_node.element_id,
+                    content_item_to=self._id_to_obj[node_to.element_id],
+                    is_direct=True,
+                    **rel.properties,
+                ),
+            )
+
+    def _add_relationships_to_objects(
+        self,
+        result: Dict[str, Neo4jRelationshipResult],
+        marketplace: Optional[MarketplaceVersions] = None,
+    ) -> None:
+        content_item_nodes: Set[str] = set()
+        packs: List[Pack] = []
+        nodes_to = []
+        for res in result.values():
+            nodes_to.extend(res.nodes_to)
+        self._add_nodes_to_mapping(nodes_to)
+        for id, res in result.items():
+            obj = self._id_to_obj[id]
+            self._add_relationships(obj, res.relationships, res.nodes_to)
+            if isinstance(obj, Pack) and not obj.content_items:
+                packs.append(obj)
+                content_item_nodes.update(
+                    node.element_id
+                    for node, rel in zip(res.nodes_to, res.relationships)
+                    if rel.type == RelationshipType.IN_PACK
+                )
+
+            if isinstance(obj, Integration) and not obj.commands:
+                obj.set_commands()  # type: ignore[union-attr]
+
+        if content_item_nodes:
+            self._add_relationships_to_objects(
+                queries.match_relationships(
+                    self.store, content_item_nodes, marketplace
+                ),
+                marketplace,
+            )
+
+        # we need to set content items only after they are fully loaded
+        for pack in packs:
+            pack.set_content_items()
+
+    def _add_all_level_relationships(
+        self,
+        node_ids: Iterable[str],
+        relationship_type: RelationshipType,
+        marketplace: Optional[MarketplaceVersions] = None,
+    ) -> None:
+        relationships = queries.get_all_level_packs_relationships(
+            self.store, relationship_type, node_ids, marketplace, True
+        )
+        for nodes_to in relationships.values():
+            self._add_nodes_to_mapping(nodes_to)
+
+        for content_item_id, nodes_to in relationships.items():
+            obj = self._id_to_obj[content_item_id]
+            for node in nodes_to:
+                source_id = content_item_id
+                target_id = node.element_id
+                if relationship_type == RelationshipType.IMPORTS:
+                    # the import relationship is from the integration to the content item
+                    source_id = node.element_id
+                    target_id = content_item_id
+                obj.add_relationship(
+                    relationship_type,
+                    RelationshipData(
+                        relationship_type=relationship_type,
+                        source_id=source_id,
+                        target_id=target_id,
+                        content_item_to=self._id_to_obj[node.element_id],
+                        mandatorily=True,
+                        is_direct=False,
+                    ),
+                )
+
+    def _results_to_objects(
+        self, results: Dict[str, Neo4jRelationshipResult]
+    ) -> List[BaseNode]:
+        self._add_nodes_to_mapping(result.node_from for result in results.values())
+        self._add_relationships_to_objects(results)
+        return [self._id_to_obj[result] for result in results]
+
+    def search(
+        self,
+        marketplace: Union[MarketplaceVersions, str] = None,
+        content_type: ContentType = ContentType.BASE_NODE,
+        ids_list: Optional[Iterable[int]] = None,
+        all_level_dependencies: bool = False,
+        all_level_imports: bool = False,
+        **properties,
+    ) -> List[BaseNode]:
+        if isinstance(marketplace, str):
+            marketplace = MarketplaceVersions(marketplace)
+
+        super().search()
+        results = queries.match(
+            self.store,
+            marketplace,
+            content_type,
+            [str(id) for id in ids_list] if ids_list else None,
+            **properties,
+        )
+        self._add_nodes_to_mapping(results)
+
+        nodes_without_relationships = {
+            result.element_id
+            for result in results
+            # parsing a content item may look up its pack, leaving an empty relationships entry
+            if not any(self._id_to_obj[result.element_id].relationships_data.values())
+        }
+        self._add_relationships_to_objects(
+            queries.match_relationships(
+                self.store, nodes_without_relationships, marketplace
+            ),
+            marketplace,
+        )
+
+        nodes = {result.element_id for result in results}
+        pack_nodes = {
+            node_id for node_id in nodes if isinstance(self._id_to_obj[node_id], Pack)
+        }
+        if all_level_imports:
+            self._add_all_level_relationships(nodes, RelationshipType.IMPORTS)
+        if all_level_dependencies and pack_nodes and marketplace:
+            self._add_all_level_relationships(
+                pack_nodes, RelationshipType.DEPENDS_ON, marketplace
+            )
+        return [self._id_to_obj[result.element_id] for result in results]
+
+    def create_indexes_and_constraints(self) -> None:
+        # the store indexes the nodes as they are created
+        pass
+
+    def create_nodes(self, nodes: Dict[ContentType, List[Dict[str, Any]]]) -> None:
+        logger.info("Creating graph nodes...")
+        pack_ids = [p.get("object_id") for p in nodes.get(ContentType.PACK, [])]
+        # extend rather than override, as nodes may be created in several batches
+        self._rels_to_preserve.extend(
+            queries.get_relationships_to_preserve(self.store, pack_ids)
+        )
+        queries.remove_packs_before_creation(self.store, pack_ids)
+        queries.create_nodes(self.store, nodes)
+
+    def create_relationships(
+        self, relationships: Dict[RelationshipType, List[Dict[str, Any]]]
+    ) -> None:
+        logger.info("Creating graph relationships...")
+        queries.create_relationships(self.store, relationships)
+        if self._rels_to_preserve:
+            queries.return_preserved_relationships(self.store, self._rels_to_preserve)
+            self._rels_to_preserve = []
+
+    def update_content_items(
+        self,
+        nodes: Dict[ContentType, List[Dict[str, Any]]],
+        relationships: Dict[RelationshipType, List[Dict[str, Any]]],
+        paths_to_relink: List[str],
+    ) -> None:
+        logger.info("Updating graph content items...")
+        queries.update_content_item_nodes(self.store, nodes)
+        command_ids = queries.remove_outgoing_relationships_by_path(
+            self.store, paths_to_relink
+        )
+        queries.create_relationships(self.store, relationships)
+        queries.remove_orphan_commands(self.store, command_ids)
+        queries.remove_empty_properties(self.store)
+        self._id_to_obj = {}
+
+    def remove_non_repo_items(self) -> None:
+        queries.remove_content_private_nodes(self.store)
+        queries.remove_server_nodes(self.store)
+
+    def get_relationships_by_path(
+        self,
+        path: Path,
+        relationship_type: RelationshipType,
+        content_type: ContentType,
+        depth: int,
+        marketplace: MarketplaceVersions,
+        retrieve_sources: bool,
+        retrieve_targets: bool,
+        mandatory_only: bool,
+        include_tests: bool,
+        include_deprecated: bool,
+        include_hidden: bool,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        args = (
+            path,
+            relationship_type,
+            content_type,
+            depth,
+            marketplace,
+            mandatory_only,
+            include_tests,
+            include_deprecated,
+            include_hidden,
+        )
+        sources = (
+            queries.get_sources_by_path(self.store, *args) if retrieve_sources else []
+        )
+        targets = (
+            queries.get_targets_by_path(self.store, *args) if retrieve_targets else []
+        )
+        return sources, targets
+
+    def get_unknown_content_uses(self, file_paths: List[str]) -> List[BaseNode]:
+        return self._results_to_objects(
+            queries.validate_unknown_content(self.store, file_paths)
+        )
+
+    def get_duplicate_pack_display_name(
+        self, file_paths: List[str]
+    ) -> List[Tuple[str, List[str]]]:
+        return queries.validate_multiple_packs_with_same_display_name(
+            self.store, file_paths
+        )
+
+    def get_duplicate_script_name_included_incident(
+        self, file_paths: List[str]
+    ) -> Dict[str, str]:
+        return queries.validate_multiple_script_with_same_name(self.store, file_paths)
+
+    def validate_duplicate_ids(
+        self, file_paths: List[str]
+    ) -> List[Tuple[BaseNode, List[BaseNode]]]:
+        duplicates = queries.validate_duplicate_ids(self.store, file_paths)
+        for content_item, dups in duplicates:
+            self._add_nodes_to_mapping([content_item, *dups])
+        return [
+            (
+                self._id_to_obj[content_item.element_id],
+                [self._id_to_obj[duplicate.element_id] for duplicate in dups],
+            )
+            for content_item, dups in duplicates
+        ]
+
+    def find_uses_paths_with_invalid_fromversion(
+        self, file_paths: List[str], for_supported_versions=False
+    ) -> List[BaseNode]:
+        return self._results_to_objects(
+            queries.validate_fromversion(self.store, file_paths, for_supported_versions)
+        )
+
+    def find_uses_paths_with_invalid_toversion(
+        self, file_paths: List[str], for_supported_versions=False
+    ) -> List[BaseNode]:
+        return self._results_to_objects(
+            queries.validate_toversion(self.store, file_paths, for_supported_versions)
+        )
+
+    def find_items_using_deprecated_items(self, file_paths: List[str]) -> List[dict]:
+        return queries.get_items_using_deprecated(self.store, file_paths)
+
+    def find_uses_paths_with_invalid_marketplaces(
+        self, pack_ids: List[str]
+    ) -> List[BaseNode]:
+        return self._results_to_objects(
+            queries.validate_marketplaces(self.store, pack_ids)
+        )
+
+    def find_core_packs_depend_on_non_core_packs(
+        self,
+        pack_ids: List[str],
+        marketplace: MarketplaceVersions,
+        core_pack_list: List[str],
+    ) -> List[BaseNode]:
+        return self._results_to_objects(
+            queries.validate_core_packs_dependencies(
+                self.store, pack_ids, marketplace, core_pack_list
+            )
+        )
+
+    def find_mandatory_hidden_packs_dependencies(
+        self, pack_ids: List[str]
+    ) -> List[BaseNode]:
+        return self._results_to_objects(
+            queries.validate_hidden_pack_dependencies(self.store, pack_ids)
+        )
+
+    def find_unused_test_playbook(
+        self, test_playbook_ids: List[str], test_playbooks_ids_to_skip: List[str]
+    ) -> List[BaseNode]:
+        results = queries.validate_test_playbook_in_use(
+            self.store, test_playbook_ids, test_playbooks_ids_to_skip
+        )
+        self._add_nodes_to_mapping(results)
+        return [self._id_to_obj[result.element_id] for result in results]
+
+    def create_pack_dependencies(self):
+        logger.info("Creating pack dependencies...")
+        self._depends_on = queries.create_pack_dependencies(self.store)
+
+    def _dump_snapshot(self) -> None:
+        with GraphSnapshotWriter(
+            self.import_path / f"{self.repo_path.absolute().name}{SNAPSHOT_FILE_SUFFIX}"
+        ) as writer:
+            for node in self.store.nodes.values():
+                writer.add_node(node.element_id, node.labels, node.properties)
+            for rel in self.store.relationships.values():
+                writer.add_relationship(
+                    rel.type,
+                    rel.start_node.element_id,
+                    rel.end_node.element_id,
+                    rel.properties,
+                )
+
+    def _load_graph_files(self) -> bool:
+        """Loads the snapshots (or GraphML files of older graphs) in the import dir, then merges duplicate nodes.
+
+        Returns:
+            bool: Whether there were files to load.
+        """
+        if snapshot_paths := get_snapshot_paths(self.import_path):
+            batches_by_source = [
+                read_graph_snapshot(snapshot_path) for snapshot_path in snapshot_paths
+            ]
+        elif graphml_paths := get_graphml_paths(self.import_path):
+            # graphs exported by older versions are GraphML files
+            batches_by_source = [
+                read_graphml(graphml_path) for graphml_path in graphml_paths
+            ]
+        else:
+            return False
+        self.clean_graph()
+        for batches in batches_by_source:
+            nodes: Dict[str, NativeNode] = {}
+            for batch in batches:
+                if isinstance(batch, NodesBatch):
+                    for row in batch.rows:
+                        nodes[row["id"]] = self.store.create_node(
+                            row["properties"].get("content_type"),
+                            row["properties"],
+                            labels=batch.labels,
+                        )
+                    continue
+                for row in batch.rows:
+                    self.store.create_relationship(
+                        batch.type,
+                        nodes[row["start"]],
+                        nodes[row["end"]],
+                        row["properties"],
+                    )
+        queries.merge_duplicate_commands(self.store)
+        if len(batches_by_source) > 1:
+            queries.merge_duplicate_content_items(self.store)
+        return True
+
+    def import_graph(
+        self,
+        imported_path: Optional[Path] = None,
+        download: bool = False,
+        fail_on_error: bool = False,
+    ) -> bool:
+        """Imports graph snapshots (or GraphML files of older graphs) to the in-process graph,
+        merging the duplicate nodes of different repositories as the Neo4j import does.
+
+        Args:
+            imported_path (Path): The path to import the graph from.
+            download (bool): Wheter download the graph from bucket or not.
+            fail_on_error (bool): Whether to raise exception on error or not.
+
+        Returns:
+            bool: Whether the import was successful or not
+        """
+        if imported_path:
+            logger.info(f"Importing graph from {imported_path}")
+            self.clean_import_dir()
+            self.move_to_import_dir(imported_path)
+
+        if download:
+            logger.info("Importing graph from bucket")
+            self.clean_import_dir()
+            try:
+                with NamedTemporaryFile() as temp_file:
+                    self.move_to_import_dir(
+                        download_content_graph(Path(temp_file.name))
+                    )
+            except Exception:
+                logger.error("Failed to download content graph from bucket")
+                if fail_on_error:
+                    raise
+                return False
+
+        if not self._load_graph_files():
+            logger.info("No graph files found, nothing to import")
+            return False
+        self._id_to_obj = {}
+        return not self._has_infra_graph_been_changed()
+
+    def export_graph(
+        self,
+        output_path: Optional[Path] = None,
+        override_commit: bool = True,
+        marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
+        clean_import_dir: bool = True,
+    ) -> None:
+        if clean_import_dir:
+            self.clean_import_dir()
+        self._dump_snapshot()
+        self.dump_metadata(override_commit)
+        self.dump_depends_on()
+        if output_path:
+            output_path = output_path / marketplace.value
+            logger.info(f"Saving content graph in {output_path}.zip")
+            self.zip_import_dir(output_path)
+
+    def clean_graph(self):
+        self.store.clear()
+        self._id_to_obj = {}
+
+    def is_alive(self):
+        return bool(self.store.nodes)
+
+    def get_schema(self) -> dict:
+        return queries.get_schema(self.store)
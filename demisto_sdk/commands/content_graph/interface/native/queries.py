@@ -0,0 +1,1356 @@
+"""The content graph queries of the native graph.
+
+Every query here is the in-process equivalent of the Cypher query of the same name under `interface/neo4j/queries`,
+and returns its results in the same shape.
+"""
+
+import os
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from demisto_sdk.commands.common.constants import (
+    DEFAULT_CONTENT_ITEM_FROM_VERSION,
+    DEPRECATED_CONTENT_PACK,
+    GENERAL_DEFAULT_FROMVERSION,
+    GENERIC_COMMANDS_NAMES,
+    MarketplaceVersions,
+)
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import replace_alert_to_incident
+from demisto_sdk.commands.content_graph.common import (
+    CONTENT_PRIVATE_ITEMS,
+    ContentType,
+    Neo4jRelationshipResult,
+    RelationshipType,
+    get_server_content_items,
+)
+from demisto_sdk.commands.content_graph.interface.native.graph_store import (
+    NativeGraphStore,
+    NativeNode,
+    NativeRelationship,
+)
+
+json = JSON_Handler()
+
+IGNORED_PACKS_IN_DEPENDENCY_CALC = ["NonSupported", "ApiModules"]
+MAX_DEPTH = 5
+
+USES_TARGET_IDENTIFIERS = {
+    RelationshipType.USES_BY_ID: "object_id",
+    RelationshipType.USES_BY_NAME: "name",
+    RelationshipType.USES_BY_CLI_NAME: "cli_name",
+    RelationshipType.USES_COMMAND_OR_SCRIPT: "object_id",
+    RelationshipType.USES_PLAYBOOK: "name",
+}
+
+Version = Optional[Tuple[int, ...]]
+
+
+def versioned(version: Optional[str]) -> Version:
+    """The equivalent of `toIntegerList(split(version, "."))`. Returns None when the version can't be compared."""
+    if version is None:
+        return None
+    try:
+        return tuple(int(part) for part in str(version).split("."))
+    except ValueError:
+        return None
+
+
+def _compare(
+    left: Version, right: Version, operator: Callable[[Any, Any], bool]
+) -> bool:
+    """Compares two versions, where comparing to a missing version is never true (as comparing to null)."""
+    return left is not None and right is not None and operator(left, right)
+
+
+def _lt(left: Version, right: Version) -> bool:
+    return _compare(left, right, lambda a, b: a < b)
+
+
+def _gt(left: Version, right: Version) -> bool:
+    return _compare(left, right, lambda a, b: a > b)
+
+
+def _ge(left: Version, right: Version) -> bool:
+    return _compare(left, right, lambda a, b: a >= b)
+
+
+def _le(left: Version, right: Version) -> bool:
+    return _compare(left, right, lambda a, b: a <= b)
+
+
+def intersects(arr1: Optional[Iterable], arr2: Optional[Iterable]) -> bool:
+    return bool(set(arr1 or ()) & set(arr2 or ()))
+
+
+def is_target_available(source: NativeNode, target: NativeNode) -> bool:
+    """Determines if a target content item is available for use by a source content item
+    (i.e. they share a marketplace and have overlapping versions).
+    """
+    return (
+        intersects(source.get("marketplaces"), target.get("marketplaces"))
+        and _ge(
+            versioned(source.get("toversion")), versioned(target.get("fromversion"))
+        )
+        and _ge(
+            versioned(target.get("toversion")), versioned(source.get("fromversion"))
+        )
+    )
+
+
+def _in_pack(store: NativeGraphStore, node: NativeNode) -> List[NativeNode]:
+    return [
+        relationship.end_node
+        for relationship in store.get_outgoing(node, RelationshipType.IN_PACK)
+    ]
+
+
+def _group_results(
+    rows: Iterable[Tuple[NativeNode, NativeRelationship, NativeNode]],
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Groups (node_from, relationship, node_to) rows by node_from, as `collect` does."""
+    results: Dict[str, Neo4jRelationshipResult] = {}
+    for node_from, relationship, node_to in rows:
+        if node_from.element_id not in results:
+            results[node_from.element_id] = Neo4jRelationshipResult(
+                node_from=node_from, relationships=[], nodes_to=[]
+            )
+        results[node_from.element_id].relationships.append(relationship)
+        results[node_from.element_id].nodes_to.append(node_to)
+    return results
+
+
+# Nodes
+
+
+def remove_empty_properties(
+    store: NativeGraphStore, nodes: Optional[Iterable[NativeNode]] = None
+) -> None:
+    """Removes string properties with empty values ("") from nodes."""
+    for node in list(nodes if nodes is not None else store.nodes.values()):
+        if any(value == "" for value in node.properties.values()):
+            store.set_node_properties(
+                node, {k: v for k, v in node.properties.items() if v != ""}
+            )
+
+
+def create_nodes(
+    store: NativeGraphStore, nodes: Dict[ContentType, List[Dict[str, Any]]]
+) -> List[NativeNode]:
+    """Creates the content item nodes, and creates or overrides the rest of the nodes (e.g packs) by their object_id."""
+    created = []
+    content_items = set(ContentType.content_items())
+    for content_type, data in nodes.items():
+        for node_data in data:
+            properties = {**node_data, "not_in_repository": False}
+            existing = (
+                None
+                if content_type in content_items
+                else store.find_node(content_type, object_id=node_data.get("object_id"))
+            )
+            if existing:
+                store.set_node_properties(existing, properties)
+                created.append(existing)
+            else:
+                created.append(store.create_node(content_type, properties))
+        logger.debug(f"Created {len(data)} nodes of type {content_type}.")
+    remove_empty_properties(store, created)
+    return created
+
+
+def update_content_item_nodes(
+    store: NativeGraphStore, nodes: Dict[ContentType, List[Dict[str, Any]]]
+) -> None:
+    """Updates existing content items in place by their path, keeping their relationships."""
+    for content_type, data in nodes.items():
+        updated = 0
+        for node_data in data:
+            for node in store.find_nodes(content_type, path=node_data.get("path")):
+                store.set_node_properties(
+                    node, {**node_data, "not_in_repository": False}
+                )
+                updated += 1
+        logger.debug(f"Updated {updated} nodes of type {content_type}.")
+
+
+def get_relationships_to_preserve(
+    store: NativeGraphStore, pack_ids: List[str]
+) -> List[Dict[str, Any]]:
+    """Gets the relationships from outside of the packs into them, to recreate after the packs are recreated."""
+    pack_ids_set = set(pack_ids)
+    preserved: Dict[str, Dict[str, Any]] = {}
+
+    def preserve(relationship: NativeRelationship) -> None:
+        preserved[relationship.element_id] = {
+            "source_id": relationship.start_node.element_id,
+            "source": dict(relationship.start_node.properties),
+            "r_type": relationship.type,
+            "r_properties": dict(relationship.properties),
+            "target": dict(relationship.end_node.properties),
+        }
+
+    def is_in_pack(node: NativeNode, pack: NativeNode) -> bool:
+        return any(p is pack for p in _in_pack(store, node))
+
+    for pack in store.find_nodes(ContentType.PACK):
+        if pack.get("object_id") not in pack_ids_set:
+            continue
+        for in_pack in store.get_incoming(pack, RelationshipType.IN_PACK):
+            content_item = in_pack.start_node
+            targets = [content_item] + [
+                has_command.end_node
+                for has_command in store.get_outgoing(
+                    content_item, RelationshipType.HAS_COMMAND
+                )
+            ]
+            for target in targets:
+                for relationship in store.get_incoming(target):
+                    if not is_in_pack(relationship.start_node, pack):
+                        preserve(relationship)
+    for node in list(store.nodes.values()):
+        if node.get("object_id") not in pack_ids_set:
+            continue
+        for relationship in store.get_incoming(node):
+            if not (
+                relationship.type == RelationshipType.IN_PACK
+                and relationship.end_node is node
+            ) and not is_in_pack(relationship.start_node, node):
+                preserve(relationship)
+    return list(preserved.values())
+
+
+def remove_packs_before_creation(store: NativeGraphStore, pack_ids: List[str]) -> None:
+    """Removes the packs, their content items and their commands before recreating them."""
+    pack_ids_set = set(pack_ids)
+    packs = [
+        pack
+        for pack in store.find_nodes(ContentType.PACK)
+        if pack.get("object_id") in pack_ids_set
+    ]
+    for pack in packs:
+        for in_pack in list(store.get_incoming(pack, RelationshipType.IN_PACK)):
+            for has_command in list(
+                store.get_outgoing(in_pack.start_node, RelationshipType.HAS_COMMAND)
+            ):
+                command = has_command.end_node
+                # keep commands of integrations from other packs
+                if not any(
+                    other_pack.get("object_id") not in pack_ids_set
+                    for rel in store.get_incoming(command, RelationshipType.HAS_COMMAND)
+                    for other_pack in _in_pack(store, rel.start_node)
+                ):
+                    store.delete_node(command)
+    for pack in packs:
+        content_items = [
+            in_pack.start_node
+            for in_pack in store.get_incoming(pack, RelationshipType.IN_PACK)
+        ]
+        if content_items:
+            for content_item in content_items:
+                store.delete_node(content_item)
+            store.delete_node(pack)
+
+
+def return_preserved_relationships(
+    store: NativeGraphStore, rels_to_preserve: List[Dict[str, Any]]
+) -> None:
+    """Recreates the preserved relationships from the same source nodes (same object_id and content_type)."""
+    for rel_data in rels_to_preserve:
+        source = store.nodes.get(rel_data["source_id"])
+        if (
+            not source
+            or source.get("object_id") != rel_data["source"].get("object_id")
+            or source.get("content_type") != rel_data["source"].get("content_type")
+        ):
+            continue
+        for target in store.find_nodes(
+            object_id=rel_data["target"].get("object_id"),
+            content_type=rel_data["target"].get("content_type"),
+        ):
+            store.create_relationship(
+                rel_data["r_type"], source, target, rel_data["r_properties"]
+            )
+
+
+def remove_orphan_commands(store: NativeGraphStore, command_ids: List[str]) -> None:
+    """Removes commands which are no longer implemented by any integration."""
+    command_ids_set = set(command_ids)
+    for command in store.find_nodes(ContentType.COMMAND):
+        if command.get("object_id") in command_ids_set and not any(
+            store.get_incoming(command, RelationshipType.HAS_COMMAND)
+        ):
+            store.delete_node(command)
+
+
+def remove_nodes(store: NativeGraphStore, content_type_to_identifiers: dict) -> None:
+    """Removes the nodes of the given identifiers which are not in the repository."""
+    for content_type, content_items_identifiers in content_type_to_identifiers.items():
+        label = (
+            ContentType.COMMAND_OR_SCRIPT
+            if content_type in [ContentType.COMMAND, ContentType.SCRIPT]
+            else ContentType.BASE_NODE
+        )
+        identifiers = {c.lower() for c in content_items_identifiers}
+        for node in list(store.nodes.values()):
+            if (
+                (label in node.labels or node.get("content_type") == content_type)
+                and node.get("not_in_repository") is True
+                and any(
+                    isinstance(identifier, str) and identifier.lower() in identifiers
+                    for identifier in (node.get("object_id"), node.get("name"))
+                )
+            ):
+                store.delete_node(node)
+
+
+def remove_server_nodes(store: NativeGraphStore) -> None:
+    remove_nodes(store, get_server_content_items())
+
+
+def remove_content_private_nodes(store: NativeGraphStore) -> None:
+    remove_nodes(store, CONTENT_PRIVATE_ITEMS)
+
+
+def merge_duplicate_commands(store: NativeGraphStore) -> None:
+    """Merges possible duplicate command nodes after import."""
+    commands_by_id: Dict[str, List[NativeNode]] = defaultdict(list)
+    for command in store.find_nodes(ContentType.COMMAND):
+        commands_by_id[command.get("object_id")].append(command)
+    for commands in commands_by_id.values():
+        if len(commands) > 1:
+            store.merge_nodes(commands, combine=True)
+
+
+def merge_duplicate_content_items(store: NativeGraphStore) -> None:
+    """Merges the nodes which are not in the repository into their equivalent repository nodes after import."""
+    for node in store.find_nodes(ContentType.BASE_NODE, not_in_repository=True):
+        for identifier in ("object_id", "name"):
+            if not (value := node.get(identifier)):
+                continue
+            equivalent = store.find_node(
+                ContentType.BASE_NODE,
+                content_type=node.get("content_type"),
+                not_in_repository=False,
+                **{identifier: value},
+            )
+            if equivalent:
+                store.merge_nodes([equivalent, node], combine=False)
+                break
+
+
+def _matches_property(node: NativeNode, key: str, value: Any) -> bool:
+    node_value = node.get(key)
+    if isinstance(value, Path):
+        value = str(value)
+    if not isinstance(value, (str, bool, int, float)) and isinstance(value, Iterable):
+        return node_value in list(value)
+    if isinstance(node_value, list):
+        return value in node_value
+    return node_value == value
+
+
+def match(
+    store: NativeGraphStore,
+    marketplace: Optional[MarketplaceVersions] = None,
+    content_type: ContentType = ContentType.BASE_NODE,
+    ids_list: Optional[Iterable[str]] = None,
+    **properties,
+) -> List[NativeNode]:
+    """Matches nodes by their content type, their ids and their properties (`_match`)."""
+    if marketplace:
+        properties["marketplaces"] = marketplace.value
+    ids = set(ids_list) if ids_list else None
+    indexed_properties = {
+        k: v
+        for k, v in properties.items()
+        if k in ("object_id", "name", "cli_name", "path", "content_type")
+        and isinstance(v, (str, Path))
+    }
+    return [
+        node
+        for node in store.find_nodes(content_type, **indexed_properties)
+        if (ids is None or node.element_id in ids)
+        and all(_matches_property(node, k, v) for k, v in properties.items())
+    ]
+
+
+def match_relationships(
+    store: NativeGraphStore,
+    ids_list: Iterable[str],
+    marketplace: Optional[MarketplaceVersions] = None,
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Matches the relationships of the given nodes in both directions (`_match_relationships`)."""
+    rows = []
+    for element_id in ids_list or ():
+        if not (node_from := store.nodes.get(element_id)):
+            continue
+        for relationship in store.get_relationships(node_from):
+            node_to = (
+                relationship.end_node
+                if relationship.start_node is node_from
+                else relationship.start_node
+            )
+            if marketplace and not (
+                marketplace in (node_from.get("marketplaces") or [])
+                and marketplace in (node_to.get("marketplaces") or [])
+            ):
+                continue
+            rows.append((node_from, relationship, node_to))
+    return _group_results(rows)
+
+
+def get_schema(store: NativeGraphStore) -> dict:
+    schema: Dict[str, Set[str]] = defaultdict(set)
+    for node in store.nodes.values():
+        for label in node.labels:
+            schema[label].update(node.properties)
+    for relationship in store.relationships.values():
+        schema[relationship.type].update(relationship.properties)
+    return {label: sorted(properties) for label, properties in schema.items()}
+
+
+# Relationships
+
+
+def _match_sources(
+    store: NativeGraphStore,
+    rel_data: Dict[str, Any],
+    label: str = ContentType.BASE_NODE,
+) -> List[NativeNode]:
+    properties = {
+        "object_id": rel_data.get("source_id"),
+        "content_type": rel_data.get("source_type"),
+        "fromversion": rel_data.get("source_fromversion"),
+    }
+    marketplaces = rel_data.get("source_marketplaces")
+    if marketplaces is None or any(value is None for value in properties.values()):
+        # matching by a null property never matches
+        return []
+    marketplaces = list(marketplaces)
+    return [
+        node
+        for node in store.find_nodes(label, **properties)
+        if node.get("marketplaces") == marketplaces
+    ]
+
+
+def _merge_node(
+    store: NativeGraphStore,
+    content_type: ContentType,
+    match_properties: Dict[str, Any],
+    create_properties: Dict[str, Any],
+    labels: Optional[Iterable[str]] = None,
+) -> List[Tuple[NativeNode, bool]]:
+    """Returns the nodes matching the properties, or a new node if none match, as `MERGE` does."""
+    if nodes := store.find_nodes(content_type, **match_properties):
+        return [(node, False) for node in nodes]
+    return [(store.create_node(content_type, create_properties, labels), True)]
+
+
+def create_has_command_relationships(
+    store: NativeGraphStore, data: List[Dict[str, Any]]
+) -> None:
+    for rel_data in data:
+        for integration in _match_sources(store, rel_data, ContentType.INTEGRATION):
+            for command, created in _merge_node(
+                store,
+                ContentType.COMMAND,
+                {
+                    "object_id": rel_data.get("target"),
+                    "content_type": rel_data.get("target_type"),
+                },
+                {
+                    "object_id": rel_data.get("target"),
+                    "content_type": rel_data.get("target_type"),
+                    "marketplaces": list(rel_data.get("source_marketplaces") or []),
+                    "name": rel_data.get("name"),
+                    "not_in_repository": False,
+                },
+            ):
+                if not created:
+                    marketplaces = list(command.get("marketplaces") or [])
+                    marketplaces.extend(
+                        marketplace
+                        for marketplace in rel_data.get("source_marketplaces") or []
+                        if marketplace not in marketplaces
+                    )
+                    store.update_node_properties(
+                        command, {"marketplaces": marketplaces}
+                    )
+                properties = {
+                    "deprecated": rel_data.get("deprecated"),
+                    "description": rel_data.get("description"),
+                }
+                if not store.has_relationship(
+                    RelationshipType.HAS_COMMAND, integration, command, **properties
+                ):
+                    store.create_relationship(
+                        RelationshipType.HAS_COMMAND, integration, command, properties
+                    )
+
+
+def create_uses_relationships(
+    store: NativeGraphStore, data: List[Dict[str, Any]], target_identifier: str
+) -> None:
+    """Creates USES relationships between parsed nodes.
+    If a target node is created, it means the node does not exist in the repository.
+    """
+    for rel_data in data:
+        sources = _match_sources(store, rel_data)
+        if not sources:
+            continue
+        target_type = ContentType(rel_data["target_type"])
+        targets = _merge_node(
+            store,
+            target_type,
+            {target_identifier: rel_data.get("target")},
+            {
+                "not_in_repository": True,
+                "object_id": rel_data.get("target"),
+                "name": rel_data.get("target"),
+                "cli_name": rel_data.get("target"),
+                "content_type": target_type,
+            },
+            labels=[target_type, ContentType.BASE_NODE],
+        )
+        has_existing_target = any(
+            node.get("not_in_repository") is False
+            for node in store.find_nodes(
+                target_type, **{target_identifier: rel_data.get("target")}
+            )
+        )
+        for source in sources:
+            for target, _ in targets:
+                # create a relationship to a node which is not in the repository
+                # only if there is no equivalent node in the repository
+                if has_existing_target and target.get("not_in_repository") is not False:
+                    continue
+                relationship, created = store.merge_relationship(
+                    RelationshipType.USES, source, target
+                )
+                mandatorily = rel_data.get("mandatorily")
+                relationship.set(
+                    "mandatorily",
+                    mandatorily
+                    if created
+                    else bool(relationship.get("mandatorily") or mandatorily),
+                )
+
+
+def create_in_pack_relationships(
+    store: NativeGraphStore, data: List[Dict[str, Any]]
+) -> None:
+    for rel_data in data:
+        packs = store.find_nodes(ContentType.PACK, object_id=rel_data.get("target"))
+        for content_item in _match_sources(store, rel_data):
+            for pack in packs:
+                store.merge_relationship(RelationshipType.IN_PACK, content_item, pack)
+
+
+def create_tested_by_relationships(
+    store: NativeGraphStore, data: List[Dict[str, Any]]
+) -> None:
+    for rel_data in data:
+        sources = _match_sources(store, rel_data)
+        if not sources:
+            continue
+        test_playbooks = _merge_node(
+            store,
+            ContentType.TEST_PLAYBOOK,
+            {"object_id": rel_data.get("target")},
+            {"object_id": rel_data.get("target"), "not_in_repository": True},
+        )
+        for content_item in sources:
+            for test_playbook, _ in test_playbooks:
+                store.merge_relationship(
+                    RelationshipType.TESTED_BY, content_item, test_playbook
+                )
+
+
+def create_depends_on_relationships_from_metadata(
+    store: NativeGraphStore, data: List[Dict[str, Any]]
+) -> None:
+    for rel_data in data:
+        if rel_data.get("source") is None or rel_data.get("target") is None:
+            continue
+        for pack_a in store.find_nodes(ContentType.PACK, object_id=rel_data["source"]):
+            for pack_b in store.find_nodes(
+                ContentType.PACK, object_id=rel_data["target"]
+            ):
+                store.create_relationship(
+                    RelationshipType.DEPENDS_ON,
+                    pack_a,
+                    pack_b,
+                    {
+                        "mandatorily": rel_data.get("mandatorily"),
+                        "from_metadata": True,
+                        "is_test": False,
+                    },
+                )
+
+
+def create_default_relationships(
+    store: NativeGraphStore, relationship: RelationshipType, data: List[Dict[str, Any]]
+) -> None:
+    for rel_data in data:
+        sources = _match_sources(store, rel_data)
+        if not sources:
+            continue
+        targets = _merge_node(
+            store,
+            ContentType.BASE_NODE,
+            {"object_id": rel_data.get("target")},
+            {
+                "object_id": rel_data.get("target"),
+                "name": rel_data.get("target"),
+                "not_in_repository": True,
+            },
+            labels=[ContentType.BASE_NODE],
+        )
+        for source in sources:
+            for target, _ in targets:
+                store.merge_relationship(relationship, source, target)
+
+
+def create_relationships(
+    store: NativeGraphStore,
+    relationships: Dict[RelationshipType, List[Dict[str, Any]]],
+) -> None:
+    if relationships.get(RelationshipType.HAS_COMMAND):
+        data = relationships.pop(RelationshipType.HAS_COMMAND)
+        create_relationships_by_type(store, RelationshipType.HAS_COMMAND, data)
+
+    for relationship, data in relationships.items():
+        create_relationships_by_type(store, relationship, data)
+
+
+def create_relationships_by_type(
+    store: NativeGraphStore,
+    relationship: RelationshipType,
+    data: List[Dict[str, Any]],
+) -> None:
+    if relationship == RelationshipType.HAS_COMMAND:
+        create_has_command_relationships(store, data)
+    elif relationship in USES_TARGET_IDENTIFIERS:
+        create_uses_relationships(store, data, USES_TARGET_IDENTIFIERS[relationship])
+    elif relationship == RelationshipType.IN_PACK:
+        create_in_pack_relationships(store, data)
+    elif relationship == RelationshipType.TESTED_BY:
+        create_tested_by_relationships(store, data)
+    elif relationship == RelationshipType.DEPENDS_ON:
+        create_depends_on_relationships_from_metadata(store, data)
+    else:
+        create_default_relationships(store, relationship, data)
+    logger.debug(f"Merged relationships of type {relationship}.")
+
+
+def remove_outgoing_relationships_by_path(
+    store: NativeGraphStore, file_paths: List[str]
+) -> List[str]:
+    """Removes the outgoing relationships of the content items in the given paths, before recreating them.
+
+    Returns:
+        List[str]: The IDs of the commands of the content items, which may become orphans.
+    """
+    command_ids: List[str] = []
+    for path in set(file_paths):
+        for node in store.find_nodes(path=path):
+            for relationship in list(store.get_outgoing(node)):
+                if (
+                    relationship.type == RelationshipType.HAS_COMMAND
+                    and relationship.end_node.get("object_id") not in command_ids
+                ):
+                    command_ids.append(relationship.end_node.get("object_id"))
+                store.delete_relationship(relationship)
+    return command_ids
+
+
+def _node_summary(node: NativeNode) -> Dict[str, Any]:
+    return {
+        "path": node.get("path"),
+        "name": node.get("name"),
+        "object_id": node.get("object_id"),
+        "content_type": node.get("content_type"),
+    }
+
+
+def _expand_paths(
+    store: NativeGraphStore,
+    start: NativeNode,
+    relationship_type: RelationshipType,
+    content_type: ContentType,
+    depth: int,
+    incoming: bool,
+) -> Iterator[Tuple[List[NativeNode], List[NativeRelationship]]]:
+    """Yields the paths from the start node by the relationship type, of length 1 to depth,
+    ending at a node of the content type, without visiting a node twice in a path.
+    As `apoc.path.expandConfig`, the paths are expanded breadth first, so shorter paths are yielded first.
+    """
+    queue: Deque[Tuple[List[NativeNode], List[NativeRelationship]]] = deque(
+        [([start], [])]
+    )
+    while queue:
+        nodes, relationships = queue.popleft()
+        if len(relationships) >= depth:
+            continue
+        neighbours = (
+            store.get_incoming(nodes[-1], relationship_type)
+            if incoming
+            else store.get_outgoing(nodes[-1], relationship_type)
+        )
+        for relationship in neighbours:
+            node = relationship.start_node if incoming else relationship.end_node
+            if any(node is visited for visited in nodes):
+                continue
+            path = (nodes + [node], relationships + [relationship])
+            if content_type == ContentType.BASE_NODE or content_type in node.labels:
+                yield path
+            queue.append(path)
+
+
+def _get_relationships_by_path(
+    store: NativeGraphStore,
+    path: Path,
+    relationship: RelationshipType,
+    content_type: ContentType,
+    depth: int,
+    marketplace: MarketplaceVersions,
+    mandatory_only: bool,
+    include_tests: bool,
+    include_deprecated: bool,
+    include_hidden: bool,
+    *,
+    is_source: bool,
+) -> List[Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    endpoints: Dict[str, NativeNode] = {}
+    for start in store.find_nodes(path=str(path)):
+        for nodes, rels in _expand_paths(
+            store, start, relationship, content_type, depth, incoming=is_source
+        ):
+            if is_source:
+                # the paths are found in reversed order, so we fix this here
+                nodes, rels = nodes[::-1], rels[::-1]
+            endpoint = nodes[0] if is_source else nodes[-1]
+            rels_properties = [dict(r.properties) for r in rels]
+            if all(r.get("mandatorily") is True for r in rels_properties):
+                mandatorily: Optional[bool] = True
+            elif any(r.get("mandatorily") is not None for r in rels_properties):
+                mandatorily = False
+            else:
+                mandatorily = None
+            is_test = any(r.get("is_test") for r in rels_properties)
+            if (
+                endpoint.get("path") is None
+                or not all(marketplace in (n.get("marketplaces") or []) for n in nodes)
+                or (not include_tests and is_test)
+                or (not include_deprecated and any(n.get("deprecated") for n in nodes))
+                or (not include_hidden and any(n.get("hidden") for n in nodes))
+                or (mandatory_only and not mandatorily)
+            ):
+                continue
+            full_path: List[Dict[str, Any]] = [_node_summary(nodes[0])]
+            for rel_properties, node in zip(rels_properties, nodes[1:]):
+                full_path.extend((rel_properties, _node_summary(node)))
+            result = results.setdefault(
+                endpoint.element_id,
+                {
+                    "object_id": endpoint.get("object_id"),
+                    "name": endpoint.get("name"),
+                    "content_type": endpoint.get("content_type"),
+                    "filepath": endpoint.get("path"),
+                    "is_source": is_source,
+                    "paths": [],
+                    "minDepth": len(rels),
+                },
+            )
+            endpoints[endpoint.element_id] = endpoint
+            result["minDepth"] = min(result["minDepth"], len(rels))
+            result["paths"].append(
+                {
+                    "path": full_path,
+                    "mandatorily": mandatorily,
+                    "depth": len(rels),
+                    "is_test": is_test,
+                }
+            )
+    for result in results.values():
+        paths_mandatorily = [p["mandatorily"] for p in result["paths"]]
+        if any(paths_mandatorily):
+            result["mandatorily"] = True
+        elif all(m is not None for m in paths_mandatorily):
+            result["mandatorily"] = False
+        else:
+            result["mandatorily"] = None
+    return sorted(
+        results.values(),
+        key=lambda r: (str(r["content_type"]), str(r["object_id"])),
+    )
+
+
+def get_sources_by_path(store: NativeGraphStore, *args) -> List[Dict[str, Any]]:
+    """Returns all paths to a given node by relationship type and depth."""
+    return _get_relationships_by_path(store, *args, is_source=True)
+
+
+def get_targets_by_path(store: NativeGraphStore, *args) -> List[Dict[str, Any]]:
+    """Returns all paths from a given node by relationship type and depth."""
+    return _get_relationships_by_path(store, *args, is_source=False)
+
+
+# Dependencies
+
+
+def get_all_level_packs_relationships(
+    store: NativeGraphStore,
+    relationship_type: RelationshipType,
+    ids_list: Iterable[str],
+    marketplace: Optional[MarketplaceVersions],
+    mandatorily: bool = False,
+) -> Dict[str, List[NativeNode]]:
+    """Returns the nodes reachable from every node by the relationship type, up to MAX_DEPTH (shortest paths).
+    DEPENDS_ON relationships are followed from packs to the packs they depend on, through non-test relationships
+    of packs in the marketplace, and IMPORTS relationships are followed to the nodes which import the node.
+    """
+    results: Dict[str, List[NativeNode]] = {}
+    for element_id in ids_list:
+        if not (node_from := store.nodes.get(element_id)):
+            continue
+        if relationship_type == RelationshipType.DEPENDS_ON and marketplace not in (
+            node_from.get("marketplaces") or []
+        ):
+            continue
+        visited = {node_from.element_id}
+        frontier = [node_from]
+        nodes_to: List[NativeNode] = []
+        for _ in range(MAX_DEPTH):
+            next_frontier = []
+            for node in frontier:
+                if relationship_type == RelationshipType.IMPORTS:
+                    neighbours = [
+                        r.start_node
+                        for r in store.get_incoming(node, relationship_type)
+                    ]
+                else:
+                    neighbours = [
+                        r.end_node
+                        for r in store.get_outgoing(node, relationship_type)
+                        if not r.get("is_test")
+                        and (not mandatorily or r.get("mandatorily") is True)
+                        and ContentType.PACK in r.end_node.labels
+                        and marketplace in (r.end_node.get("marketplaces") or [])
+                    ]
+                for neighbour in neighbours:
+                    if neighbour.element_id not in visited:
+                        visited.add(neighbour.element_id)
+                        next_frontier.append(neighbour)
+                        nodes_to.append(neighbour)
+            frontier = next_frontier
+        if nodes_to:
+            results[element_id] = nodes_to
+    logger.debug("Found dependencies.")
+    return results
+
+
+def remove_existing_depends_on_relationships(store: NativeGraphStore) -> None:
+    for relationship in store.iter_relationships(RelationshipType.DEPENDS_ON):
+        if relationship.get("from_metadata") is False:
+            store.delete_relationship(relationship)
+
+
+def update_uses_for_integration_commands(store: NativeGraphStore) -> None:
+    """Creates USES relationships between content items and integrations, based on the commands they use.
+    The mandatorily property is the command's one if only one integration implements the command, otherwise false.
+    """
+    rows = []
+    implementations_by_command: Dict[str, Set[str]] = defaultdict(set)
+    for command in store.find_nodes(ContentType.COMMAND):
+        if command.get("object_id") in GENERIC_COMMANDS_NAMES:
+            continue
+        for uses in store.get_incoming(command, RelationshipType.USES):
+            for has_command in store.get_incoming(
+                command, RelationshipType.HAS_COMMAND
+            ):
+                integration = has_command.start_node
+                if ContentType.INTEGRATION not in integration.labels:
+                    continue
+                if is_target_available(uses.start_node, integration):
+                    rows.append((uses.start_node, uses, command, integration))
+                    implementations_by_command[command.element_id].add(
+                        has_command.element_id
+                    )
+    for content_item, uses, command, integration in rows:
+        mandatorily = (
+            uses.get("mandatorily")
+            if len(implementations_by_command[command.element_id]) == 1
+            else False
+        )
+        relationship, created = store.merge_relationship(
+            RelationshipType.USES, content_item, integration
+        )
+        relationship.set(
+            "mandatorily",
+            mandatorily
+            if created
+            else bool(relationship.get("mandatorily") or mandatorily),
+        )
+
+
+def delete_deprecatedcontent_relationship(store: NativeGraphStore) -> None:
+    """Deletes USES relationships to content items under the DeprecatedContent pack,
+    which we do not want to consider in the dependency calculation.
+    """
+    for pack in store.find_nodes(ContentType.PACK, object_id=DEPRECATED_CONTENT_PACK):
+        for in_pack in list(store.get_incoming(pack, RelationshipType.IN_PACK)):
+            for uses in list(
+                store.get_incoming(in_pack.start_node, RelationshipType.USES)
+            ):
+                store.delete_relationship(uses)
+
+
+def create_depends_on_relationships(store: NativeGraphStore) -> dict:
+    outputs: Dict[str, Dict[str, list]] = {}
+    for uses in store.iter_relationships(RelationshipType.USES):
+        a, b = uses.start_node, uses.end_node
+        for pack_a in _in_pack(store, a):
+            for pack_b in _in_pack(store, b):
+                if (
+                    pack_a is pack_b
+                    or not intersects(
+                        pack_a.get("marketplaces"), pack_b.get("marketplaces")
+                    )
+                    or pack_b.get("object_id")
+                    in (pack_a.get("excluded_dependencies") or [])
+                    or pack_a.get("name") in IGNORED_PACKS_IN_DEPENDENCY_CALC
+                    or pack_b.get("name") in IGNORED_PACKS_IN_DEPENDENCY_CALC
+                ):
+                    continue
+                dependencies = [
+                    r
+                    for r in store.get_outgoing(pack_a, RelationshipType.DEPENDS_ON)
+                    if r.end_node is pack_b
+                ]
+                if not dependencies:
+                    store.create_relationship(
+                        RelationshipType.DEPENDS_ON,
+                        pack_a,
+                        pack_b,
+                        {
+                            "is_test": a.get("is_test"),
+                            "from_metadata": False,
+                            "mandatorily": uses.get("mandatorily"),
+                        },
+                    )
+                for dependency in dependencies:
+                    dependency.properties["is_test"] = bool(
+                        dependency.get("is_test") and a.get("is_test")
+                    )
+                    if not dependency.get("from_metadata"):
+                        dependency.properties["mandatorily"] = bool(
+                            uses.get("mandatorily") or dependency.get("mandatorily")
+                        )
+                outputs.setdefault(pack_a.get("object_id"), {}).setdefault(
+                    pack_b.get("object_id"), []
+                ).append(
+                    {
+                        "source": a.get("node_id"),
+                        "target": b.get("node_id"),
+                        "mandatorily": uses.get("mandatorily"),
+                        "is_test": a.get("is_test"),
+                    }
+                )
+
+    if (artifacts_folder := os.getenv("ARTIFACTS_FOLDER")) and Path(
+        artifacts_folder
+    ).exists():
+        with open(f"{artifacts_folder}/depends_on.json", "w") as fp:
+            json.dump(outputs, fp, indent=4)
+    return outputs
+
+
+def create_pack_dependencies(store: NativeGraphStore) -> dict:
+    remove_existing_depends_on_relationships(store)
+    update_uses_for_integration_commands(store)
+    delete_deprecatedcontent_relationship(store)
+    return create_depends_on_relationships(store)
+
+
+# Validations
+
+
+def validate_unknown_content(
+    store: NativeGraphStore, file_paths: List[str]
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns USES relationships to content items not in the repository."""
+    paths = set(file_paths)
+    return _group_results(
+        (uses.start_node, uses, uses.end_node)
+        for uses in store.iter_relationships(RelationshipType.USES)
+        if uses.start_node.get("deprecated") is False
+        and uses.end_node.get("not_in_repository") is True
+        and (not paths or uses.start_node.get("path") in paths)
+    )
+
+
+def _filter_uses_with_alternatives(
+    store: NativeGraphStore,
+    rows: Iterable[Tuple[NativeNode, NativeRelationship, NativeNode]],
+    is_valid_alternative: Callable[[NativeNode, NativeNode], bool],
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Filters out the USES relationships of content items which mandatorily use a valid alternative target
+    (a node with the same object_id and content type).
+    """
+
+    def uses_alternative(
+        content_item_from: NativeNode, alternative: NativeNode
+    ) -> bool:
+        return store.has_relationship(
+            RelationshipType.USES, content_item_from, alternative, mandatorily=True
+        )
+
+    filtered_rows = []
+    for content_item_from, relationship, node_to in rows:
+        alternatives = [
+            alternative
+            for alternative in store.find_nodes(
+                object_id=node_to.get("object_id"),
+                content_type=node_to.get("content_type"),
+            )
+            if alternative is not node_to
+            and is_valid_alternative(content_item_from, alternative)
+        ]
+        if not alternatives or any(
+            not uses_alternative(content_item_from, alternative)
+            for alternative in alternatives
+        ):
+            filtered_rows.append((content_item_from, relationship, node_to))
+    return _group_results(filtered_rows)
+
+
+def _iter_mandatory_uses(
+    store: NativeGraphStore,
+) -> Iterator[Tuple[NativeNode, NativeRelationship, NativeNode]]:
+    for uses in store.iter_relationships(RelationshipType.USES):
+        if (
+            uses.get("mandatorily") is True
+            and uses.start_node.get("deprecated") is False
+        ):
+            yield uses.start_node, uses, uses.end_node
+
+
+def validate_fromversion(
+    store: NativeGraphStore, file_paths: List[str], for_supported_versions: bool
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns the USES relationships where the target's fromversion is higher than the source's."""
+    paths = set(file_paths)
+    general_default = versioned(GENERAL_DEFAULT_FROMVERSION)
+    op = _ge if for_supported_versions else _lt
+    rows = [
+        (content_item_from, uses, n)
+        for content_item_from, uses, n in _iter_mandatory_uses(store)
+        if content_item_from.get("is_test") is False
+        and _lt(
+            versioned(content_item_from.get("fromversion")),
+            versioned(n.get("fromversion")),
+        )
+        and op(versioned(n.get("fromversion")), general_default)
+        and n.get("fromversion") is not None
+        and n.get("fromversion") != DEFAULT_CONTENT_ITEM_FROM_VERSION
+        and (
+            not paths
+            or content_item_from.get("path") in paths
+            or n.get("path") in paths
+        )
+    ]
+    return _filter_uses_with_alternatives(
+        store,
+        rows,
+        lambda content_item_from, n2: _ge(
+            versioned(content_item_from.get("fromversion")),
+            versioned(n2.get("fromversion")),
+        ),
+    )
+
+
+def validate_toversion(
+    store: NativeGraphStore, file_paths: List[str], for_supported_versions: bool
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns the USES relationships where the target's toversion is lower than the source's."""
+    paths = set(file_paths)
+    general_default = versioned(GENERAL_DEFAULT_FROMVERSION)
+    op = _ge if for_supported_versions else _lt
+    rows = [
+        (content_item_from, uses, n)
+        for content_item_from, uses, n in _iter_mandatory_uses(store)
+        if _gt(
+            versioned(content_item_from.get("toversion")),
+            versioned(n.get("toversion")),
+        )
+        and op(versioned(content_item_from.get("toversion")), general_default)
+        and (
+            not paths
+            or content_item_from.get("path") in paths
+            or n.get("path") in paths
+        )
+    ]
+    return _filter_uses_with_alternatives(
+        store,
+        rows,
+        lambda content_item_from, n2: _le(
+            versioned(content_item_from.get("toversion")),
+            versioned(n2.get("toversion")),
+        ),
+    )
+
+
+def validate_marketplaces(
+    store: NativeGraphStore, pack_ids: List[str]
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns the USES relationships where the target's marketplaces don't include all of the source's marketplaces."""
+    ids = set(pack_ids)
+
+    def supports_all_marketplaces(
+        content_item_from: NativeNode, node: NativeNode
+    ) -> bool:
+        return set(content_item_from.get("marketplaces") or []).issubset(
+            node.get("marketplaces") or []
+        )
+
+    rows = []
+    for content_item_from, uses, n in _iter_mandatory_uses(store):
+        if content_item_from.get("is_test") or supports_all_marketplaces(
+            content_item_from, n
+        ):
+            continue
+        for p1 in _in_pack(store, content_item_from):
+            for p2 in _in_pack(store, n):
+                if not ids or p1.get("object_id") in ids or p2.get("object_id") in ids:
+                    rows.append((content_item_from, uses, n))
+    return _filter_uses_with_alternatives(store, rows, supports_all_marketplaces)
+
+
+def validate_multiple_packs_with_same_display_name(
+    store: NativeGraphStore, file_paths: List[str]
+) -> List[Tuple[str, List[str]]]:
+    """Returns all the packs that have the same name but different id."""
+    paths = set(file_paths)
+    packs = store.find_nodes(ContentType.PACK)
+    results = []
+    for a in packs:
+        if paths and a.get("path") not in paths:
+            continue
+        if same_name := [
+            b.get("object_id")
+            for b in packs
+            if b is not a
+            and b.get("name") is not None
+            and b.get("name") == a.get("name")
+        ]:
+            results.append((a.get("object_id"), same_name))
+    return results
+
+
+def validate_multiple_script_with_same_name(
+    store: NativeGraphStore, file_paths: List[str]
+) -> Dict[str, str]:
+    """Returns the scripts whose name contains 'alert', which have a script named like them with 'incident'."""
+    paths = set(file_paths)
+    scripts = [
+        script
+        for script in store.find_nodes(ContentType.SCRIPT)
+        if MarketplaceVersions.MarketplaceV2 in (script.get("marketplaces") or [])
+    ]
+    content_item_names_and_paths = {
+        # replace the name of the script.
+        replace_alert_to_incident(script.get("name")): script.get("path")
+        for script in scripts
+        if "alert" in (script.get("name") or "").lower()
+        and (not paths or script.get("path") in paths)
+    }
+    return {
+        script.get("name"): content_item_names_and_paths[script.get("name")]
+        for script in scripts
+        if script.get("name") in content_item_names_and_paths
+        and "script-name-incident-to-alert" not in (script.get("skip_prepare") or [])
+    }
+
+
+def _iter_mandatory_pack_dependencies(
+    store: NativeGraphStore,
+) -> Iterator[Tuple[NativeNode, NativeRelationship, NativeNode]]:
+    for depends_on in store.iter_relationships(RelationshipType.DEPENDS_ON):
+        if depends_on.get("mandatorily") is True and depends_on.get("is_test") is False:
+            yield depends_on.start_node, depends_on, depends_on.end_node
+
+
+def validate_core_packs_dependencies(
+    store: NativeGraphStore,
+    pack_ids: List[str],
+    marketplace: MarketplaceVersions,
+    core_pack_list: List[str],
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns DEPENDS_ON relationships to packs which are not core packs."""
+    return _group_results(
+        (pack1, depends_on, pack2)
+        for pack1, depends_on, pack2 in _iter_mandatory_pack_dependencies(store)
+        if pack1.get("object_id") in pack_ids
+        and pack2.get("object_id") not in core_pack_list
+        and marketplace in (pack1.get("marketplaces") or [])
+        and marketplace in (pack2.get("marketplaces") or [])
+    )
+
+
+def validate_hidden_pack_dependencies(
+    store: NativeGraphStore, pack_ids: List[str]
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns DEPENDS_ON relationships to packs which are hidden."""
+    ids = set(pack_ids)
+    return _group_results(
+        (pack1, depends_on, pack2)
+        for pack1, depends_on, pack2 in _iter_mandatory_pack_dependencies(store)
+        if pack2.get("hidden") is True
+        and (not ids or pack1.get("object_id") in ids or pack2.get("object_id") in ids)
+        and pack1.get("hidden") is False
+        and pack1.get("deprecated") is False
+    )
+
+
+def validate_duplicate_ids(
+    store: NativeGraphStore, file_paths: List[str]
+) -> List[Tuple[NativeNode, List[NativeNode]]]:
+    """Returns the content items with the same id and content type, which are available to each other."""
+    paths = set(file_paths)
+    results = []
+    for content_item in list(store.nodes.values()):
+        if paths and content_item.get("path") not in paths:
+            continue
+        if content_item.get("object_id") is None:
+            continue
+        if duplicates := [
+            duplicate
+            for duplicate in store.find_nodes(
+                object_id=content_item.get("object_id"),
+                content_type=content_item.get("content_type"),
+            )
+            if duplicate is not content_item
+            and is_target_available(content_item, duplicate)
+        ]:
+            results.append((content_item, duplicates))
+    return results
+
+
+def validate_test_playbook_in_use(
+    store: NativeGraphStore,
+    test_playbook_ids: List[str],
+    test_playbooks_ids_to_skip: List[str],
+) -> List[NativeNode]:
+    """Returns the test playbooks of xsoar supported packs which are not used to test any content item."""
+    return [
+        test_playbook
+        for test_playbook in store.find_nodes(ContentType.TEST_PLAYBOOK)
+        if (
+            not test_playbook_ids or test_playbook.get("object_id") in test_playbook_ids
+        )
+        and not any(store.get_incoming(test_playbook, RelationshipType.TESTED_BY))
+        and test_playbook.get("deprecated") is False
+        and test_playbook.get("object_id") not in test_playbooks_ids_to_skip
+        and any(
+            pack.get("support") == "xsoar" and pack.get("deprecated") is False
+            for pack in _in_pack(store, test_playbook)
+            if ContentType.PACK in pack.labels
+        )
+    ]
+
+
+def get_items_using_deprecated_commands(
+    store: NativeGraphStore, file_paths: List[str]
+) -> List[Dict[str, Any]]:
+    paths = set(file_paths)
+    results: Dict[str, Dict[str, Any]] = {}
+    for command in store.find_nodes(ContentType.COMMAND):
+        has_commands = [
+            r
+            for r in store.get_incoming(command, RelationshipType.HAS_COMMAND)
+            if ContentType.INTEGRATION in r.start_node.labels
+        ]
+        for deprecated in has_commands:
+            if deprecated.get("deprecated") is not True:
+                continue
+            i = deprecated.start_node
+            # the command is not implemented by another integration which is not deprecated
+            if any(
+                r.start_node is not i and r.get("deprecated") is False
+                for r in has_commands
+            ):
+                continue
+            for uses in store.get_incoming(command, RelationshipType.USES):
+                p = uses.start_node
+                if p.get("deprecated") is not False or p.get("is_test"):
+                    continue
+                if paths and not (p.get("path") in paths or i.get("path") in paths):
+                    continue
+                result = results.setdefault(
+                    command.element_id,
+                    {
+                        "deprecated_command": command.get("object_id"),
+                        "deprecated_content_type": command.get("content_type"),
+                        "object_using_deprecated": [],
+                    },
+                )
+                result["object_using_deprecated"].append(p.get("path"))
+    return list(results.values())
+
+
+def get_items_using_deprecated_content_items(
+    store: NativeGraphStore, file_paths: List[str]
+) -> List[Dict[str, Any]]:
+    paths = set(file_paths)
+    results: Dict[str, Dict[str, Any]] = {}
+    for uses in store.iter_relationships(RelationshipType.USES):
+        p, d = uses.start_node, uses.end_node
+        if (
+            p.get("deprecated") is not False
+            or p.get("is_test")
+            or d.get("deprecated") is not True
+        ):
+            continue
+        # be sure the USES relationship is not because a command, as commands has dedicated query
+        if any(
+            ContentType.COMMAND in r.end_node.labels
+            and store.has_relationship(RelationshipType.HAS_COMMAND, d, r.end_node)
+            for r in store.get_outgoing(p, RelationshipType.USES)
+        ):
+            continue
+        if paths and not (p.get("path") in paths or d.get("path") in paths):
+            continue
+        result = results.setdefault(
+            d.element_id,
+            {
+                "deprecated_content": d.get("object_id"),
+                "deprecated_content_type": d.get("content_type"),
+                "object_using_deprecated": [],
+            },
+        )
+        result["object_using_deprecated"].append(p.get("path"))
+    return list(results.values())
+
+
+def get_items_using_deprecated(
+    store: NativeGraphStore, file_paths: List[str]
+) -> List[Dict[str, Any]]:
+    return get_items_using_deprecated_commands(
+        store, file_paths
+    ) + get_items_using_deprecated_content_items(store, file_paths)
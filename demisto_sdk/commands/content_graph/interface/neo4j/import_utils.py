@@ -5,6 +5,9 @@ from zipfile import ZipFile
 
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.singleton import SingletonMeta
+from demisto_sdk.commands.content_graph.interface.graph_snapshot import (
+    get_snapshot_paths,
+)
 from demisto_sdk.commands.content_graph.neo4j_service import get_neo4j_import_path
 
 GRAPHML_FILE_SUFFIX = ".graphml"
@@ -34,6 +37,9 @@ class Neo4jImportHandler(metaclass=SingletonMeta):
         for file in self.import_path.iterdir():
             Path(file).unlink()
 
+    def get_snapshot_paths(self) -> List[Path]:
+        return get_snapshot_paths(self.import_path)
+
     def get_graphml_filenames(self) -> List[str]:
         return [
             file.name
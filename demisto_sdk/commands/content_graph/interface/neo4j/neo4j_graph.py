@@ -1,5 +1,4 @@
 import os
-from multiprocessing import Pool
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
@@ -8,8 +7,8 @@ from neo4j import Driver, GraphDatabase, Session, graph
 
 import demisto_sdk.commands.content_graph.neo4j_service as neo4j_service
 from demisto_sdk.commands.common.constants import MarketplaceVersions
-from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parse_pool import parse_pool
 from demisto_sdk.commands.common.tools import download_content_graph
 from demisto_sdk.commands.content_graph.common import (
     NEO4J_DATABASE_URL,
@@ -19,7 +18,17 @@ from demisto_sdk.commands.content_graph.common import (
     Neo4jRelationshipResult,
     RelationshipType,
 )
-from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInterface
+from demisto_sdk.commands.content_graph.interface.graph import (
+    ContentGraphInterface,
+    NoModelException,  # noqa: F401
+    _parse_node,
+)
+from demisto_sdk.commands.content_graph.interface.graph_snapshot import (
+    SNAPSHOT_FILE_SUFFIX,
+    GraphSnapshotWriter,
+    NodesBatch,
+    read_graph_snapshot,
+)
 from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
     Neo4jImportHandler,
 )
@@ -32,10 +41,15 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.dependencies imp
     get_all_level_packs_relationships,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.import_export import (
-    export_graphml,
+    await_indexes,
+    create_snapshot_id_index,
+    export_snapshot,
     import_graphml,
+    import_snapshot_nodes,
+    import_snapshot_relationships,
     merge_duplicate_commands,
     merge_duplicate_content_items,
+    remove_snapshot_ids,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.indexes import (
     create_indexes,
@@ -48,9 +62,11 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.nodes import (
     get_schema,
     remove_content_private_nodes,
     remove_empty_properties,
+    remove_orphan_commands,
     remove_packs_before_creation,
     remove_server_nodes,
     return_preserved_relationships,
+    update_content_item_nodes,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.relationships import (
     _match_relationships,
@@ -58,6 +74,7 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.relationships im
     delete_all_graph_relationships,
     get_sources_by_path,
     get_targets_by_path,
+    remove_outgoing_relationships_by_path,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.validations import (
     get_items_using_deprecated,
@@ -72,43 +89,12 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.validations impo
     validate_toversion,
     validate_unknown_content,
 )
-from demisto_sdk.commands.content_graph.objects.base_content import (
-    CONTENT_TYPE_TO_MODEL,
-    BaseNode,
-    UnknownContent,
-)
+from demisto_sdk.commands.content_graph.objects.base_content import BaseNode
 from demisto_sdk.commands.content_graph.objects.integration import Integration
 from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
 
 
-def _parse_node(element_id: str, node: dict) -> BaseNode:
-    """Parses nodes to content objects and adds it to mapping
-
-    Args:
-        nodes (Iterable[graph.Node]): List of nodes to parse
-
-    Raises:
-        NoModelException: If no model found to parse on
-    """
-    obj: BaseNode
-    content_type = node.get("content_type", "")
-    if node.get("not_in_repository"):
-        obj = UnknownContent.parse_obj(node)
-
-    else:
-        model = CONTENT_TYPE_TO_MODEL.get(content_type)
-        if not model:
-            raise NoModelException(f"No model for {content_type}")
-        obj = model.parse_obj(node)
-    obj.database_id = element_id
-    return obj
-
-
-class NoModelException(Exception):
-    pass
-
-
 class Neo4jContentGraphInterface(ContentGraphInterface):
     def __init__(
         self,
@@ -291,7 +277,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             )
             logger.debug("{}", f"{self._id_to_obj=}")  # noqa: PLE1205
             return
-        with Pool(processes=cpu_count()) as pool:
+        with parse_pool() as pool:
             results = pool.starmap(
                 _parse_node, ((node.element_id, dict(node.items())) for node in nodes)
             )
@@ -355,8 +341,9 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         logger.info("Creating graph nodes...")
         pack_ids = [p.get("object_id") for p in nodes.get(ContentType.PACK, [])]
         with self.driver.session() as session:
-            self._rels_to_preserve = session.execute_read(
-                get_relationships_to_preserve, pack_ids
+            # extend rather than override, as nodes may be created in several batches
+            self._rels_to_preserve.extend(
+                session.execute_read(get_relationships_to_preserve, pack_ids)
             )
             session.execute_write(remove_packs_before_creation, pack_ids)
             session.execute_write(create_nodes, nodes)
@@ -606,6 +593,23 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                 session.execute_write(
                     return_preserved_relationships, self._rels_to_preserve
                 )
+                self._rels_to_preserve = []
+
+    def update_content_items(
+        self,
+        nodes: Dict[ContentType, List[Dict[str, Any]]],
+        relationships: Dict[RelationshipType, List[Dict[str, Any]]],
+        paths_to_relink: List[str],
+    ) -> None:
+        logger.info("Updating graph content items...")
+        with self.driver.session() as session:
+            session.execute_write(update_content_item_nodes, nodes)
+            command_ids = session.execute_write(
+                remove_outgoing_relationships_by_path, paths_to_relink
+            )
+            session.execute_write(create_relationships, relationships)
+            session.execute_write(remove_orphan_commands, command_ids)
+            session.execute_write(remove_empty_properties)
 
     def remove_non_repo_items(self) -> None:
         with self.driver.session() as session:
@@ -620,16 +624,13 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         download: bool = False,
         fail_on_error: bool = False,
     ) -> bool:
-        """Imports GraphML files to neo4j, by:
-        1. Preparing the GraphML files for import
-        2. Dropping the constraints (we temporarily allow creating duplicate nodes from different repos)
-        3. Import the GraphML files
-        4. Merging duplicate nodes (conmmands/content items)
-        5. Recreating the constraints
-        6. Remove empty properties
+        """Imports graph snapshots (or GraphML files of older graphs) to neo4j, by:
+        1. Dropping the constraints (we temporarily allow creating duplicate nodes from different repos)
+        2. Loading the snapshots in batches, prefixing the node IDs of every snapshot to keep them unique
+        3. Merging duplicate nodes (conmmands/content items)
+        4. Recreating the constraints
 
         Args:
-            external_import_paths (List[Path]): A list of external repositories' import paths.
             imported_path (Path): The path to import the graph from.
             download (bool): Wheter download the graph from bucket or not.
             fail_on_error (bool): Whether to raise exception on error or not.
@@ -656,24 +657,48 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                     raise
                 return False
 
-        logger.info("Importing graph from GraphML files...")
         self._import_handler.extract_files_from_path(imported_path)
-        self._import_handler.ensure_data_uniqueness()
-        graphml_filenames = self._import_handler.get_graphml_filenames()
-        if not graphml_filenames:
-            # no ml files found in the import dir, nothing to import
-            return False
+        if snapshot_paths := self._import_handler.get_snapshot_paths():
+            logger.info("Importing graph from snapshot files...")
+            sources_count = len(snapshot_paths)
+        else:
+            # graphs exported by older versions are GraphML files
+            logger.info("Importing graph from GraphML files...")
+            self._import_handler.ensure_data_uniqueness()
+            graphml_filenames = self._import_handler.get_graphml_filenames()
+            if not graphml_filenames:
+                # no files found in the import dir, nothing to import
+                return False
+            sources_count = len(graphml_filenames)
         with self.driver.session() as session:
             session.execute_write(drop_constraints)
-            session.execute_write(import_graphml, graphml_filenames)
+            if snapshot_paths:
+                self._import_snapshots(session, snapshot_paths)
+            else:
+                session.execute_write(import_graphml, graphml_filenames)
             session.execute_write(merge_duplicate_commands)
             session.execute_write(create_constraints)
-            if len(graphml_filenames) > 1:
+            if sources_count > 1:
                 session.execute_write(merge_duplicate_content_items)
         has_infra_graph_been_changed = self._has_infra_graph_been_changed()
         self._id_to_obj = {}
         return not has_infra_graph_been_changed
 
+    def _import_snapshots(self, session: Session, snapshot_paths: List[Path]) -> None:
+        session.execute_write(create_snapshot_id_index)
+        session.execute_write(await_indexes)
+        for idx, snapshot_path in enumerate(snapshot_paths, 1):
+            for batch in read_graph_snapshot(snapshot_path, id_prefix=f"{idx}:"):
+                if isinstance(batch, NodesBatch):
+                    session.execute_write(
+                        import_snapshot_nodes, batch.labels, batch.rows
+                    )
+                else:
+                    session.execute_write(
+                        import_snapshot_relationships, batch.type, batch.rows
+                    )
+        session.execute_write(remove_snapshot_ids)
+
     def export_graph(
         self,
         output_path: Optional[Path] = None,
@@ -683,8 +708,15 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
     ) -> None:
         if clean_import_dir:
             self.clean_import_dir()
-        with self.driver.session() as session:
-            session.execute_write(export_graphml, self.repo_path.name)
+        snapshot_path = (
+            self.import_path / f"{self.repo_path.absolute().name}{SNAPSHOT_FILE_SUFFIX}"
+        )
+        with GraphSnapshotWriter(snapshot_path) as writer:
+            with self.driver.session() as session:
+                session.execute_read(export_snapshot, writer)
+        logger.debug(
+            f"Exported {writer.nodes_count} nodes and {writer.relationships_count} relationships to {snapshot_path}"
+        )
         self.dump_metadata(override_commit)
         self.dump_depends_on()
         if output_path:
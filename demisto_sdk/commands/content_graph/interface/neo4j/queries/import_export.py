@@ -1,11 +1,16 @@
-from time import sleep
-from typing import List
+from typing import Any, Dict, List
 
 from neo4j import Transaction
 
 from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.interface.graph_snapshot import (
+    GraphSnapshotWriter,
+)
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import run_query
 
+# a temporary property of imported nodes, used to match the relationships between them
+SNAPSHOT_ID = "snapshot_id"
+
 
 def import_graphml(tx: Transaction, graphml_filenames: List[str]) -> None:
     for filename in graphml_filenames:
@@ -13,10 +18,66 @@ def import_graphml(tx: Transaction, graphml_filenames: List[str]) -> None:
         run_query(tx, query)
 
 
-def export_graphml(tx: Transaction, repo_name: str) -> None:
-    sleep(1)  # doesn't work without it
-    query = f'CALL apoc.export.graphml.all("{repo_name}.graphml", {{useTypes: true}})'
-    run_query(tx, query)
+def export_snapshot(tx: Transaction, writer: GraphSnapshotWriter) -> None:
+    """Streams all the nodes and relationships of the graph into a snapshot."""
+    nodes = run_query(
+        tx,
+        "MATCH (n) RETURN elementId(n) AS id, labels(n) AS labels, properties(n) AS properties",
+    )
+    for node in nodes:
+        writer.add_node(node["id"], node["labels"], node["properties"])
+    relationships = run_query(
+        tx,
+        """MATCH (a)-[r]->(b)
+RETURN type(r) AS type, elementId(a) AS start, elementId(b) AS end, properties(r) AS properties""",
+    )
+    for rel in relationships:
+        writer.add_relationship(
+            rel["type"], rel["start"], rel["end"], rel["properties"]
+        )
+
+
+def create_snapshot_id_index(tx: Transaction) -> None:
+    run_query(
+        tx,
+        f"CREATE INDEX IF NOT EXISTS FOR (n:{ContentType.BASE_NODE}) ON (n.{SNAPSHOT_ID})",
+    )
+
+
+def await_indexes(tx: Transaction) -> None:
+    run_query(tx, "CALL db.awaitIndexes()")
+
+
+def import_snapshot_nodes(
+    tx: Transaction, labels: List[str], rows: List[Dict[str, Any]]
+) -> None:
+    labels_str = ":".join(f"`{label}`" for label in labels)
+    query = f"""// Creates a batch of nodes from a graph snapshot
+UNWIND $rows AS row
+CREATE (n:{labels_str})
+SET n = row.properties, n.{SNAPSHOT_ID} = row.id"""
+    run_query(tx, query, rows=rows)
+
+
+def import_snapshot_relationships(
+    tx: Transaction, relationship_type: str, rows: List[Dict[str, Any]]
+) -> None:
+    query = f"""// Creates a batch of relationships from a graph snapshot
+UNWIND $rows AS row
+MATCH (a:{ContentType.BASE_NODE}{{{SNAPSHOT_ID}: row.start}})
+MATCH (b:{ContentType.BASE_NODE}{{{SNAPSHOT_ID}: row.end}})
+CREATE (a)-[r:`{relationship_type}`]->(b)
+SET r = row.properties"""
+    run_query(tx, query, rows=rows)
+
+
+def remove_snapshot_ids(tx: Transaction) -> None:
+    run_query(
+        tx,
+        f"""MATCH (n:{ContentType.BASE_NODE})
+WHERE n.{SNAPSHOT_ID} IS NOT NULL
+REMOVE n.{SNAPSHOT_ID}""",
+    )
 
 
 def merge_duplicate_commands(tx: Transaction) -> None:
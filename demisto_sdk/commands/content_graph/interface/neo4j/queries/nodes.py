@@ -42,6 +42,14 @@ SET n = node_data,  // override existing data
 RETURN count(n) AS nodes_created"""
 
 
+UPDATE_CONTENT_ITEM_NODES_BY_TYPE_TEMPLATE = """// Updates existing content items with labels {labels}, keeping their relationships
+UNWIND $data AS node_data
+MATCH (n:{labels}{{path: node_data.path}})
+SET n = node_data,  // override existing data
+    n.not_in_repository = false
+RETURN count(n) AS nodes_updated"""
+
+
 REMOVE_NODES_BY_TYPE = """// Removes parsed nodes of type {content_type} (according to constants)
 MATCH (a)
 WHERE (a:{label} OR a.content_type = "{content_type}")
@@ -141,6 +149,27 @@ def create_nodes(
         create_nodes_by_type(tx, content_type, data)
 
 
+def update_content_item_nodes(
+    tx: Transaction,
+    nodes: Dict[ContentType, List[Dict[str, Any]]],
+) -> None:
+    for content_type, data in nodes.items():
+        labels: str = ":".join(content_type.labels)
+        query = UPDATE_CONTENT_ITEM_NODES_BY_TYPE_TEMPLATE.format(labels=labels)
+        result = run_query(tx, query, data=data).single()
+        nodes_count: int = result["nodes_updated"]
+        logger.debug(f"Updated {nodes_count} nodes of type {content_type}.")
+
+
+def remove_orphan_commands(tx: Transaction, command_ids: List[str]) -> None:
+    query = f"""// Removes commands which are no longer implemented by any integration
+MATCH (c:{ContentType.COMMAND})
+WHERE c.object_id IN $command_ids
+AND NOT (c)<-[:{RelationshipType.HAS_COMMAND}]-()
+DETACH DELETE c"""
+    run_query(tx, query, command_ids=command_ids)
+
+
 def remove_nodes(tx: Transaction, content_type_to_identifiers: dict) -> None:
     for content_type, content_items_identifiers in content_type_to_identifiers.items():
         if content_type in [ContentType.COMMAND, ContentType.SCRIPT]:
@@ -224,6 +224,24 @@ def create_relationships_by_type(
     logger.debug(f"Merged relationships of type {relationship}.")
 
 
+def remove_outgoing_relationships_by_path(
+    tx: Transaction, file_paths: List[str]
+) -> List[str]:
+    """Removes the outgoing relationships of the content items in the given paths, before recreating them.
+
+    Returns:
+        List[str]: The IDs of the commands of the content items, which may become orphans.
+    """
+    query = f"""// Removes the outgoing relationships of content items before recreating them
+MATCH (n:{ContentType.BASE_NODE})-[r]->(t)
+WHERE n.path IN $file_paths
+WITH r, CASE WHEN type(r) = "{RelationshipType.HAS_COMMAND}" THEN t.object_id END AS command_id
+DELETE r
+RETURN collect(DISTINCT command_id) AS command_ids"""
+    result = run_query(tx, query, file_paths=file_paths).single()
+    return result["command_ids"] if result else []
+
+
 def _match_relationships(
     tx: Transaction,
     ids_list: List[str],
@@ -1,7 +1,7 @@
 import inspect
 from abc import ABC
 from collections import defaultdict
-from functools import cached_property, lru_cache
+from functools import cached_property
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -29,6 +29,11 @@ from demisto_sdk.commands.common.constants import (
     MarketplaceVersions,
 )
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+from demisto_sdk.commands.common.file_cache import (
+    FileStamp,
+    file_cache,
+    get_file_stamp,
+)
 from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import set_value, write_dict
@@ -55,6 +60,23 @@ CONTENT_TYPE_TO_MODEL: Dict[ContentType, Type["BaseContent"]] = {}
 json = JSON_Handler()
 
 
+def get_content_path_stamp(path: Path) -> FileStamp:
+    """Returns the stamp of all the files parsed when loading the content in the given path.
+
+    A pack is parsed from all its files, and a content item in its own folder (e.g an integration)
+    is parsed also from the files next to its yml (code, description, image).
+    """
+    if path.name == PACKS_PACK_META_FILE_NAME:
+        return get_file_stamp(path.parent)
+    if (
+        path.is_file()
+        and len(path.parents) > 3
+        and path.parents[3].name == PACKS_FOLDER
+    ):
+        return get_file_stamp(path.parent)
+    return get_file_stamp(path)
+
+
 class BaseContentMetaclass(ModelMetaclass):
     def __new__(
         cls, name, bases, namespace, content_type: ContentType = None, **kwargs
@@ -279,7 +301,7 @@ class BaseContent(BaseNode):
         raise NotImplementedError()
 
     @staticmethod
-    @lru_cache
+    @file_cache(path_argument="path", get_stamp=get_content_path_stamp)
     def from_path(
         path: Path,
         git_sha: Optional[str] = None,
@@ -1,5 +1,6 @@
 import shutil
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -61,8 +62,10 @@ from demisto_sdk.commands.prepare_content.markdown_images_handler import (
 )
 from demisto_sdk.commands.upload.constants import (
     CONTENT_TYPES_EXCLUDED_FROM_UPLOAD,
+    DEFAULT_UPLOAD_MAX_WORKERS,
     MULTIPLE_ZIPPED_PACKS_FILE_NAME,
     MULTIPLE_ZIPPED_PACKS_FILE_STEM,
+    UPLOAD_ORDER,
 )
 from demisto_sdk.commands.upload.exceptions import IncompatibleUploadVersionException
 from demisto_sdk.commands.upload.tools import (
@@ -72,6 +75,7 @@ from demisto_sdk.commands.upload.tools import (
 
 if TYPE_CHECKING:
     from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
+    from demisto_sdk.commands.upload.upload_delta import UploadDelta
 
 
 MINIMAL_UPLOAD_SUPPORTED_VERSION = Version("6.5.0")
@@ -417,6 +421,8 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
                 marketplace=marketplace,
                 target_demisto_version=target_demisto_version,
                 tpb=tpb,
+                max_workers=kwargs.get("max_workers") or DEFAULT_UPLOAD_MAX_WORKERS,
+                delta=kwargs.get("delta"),
             )
 
     def _zip_and_upload(
@@ -472,6 +478,8 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         marketplace: MarketplaceVersions,
         target_demisto_version: Version,
         tpb: bool = False,
+        max_workers: int = DEFAULT_UPLOAD_MAX_WORKERS,
+        delta: Optional["UploadDelta"] = None,
     ) -> bool:
         # this should only be called from Pack.upload
         logger.debug(
@@ -485,42 +493,72 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         if tpb:
             content_types_excluded_from_upload.discard(ContentType.TEST_PLAYBOOK)
 
+        upload_groups: List[List[ContentItem]] = [
+            [] for _ in range(len(UPLOAD_ORDER) + 1)
+        ]
         for item in self.content_items:
             if item.content_type in content_types_excluded_from_upload:
                 logger.debug(
                     f"SKIPPING upload of {item.content_type} {item.object_id}: type is skipped"
                 )
                 continue
-
-            try:
-                logger.debug(
-                    f"uploading pack {self.object_id}: {item.content_type} {item.object_id}"
-                )
-                item.upload(
-                    client=client,
-                    marketplace=marketplace,
-                    target_demisto_version=target_demisto_version,
-                )
-                uploaded_successfully.append(item)
-            except NotIndivitudallyUploadableException:
-                if marketplace == MarketplaceVersions.MarketplaceV2:
-                    raise  # many XSIAM content types must be uploaded zipped.
-                logger.warning(
-                    f"Not uploading pack {self.object_id}: {item.content_type} {item.object_id} as it was not indivudally uploaded"
-                )
-            except ApiException as e:
-                upload_failures.append(
-                    FailedUploadException(
-                        item.path,
-                        response_body={},
-                        additional_info=parse_error_response(e),
-                    )
+            if delta and delta.is_unchanged(item):
+                continue
+            upload_groups[
+                next(
+                    (
+                        i
+                        for i, content_types in enumerate(UPLOAD_ORDER)
+                        if item.content_type in content_types
+                    ),
+                    len(UPLOAD_ORDER),
                 )
-            except IncompatibleUploadVersionException as e:
-                incompatible_content_items.append(e)
+            ].append(item)
+
+        def upload_item(item: ContentItem) -> None:
+            logger.debug(
+                f"uploading pack {self.object_id}: {item.content_type} {item.object_id}"
+            )
+            item.upload(
+                client=client,
+                marketplace=marketplace,
+                target_demisto_version=target_demisto_version,
+            )
 
-            except FailedUploadException as e:
-                upload_failures.append(e)
+        # the client is shared by the workers, each request uses a connection of its pool
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            for upload_group in upload_groups:
+                futures = {
+                    executor.submit(upload_item, item): item for item in upload_group
+                }
+                # iterating in submission order, so the results are in the pack order
+                for future, item in futures.items():
+                    try:
+                        future.result()
+                        uploaded_successfully.append(item)
+                        if delta:
+                            delta.mark_uploaded(item)
+                    except NotIndivitudallyUploadableException:
+                        if marketplace == MarketplaceVersions.MarketplaceV2:
+                            for pending in futures:
+                                pending.cancel()
+                            raise  # many XSIAM content types must be uploaded zipped.
+                        logger.warning(
+                            f"Not uploading pack {self.object_id}: {item.content_type} {item.object_id} as it was not indivudally uploaded"
+                        )
+                    except ApiException as e:
+                        upload_failures.append(
+                            FailedUploadException(
+                                item.path,
+                                response_body={},
+                                additional_info=parse_error_response(e),
+                            )
+                        )
+                    except IncompatibleUploadVersionException as e:
+                        incompatible_content_items.append(e)
+
+                    except FailedUploadException as e:
+                        upload_failures.append(e)
 
         if upload_failures or incompatible_content_items:
             raise FailedUploadMultipleException(
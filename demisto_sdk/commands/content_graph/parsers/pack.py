@@ -40,6 +40,10 @@ from demisto_sdk.commands.content_graph.parsers.content_item import (
 from demisto_sdk.commands.content_graph.parsers.content_items_list import (
     ContentItemsList,
 )
+from demisto_sdk.commands.content_graph.parsers.parser_cache import (
+    ContentItemParserCache,
+    is_parser_cache_enabled,
+)
 from demisto_sdk.commands.content_graph.strict_objects.base_strict_model import (
     StructureError,
 )
@@ -324,21 +328,33 @@ class PackParser(BaseContentParser, PackMetadataParser):
 
     def parse_pack_folders(self) -> None:
         """Parses all pack content items by iterating its folders."""
+        parser_cache = ContentItemParserCache() if is_parser_cache_enabled() else None
         for folder_path in ContentType.pack_folders(self.path):
             for (
                 content_item_path
             ) in folder_path.iterdir():  # todo: consider multiprocessing
-                self.parse_content_item(content_item_path)
+                self.parse_content_item(content_item_path, parser_cache)
+        if parser_cache:
+            logger.debug(
+                f"Parser cache for {self.node_id}: {parser_cache.hits} hits, {parser_cache.misses} misses"
+            )
 
-    def parse_content_item(self, content_item_path: Path) -> None:
+    def parse_content_item(
+        self,
+        content_item_path: Path,
+        parser_cache: Optional[ContentItemParserCache] = None,
+    ) -> None:
         """Potentially parses a single content item.
 
         Args:
             content_item_path (Path): The content item path.
+            parser_cache (Optional[ContentItemParserCache]): If provided, unchanged content items are loaded from it.
         """
         try:
-            content_item = ContentItemParser.from_path(
-                content_item_path, self.marketplaces
+            content_item = (
+                parser_cache.from_path(content_item_path, self.marketplaces)
+                if parser_cache
+                else ContentItemParser.from_path(content_item_path, self.marketplaces)
             )
             content_item.add_to_pack(self.object_id)
             self.content_items.append(content_item)
@@ -0,0 +1,164 @@
+import os
+import pickle
+from functools import lru_cache
+from hashlib import sha1
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from demisto_sdk.commands.common.constants import (
+    CACHE_DIR,
+    DEMISTO_SDK_GRAPH_PARSE_CACHE,
+    MarketplaceVersions,
+)
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import (
+    prune_cache_dir,
+    sha1_update_from_file,
+    string_to_bool,
+)
+from demisto_sdk.commands.content_graph.parsers.content_item import (
+    ContentItemParser,
+)
+
+PARSER_CACHE_DIR = CACHE_DIR / "content_graph_parsers"
+# entries which were not used recently are removed, so the cache does not grow with every change
+PARSER_CACHE_MAX_ENTRIES = 50000
+PARSER_CACHE_MAX_AGE_DAYS = 14
+SDK_PACKAGE_DIR = Path(__file__).parents[3]
+
+
+def is_parser_cache_enabled() -> bool:
+    return string_to_bool(os.getenv(DEMISTO_SDK_GRAPH_PARSE_CACHE), False)
+
+
+@lru_cache
+def get_sdk_code_hash() -> str:
+    """
+    Returns the hash of the SDK code (its python modules, except for the tests).
+    The parsers depend on other SDK modules too (e.g. tools and constants),
+    so any change in the SDK code invalidates the whole cache.
+    """
+    hash_ = sha1()
+    for path in sorted(SDK_PACKAGE_DIR.rglob("*.py")):
+        relative_path = path.relative_to(SDK_PACKAGE_DIR)
+        if {"tests", "test_files"} & set(relative_path.parts):
+            continue
+        hash_.update(str(relative_path).encode())
+        hash_ = sha1_update_from_file(path, hash_)
+    return hash_.hexdigest()
+
+
+class ContentItemParserCache:
+    """An on-disk, content-addressed cache of parsed content items.
+
+    Each entry holds the pickled `ContentItemParser` (including its relationships) of a single content item.
+    The entry key is a hash of the SDK code, the item path, the pack marketplaces and the content of all
+    the item's files, so an entry is never read after any of its inputs changed.
+
+    Attributes:
+        cache_dir (Path): The directory in which the cache entries are stored.
+        hits (int): The number of content items loaded from the cache.
+        misses (int): The number of content items which were parsed.
+    """
+
+    def __init__(self, cache_dir: Path = PARSER_CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def iter_content_item_files(path: Path) -> Iterator[Path]:
+        """Yields the files that a content item is parsed from.
+
+        For a package this is every file in its folder. For a unified file this is the file itself
+        and its sibling files sharing the same stem (e.g. README, .xif and schema files).
+        """
+        if path.is_dir():
+            yield from sorted(
+                (p for p in path.rglob("*") if p.is_file()),
+                key=lambda p: str(p).lower(),
+            )
+        elif path.is_file():
+            yield path
+            yield from sorted(
+                p
+                for p in path.parent.glob(f"{path.stem}*")
+                if p != path and p.is_file()
+            )
+
+    def get_key(self, path: Path, pack_marketplaces: List[MarketplaceVersions]) -> str:
+        hash_ = sha1()
+        hash_.update(get_sdk_code_hash().encode())
+        hash_.update(str(path.absolute()).encode())
+        hash_.update(",".join(sorted(pack_marketplaces)).encode())
+        for file_path in self.iter_content_item_files(path):
+            hash_.update(file_path.name.encode())
+            hash_ = sha1_update_from_file(file_path, hash_)
+        return hash_.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pickle"
+
+    def get(self, key: str) -> Optional[ContentItemParser]:
+        entry_path = self._entry_path(key)
+        if not entry_path.exists():
+            return None
+        try:
+            with entry_path.open("rb") as f:
+                parser = pickle.load(f)
+            # marking the entry as recently used, so it is kept when the cache is pruned
+            entry_path.touch()
+            return parser
+        except Exception as e:
+            logger.debug(f"Could not load parser cache entry {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+    def set(self, key: str, parser: ContentItemParser) -> None:
+        entry_path = self._entry_path(key)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first, as packs are parsed concurrently by several processes
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp_path.open("wb") as f:
+                pickle.dump(parser, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except Exception as e:
+            logger.debug(f"Could not write parser cache entry {entry_path}: {e}")
+
+    def from_path(
+        self, path: Path, pack_marketplaces: List[MarketplaceVersions]
+    ) -> ContentItemParser:
+        """Returns the cached parser of the content item if exists, otherwise parses it and caches the result.
+
+        Args:
+            path (Path): The content item path.
+            pack_marketplaces (List[MarketplaceVersions]): The marketplaces of the content item's pack.
+
+        Returns:
+            ContentItemParser: The parsed content item.
+        """
+        if not ContentItemParser.is_content_item(path) and (
+            ContentItemParser.is_content_item(path.parent)
+        ):
+            path = path.parent
+        key = self.get_key(path, pack_marketplaces)
+        if (parser := self.get(key)) is not None:
+            self.hits += 1
+            logger.debug(f"Loaded {parser.node_id} from the parser cache")
+            return parser
+        self.misses += 1
+        parser = ContentItemParser.from_path(path, pack_marketplaces)
+        self.set(key, parser)
+        return parser
+
+    def clear(self) -> None:
+        """Removes all the cache entries."""
+        for entry_path in self.cache_dir.glob("*/*.pickle"):
+            entry_path.unlink(missing_ok=True)
+
+    def prune(self) -> None:
+        """Removes the entries which were not used recently, keeping up to the maximal number of entries."""
+        prune_cache_dir(
+            self.cache_dir, PARSER_CACHE_MAX_ENTRIES, PARSER_CACHE_MAX_AGE_DAYS
+        )
@@ -1,4 +1,3 @@
-import multiprocessing
 import traceback
 from pathlib import Path
 from typing import Iterator, List, Optional, Tuple
@@ -6,12 +5,16 @@ from typing import Iterator, List, Optional, Tuple
 from tqdm import tqdm
 
 from demisto_sdk.commands.common.constants import PACKS_FOLDER
-from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parse_pool import parse_pool
 from demisto_sdk.commands.content_graph.parsers.content_item import (
     NotAContentItemException,
 )
 from demisto_sdk.commands.content_graph.parsers.pack import PackParser
+from demisto_sdk.commands.content_graph.parsers.parser_cache import (
+    ContentItemParserCache,
+    is_parser_cache_enabled,
+)
 
 IGNORED_PACKS_FOR_PARSING = ["NonSupported"]
 
@@ -39,19 +42,37 @@ class RepositoryParser:
         packs_to_parse: Optional[Tuple[Path, ...]] = None,
         progress_bar: Optional[tqdm] = None,
     ):
+        self.packs.extend(self.iter_parse(packs_to_parse, progress_bar))
+
+    def iter_parse(
+        self,
+        packs_to_parse: Optional[Tuple[Path, ...]] = None,
+        progress_bar: Optional[tqdm] = None,
+    ) -> Iterator[PackParser]:
+        """Parses the repository packs, and yields each pack as soon as it is parsed.
+
+        Args:
+            packs_to_parse (Optional[Tuple[Path, ...]]): The packs to parse. If not provided, parses all packs.
+            progress_bar (Optional[tqdm]): A progress bar to update with every parsed pack.
+
+        Yields:
+            Iterator[PackParser]: A pack parser.
+        """
         if not packs_to_parse:
             # if no packs to parse were provided, parse all packs
             packs_to_parse = tuple(self.iter_packs())
         try:
             logger.debug("Parsing packs...")
-            with multiprocessing.Pool(processes=cpu_count()) as pool:
+            with parse_pool() as pool:
                 for pack in pool.imap_unordered(
                     RepositoryParser.parse_pack, packs_to_parse
                 ):
                     if pack:
-                        self.packs.append(pack)
+                        yield pack
                         if progress_bar:
                             progress_bar.update(1)
+            if is_parser_cache_enabled():
+                ContentItemParserCache().prune()
         except Exception:
             logger.error(traceback.format_exc())
             raise
@@ -0,0 +1,193 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    Nodes,
+    Relationships,
+    RelationshipType,
+)
+from demisto_sdk.commands.content_graph.content_graph_builder import (
+    ContentGraphBuilder,
+    RelationshipsSpool,
+)
+
+
+def mock_relationships(pack_id: str) -> Relationships:
+    relationships = Relationships()
+    relationships.add(
+        RelationshipType.USES_BY_ID,
+        source=f"{pack_id}Integration",
+        source_type=ContentType.INTEGRATION,
+        source_fromversion="5.0.0",
+        source_marketplaces=["xsoar"],
+        target="SomeScript",
+        target_type=ContentType.SCRIPT,
+        mandatorily=True,
+    )
+    relationships.add(
+        RelationshipType.HAS_COMMAND,
+        source=f"{pack_id}Integration",
+        source_type=ContentType.INTEGRATION,
+        source_fromversion="5.0.0",
+        source_marketplaces=["xsoar"],
+        target=f"{pack_id.lower()}-command",
+        target_type=ContentType.COMMAND,
+        name=f"{pack_id.lower()}-command",
+        deprecated=False,
+        description="",
+    )
+    return relationships
+
+
+def mock_pack(pack_id: str) -> MagicMock:
+    pack = MagicMock()
+    pack.to_nodes.return_value = Nodes(
+        {"content_type": ContentType.PACK, "object_id": pack_id}
+    )
+    pack.relationships = mock_relationships(pack_id)
+    return pack
+
+
+def test_relationships_spool(tmp_path: Path):
+    """
+    Given:
+        - Relationships of three packs.
+    When:
+        - Spooling them and reading them back in batches of two relationships.
+    Then:
+        - Verify all the relationships are read back.
+        - Verify the HAS_COMMAND relationships are read first, and each batch has a single relationship type.
+    """
+    spool = RelationshipsSpool(tmp_path)
+    for pack_id in ("A", "B", "C"):
+        spool.add(mock_relationships(pack_id))
+
+    batches = list(spool.iter_batches(2))
+
+    assert [list(batch.keys()) for batch in batches] == [
+        [RelationshipType.HAS_COMMAND],
+        [RelationshipType.HAS_COMMAND],
+        [RelationshipType.USES_BY_ID],
+        [RelationshipType.USES_BY_ID],
+    ]
+    assert [rel["target"] for rel in batches[0][RelationshipType.HAS_COMMAND]] == [
+        "a-command",
+        "b-command",
+    ]
+    assert sum(len(rels) for batch in batches for rels in batch.values()) == 6
+
+
+def test_create_graph_streaming(mocker):
+    """
+    Given:
+        - A content graph builder with a batch size of two packs.
+    When:
+        - Creating the graph from three parsed packs.
+    Then:
+        - Verify the nodes are created in two batches.
+        - Verify the relationships are created only after all the nodes, starting with HAS_COMMAND.
+    """
+    content_graph = MagicMock()
+    builder = ContentGraphBuilder(content_graph, packs_per_batch=2)
+    packs = [mock_pack(pack_id) for pack_id in ("A", "B", "C")]
+    mocker.patch.object(
+        builder,
+        "_iter_pack_batches",
+        return_value=iter([tuple(packs[:2]), tuple(packs[2:])]),
+    )
+
+    builder.create_graph()
+
+    method_calls = [call[0] for call in content_graph.method_calls]
+    assert method_calls == [
+        "create_nodes",
+        "create_nodes",
+        "create_relationships",
+        "create_relationships",
+        "remove_non_repo_items",
+    ]
+    first_nodes = content_graph.create_nodes.call_args_list[0].args[0]
+    assert [node["object_id"] for node in first_nodes[ContentType.PACK]] == [
+        "A",
+        "B",
+    ]
+    first_relationships = content_graph.create_relationships.call_args_list[0].args[0]
+    assert list(first_relationships.keys()) == [RelationshipType.HAS_COMMAND]
+    assert len(first_relationships[RelationshipType.HAS_COMMAND]) == 3
+
+
+def test_update_content_items(mocker, repo):
+    """
+    Given:
+        - A repository with three changed integrations and a changed release notes file in one pack,
+          and a changed pack metadata file in another pack.
+    When:
+        - Updating the graph by the changed files.
+    Then:
+        - Verify the unchanged integration is skipped, the integration with changed properties is updated in place,
+          and only the integration with changed relationships is re-linked.
+        - Verify the release notes file is ignored, and the pack with the changed metadata is returned to be updated.
+    """
+    from demisto_sdk.commands.content_graph import content_graph_builder
+
+    pack = repo.create_pack("PackA")
+    unchanged = pack.create_integration("Unchanged")
+    updated = pack.create_integration("Updated")
+    relinked = pack.create_integration("Relinked")
+    other_pack = repo.create_pack("PackB")
+    mocker.patch.object(content_graph_builder, "CONTENT_PATH", Path(repo.path))
+    mocker.patch.object(content_graph_builder, "PackParser")
+
+    def parse_content_item(content_item_path, pack_id, pack_marketplaces, git_sha=None):
+        name = content_item_path.name
+        node = {
+            "content_type": ContentType.INTEGRATION,
+            "object_id": name,
+            "path": f"Packs/{pack_id}/Integrations/{name}/{name}.yml",
+            "description": "old" if git_sha and name == "Updated" else "new",
+        }
+        relationships = Relationships()
+        if not (git_sha and name == "Relinked"):
+            relationships.add(
+                RelationshipType.USES_BY_ID,
+                source=name,
+                source_type=ContentType.INTEGRATION,
+                source_fromversion="5.0.0",
+                source_marketplaces=["xsoar"],
+                target="SomeScript",
+                target_type=ContentType.SCRIPT,
+                mandatorily=True,
+            )
+        return node, relationships
+
+    mocker.patch.object(
+        ContentGraphBuilder, "_parse_content_item", side_effect=parse_content_item
+    )
+    content_graph = MagicMock()
+    builder = ContentGraphBuilder(content_graph)
+    changed_files = {
+        Path(path).relative_to(repo.path)
+        for path in (
+            unchanged.yml.path,
+            updated.yml.path,
+            relinked.code.path,
+            Path(pack.path) / "ReleaseNotes" / "1_0_1.md",
+            Path(other_pack.path) / "pack_metadata.json",
+        )
+    }
+
+    packs_to_update = builder.update_content_items(changed_files, "commit")
+
+    assert packs_to_update == {"PackB"}
+    nodes, relationships, paths_to_relink = (
+        content_graph.update_content_items.call_args.args
+    )
+    assert sorted(node["object_id"] for node in nodes[ContentType.INTEGRATION]) == [
+        "Relinked",
+        "Updated",
+    ]
+    assert paths_to_relink == ["Packs/PackA/Integrations/Relinked/Relinked.yml"]
+    assert [rel["source"] for rel in relationships[RelationshipType.USES_BY_ID]] == [
+        "Relinked"
+    ]
@@ -15,6 +15,7 @@ from demisto_sdk.commands.content_graph.common import (
     Relationships,
     RelationshipType,
 )
+from demisto_sdk.commands.content_graph.interface import IS_NATIVE_GRAPH_BACKEND
 from demisto_sdk.commands.content_graph.objects import IncidentField, Layout, Mapper
 from demisto_sdk.commands.content_graph.objects.classifier import Classifier
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
@@ -578,7 +579,7 @@ class TestCreateContentGraph:
             extracted_files = list(tmp_path.glob("extracted/*"))
             assert extracted_files
             assert all(
-                file.suffix == ".graphml" or file.name == "metadata.json"
+                file.suffix == ".snapshot" or file.name == "metadata.json"
                 for file in extracted_files
             )
 
@@ -820,6 +821,11 @@ class TestCreateContentGraph:
         assert (scripts_path / "script-setIncident.yml").exists()
         assert not (scripts_path / "script-setAlert.yml").exists()
 
+    @pytest.mark.skipif(
+        IS_NATIVE_GRAPH_BACKEND,
+        reason="The native content graph does not run Cypher queries, "
+        "see test_create_relationship_without_null_properties in native_graph_test",
+    )
     def test_create_content_graph_relationships_from_metadata(
         self,
         graph_repo: Repo,
@@ -0,0 +1,80 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.content_graph.interface.graph_snapshot import (
+    GraphSnapshotWriter,
+    InvalidGraphSnapshotException,
+    NodesBatch,
+    RelationshipsBatch,
+    read_graph_snapshot,
+)
+
+
+def test_graph_snapshot_round_trip(tmp_path: Path):
+    """
+    Given:
+        - Nodes of two label sets, and relationships between them.
+    When:
+        - Writing them to a snapshot in batches of two, and reading it with an ID prefix.
+    Then:
+        - Ensure the nodes are read before the relationships, in batches of the same labels.
+        - Ensure the node IDs are remapped and prefixed consistently.
+        - Ensure missing properties are not read as null properties.
+    """
+    snapshot_path = tmp_path / "content.snapshot"
+    with GraphSnapshotWriter(snapshot_path, batch_size=2) as writer:
+        writer.add_node("4:a", ["BaseNode", "Pack"], {"object_id": "Pack1"})
+        writer.add_node(
+            "4:b", ["BaseNode", "Script"], {"object_id": "Script1", "tags": ["a"]}
+        )
+        writer.add_node("4:c", ["BaseNode", "Script"], {"object_id": "Script2"})
+        writer.add_node("4:c", ["BaseNode", "Script"], {"object_id": "Script2"})
+        writer.add_relationship("IN_PACK", "4:b", "4:a", {})
+        writer.add_relationship("USES", "4:c", "4:b", {"mandatorily": True})
+    assert (writer.nodes_count, writer.relationships_count) == (3, 2)
+
+    batches = list(read_graph_snapshot(snapshot_path, id_prefix="1:"))
+    node_batches = [b for b in batches if isinstance(b, NodesBatch)]
+    assert batches[: len(node_batches)] == node_batches
+    assert [(b.labels, b.rows) for b in node_batches] == [
+        (
+            ["BaseNode", "Script"],
+            [
+                {"id": "1:1", "properties": {"object_id": "Script1", "tags": ["a"]}},
+                {"id": "1:2", "properties": {"object_id": "Script2"}},
+            ],
+        ),
+        (["BaseNode", "Pack"], [{"id": "1:0", "properties": {"object_id": "Pack1"}}]),
+    ]
+    assert batches[len(node_batches) :] == [
+        RelationshipsBatch(
+            "IN_PACK", [{"start": "1:1", "end": "1:0", "properties": {}}]
+        ),
+        RelationshipsBatch(
+            "USES",
+            [{"start": "1:2", "end": "1:1", "properties": {"mandatorily": True}}],
+        ),
+    ]
+
+
+def test_graph_snapshot_invalid(tmp_path: Path):
+    """
+    Given:
+        - A relationship to a node which is not in the snapshot, and a file which is not a snapshot.
+    When:
+        - Writing the relationship, and reading the file.
+    Then:
+        - Ensure InvalidGraphSnapshotException is raised.
+    """
+    with pytest.raises(InvalidGraphSnapshotException):
+        with GraphSnapshotWriter(tmp_path / "content.snapshot") as writer:
+            writer.add_node("a", ["BaseNode"], {})
+            writer.add_relationship("USES", "a", "b", {})
+
+    not_snapshot_path = tmp_path / "other.snapshot"
+    with gzip.open(not_snapshot_path, "wb") as f:
+        f.write(b'{"format": "graphml"}\n')
+    with pytest.raises(InvalidGraphSnapshotException):
+        list(read_graph_snapshot(not_snapshot_path))
@@ -0,0 +1,264 @@
+from pathlib import Path
+
+import pytest
+from create_content_graph_test import (
+    mock_pack,
+    mock_script,
+    repository,  # noqa: F401
+)
+from get_relationships_test import compare, create_mini_content
+from test_tools import TEST_DATA_PATH
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.content_graph.commands.create import create_content_graph
+from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
+from demisto_sdk.commands.content_graph.interface.native import native_graph
+from demisto_sdk.commands.content_graph.interface.native.graph_store import (
+    NativeGraphStore,
+)
+from demisto_sdk.commands.content_graph.interface.native.native_graph import (
+    NativeContentGraphInterface,
+)
+from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+
+
+@pytest.fixture(autouse=True)
+def setup_method(mocker, tmp_path):
+    mocker.patch.object(native_graph, "NATIVE_GRAPH_DIR", tmp_path)
+    NativeContentGraphInterface().clean_graph()
+
+
+@pytest.fixture
+def interface(repository: ContentDTO) -> NativeContentGraphInterface:  # noqa: F811
+    create_mini_content(repository)
+    interface = NativeContentGraphInterface()
+    create_content_graph(interface)
+    return interface
+
+
+def test_get_relationships_by_path(interface: NativeContentGraphInterface):
+    """
+    Given:
+        - A native content graph of three packs.
+    When:
+        - Running get_relationships_by_path() for USES relationships of SampleScript2.
+    Then:
+        - Make sure the sources and targets are the same as the Neo4j ones.
+    """
+    sources, targets = interface.get_relationships_by_path(
+        Path("Packs/SamplePack2/Scripts/SampleScript2/SampleScript2.yml"),
+        RelationshipType.USES,
+        ContentType.BASE_NODE,
+        2,
+        MarketplaceVersions.XSOAR,
+        retrieve_sources=True,
+        retrieve_targets=True,
+        mandatory_only=False,
+        include_tests=False,
+        include_deprecated=False,
+        include_hidden=False,
+    )
+    compare(
+        sources,
+        [
+            {
+                "filepath": "Packs/SamplePack3/TestPlaybooks/SampleTestPlaybook/SampleTestPlaybook.yml",
+                "mandatorily": True,
+                "paths_count": 1,
+            },
+        ],
+    )
+    compare(
+        targets,
+        [
+            {
+                "filepath": "Packs/SamplePack/Integrations/SampleIntegration/SampleIntegration.yml",
+                "mandatorily": False,
+                "paths_count": 1,
+            },
+            {
+                "filepath": "Packs/SamplePack/Scripts/SampleScript/SampleScript.yml",
+                "mandatorily": True,
+                "paths_count": 1,
+            },
+        ],
+    )
+
+    sources, _ = interface.get_relationships_by_path(
+        Path("Packs/SamplePack/Integrations/SampleIntegration/SampleIntegration.yml"),
+        RelationshipType.USES,
+        ContentType.BASE_NODE,
+        2,
+        MarketplaceVersions.XSOAR,
+        retrieve_sources=True,
+        retrieve_targets=False,
+        mandatory_only=False,
+        include_tests=True,
+        include_deprecated=False,
+        include_hidden=False,
+    )
+    compare(
+        sources,
+        [
+            {
+                "filepath": "Packs/SamplePack2/Scripts/SampleScript2/SampleScript2.yml",
+                "mandatorily": False,
+                "paths_count": 1,
+            },
+            {
+                "filepath": "Packs/SamplePack3/TestPlaybooks/SampleTestPlaybook/SampleTestPlaybook.yml",
+                "mandatorily": True,
+                "paths_count": 2,
+            },
+        ],
+    )
+
+
+def test_create_pack_dependencies(interface: NativeContentGraphInterface):
+    """
+    Given:
+        - A native content graph of three packs.
+    When:
+        - Creating the pack dependencies.
+    Then:
+        - Make sure the packs depend on the packs of the content items they use.
+        - Make sure the dependencies are searchable, including all level dependencies.
+    """
+    assert interface._depends_on.keys() == {"SamplePack2", "SamplePack3"}
+    assert interface._depends_on["SamplePack2"].keys() == {"SamplePack"}
+    assert interface._depends_on["SamplePack3"].keys() == {
+        "SamplePack",
+        "SamplePack2",
+    }
+
+    pack = interface.search(
+        MarketplaceVersions.XSOAR,
+        content_type=ContentType.PACK,
+        object_id="SamplePack2",
+        all_level_dependencies=True,
+    )[0]
+    dependencies = {
+        r.content_item_to.object_id: (r.mandatorily, r.is_test)
+        for r in pack.relationships_data[RelationshipType.DEPENDS_ON]
+        if r.source_id == pack.database_id
+    }
+    assert dependencies == {"SamplePack": (True, False)}
+    assert len(pack.content_items.script) == 1
+
+
+def test_validate_duplicate_ids_and_fromversion(
+    repository: ContentDTO,  # noqa: F811
+):
+    """
+    Given:
+        - A script with the same id in two packs.
+        - A script using a script with a higher fromversion.
+    When:
+        - Running validate_duplicate_ids() and find_uses_paths_with_invalid_fromversion().
+    Then:
+        - Make sure the duplicates and the invalid usage are found.
+    """
+    pack1 = mock_pack("Pack1", Path("Packs/Pack1"), repository)
+    pack2 = mock_pack("Pack2", Path("Packs/Pack2"), repository)
+    new_script = mock_script(
+        "NewScript", path=Path("Packs/Pack1/Scripts/NewScript.yml"), pack=pack1
+    )
+    new_script.fromversion = "6.5.0"
+    mock_script(
+        "OldScript",
+        path=Path("Packs/Pack1/Scripts/OldScript.yml"),
+        pack=pack1,
+        uses=[(new_script, True)],
+    )
+    mock_script(
+        "NewScript", path=Path("Packs/Pack2/Scripts/NewScript.yml"), pack=pack2
+    ).fromversion = "6.5.0"
+    interface = NativeContentGraphInterface()
+    create_content_graph(interface, dependencies=False)
+
+    duplicates = interface.validate_duplicate_ids([])
+    assert sorted(str(content_item.path) for content_item, _ in duplicates) == [
+        "Packs/Pack1/Scripts/NewScript.yml",
+        "Packs/Pack2/Scripts/NewScript.yml",
+    ]
+
+    invalid = interface.find_uses_paths_with_invalid_fromversion(
+        ["Packs/Pack1/Scripts/OldScript.yml"]
+    )
+    assert [content_item.object_id for content_item in invalid] == ["OldScript"]
+
+
+def test_export_and_import_graph(interface: NativeContentGraphInterface, tmp_path):
+    """
+    Given:
+        - A native content graph of three packs.
+    When:
+        - Exporting the graph to a zip, cleaning it and importing the zip.
+    Then:
+        - Make sure the imported graph has the same nodes and relationships.
+    """
+    nodes_count = len(interface.store.nodes)
+    relationships_count = len(interface.store.relationships)
+    interface.export_graph(tmp_path / "output")
+    interface.clean_graph()
+    assert not interface.is_alive()
+
+    assert interface.import_graph(tmp_path / "output" / "xsoar.zip")
+    assert len(interface.store.nodes) == nodes_count
+    assert len(interface.store.relationships) == relationships_count
+    assert interface.search(object_id="SampleScript2")[0].uses[0].content_item_to
+
+
+def test_import_graphml_of_multiple_repositories():
+    """
+    Given:
+        - GraphML files of two repositories, exported by an older version.
+          Both have an integration with the `test-command` command,
+          and the second uses a classifier of the first, which is not in its repository.
+    When:
+        - Importing the graph.
+    Then:
+        - Make sure the duplicate command and classifier nodes are merged, as the Neo4j import does.
+    """
+    interface = NativeContentGraphInterface()
+    interface.import_graph(
+        TEST_DATA_PATH / "mock_import_files_multiple_repos__valid" / "valid_graph.zip"
+    )
+
+    def count(content_type: ContentType) -> int:
+        return len(interface.store.find_nodes(content_type))
+
+    assert count(ContentType.PACK) == 2
+    assert count(ContentType.INTEGRATION) == 2
+    assert count(ContentType.COMMAND) == 1
+    assert count(ContentType.CLASSIFIER) == 1
+    command = interface.store.find_node(ContentType.COMMAND)
+    assert command
+    assert [
+        r.get("description")
+        for r in interface.store.get_incoming(command, RelationshipType.HAS_COMMAND)
+    ] == ["A test command.", "A test command."]
+
+
+def test_create_relationship_without_null_properties():
+    """
+    Given:
+        - A native graph store with two packs.
+    When:
+        - Creating a relationship with a null property, and setting another property to null.
+    Then:
+        - Make sure the null properties are not stored, as in Neo4j.
+    """
+    store = NativeGraphStore()
+    pack_a = store.create_node(ContentType.PACK, {"object_id": "A"})
+    pack_b = store.create_node(ContentType.PACK, {"object_id": "B"})
+    relationship = store.create_relationship(
+        RelationshipType.DEPENDS_ON,
+        pack_a,
+        pack_b,
+        {"mandatorily": None, "is_test": False, "from_metadata": True},
+    )
+    assert relationship.properties == {"is_test": False, "from_metadata": True}
+
+    relationship.set("is_test", None)
+    assert relationship.properties == {"from_metadata": True}
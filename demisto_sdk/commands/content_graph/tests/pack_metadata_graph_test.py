@@ -10,8 +10,8 @@ from demisto_sdk.commands.common.tools import get_json
 from demisto_sdk.commands.content_graph.commands.create import (
     create_content_graph,
 )
-from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
-    Neo4jContentGraphInterface as ContentGraphInterface,
+from demisto_sdk.commands.content_graph.interface import (
+    ContentGraphInterface,
 )
 from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
@@ -3093,3 +3093,55 @@ def test_layout_parser_group():
     layout_path = Path(layout.path)
     layout_parser_instance = LayoutParser(layout_path, list(MarketplaceVersions))
     assert layout_parser_instance.group == "incident"
+
+
+def test_content_item_parser_cache(pack: Pack, tmp_path: Path, mocker):
+    """
+    Given:
+        - A pack with an integration.
+    When:
+        - Parsing the integration twice through the parser cache, and then once more after modifying it.
+        - Parsing it again after the SDK code changed.
+        - Pruning the cache.
+    Then:
+        - Verify the second parsing is loaded from the cache with the same relationships.
+        - Verify modifying the integration invalidates its cache entry.
+        - Verify changing the SDK code invalidates the cache entries.
+        - Verify only the most recently used entries are kept when the cache is pruned.
+    """
+    from demisto_sdk.commands.content_graph.parsers import (
+        parser_cache as parser_cache_module,
+    )
+    from demisto_sdk.commands.content_graph.parsers.parser_cache import (
+        ContentItemParserCache,
+    )
+
+    integration = pack.create_integration(yml=load_yaml("integration.yml"))
+    integration_path = Path(integration.path)
+    parser_cache = ContentItemParserCache(cache_dir=tmp_path)
+
+    parser = parser_cache.from_path(integration_path, list(MarketplaceVersions))
+    cached_parser = parser_cache.from_path(integration_path, list(MarketplaceVersions))
+    assert (parser_cache.hits, parser_cache.misses) == (1, 1)
+    assert cached_parser.node_id == parser.node_id
+    assert cached_parser.relationships == parser.relationships
+
+    integration.yml.update({"tests": ["test_playbook"]})
+    parser_cache.from_path(integration_path, list(MarketplaceVersions))
+    assert (parser_cache.hits, parser_cache.misses) == (1, 2)
+
+    mocker.patch.object(
+        parser_cache_module, "get_sdk_code_hash", return_value="another version"
+    )
+    parser_cache.from_path(integration_path, list(MarketplaceVersions))
+    assert (parser_cache.hits, parser_cache.misses) == (1, 3)
+
+    assert len(list(tmp_path.glob("*/*.pickle"))) == 3
+    mocker.patch.object(parser_cache_module, "PARSER_CACHE_MAX_ENTRIES", 1)
+    parser_cache.prune()
+    parser_cache.from_path(integration_path, list(MarketplaceVersions))
+    assert (parser_cache.hits, parser_cache.misses) == (2, 3)
+    assert len(list(tmp_path.glob("*/*.pickle"))) == 1
+
+    parser_cache.clear()
+    assert not list(tmp_path.glob("*/*.pickle"))
@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import Any, Callable, Dict, List
+from uuid import uuid4
 from zipfile import ZipFile
 
 import pytest
@@ -17,6 +18,7 @@ from demisto_sdk.commands.content_graph.common import ContentType, RelationshipT
 from demisto_sdk.commands.content_graph.interface import (
     ContentGraphInterface,
 )
+from demisto_sdk.commands.content_graph.interface.native import native_graph
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
 from demisto_sdk.commands.content_graph.objects.integration import Integration
 from demisto_sdk.commands.content_graph.objects.pack import Pack
@@ -51,6 +53,9 @@ def setup_method(mocker, tmp_path_factory):
     mocker.patch.object(
         neo4j_service, "NEO4J_DIR", new=tmp_path_factory.mktemp("neo4j")
     )
+    mocker.patch.object(
+        native_graph, "NATIVE_GRAPH_DIR", new=tmp_path_factory.mktemp("native_graph")
+    )
     mocker.patch.object(ContentGraphInterface, "repo_path", GIT_PATH)
     mocker.patch.object(
         File,
@@ -701,7 +706,7 @@ class TestUpdateContentGraph:
             extracted_files = list(tmp_path.glob("extracted/*"))
             assert extracted_files
             assert all(
-                file.suffix == ".graphml"
+                file.suffix == ".snapshot"
                 or file.name == "metadata.json"
                 or file.name == "depends_on.json"
                 for file in extracted_files
@@ -752,8 +757,11 @@ class TestUpdateContentGraph:
                 all_level_dependencies=True,
             )
 
+            # a unique name, as the tests may run in parallel
             file_added = (
-                Path(__file__).parent.parent / "parsers" / "content_graph_test.txt"
+                Path(__file__).parent.parent
+                / "parsers"
+                / f"content_graph_test_{uuid4().hex}.txt"
             )
             file_added.write_text(
                 "this file is created by a test in "
@@ -801,7 +809,7 @@ class TestUpdateContentGraph:
             extracted_files = list(tmp_path.glob("extracted/*"))
             assert extracted_files
             assert all(
-                file.suffix == ".graphml"
+                file.suffix == ".snapshot"
                 or file.name == "metadata.json"
                 or file.name == "depends_on.json"
                 for file in extracted_files
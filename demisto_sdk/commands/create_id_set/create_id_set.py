@@ -2,7 +2,7 @@ import os
 from collections import OrderedDict
 from genericpath import exists
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 from demisto_sdk.commands.common.constants import (
     GENERIC_COMMANDS_NAMES,
@@ -13,9 +13,14 @@ from demisto_sdk.commands.common.content_constant_paths import (
     MP_V2_ID_SET_PATH,
     XPANSE_ID_SET_PATH,
 )
+from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import open_id_set_file
-from demisto_sdk.commands.common.update_id_set import re_create_id_set
+from demisto_sdk.commands.common.update_id_set import (
+    re_create_id_set,
+    update_id_set_incrementally,
+)
 
 
 class IDSetCreator:
@@ -26,6 +31,8 @@ class IDSetCreator:
         print_logs: bool = True,
         fail_duplicates: bool = False,
         marketplace: str = "",
+        previous_id_set: Optional[Path] = None,
+        prev_ver: str = "",
         **kwargs,
     ):
         """IDSetCreator
@@ -36,6 +43,10 @@ class IDSetCreator:
             print_logs (bool, optional): Print log output. Defaults to True.
             fail_duplicates(bool, optional): Flag which marks whether create_id_set fails when duplicates
              are found or not
+            previous_id_set (str, optional): A previously created id set to update with the changed packs only,
+             instead of creating the id set from scratch.
+            prev_ver (str, optional): The commit the previous id set was created from, to find the changed packs by.
+             Required to update the previous id set.
         """
         self.output = output
         self.input = input
@@ -43,20 +54,95 @@ class IDSetCreator:
         self.fail_duplicates = fail_duplicates
         self.id_set = OrderedDict()  # type: ignore
         self.marketplace = marketplace.lower()
+        self.previous_id_set = previous_id_set
+        self.prev_ver = prev_ver
 
     def create_id_set(self):
-        self.id_set, excluded_items_by_pack, excluded_items_by_type = re_create_id_set(
-            id_set_path=self.output,
-            pack_to_create=self.input,
-            print_logs=self.print_logs,
-            fail_on_duplicates=self.fail_duplicates,
-            marketplace=self.marketplace,
-        )
+        changed_packs = self.get_changed_packs()
+        if changed_packs is not None:
+            (
+                self.id_set,
+                excluded_items_by_pack,
+                excluded_items_by_type,
+            ) = update_id_set_incrementally(
+                open_id_set_file(self.previous_id_set),
+                changed_packs,
+                print_logs=self.print_logs,
+                fail_on_duplicates=self.fail_duplicates,
+                marketplace=self.marketplace,
+            )
+            self.reset_command_to_implementing_integrations_mapping()
+            if excluded_items_by_pack:
+                # their dependents in the other packs are removed from the id set, and are only known from scratch
+                logger.info(
+                    "Items of the changed packs are excluded from the id set. Creating the id set from scratch."
+                )
+                changed_packs = None
+        if changed_packs is None:
+            (
+                self.id_set,
+                excluded_items_by_pack,
+                excluded_items_by_type,
+            ) = re_create_id_set(
+                id_set_path=self.output,
+                pack_to_create=self.input,
+                print_logs=self.print_logs,
+                fail_on_duplicates=self.fail_duplicates,
+                marketplace=self.marketplace,
+            )
 
         self.add_command_to_implementing_integrations_mapping()
         self.save_id_set()
         return self.id_set, excluded_items_by_pack, excluded_items_by_type
 
+    def get_changed_packs(self) -> Optional[Set[str]]:
+        """
+        Returns the packs which changed since the previous id set was created,
+        or None if the id set should be created from scratch.
+        """
+        if not self.previous_id_set or self.input:
+            return None
+        if not Path(self.previous_id_set).exists():
+            logger.warning(
+                f"The previous id set {self.previous_id_set} does not exist. Creating the id set from scratch."
+            )
+            return None
+        if not self.prev_ver:
+            logger.warning(
+                "The commit the previous id set was created from was not given. Creating the id set from scratch."
+            )
+            return None
+        if self.marketplace:
+            # the items excluded for the marketplace, and their dependents which are removed from the other packs,
+            # depend on the whole repository rather than on the changed packs only
+            logger.info(
+                f"An id set for the {self.marketplace} marketplace can't be updated incrementally. "
+                "Creating the id set from scratch."
+            )
+            return None
+        try:
+            return GitUtil.from_content_path().get_changed_pack_ids_since_commit(
+                self.prev_ver
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to get the changed packs from git. Creating the id set from scratch. Error: {e}"
+            )
+            return None
+
+    def reset_command_to_implementing_integrations_mapping(self):
+        """
+        Resets the commands mapped to their implementing integrations in the playbooks,
+        so the mapping is created again with the updated integrations.
+        """
+        for playbook_dict in self.id_set["playbooks"]:
+            commands_to_integration = list(playbook_dict.values())[0].get(
+                "command_to_integration", {}
+            )
+            for command, integrations in commands_to_integration.items():
+                if isinstance(integrations, list):
+                    commands_to_integration[command] = ""
+
     def add_command_to_implementing_integrations_mapping(self):
         """
         Modifies playbook set in id_set dictionary once it was created.
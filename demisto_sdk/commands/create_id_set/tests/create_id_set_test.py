@@ -4,6 +4,8 @@ from collections import OrderedDict
 from pathlib import Path
 from tempfile import mkdtemp
 
+import pytest
+
 from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.legacy_git_tools import git_path
@@ -337,6 +339,137 @@ def setup_id_set():
     return id_set_creator
 
 
+def test_create_id_set_incrementally(repo, mocker):
+    """
+    Given
+    - an id set created from three packs
+    - one pack with a new integration, one deleted pack and one unchanged pack
+
+    When
+    - create the id set with the previous id set
+
+    Then
+    - ensure only the changed pack is parsed
+    - ensure the id set is the same as the one created from scratch
+    """
+    mocker.patch.dict(os.environ, {"DEMISTO_SDK_ID_SET_REFRESH_INTERVAL": "-1"})
+    import demisto_sdk.commands.common.update_id_set as uis
+
+    mocker.patch.object(uis, "should_skip_item_by_mp", return_value=False)
+    packs = [repo.create_pack(f"Pack{i}") for i in range(3)]
+    for pack in packs:
+        pack.create_integration(
+            name=f"{pack.name}Integration"
+        ).create_default_integration(f"{pack.name}Integration")
+        pack.create_script(name=f"{pack.name}Script").create_default_script(
+            f"{pack.name}Script"
+        )
+    previous_id_set_path = Path(repo.path, "previous_id_set.json")
+
+    with ChangeCWD(repo.path):
+        IDSetCreator(str(previous_id_set_path), print_logs=False).create_id_set()
+
+        packs[0].create_integration(name="NewIntegration").create_default_integration(
+            "NewIntegration"
+        )
+        shutil.rmtree(packs[1].path)
+        git_util = mocker.patch(
+            "demisto_sdk.commands.create_id_set.create_id_set.GitUtil"
+        )
+        git_util.from_content_path.return_value.get_changed_pack_ids_since_commit.return_value = {
+            "Pack0",
+            "Pack1",
+        }
+        re_create_id_set = mocker.spy(uis, "re_create_id_set")
+        id_set, _, _ = IDSetCreator(
+            repo.id_set.path,
+            print_logs=False,
+            previous_id_set=previous_id_set_path,
+            prev_ver="1a2b3c4",
+        ).create_id_set()
+
+        assert re_create_id_set.call_args.kwargs["pack_to_create"] == [
+            os.path.join("Packs", "Pack0")
+        ]
+        expected_id_set, _, _ = IDSetCreator(
+            str(Path(repo.path, "full_id_set.json")), print_logs=False
+        ).create_id_set()
+
+    # the unchanged packs are read from the previous id set file
+    assert json.loads(json.dumps(id_set)) == json.loads(json.dumps(expected_id_set))
+    assert {list(item)[0] for item in id_set["integrations"]} == {
+        "Pack0Integration",
+        "NewIntegration",
+        "Pack2Integration",
+    }
+    assert set(id_set["Packs"]) == {"Pack0", "Pack2"}
+    assert repo.id_set.read_json_as_dict() == json.loads(json.dumps(id_set))
+
+
+@pytest.mark.parametrize(
+    "kwargs, excluded_items_by_pack",
+    [
+        pytest.param({"marketplace": ""}, {}, id="no prev-ver"),
+        pytest.param(
+            {"prev_ver": "1a2b3c4", "marketplace": "marketplacev2"},
+            {},
+            id="marketplace",
+        ),
+        pytest.param(
+            {"prev_ver": "1a2b3c4", "marketplace": ""},
+            {"Pack0": {("integration", "Pack0Integration")}},
+            id="excluded items",
+        ),
+    ],
+)
+def test_create_id_set_incrementally_from_scratch(
+    repo, mocker, kwargs, excluded_items_by_pack
+):
+    """
+    Given
+    - a previous id set
+    - case 1: without the commit it was created from
+    - case 2: of a specific marketplace
+    - case 3: items of the changed packs which are excluded from the id set
+
+    When
+    - create the id set with the previous id set
+
+    Then
+    - ensure the id set is created from scratch, as it may differ from the updated previous id set
+    """
+    from demisto_sdk.commands.create_id_set import create_id_set
+
+    previous_id_set_path = Path(repo.path, "previous_id_set.json")
+    previous_id_set_path.write_text(json.dumps({"Packs": {}}))
+    git_util = mocker.patch.object(create_id_set, "GitUtil")
+    git_util.from_content_path.return_value.get_changed_pack_ids_since_commit.return_value = {
+        "Pack0"
+    }
+    update_id_set_incrementally = mocker.patch.object(
+        create_id_set,
+        "update_id_set_incrementally",
+        return_value=({"playbooks": []}, excluded_items_by_pack, {}),
+    )
+    re_create_id_set = mocker.patch.object(
+        create_id_set,
+        "re_create_id_set",
+        return_value=({"playbooks": [], "integrations": []}, {}, {}),
+    )
+    mocker.patch.object(IDSetCreator, "save_id_set")
+
+    with ChangeCWD(repo.path):
+        IDSetCreator(
+            repo.id_set.path,
+            print_logs=False,
+            previous_id_set=previous_id_set_path,
+            **kwargs,
+        ).create_id_set()
+
+    assert update_id_set_incrementally.called == bool(excluded_items_by_pack)
+    assert re_create_id_set.called
+
+
 def test_create_command_to_implemented_integration_map(repo):
     """
     Given
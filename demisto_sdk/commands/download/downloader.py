@@ -5,11 +5,14 @@ import shutil
 import tarfile
 import traceback
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import partial
 from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import DefaultDict, Dict
+from threading import Lock
+from typing import IO, Callable, DefaultDict, Dict, Iterator, cast
 
 import demisto_client.demisto_api
 import mergedeep
@@ -56,6 +59,10 @@ from demisto_sdk.commands.format.format_module import format_manager
 from demisto_sdk.commands.init.initiator import Initiator
 from demisto_sdk.commands.split.jsonsplitter import JsonSplitter
 from demisto_sdk.commands.split.ymlsplitter import YmlSplitter
+from demisto_sdk.commands.upload.tools import ensure_connection_pool_size
+
+# The maximal number of system content items fetched from the server at the same time
+SYSTEM_CONTENT_MAX_WORKERS = 10
 
 
 class ContentItemType(Enum):
@@ -170,6 +177,9 @@ class Downloader:
         self.should_init_new_pack = init
         self.keep_empty_folders = keep_empty_folders
         self.auto_replace_uuids = auto_replace_uuids
+        self._playbook_name_to_id: dict[str, str] = {}
+        self._searched_playbook_names: set[str] = set()
+        self._playbook_ids_lock = Lock()
         if is_sdk_defined_working_offline() and self.should_run_format:
             self.should_run_format = False
             logger.warning(
@@ -244,15 +254,11 @@ class Downloader:
                         )
                         return 1
 
-                all_custom_content_data = self.download_custom_content()
-                all_custom_content_objects = self.parse_custom_content_data(
-                    file_name_to_content_item_data=all_custom_content_data
-                )
-
-                # Filter custom content so that we'll process only downloaded content
-                downloaded_content_objects = self.filter_custom_content(
-                    custom_content_objects=all_custom_content_objects
-                )
+                # Only the custom content matching the filters is kept, the rest is parsed for its ID and name only
+                (
+                    downloaded_content_objects,
+                    all_custom_content_ids,
+                ) = self.stream_custom_content()
                 for _, value in downloaded_content_objects.items():
                     if value["type"] == FileType.PLAYBOOK:
                         format_playbook_task(value)
@@ -278,7 +284,7 @@ class Downloader:
                 if self.auto_replace_uuids:
                     # Replace UUID IDs with names in filtered content (only content we download)
                     uuid_mapping = self.create_uuid_to_name_mapping(
-                        custom_content_objects=all_custom_content_objects
+                        custom_content_objects=all_custom_content_ids
                     )
 
                     self.replace_uuid_ids(
@@ -340,25 +346,12 @@ class Downloader:
         Returns:
             dict[str, dict]: A new custom content objects dict with filtered items.
         """
-        file_name_to_content_name_map = {
-            file_name: content_object["name"]
-            for file_name, content_object in custom_content_objects.items()
-        }
         filtered_custom_content_objects: dict[str, dict] = {}
         original_count = len(custom_content_objects)
         logger.debug(f"Filtering {original_count} custom content items...")
 
-        compiled_regex = re.compile(self.regex) if self.regex else None
-
         for file_name, content_item_data in custom_content_objects.items():
-            content_item_name = file_name_to_content_name_map[file_name]
-
-            # Filter according input / regex flags
-            if (
-                self.download_all_custom_content
-                or (compiled_regex and re.match(compiled_regex, content_item_name))
-                or content_item_name in self.input_files
-            ):
+            if self.is_custom_content_item_requested(content_item_data["name"]):
                 filtered_custom_content_objects[file_name] = content_item_data
 
         logger.info(
@@ -366,6 +359,22 @@ class Downloader:
         )
         return filtered_custom_content_objects
 
+    def is_custom_content_item_requested(self, content_item_name: str) -> bool:
+        """
+        Check whether a custom content item should be downloaded, according to the input / regex flags.
+
+        Args:
+            content_item_name (str): The name of the custom content item.
+
+        Returns:
+            bool: True if the custom content item should be downloaded, False otherwise.
+        """
+        return bool(
+            self.download_all_custom_content
+            or (self.regex and re.match(self.regex, content_item_name))
+            or content_item_name in self.input_files
+        )
+
     def create_uuid_to_name_mapping(
         self, custom_content_objects: dict[str, dict]
     ) -> dict[str, str]:
@@ -404,13 +413,12 @@ class Downloader:
         logger.debug("Custom content IDs mapping created successfully.")
         return mapping
 
-    def download_custom_content(self) -> dict[str, StringIO]:
+    def request_custom_content_bundle(self) -> HTTPResponse:
         """
-        Download custom content bundle using server's API,
-        and create a StringIO object containing file data for each file within it.
+        Request the custom content bundle using server's API, without loading it.
 
         Returns:
-            dict[str, StringIO]: A dictionary mapping custom content's file names to their content.
+            HTTPResponse: The response of the server, which can be read as a stream.
         """
         try:
             logger.info(
@@ -446,26 +454,83 @@ class Downloader:
             raise HandledError from e
 
         logger.debug("Custom content bundle fetched successfully.")
-        logger.debug(
-            f"Downloaded content bundle size (bytes): {len(api_response.data)}"
-        )
+        return api_response
 
-        loaded_files: dict[str, StringIO] = {}
+    def iter_custom_content(self) -> Iterator[tuple[str, StringIO]]:
+        """
+        Download custom content bundle using server's API,
+        and yield a StringIO object containing file data for each file within it, as the bundle is read.
 
-        with tarfile.open(fileobj=BytesIO(api_response.data), mode="r") as tar:
-            tar_members = tar.getmembers()
-            logger.debug(f"Custom content bundle contains {len(tar_members)} items.")
+        Yields:
+            tuple[str, StringIO]: A custom content's file name, and its content.
+        """
+        api_response = self.request_custom_content_bundle()
+        # A response whose body was already loaded is closed, and can't be read as a stream
+        bundle = cast(
+            IO[bytes],
+            BytesIO(api_response.data) if api_response.closed else api_response,
+        )
+        files_count = 0
 
-            for file in tar_members:
+        with tarfile.open(fileobj=bundle, mode="r|*") as tar:
+            for file in tar:
                 file_name = file.name.lstrip("/")
 
                 if extracted_file := tar.extractfile(file):
-                    file_data = StringIO(safe_read_unicode(extracted_file.read()))
-                    loaded_files[file_name] = file_data
+                    files_count += 1
+                    yield file_name, StringIO(safe_read_unicode(extracted_file.read()))
 
+        logger.debug(f"Custom content bundle contains {files_count} items.")
+
+    def download_custom_content(self) -> dict[str, StringIO]:
+        """
+        Download custom content bundle using server's API,
+        and create a StringIO object containing file data for each file within it.
+
+        Returns:
+            dict[str, StringIO]: A dictionary mapping custom content's file names to their content.
+        """
+        loaded_files = dict(self.iter_custom_content())
         logger.debug("Custom content items loaded to memory successfully.")
         return loaded_files
 
+    def stream_custom_content(self) -> tuple[dict[str, dict], dict[str, dict]]:
+        """
+        Download custom content bundle using server's API, and parse its files as the bundle is read.
+        Only the custom content objects matching the input / regex flags are kept,
+        so memory is bounded by the requested content rather than by all the custom content on the server.
+
+        Returns:
+            tuple[dict[str, dict], dict[str, dict]]:
+                - A dictionary mapping the requested content item's file names to their custom content objects.
+                - A dictionary mapping all the content item's file names to their IDs and names
+                  (used for replacing UUIDs).
+        """
+        logger.info("Parsing downloaded custom content data...")
+        custom_content_objects: dict[str, dict] = {}
+        custom_content_ids: dict[str, dict] = {}
+
+        for file_name, file_data in self.iter_custom_content():
+            if not (
+                custom_content_object := self.parse_custom_content_item(
+                    file_name=file_name, file_data=file_data
+                )
+            ):
+                continue
+
+            custom_content_ids[file_name] = {
+                "id": custom_content_object["id"],
+                "name": custom_content_object["name"],
+            }
+            if self.is_custom_content_item_requested(custom_content_object["name"]):
+                custom_content_objects[file_name] = custom_content_object
+
+        logger.info(
+            f"Successfully parsed {len(custom_content_ids)} custom content objects, "
+            f"{len(custom_content_objects)} of which match the provided input filters."
+        )
+        return custom_content_objects, custom_content_ids
+
     def replace_uuid_ids(
         self, custom_content_objects: dict[str, dict], uuid_mapping: dict[str, str]
     ):
@@ -587,6 +652,70 @@ class Downloader:
 
         return endpoint, request_type, request_body
 
+    def fetch_concurrently(
+        self,
+        fetch: Callable[[str], bytes],
+        content_items: list[str],
+        content_item_type_name: str,
+    ) -> list[bytes]:
+        """
+        Fetch content items from server concurrently, using a bounded number of requests at a time.
+        Items which could not be fetched are logged, and are not returned.
+
+        Args:
+            fetch (Callable[[str], bytes]): A function fetching a single content item by its name.
+            content_items (list[str]): A list of names of content items to fetch.
+            content_item_type_name (str): The type of the content items, for logging.
+
+        Returns:
+            list[bytes]: The fetched content items, in the order they were requested.
+        """
+        max_workers = max(min(SYSTEM_CONTENT_MAX_WORKERS, len(content_items)), 1)
+        ensure_connection_pool_size(self.client, max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fetch, item) for item in content_items]
+
+        downloaded_items: list[bytes] = []
+        for content_item, future in zip(content_items, futures):
+            try:
+                downloaded_items.append(future.result())
+
+            except Exception as e:
+                logger.error(
+                    f"Failed to fetch system {content_item_type_name} '{content_item}': {e}"
+                )
+
+        return downloaded_items
+
+    def fetch_system_automation(self, automation: str) -> bytes:
+        """
+        Fetch a single system automation from server.
+
+        Args:
+            automation (str): The name of the system automation to fetch.
+
+        Returns:
+            bytes: The raw data of the automation.
+        """
+        # This is required due to a server issue where the '/' character
+        # is considered a path separator for the expected_endpoint.
+        if "/" in automation:
+            raise ValueError(
+                f"Automation name '{automation}' is invalid. "
+                f"Automation names cannot contain the '/' character."
+            )
+
+        endpoint = f"automation/load/{automation}"
+        api_response = demisto_client.generic_request_func(
+            self.client,
+            endpoint,
+            "POST",
+            _preload_content=False,
+        )[0]
+
+        return api_response.data
+
     def get_system_automations(self, content_items: list[str]) -> dict[str, dict]:
         """
         Fetch system automations from server.
@@ -598,33 +727,13 @@ class Downloader:
             dict[str, dict]: A dictionary mapping downloaded automations file names,
                 to corresponding dictionaries containing metadata and content.
         """
-        downloaded_automations: list[bytes] = []
         logger.info(
             f"Fetching system automations from server ({self.client.api_client.configuration.host})..."
         )
 
-        for automation in content_items:
-            try:
-                # This is required due to a server issue where the '/' character
-                # is considered a path separator for the expected_endpoint.
-                if "/" in automation:
-                    raise ValueError(
-                        f"Automation name '{automation}' is invalid. "
-                        f"Automation names cannot contain the '/' character."
-                    )
-
-                endpoint = f"automation/load/{automation}"
-                api_response = demisto_client.generic_request_func(
-                    self.client,
-                    endpoint,
-                    "POST",
-                    _preload_content=False,
-                )[0]
-
-                downloaded_automations.append(api_response.data)
-
-            except Exception as e:
-                logger.error(f"Failed to fetch system automation '{automation}': {e}")
+        downloaded_automations = self.fetch_concurrently(
+            self.fetch_system_automation, content_items, "automation"
+        )
 
         logger.debug(
             f"Successfully fetched {len(downloaded_automations)} system automations."
@@ -649,6 +758,68 @@ class Downloader:
 
         return content_items_objects
 
+    def fetch_system_playbook(
+        self, playbook: str, playbook_names: list[str] | None = None
+    ) -> bytes:
+        """
+        Fetch a single system playbook from server.
+
+        Args:
+            playbook (str): The name of the system playbook to fetch.
+            playbook_names (list[str] | None): The names of all the playbooks being fetched,
+                to resolve their IDs together if their names and IDs are not the same.
+
+        Returns:
+            bytes: The raw data of the playbook.
+        """
+        # This is required due to a server issue where the '/' character
+        # is considered a path separator for the expected_endpoint.
+        if "/" in playbook:
+            raise ValueError(
+                f"Playbook name '{playbook}' is invalid. "
+                f"Playbook names cannot contain the '/' character."
+            )
+
+        endpoint = f"/playbook/{playbook}/yaml"
+        try:
+            api_response = demisto_client.generic_request_func(
+                self.client,
+                endpoint,
+                "GET",
+                _preload_content=False,
+            )[0]
+
+        except ApiException as err:
+            # handling in case the id and name are not the same,
+            # trying to get the id by the name through a different api call
+            logger.debug(
+                f"API call using playbook's name failed:\n{err}\n"
+                f"Attempting to fetch using playbook's ID..."
+            )
+
+            playbook_id = self.get_playbook_id_by_playbook_name(
+                playbook, playbook_names=playbook_names
+            )
+
+            if not playbook_id:
+                logger.debug(f"No matching ID found for playbook '{playbook}'.")
+                raise
+
+            logger.debug(
+                f"Found matching ID for '{playbook}' - {playbook_id}.\n"
+                f"Attempting to fetch playbook's YAML file using the ID."
+            )
+
+            endpoint = f"/playbook/{playbook_id}/yaml"
+            api_response = demisto_client.generic_request_func(
+                self.client,
+                endpoint,
+                "GET",
+                _preload_content=False,
+            )[0]
+
+        return api_response.data
+
     def get_system_playbooks(self, content_items: list[str]) -> dict[str, dict]:
         """
         Fetch system playbooks from server.
@@ -660,61 +831,15 @@ class Downloader:
             dict[str, dict]: A dictionary mapping downloaded playbooks file names,
                 to corresponding dictionaries containing metadata and content.
         """
-        downloaded_playbooks: list[bytes] = []
         logger.info(
             f"Fetching system playbooks from server ({self.client.api_client.configuration.host})..."
         )
 
-        for playbook in content_items:
-            try:
-                # This is required due to a server issue where the '/' character
-                # is considered a path separator for the expected_endpoint.
-                if "/" in playbook:
-                    raise ValueError(
-                        f"Playbook name '{playbook}' is invalid. "
-                        f"Playbook names cannot contain the '/' character."
-                    )
-
-                endpoint = f"/playbook/{playbook}/yaml"
-                try:
-                    api_response = demisto_client.generic_request_func(
-                        self.client,
-                        endpoint,
-                        "GET",
-                        _preload_content=False,
-                    )[0]
-
-                except ApiException as err:
-                    # handling in case the id and name are not the same,
-                    # trying to get the id by the name through a different api call
-                    logger.debug(
-                        f"API call using playbook's name failed:\n{err}\n"
-                        f"Attempting to fetch using playbook's ID..."
-                    )
-
-                    playbook_id = self.get_playbook_id_by_playbook_name(playbook)
-
-                    if not playbook_id:
-                        logger.debug(f"No matching ID found for playbook '{playbook}'.")
-                        raise
-
-                    logger.debug(
-                        f"Found matching ID for '{playbook}' - {playbook_id}.\n"
-                        f"Attempting to fetch playbook's YAML file using the ID."
-                    )
-
-                    endpoint = f"/playbook/{playbook_id}/yaml"
-                    api_response = demisto_client.generic_request_func(
-                        self.client,
-                        endpoint,
-                        "GET",
-                        _preload_content=False,
-                    )[0]
-
-                downloaded_playbooks.append(api_response.data)
-
-            except Exception as e:
-                logger.error(f"Failed to fetch system playbook '{playbook}': {e}")
+        downloaded_playbooks = self.fetch_concurrently(
+            partial(self.fetch_system_playbook, playbook_names=content_items),
+            content_items,
+            "playbook",
+        )
 
         if len(downloaded_playbooks):
             logger.debug(
@@ -881,47 +1006,62 @@ class Downloader:
         custom_content_objects: dict[str, dict] = {}
 
         for file_name, file_data in file_name_to_content_item_data.items():
-            try:
-                logger.debug(f"Parsing '{file_name}'...")
-                custom_content_object: Dict = self.create_content_item_object(
-                    file_name=file_name, file_data=file_data
-                )
+            if custom_content_object := self.parse_custom_content_item(
+                file_name=file_name, file_data=file_data
+            ):
+                custom_content_objects[file_name] = custom_content_object
 
-                # Check if all required fields are present
-                missing_field = False
-                for _field in ("id", "name", "entity", "type"):
-                    if not custom_content_object.get(_field):
-                        logger.warning(
-                            f"'{file_name}' will be skipped as its {_field} could not be detected."
-                        )
-                        missing_field = True
-                        break
+        logger.info(
+            f"Successfully parsed {len(custom_content_objects)} custom content objects."
+        )
+        return custom_content_objects
 
-                # If the content is missing a required field, skip it
-                if missing_field:
-                    continue
+    def parse_custom_content_item(
+        self, file_name: str, file_data: StringIO
+    ) -> dict | None:
+        """
+        Convert raw file data of a single custom content item into a custom content object.
 
-                # If the content is written in JavaScript (not supported), skip it
-                if custom_content_object["type"] in (
-                    FileType.INTEGRATION,
-                    FileType.SCRIPT,
-                ) and custom_content_object.get("code_lang") in (None, "javascript"):
+        Note:
+            Custom content items with an empty 'type' key are not supported and will be omitted.
+
+        Args:
+            file_name (str): The file name of the custom content item.
+            file_data (StringIO): The file data of the custom content item.
+
+        Returns:
+            dict | None: The custom content object, or None if the custom content item is not supported.
+        """
+        try:
+            logger.debug(f"Parsing '{file_name}'...")
+            custom_content_object: Dict = self.create_content_item_object(
+                file_name=file_name, file_data=file_data
+            )
+
+            # If the content is missing a required field, skip it
+            for _field in ("id", "name", "entity", "type"):
+                if not custom_content_object.get(_field):
                     logger.warning(
-                        f"Skipping '{file_name}' as JavaScript content is not supported."
+                        f"'{file_name}' will be skipped as its {_field} could not be detected."
                     )
-                    continue
+                    return None
 
-                custom_content_objects[file_name] = custom_content_object
+            # If the content is written in JavaScript (not supported), skip it
+            if custom_content_object["type"] in (
+                FileType.INTEGRATION,
+                FileType.SCRIPT,
+            ) and custom_content_object.get("code_lang") in (None, "javascript"):
+                logger.warning(
+                    f"Skipping '{file_name}' as JavaScript content is not supported."
+                )
+                return None
 
-            except Exception as e:
-                # We fail the whole download process, since we might miss UUIDs to replace if not.
-                logger.error(f"Error while parsing '{file_name}': {e}")
-                raise
+            return custom_content_object
 
-        logger.info(
-            f"Successfully parsed {len(custom_content_objects)} custom content objects."
-        )
-        return custom_content_objects
+        except Exception as e:
+            # We fail the whole download process, since we might miss UUIDs to replace if not.
+            logger.error(f"Error while parsing '{file_name}': {e}")
+            raise
 
     def create_custom_content_table(
         self, custom_content_objects: dict[str, dict]
@@ -1132,34 +1272,97 @@ class Downloader:
 
         return content_item_name, content_item_files
 
-    def get_playbook_id_by_playbook_name(self, playbook_name: str) -> str | None:
+    def get_playbook_id_by_playbook_name(
+        self, playbook_name: str, playbook_names: list[str] | None = None
+    ) -> str | None:
         """
         Extract the playbook id by name, calling the api returns an object that cannot be parsed properly,
         and its use is only for extracting the id.
+        The IDs are cached, and the IDs of all the given playbook names are fetched together in a single request.
 
         Args:
             playbook_name (str): The name of a playbook
+            playbook_names (list[str] | None): The names of other playbooks whose IDs may be needed later.
 
         Returns:
             str | None: The ID of a playbook
         """
-        logger.info(f"Fetching playbook ID using API for '{playbook_name}'...")
+        with self._playbook_ids_lock:
+            if playbook_name not in self._playbook_name_to_id:
+                names = [playbook_name] + [
+                    name
+                    for name in dict.fromkeys(playbook_names or ())
+                    if name != playbook_name
+                    and name not in self._searched_playbook_names
+                ]
+                self._searched_playbook_names.update(names)
+                self._playbook_name_to_id.update(self.search_playbook_ids(names))
+
+                if playbook_name not in self._playbook_name_to_id and len(names) > 1:
+                    # the search results may be limited, so search for the playbook on its own
+                    self._playbook_name_to_id.update(
+                        self.search_playbook_ids([playbook_name])
+                    )
+
+            return self._playbook_name_to_id.get(playbook_name)
+
+    @staticmethod
+    def build_playbook_names_query(playbook_names: list[str]) -> str:
+        """
+        Build a search query for playbooks by their names.
+        A single name is searched as before. Several names are each quoted and filtered on the name field,
+        as otherwise only the first one is, and names with spaces are split into separate terms.
+
+        Args:
+            playbook_names (list[str]): The names of the playbooks.
+
+        Returns:
+            str: The search query.
+        """
+        if len(playbook_names) == 1:
+            return f"name:{playbook_names[0]}"
+        return " or ".join(
+            'name:"{}"'.format(name.replace("\\", "\\\\").replace('"', '\\"'))
+            for name in playbook_names
+        )
+
+    def search_playbook_ids(self, playbook_names: list[str]) -> dict[str, str]:
+        """
+        Search the IDs of playbooks by their names, in a single request.
+
+        Args:
+            playbook_names (list[str]): The names of the playbooks.
+
+        Returns:
+            dict[str, str]: A dictionary mapping the names of the playbooks which were found to their IDs.
+        """
+        names_str = ", ".join(f"'{name}'" for name in playbook_names)
+        logger.info(f"Fetching playbook IDs using API for {names_str}...")
         endpoint = "/playbook/search"
         response = demisto_client.generic_request_func(
             self.client,
             endpoint,
             "POST",
             response_type="object",
-            body={"query": f"name:{playbook_name}"},
+            body={"query": self.build_playbook_names_query(playbook_names)},
         )
         if not response:
-            return None
+            return {}
         if not (playbooks := response[0].get("playbooks")):
-            return None
+            return {}
 
-        playbook_id = playbooks[0]["id"]
-        logger.info(f"Found playbook ID '{playbook_id}' for '{playbook_name}'")
-        return playbook_id
+        if len(playbook_names) == 1:
+            playbook_name_to_id = {playbook_names[0]: playbooks[0]["id"]}
+        else:
+            playbook_name_to_id = {
+                playbook["name"]: playbook["id"]
+                for playbook in playbooks
+                if playbook.get("name") in playbook_names
+            }
+
+        for playbook_name, playbook_id in playbook_name_to_id.items():
+            logger.info(f"Found playbook ID '{playbook_id}' for '{playbook_name}'")
+        return playbook_name_to_id
 
     @staticmethod
     def get_metadata_file(content_type: str, content_item_path: Path) -> dict | None:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import builtins
 import os
+import re
 import shutil
-from io import TextIOWrapper
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
 from typing import Callable, Tuple
 
@@ -468,6 +469,41 @@ class TestFlags:
         # We subtract one since there is one JS script in the testing content bundle that is skipped during filtration.
         assert len(custom_content_data) - 1 == len(filtered_custom_content_objects)
 
+    def test_stream_custom_content(self, tmp_path, mocker):
+        """
+        Given: A downloader object with an input of a single content item
+        When: Streaming the custom content bundle from the server
+        Then: Ensure only the requested content item is kept,
+              and the IDs and names of all the custom content items are collected
+        """
+        env = Environment(tmp_path)
+        downloader = Downloader(
+            input=("custom_script",), output=str(env.CONTENT_BASE_PATH)
+        )
+
+        mock_bundle_data = (
+            TESTS_DATA_FOLDER / "custom_content" / "download_tar.tar.gz"
+        ).read_bytes()
+        mock_bundle_response = HTTPResponse(
+            body=BytesIO(mock_bundle_data), status=200, preload_content=False
+        )
+        mocker.patch.object(
+            demisto_client,
+            "generic_request_func",
+            return_value=(mock_bundle_response, None, None),
+        )
+
+        custom_content_objects, custom_content_ids = downloader.stream_custom_content()
+
+        assert [item["name"] for item in custom_content_objects.values()] == [
+            "custom_script"
+        ]
+        assert len(custom_content_ids) == 10
+        assert all(
+            item.keys() == {"id", "name"} for item in custom_content_ids.values()
+        )
+        assert custom_content_objects.keys() <= custom_content_ids.keys()
+
     def test_init_flag(self, tmp_path, mocker):
         """
         Given: A downloader object
@@ -1414,6 +1450,106 @@ def test_get_system_playbooks_api_failure(mocker, caplog):
     assert results == {}
 
 
+def test_get_system_playbooks_resolves_ids_in_one_request(mocker, caplog):
+    """
+    Given:
+        Names of playbooks to download using the API, two of which are different from their IDs.
+    When:
+        Calling get_system_playbooks function.
+    Then:
+        - Ensure all the playbooks are downloaded.
+        - Ensure the IDs of the playbooks are searched in a single request.
+        - Ensure a playbook which can't be found is reported, without failing the others.
+    """
+    playbook_data = (TESTS_DATA_FOLDER / "playbook-DummyPlaybook2.yml").read_bytes()
+    name_to_id = {"Name 1": "id1", "Name 2": "id2"}
+
+    def get_searched_names(query: str) -> set[str]:
+        # only names filtered on the name field are searched by name, and quoted names are searched as a whole
+        return {
+            quoted or name
+            for quoted, name in re.findall(r'name:(?:"([^"]*)"|(\S+))', query)
+        }
+
+    def generic_request_side_effect(client, endpoint, method, **kwargs):
+        if endpoint == "/playbook/search":
+            names = get_searched_names(kwargs["body"]["query"])
+            return (
+                {
+                    "playbooks": [
+                        {"name": name, "id": id_}
+                        for name, id_ in name_to_id.items()
+                        if name in names
+                    ]
+                },
+                200,
+                None,
+            )
+        if endpoint in ("/playbook/DummyPlaybook/yaml", "/playbook/id1/yaml"):
+            return HTTPResponse(body=playbook_data, status=200), 200, None
+        if endpoint == "/playbook/id2/yaml":
+            return (
+                HTTPResponse(
+                    body=playbook_data.replace(b"Dummy", b"Other"), status=200
+                ),
+                200,
+                None,
+            )
+        raise ApiException(status=404, reason="Item not found")
+
+    generic_request_func_mock = mocker.patch.object(
+        demisto_client, "generic_request_func", side_effect=generic_request_side_effect
+    )
+    downloader = Downloader(input=("Test",))
+
+    results = downloader.get_system_playbooks(
+        content_items=["DummyPlaybook", "Name 1", "Name 2", "Missing"]
+    )
+
+    search_calls = [
+        call
+        for call in generic_request_func_mock.call_args_list
+        if call.args[1] == "/playbook/search"
+    ]
+    assert (
+        len(search_calls) == 2
+    )  # the first search for all the names, and one for the missing one
+    query = search_calls[0].kwargs["body"]["query"]
+    assert all(
+        re.fullmatch(r'name:"[^"]*"', term) for term in query.split(" or ")
+    )  # every name is filtered on the name field, as a whole
+    assert get_searched_names(query) == {
+        "DummyPlaybook",
+        "Name 1",
+        "Name 2",
+        "Missing",
+    }
+    assert search_calls[1].kwargs["body"]["query"] == "name:Missing"
+    assert len(results) == 2
+    assert "Failed to fetch system playbook 'Missing'" in caplog.text
+    assert "Failed to fetch system playbook 'Name" not in caplog.text
+
+
+@pytest.mark.parametrize(
+    "playbook_names, expected_query",
+    [
+        (["Name 1"], "name:Name 1"),
+        (["Name 1", "Name 2"], 'name:"Name 1" or name:"Name 2"'),
+        (['Say "Hi"', "A\\B"], 'name:"Say \\"Hi\\"" or name:"A\\\\B"'),
+    ],
+)
+def test_build_playbook_names_query(playbook_names, expected_query):
+    """
+    Given:
+        Names of playbooks, some with spaces, quotes or backslashes.
+    When:
+        Building the query to search the playbooks by.
+    Then:
+        Ensure a single name is searched as before, and several names are each quoted and filtered on the name field.
+    """
+    assert Downloader.build_playbook_names_query(playbook_names) == expected_query
+
+
 def test_list_files_flag(mocker):
     """
     Given:
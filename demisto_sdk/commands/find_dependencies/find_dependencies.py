@@ -4,7 +4,7 @@ import sys
 from copy import deepcopy
 from pathlib import Path
 from pprint import pformat
-from typing import Any, Iterable, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import networkx as nx
 from packaging.version import Version
@@ -3081,6 +3081,126 @@ def calculate_single_pack_dependencies(
     return first_level_dependencies, all_level_dependencies, pack
 
 
+def calculate_dependencies_closure(successors: List[List[int]]) -> List[int]:
+    """
+    Calculates the packs every pack depends on, directly or through other packs, in a single pass over the graph.
+
+    The packs depending on each other in a cycle (strongly connected components) are found with an iterative
+    Tarjan's algorithm, which completes every component after all the components it depends on.
+    So the closure of a component is the union of the closures of its dependencies, calculated once for all its packs.
+
+    Args:
+        successors: The indices of the packs every pack depends on directly.
+
+    Returns:
+        For every pack, a bitset of all the packs it depends on: an int whose i'th bit is set if it depends on pack i.
+        A pack depends on itself only if it is part of a dependencies cycle.
+    """
+    packs_count = len(successors)
+    indices = [-1] * packs_count
+    low_links = [0] * packs_count
+    on_stack = [False] * packs_count
+    closures = [0] * packs_count
+    stack: List[int] = []
+    next_index = 0
+
+    for root in range(packs_count):
+        if indices[root] != -1:
+            continue
+        indices[root] = low_links[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = True
+        # every frame is a pack and the position of its next dependency to visit
+        frames = [[root, 0]]
+        while frames:
+            frame = frames[-1]
+            pack, position = frame
+            if position < len(successors[pack]):
+                frame[1] += 1
+                dependency = successors[pack][position]
+                if indices[dependency] == -1:
+                    indices[dependency] = low_links[dependency] = next_index
+                    next_index += 1
+                    stack.append(dependency)
+                    on_stack[dependency] = True
+                    frames.append([dependency, 0])
+                elif on_stack[dependency]:
+                    low_links[pack] = min(low_links[pack], indices[dependency])
+                continue
+
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                low_links[parent] = min(low_links[parent], low_links[pack])
+            if low_links[pack] != indices[pack]:
+                continue
+
+            component = []
+            while True:
+                member = stack.pop()
+                on_stack[member] = False
+                component.append(member)
+                if member == pack:
+                    break
+            # the closures of the dependencies outside the component are already calculated,
+            # the members of a cycle are added by the dependencies between them.
+            closure = 0
+            for member in component:
+                for dependency in successors[member]:
+                    closure |= (1 << dependency) | closures[dependency]
+            for member in component:
+                closures[member] = closure
+
+    return closures
+
+
+def calculate_all_packs_dependencies_from_graph(
+    dependency_graph: nx.DiGraph,
+) -> Dict[str, Tuple[dict, list]]:
+    """
+    Calculates the first level and all levels dependencies of all the packs in the dependencies graph at once,
+    with the same results calculate_single_pack_dependencies returns for every pack.
+
+    Args:
+        dependency_graph: The full dependencies graph, as built by build_all_dependencies_graph.
+
+    Returns:
+        A dict of every pack to its first level dependencies and its all levels dependencies.
+    """
+    packs = list(dependency_graph.nodes)
+    pack_indices = {pack: index for index, pack in enumerate(packs)}
+    successors = [
+        sorted(
+            pack_indices[dependency] for dependency in dependency_graph.successors(pack)
+        )
+        for pack in packs
+    ]
+    closures = calculate_dependencies_closure(successors)
+
+    display_names: Dict[str, str] = {}
+    packs_dependencies = {}
+    for pack, pack_successors, closure in zip(packs, successors, closures):
+        first_level_dependencies = {}
+        for dependency in pack_successors:
+            dependency_name = packs[dependency]
+            if dependency_name not in display_names:
+                display_names[dependency_name] = find_pack_display_name(dependency_name)
+            first_level_dependencies[dependency_name] = {
+                "mandatory": pack
+                in dependency_graph.nodes[dependency_name]["mandatory_for_packs"],
+                "display_name": display_names[dependency_name],
+            }
+        # the bits of the closure from the lowest, which is the first pack
+        all_level_dependencies = [
+            packs[index]
+            for index, bit in enumerate(reversed(bin(closure)[2:]))
+            if bit == "1"
+        ]
+        packs_dependencies[pack] = first_level_dependencies, all_level_dependencies
+    return packs_dependencies
+
+
 def get_all_packs_dependency_graph(id_set: dict, packs: list) -> Iterable:
     """
     Gets a graph with dependencies for all packs
@@ -3121,36 +3241,13 @@ def select_packs_for_calculation() -> list:
 
 def calculate_all_packs_dependencies(id_set_path: str, output_path: str) -> dict:
     """
-    Calculates all packs dependencies in parallel.
-    First - the method generates the full dependency graph. Then - using a process pool we extract the
-    dependencies of each pack and adds them to the dict 'pack_dependencies_result'.
+    Calculates all packs dependencies.
+    First - the method generates the full dependency graph. Then - the dependencies of all the packs are calculated
+    in a single pass over the graph, and added to the dict 'pack_dependencies_result'.
     Args:
         id_set_path: The id_set content.
         output_path: The path for the outputs json.
     """
-
-    def add_pack_metadata_results(results: Tuple) -> None:
-        """
-        This is a callback that should be called once the result of the future is ready.
-        The results include: first_level_dependencies, all_level_dependencies, pack_name
-        Using these results we write the dependencies
-        """
-        try:
-            first_level_dependencies, all_level_dependencies, pack_name = results
-            logger.debug(
-                f"Got dependencies for pack {pack_name}\n: {pformat(all_level_dependencies)}"
-            )
-            pack_dependencies_result[pack_name] = {
-                "dependencies": first_level_dependencies,
-                "displayedImages": list(first_level_dependencies.keys()),
-                "allLevelDependencies": all_level_dependencies,
-                "path": os.path.join(PACKS_DIR, pack_name),
-                "fullPath": os.path.abspath(os.path.join(PACKS_DIR, pack_name)),
-            }
-        except Exception:
-            logger.info("<red>Failed to collect pack dependencies results</red>")
-            raise
-
     pack_dependencies_result: dict = {}
     id_set = get_id_set(id_set_path)
     packs = select_packs_for_calculation()
@@ -3158,24 +3255,28 @@ def calculate_all_packs_dependencies(id_set_path: str, output_path: str) -> dict
     # Generating one graph with dependencies for all packs
     dependency_graph = get_all_packs_dependency_graph(id_set, packs)
 
-    with ProcessPoolHandler() as pool:
-        futures = []
-        for pack in dependency_graph:
-            futures.append(
-                pool.schedule(
-                    calculate_single_pack_dependencies,
-                    args=(pack, dependency_graph),
-                )
-            )
-        wait_futures_complete(futures=futures, done_fn=add_pack_metadata_results)
-        logger.info(
-            f"Number of created pack dependencies entries: {len(pack_dependencies_result.keys())}"
+    for pack_name, (
+        first_level_dependencies,
+        all_level_dependencies,
+    ) in calculate_all_packs_dependencies_from_graph(dependency_graph).items():
+        logger.debug(
+            f"Got dependencies for pack {pack_name}\n: {pformat(all_level_dependencies)}"
         )
-        # finished iteration over pack folders
-        logger.info("<green>Finished dependencies calculation</green>")
+        pack_dependencies_result[pack_name] = {
+            "dependencies": first_level_dependencies,
+            "displayedImages": list(first_level_dependencies.keys()),
+            "allLevelDependencies": all_level_dependencies,
+            "path": os.path.join(PACKS_DIR, pack_name),
+            "fullPath": os.path.abspath(os.path.join(PACKS_DIR, pack_name)),
+        }
+    logger.info(
+        f"Number of created pack dependencies entries: {len(pack_dependencies_result.keys())}"
+    )
+    # finished iteration over pack folders
+    logger.info("<green>Finished dependencies calculation</green>")
 
-        with open(output_path, "w") as pack_dependencies_file:
-            json.dump(pack_dependencies_result, pack_dependencies_file, indent=4)
+    with open(output_path, "w") as pack_dependencies_file:
+        json.dump(pack_dependencies_result, pack_dependencies_file, indent=4)
     return pack_dependencies_result
 
 
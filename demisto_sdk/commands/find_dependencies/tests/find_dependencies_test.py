@@ -12,6 +12,8 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.find_dependencies.find_dependencies import (
     PackDependencies,
+    calculate_all_packs_dependencies_from_graph,
+    calculate_dependencies_closure,
     calculate_single_pack_dependencies,
     find_dependencies_between_two_packs,
     get_packs_dependent_on_given_packs,
@@ -3557,6 +3559,76 @@ class TestCalculateSinglePackDependencies:
                 assert not self.first_level_dependencies[node]["mandatory"]
 
 
+class TestCalculateAllPacksDependenciesFromGraph:
+    def test_calculate_dependencies_closure(self):
+        """
+        Given
+            - Dependencies between packs where 0 -> 1 -> 2 -> 1, and 3 -> 0.
+        When
+            - Calculating the dependencies closure.
+        Then
+            - Ensure every pack depends on the packs reachable from it, and only the packs in the cycle on themselves.
+        """
+        closures = calculate_dependencies_closure([[1], [2], [1], [0]])
+
+        assert closures == [0b110, 0b110, 0b110, 0b111]
+
+    def test_same_results_as_single_pack_calculation(self, mocker):
+        """
+        Given
+            - A dependencies graph with dependencies cycles, mandatory dependencies and packs without dependencies.
+        When
+            - Calculating the dependencies of all the packs at once.
+        Then
+            - Ensure the dependencies of every pack are the same as calculated for every pack by
+              calculate_single_pack_dependencies, and are ordered by the order of the packs in the graph.
+        """
+        mocker.patch(
+            "demisto_sdk.commands.find_dependencies.find_dependencies.find_pack_display_name",
+            side_effect=lambda pack: f"{pack} display name",
+        )
+        graph = nx.DiGraph()
+        packs = [f"pack{index}" for index in range(12)]
+        for pack in packs:
+            graph.add_node(
+                pack,
+                mandatory_for_packs=[],
+                depending_on_items_mandatorily={},
+                mandatory_for_items={},
+                depending_on_packs=[],
+            )
+        dependencies = [
+            (0, 1, True),
+            (1, 2, False),
+            (2, 1, False),
+            (2, 3, False),
+            (4, 0, False),
+            (4, 5, True),
+            (5, 6, False),
+            (6, 4, True),
+            (7, 3, True),
+            (8, 9, False),
+            (9, 8, False),
+        ]
+        for pack_index, dependency_index, is_mandatory in dependencies:
+            graph.add_edge(packs[pack_index], packs[dependency_index])
+            if is_mandatory:
+                graph.nodes[packs[dependency_index]]["mandatory_for_packs"].append(
+                    packs[pack_index]
+                )
+
+        packs_dependencies = calculate_all_packs_dependencies_from_graph(graph)
+
+        assert list(packs_dependencies) == packs
+        for pack in packs:
+            first_level, all_levels, _ = calculate_single_pack_dependencies(pack, graph)
+            assert packs_dependencies[pack][0] == first_level
+            assert packs_dependencies[pack][1] == sorted(all_levels, key=packs.index)
+            assert list(packs_dependencies[pack][0]) == sorted(
+                first_level, key=packs.index
+            )
+
+
 def get_mock_dependency_graph():
     graph = nx.DiGraph()
 
@@ -0,0 +1,135 @@
+import os
+import shlex
+import subprocess
+from collections import defaultdict
+from hashlib import sha1
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+from demisto_sdk.commands.common.logger import logger
+
+CONTAINER_NAME_PREFIX = "demisto-sdk-pre-commit"
+
+
+def get_docker_user_args() -> List[str]:
+    """The user to run as in the containers, the same as pre-commit uses for docker hooks."""
+    try:
+        return ["-u", f"{os.getuid()}:{os.getgid()}"]
+    except AttributeError:  # not available on Windows
+        return []
+
+
+class DockerContainerPool:
+    """Keeps one warm container per docker image alive for the whole pre-commit run.
+
+    By default, pre-commit starts a new container for every docker hook it runs.
+    When the pool is used, every docker image gets a single idle container, with the content repo mounted on `/src`
+    like pre-commit does, and the docker hooks run their commands in it with `docker exec`.
+    The containers are removed when the pool is closed.
+    Every container is started while holding a lock of its image (and arguments),
+    so concurrent callers asking for the same container don't remove each other's container.
+    """
+
+    def __init__(self) -> None:
+        self._containers: Dict[Tuple[str, str], Optional[str]] = {}
+        self._lock = Lock()
+        self._key_locks: Dict[Tuple[str, str], Lock] = defaultdict(Lock)
+
+    def get_container(self, image: str, docker_run_args: str = "") -> Optional[str]:
+        """
+        Returns the name of the warm container of the image, starting it on first use.
+
+        Args:
+            image (str): The docker image of the container.
+            docker_run_args (str): Extra arguments to start the container with.
+
+        Returns:
+            Optional[str]: The container name, or None if the container could not be started.
+        """
+        key = (image, docker_run_args)
+        with self._lock:
+            key_lock = self._key_locks[key]
+        with key_lock:
+            with self._lock:
+                if key in self._containers:
+                    return self._containers[key]
+            container = self._start_container(image, docker_run_args)
+            with self._lock:
+                self._containers[key] = container
+            return container
+
+    @staticmethod
+    def _start_container(image: str, docker_run_args: str) -> Optional[str]:
+        name = f"{CONTAINER_NAME_PREFIX}-{sha1(f'{CONTENT_PATH}|{image}|{docker_run_args}'.encode()).hexdigest()[:12]}"
+        # a container left behind by an interrupted run
+        subprocess.run(
+            ["docker", "rm", "--force", name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        process = subprocess.run(
+            [
+                "docker",
+                "run",
+                "--detach",
+                "--rm",
+                "--name",
+                name,
+                *get_docker_user_args(),
+                "--volume",
+                f"{CONTENT_PATH.absolute()}:/src:rw,Z",
+                "--workdir",
+                "/src",
+                *shlex.split(docker_run_args),
+                "--entrypoint",
+                "tail",
+                image,
+                "-f",
+                "/dev/null",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        container: Optional[str] = None
+        if process.returncode:
+            logger.warning(
+                f"Could not start a warm container for {image}, running its hooks in new containers: {process.stderr}"
+            )
+        else:
+            container = name
+            logger.debug(f"Started warm container {name} for {image}")
+        return container
+
+    @staticmethod
+    def exec_entry(
+        container: str, command: str, options: str = "", workdir: str = ""
+    ) -> str:
+        """The entry of a hook which runs the command in the warm container."""
+        return " ".join(
+            filter(
+                None,
+                (
+                    "docker exec",
+                    shlex.join(get_docker_user_args()),
+                    f"-w {workdir}" if workdir else "",
+                    options,
+                    container,
+                    command,
+                ),
+            )
+        )
+
+    def close(self) -> None:
+        """Removes all the warm containers."""
+        with self._lock:
+            containers = [name for name in self._containers.values() if name]
+            self._containers.clear()
+        if containers:
+            logger.debug(f"Removing warm containers {', '.join(containers)}")
+            subprocess.run(
+                ["docker", "rm", "--force", *containers],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
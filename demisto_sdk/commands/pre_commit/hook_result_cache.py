@@ -0,0 +1,122 @@
+from contextlib import suppress
+from functools import lru_cache
+from hashlib import sha1
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, Optional
+
+from demisto_sdk.commands.common.constants import CACHE_DIR
+from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH, PYTHONPATH
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import (
+    prune_cache_dir,
+    sha1_update_from_dir,
+    sha1_update_from_file,
+)
+
+HOOK_RESULTS_CACHE_DIR = CACHE_DIR / "pre-commit-results"
+# results which were not used recently are removed, so the cache does not grow with every change
+HOOK_RESULTS_CACHE_MAX_ENTRIES = 5000
+HOOK_RESULTS_CACHE_MAX_AGE_DAYS = 14
+
+
+@lru_cache
+def get_dependencies_hash() -> str:
+    """
+    The hash of the files every docker hook depends on: the modules in the PYTHONPATH
+    (CommonServerPython, demistomock, the API modules, etc.) and the configuration files at the root of the content repo.
+    """
+    hash_ = sha1()
+    for path in sorted(PYTHONPATH):
+        if path == CONTENT_PATH.absolute() or "site-packages" in str(path):
+            continue
+        if path.is_dir():
+            hash_.update(str(path).encode())
+            hash_ = sha1_update_from_dir(path, hash_)
+    for path in sorted(CONTENT_PATH.iterdir()) if CONTENT_PATH.is_dir() else ():
+        if path.is_file():
+            hash_.update(path.name.encode())
+            hash_ = sha1_update_from_file(path, hash_)
+    return hash_.hexdigest()
+
+
+class HookResultCache:
+    """Caches the docker hooks which passed, so they are not run again while their inputs are unchanged.
+
+    A generated docker hook is identified by a key, which is the hash of the hook configuration, the digest of the
+    docker image it runs on, the files it runs on (with the rest of the files of their content items),
+    and the files all the docker hooks depend on. Only passing results are cached, so failing hooks always run again.
+    The key does not cover everything a hook may depend on (e.g. files of other content items it imports),
+    so the cache is only used when requested (with --cache).
+    """
+
+    def __init__(self, cache_dir: Path = HOOK_RESULTS_CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+        self._hook_id_to_key: Dict[str, str] = {}
+        self._lock = Lock()
+
+    def register(
+        self,
+        hook: dict,
+        image_digest: str,
+        files: Iterable[Path],
+        content_item_dirs: Iterable[Path] = (),
+    ) -> None:
+        """
+        Computes the key of a generated hook.
+
+        Args:
+            hook (dict): The generated hook, as written to the pre-commit config.
+            image_digest (str): The digest (or the name, if it's unavailable) of the docker image the hook runs on.
+            files (Iterable[Path]): The files the hook runs on, relative to the content path.
+            content_item_dirs (Iterable[Path]): The directories of the content items of the files.
+        """
+        hash_ = sha1()
+        hash_.update(json.dumps(hook, sort_keys=True).encode())
+        hash_.update(image_digest.encode())
+        hash_.update(get_dependencies_hash().encode())
+        try:
+            for file in sorted(files):
+                hash_.update(str(file).encode())
+                if (path := CONTENT_PATH / file).is_file():
+                    hash_ = sha1_update_from_file(path, hash_)
+            for directory in sorted(set(content_item_dirs)):
+                hash_.update(str(directory).encode())
+                if directory.is_dir():
+                    hash_ = sha1_update_from_dir(directory, hash_)
+        except OSError as e:
+            logger.debug(f"Could not compute the cache key of hook {hook['id']}: {e}")
+            return
+        with self._lock:
+            self._hook_id_to_key[hook["id"]] = hash_.hexdigest()
+
+    def _path(self, hook_id: str) -> Optional[Path]:
+        if key := self._hook_id_to_key.get(hook_id):
+            return self.cache_dir / key
+        return None
+
+    def is_passed(self, hook_id: str) -> bool:
+        """Returns whether the hook already passed with the same inputs."""
+        if not ((path := self._path(hook_id)) and path.exists()):
+            return False
+        with suppress(OSError):
+            # marking the result as recently used, so it is kept when the cache is pruned
+            path.touch()
+        return True
+
+    def mark_passed(self, hook_id: str) -> None:
+        if path := self._path(hook_id):
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                path.write_text(hook_id)
+            except OSError as e:
+                logger.debug(f"Could not cache the result of hook {hook_id}: {e}")
+
+    def prune(self) -> None:
+        """Removes the results which were not used recently, keeping up to the maximal number of results."""
+        prune_cache_dir(
+            self.cache_dir,
+            HOOK_RESULTS_CACHE_MAX_ENTRIES,
+            HOOK_RESULTS_CACHE_MAX_AGE_DAYS,
+        )
@@ -39,6 +39,7 @@ from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
 )
 from demisto_sdk.commands.lint.linter import DockerImageFlagOption
+from demisto_sdk.commands.pre_commit.docker_container_pool import DockerContainerPool
 from demisto_sdk.commands.pre_commit.hooks.hook import GeneratedHooks, Hook
 
 NO_SPLIT = None
@@ -219,6 +220,19 @@ def devtest_image(
     raise DockerException(errors)
 
 
+@functools.lru_cache(maxsize=512)
+def get_image_digest(image: str) -> str:
+    """
+    Returns the id of the local docker image, which changes whenever the image is rebuilt or pulled again.
+    Falls back to the image name when the image is not available locally.
+    """
+    try:
+        return init_global_docker_client().images.get(image).id
+    except Exception as e:
+        logger.debug(f"Could not get the digest of docker image {image}: {e}")
+        return image
+
+
 def compose_docker_environment_variables(env: dict, mypy_path: bool = False) -> str:
     """
     The env needed to run python scripts in docker
@@ -433,10 +447,27 @@ class DockerHook(Hook):
         if docker_version < Version("19.03"):
             quiet = False
         docker_extra_args = self._get_property("pass_docker_extra_args", "")
-        new_hook["entry"] = (
-            f'--entrypoint {new_hook.get("entry")} {docker_extra_args} {compose_docker_environment_variables(env,mypy_path=new_hook["name"].startswith("mypy-in-docker"))} {"--quiet" if quiet else ""} {dev_image}'
+        command = new_hook.get("entry")
+        env_options = compose_docker_environment_variables(
+            env, mypy_path=new_hook["name"].startswith("mypy-in-docker")
         )
+        container = None
+        if docker_container_pool := self.context.docker_container_pool:
+            container = docker_container_pool.get_container(
+                dev_image, docker_extra_args
+            )
+        if container:
+            # run in the warm container of the image, rather than in a new container
+            new_hook["language"] = "system"
+            new_hook["entry"] = DockerContainerPool.exec_entry(
+                container, command, env_options
+            )
+        else:
+            new_hook["entry"] = (
+                f'--entrypoint {command} {docker_extra_args} {env_options} {"--quiet" if quiet else ""} {dev_image}'
+            )
         ret_hooks = []
+        hooks_inputs: List[Tuple[Set[Path], List[IntegrationScript]]] = []
         for (
             integration_script,
             files_with_objects,
@@ -476,9 +507,15 @@ class DockerHook(Hook):
                     f"{hook['name']}-{integration_script.object_id}"  # for uniqueness
                 )
                 # change the working directory to the integration script, as it runs in an isolated container
-                hook["entry"] = (
-                    f"-w {Path('/src') / integration_script.path.parent.relative_to(CONTENT_PATH)} {hook['entry']}"
+                workdir = Path("/src") / integration_script.path.parent.relative_to(
+                    CONTENT_PATH
                 )
+                if container:
+                    hook["entry"] = DockerContainerPool.exec_entry(
+                        container, command, env_options, workdir=str(workdir)
+                    )
+                else:
+                    hook["entry"] = f"-w {workdir} {hook['entry']}"
 
             if self._set_files_on_hook(
                 hook,
@@ -490,7 +527,17 @@ class DockerHook(Hook):
                 # disable multiprocessing on hook
                 hook["require_serial"] = True
                 ret_hooks.append(hook)
+                hooks_inputs.append((files, objects_))
         self.clean_args_from_hook(ret_hooks)
+        if hook_result_cache := self.context.hook_result_cache:
+            image_digest = get_image_digest(dev_image)
+            for hook, (files, objects_) in zip(ret_hooks, hooks_inputs):
+                hook_result_cache.register(
+                    hook,
+                    image_digest,
+                    files,
+                    content_item_dirs=(obj.path.parent for obj in objects_),
+                )
         return ret_hooks
 
     def _get_config_file_arg(self) -> Optional[Tuple[str, str]]:
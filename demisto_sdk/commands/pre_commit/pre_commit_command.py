@@ -1,4 +1,3 @@
-import multiprocessing
 import os
 import re
 import subprocess
@@ -23,6 +22,7 @@ from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH, PYT
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parse_pool import parse_pool
 from demisto_sdk.commands.common.tools import (
     write_dict,
 )
@@ -33,6 +33,8 @@ from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
 )
 from demisto_sdk.commands.content_graph.objects.script import Script
+from demisto_sdk.commands.pre_commit.docker_container_pool import DockerContainerPool
+from demisto_sdk.commands.pre_commit.hook_result_cache import HookResultCache
 from demisto_sdk.commands.pre_commit.hooks.docker import DockerHook
 from demisto_sdk.commands.pre_commit.hooks.hook import GeneratedHooks, Hook, join_files
 from demisto_sdk.commands.pre_commit.hooks.mypy import MypyHook
@@ -70,6 +72,7 @@ class PreCommitRunner:
         """
         hooks = pre_commit_context.hooks
 
+        template_hook_ids = set(hooks)
         custom_hooks_to_classes = {
             "pycln": PyclnHook,
             "ruff": RuffHook,
@@ -106,7 +109,8 @@ class PreCommitRunner:
         system_hooks = [
             hook_id
             for hook_id, hook in hooks.items()
-            if hook["hook"].get("language") == "system"
+            # docker hooks running in warm containers are generated as system hooks, but are already prepared
+            if hook["hook"].get("language") == "system" and hook_id in template_hook_ids
         ]
         for hook_id in system_hooks.copy():
             SystemHook(**hooks[hook_id], context=pre_commit_context).prepare_hook()
@@ -118,6 +122,7 @@ class PreCommitRunner:
         precommit_env: dict,
         verbose: bool = False,
         stdout: Optional[int] = subprocess.PIPE,
+        hook_result_cache: Optional[HookResultCache] = None,
     ) -> int:
         """This function runs the pre-commit process and waits until finished.
         We run this function in multithread.
@@ -127,10 +132,16 @@ class PreCommitRunner:
             precommit_env (dict): The pre-commit environment variables
             verbose (bool, optional): Whether print verbose output. Defaults to False.
             stdout (Optional[int], optional): The way to handle stdout. Defaults to subprocess.PIPE.
+            hook_result_cache (Optional[HookResultCache], optional): The cache of passing hooks. Defaults to None.
 
         Returns:
             int: return code - 0 if hook passed, 1 if failed
         """
+        if hook_result_cache and hook_result_cache.is_passed(hook_id):
+            logger.info(
+                f"Skipping hook {hook_id}, as it already passed and its inputs did not change."
+            )
+            return 0
         logger.debug(f"Running hook {hook_id}")
         process = PreCommitRunner._run_pre_commit_process(
             PRECOMMIT_CONFIG_MAIN_PATH,
@@ -144,6 +155,8 @@ class PreCommitRunner:
             logger.info("{}", process.stdout)  # noqa: PLE1205 see https://github.com/astral-sh/ruff/issues/13390
         if process.stderr:
             logger.error("{}", process.stderr)  # noqa: PLE1205 see https://github.com/astral-sh/ruff/issues/13390
+        if hook_result_cache and process.returncode == 0:
+            hook_result_cache.mark_passed(hook_id)
         return process.returncode
 
     @staticmethod
@@ -216,6 +229,7 @@ class PreCommitRunner:
             logger.info(f"<yellow>Running hook {pre_commit_context.run_hook}</yellow>")
 
         write_dict(PRECOMMIT_CONFIG_MAIN_PATH, pre_commit_context.precommit_template)
+        hook_result_cache = pre_commit_context.hook_result_cache
         # we don't need the context anymore, we can clear it to free up memory for the pre-commit checks
         del pre_commit_context
         # install dependencies of all hooks in advance
@@ -243,6 +257,7 @@ class PreCommitRunner:
                                 precommit_env=precommit_env,
                                 verbose=verbose,
                                 stdout=subprocess.PIPE,
+                                hook_result_cache=hook_result_cache,
                             ),
                             hook_ids,
                         )
@@ -253,6 +268,7 @@ class PreCommitRunner:
                             precommit_env=precommit_env,
                             verbose=verbose,
                             stdout=None,
+                            hook_result_cache=hook_result_cache,
                         )
                         for hook_id in hook_ids
                     ]
@@ -398,7 +414,7 @@ def group_by_language(
     for integration_script_paths in more_itertools.chunked_even(
         integrations_scripts_mapping.keys(), INTEGRATIONS_BATCH
     ):
-        with multiprocessing.Pool(processes=cpu_count()) as pool:
+        with parse_pool() as pool:
             content_items = pool.map(BaseContent.from_path, integration_script_paths)
             for content_item in content_items:
                 if not content_item or not isinstance(content_item, IntegrationScript):
@@ -508,6 +524,8 @@ def pre_commit_manager(
     docker_image: Optional[str] = None,
     run_hook: Optional[str] = None,
     pre_commit_template_path: Optional[Path] = None,
+    use_cache: bool = False,
+    warm_containers: bool = False,
 ) -> int:
     """Run pre-commit hooks .
 
@@ -527,6 +545,8 @@ def pre_commit_manager(
         image_ref: (str, optional): Override the image from YAML / native config file with this image reference.
         docker_image: (str, optional): Override the `docker_image` property in the template file. This is a comma separated list of: `from-yml`, `native:dev`, `native:ga`, `native:candidate`.
         pre_commit_template_path (Path, optional): Path to the template pre-commit file.
+        use_cache (bool, optional): Whether to skip docker hooks which already passed with the same inputs.
+        warm_containers (bool, optional): Whether to run the docker hooks in one warm container per docker image.
 
     Returns:
         int: Return code of pre-commit.
@@ -588,15 +608,25 @@ def pre_commit_manager(
         image_ref,
         docker_image,
         pre_commit_template_path=pre_commit_template_path,
+        hook_result_cache=HookResultCache() if use_cache else None,
+        docker_container_pool=DockerContainerPool()
+        if warm_containers and not dry_run
+        else None,
     )
 
-    return PreCommitRunner.prepare_and_run(
-        pre_commit_context,
-        verbose,
-        show_diff_on_failure,
-        exclude_files,
-        dry_run,
-    )
+    try:
+        return PreCommitRunner.prepare_and_run(
+            pre_commit_context,
+            verbose,
+            show_diff_on_failure,
+            exclude_files,
+            dry_run,
+        )
+    finally:
+        if pre_commit_context.docker_container_pool:
+            pre_commit_context.docker_container_pool.close()
+        if pre_commit_context.hook_result_cache:
+            pre_commit_context.hook_result_cache.prune()
 
 
 def add_related_files(file: Path) -> Set[Path]:
@@ -18,6 +18,8 @@ from demisto_sdk.commands.common.tools import (
 from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
 )
+from demisto_sdk.commands.pre_commit.docker_container_pool import DockerContainerPool
+from demisto_sdk.commands.pre_commit.hook_result_cache import HookResultCache
 from demisto_sdk.commands.pre_commit.hooks.utils import get_property
 
 IS_GITHUB_ACTIONS = string_to_bool(os.getenv("GITHUB_ACTIONS"), False)
@@ -53,6 +55,8 @@ class PreCommitContext:
     docker_image: Optional[str] = None
     dry_run: bool = False
     pre_commit_template_path: Path = PRECOMMIT_TEMPLATE_PATH
+    hook_result_cache: Optional[HookResultCache] = None
+    docker_container_pool: Optional[DockerContainerPool] = None
 
     def __post_init__(self):
         """
@@ -81,6 +85,8 @@ class PreCommitContext:
     def asdict(self):
         dct = self.__dict__.copy()
         dct.pop("language_version_to_files_with_objects", None)
+        dct.pop("hook_result_cache", None)
+        dct.pop("docker_container_pool", None)
         dct["python_version_to_files"] = self.python_version_to_files
         return dct
 
@@ -1,5 +1,7 @@
 import itertools
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -11,6 +13,9 @@ import demisto_sdk.commands.pre_commit.pre_commit_context as context
 from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.native_image import NativeImageConfig
+from demisto_sdk.commands.pre_commit import hook_result_cache
+from demisto_sdk.commands.pre_commit.docker_container_pool import DockerContainerPool
+from demisto_sdk.commands.pre_commit.hook_result_cache import HookResultCache
 from demisto_sdk.commands.pre_commit.hooks.docker import DockerHook
 from demisto_sdk.commands.pre_commit.hooks.hook import Hook, join_files
 from demisto_sdk.commands.pre_commit.hooks.ruff import RuffHook
@@ -801,3 +806,147 @@ def test_system_hooks():
         system_hook["repo"]["hooks"][0]["entry"]
         == f"{Path(sys.executable).parent}/demisto-sdk"
     )
+
+
+def test_run_hook_with_result_cache(mocker, tmp_path):
+    """
+    Given:
+        A docker hook registered in the hook result cache.
+
+    When:
+        Running the hook several times, changing its file in between.
+
+    Then:
+        - The hook runs the first time, and is skipped while its inputs are unchanged.
+        - The hook runs again once its file is changed.
+        - A failing hook is never cached.
+    """
+    mocker.patch.object(hook_result_cache, "CONTENT_PATH", tmp_path)
+    mocker.patch.object(hook_result_cache, "get_dependencies_hash", return_value="")
+    run = mocker.patch.object(subprocess, "run", return_value=MockProcess())
+    code_file = tmp_path / "integration.py"
+    code_file.write_text("print('hello')")
+    hook = {"id": "pylint-in-docker-image", "entry": "pylint", "args": []}
+
+    def run_hook() -> int:
+        cache = HookResultCache(tmp_path / "cache")
+        cache.register(hook, "sha256:digest", {Path("integration.py")})
+        return PreCommitRunner.run_hook(
+            hook["id"], precommit_env={}, hook_result_cache=cache
+        )
+
+    assert run_hook() == 0
+    assert run_hook() == 0
+    assert run.call_count == 1
+
+    code_file.write_text("print('hello world')")
+    run.return_value = MockProcess()
+    run.return_value.returncode = 1
+    assert run_hook() == 1
+    assert run_hook() == 1
+    assert run.call_count == 3
+
+
+def test_hook_result_cache_prune(mocker, tmp_path):
+    """
+    Given:
+        A hook result cache with results which were used at different times.
+
+    When:
+        Pruning the cache.
+
+    Then:
+        - Results which were not used recently are removed.
+        - Only the most recently used results are kept, up to the maximal number of results.
+    """
+    mocker.patch.object(hook_result_cache, "HOOK_RESULTS_CACHE_MAX_ENTRIES", 2)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    now = time.time()
+    for name, days_ago in (("new", 0), ("recent", 1), ("older", 2), ("stale", 30)):
+        path = cache_dir / name
+        path.write_text(name)
+        os.utime(path, (now - days_ago * 24 * 60 * 60,) * 2)
+
+    HookResultCache(cache_dir).prune()
+
+    assert {path.name for path in cache_dir.iterdir()} == {"new", "recent"}
+
+
+def test_docker_container_pool(mocker):
+    """
+    Given:
+        A docker container pool.
+
+    When:
+        Getting the warm containers of several images, and closing the pool.
+
+    Then:
+        - A single container is started per image and extra docker arguments.
+        - An image whose container could not be started gets no container.
+        - All the started containers are removed when the pool is closed.
+    """
+
+    def run_side_effect(command, **kwargs):
+        process = MockProcess()
+        process.returncode = int("broken-image" in command)
+        return process
+
+    run = mocker.patch.object(subprocess, "run", side_effect=run_side_effect)
+    pool = DockerContainerPool()
+
+    container = pool.get_container("devtestdemisto/python3:3.10")
+    assert container
+    assert pool.get_container("devtestdemisto/python3:3.10") == container
+    assert pool.get_container("devtestdemisto/python3:3.10", "--network=none") not in {
+        None,
+        container,
+    }
+    assert pool.get_container("broken-image") is None
+    started = [call.args[0] for call in run.call_args_list if "run" in call.args[0]]
+    assert len(started) == 3
+    assert "--network=none" in started[1]
+
+    entry = DockerContainerPool.exec_entry(
+        container, "pytest", '--env "A=B"', workdir="/src/Packs/Pack1"
+    )
+    assert entry.startswith("docker exec")
+    assert entry.endswith(f'-w /src/Packs/Pack1 --env "A=B" {container} pytest')
+
+    pool.close()
+    assert run.call_args.args[0][:3] == ["docker", "rm", "--force"]
+    assert len(run.call_args.args[0]) == 5
+
+
+def test_docker_container_pool_concurrent(mocker):
+    """
+    Given:
+        A docker container pool.
+
+    When:
+        Getting the warm container of the same image from several threads at once.
+
+    Then:
+        - A single container is started, and it is not removed by the other threads.
+        - All the threads get the same container.
+    """
+
+    def run_side_effect(command, **kwargs):
+        time.sleep(0.05)  # letting the other threads ask for the container meanwhile
+        return MockProcess()
+
+    run = mocker.patch.object(subprocess, "run", side_effect=run_side_effect)
+    pool = DockerContainerPool()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        containers = set(
+            executor.map(
+                lambda _: pool.get_container("devtestdemisto/python3:3.10"), range(4)
+            )
+        )
+
+    assert len(containers) == 1
+    assert [call.args[0][:2] for call in run.call_args_list] == [
+        ["docker", "rm"],
+        ["docker", "run"],
+    ]
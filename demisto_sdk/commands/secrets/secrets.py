@@ -1,10 +1,11 @@
 import math
+import multiprocessing
 import os
 import string
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 from functools import lru_cache
 from pathlib import Path
-from typing import DefaultDict
+from typing import DefaultDict, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 import PyPDF2
 from bs4 import BeautifulSoup
@@ -19,6 +20,7 @@ from demisto_sdk.commands.common.constants import (
     re,
 )
 from demisto_sdk.commands.common.content import Content
+from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     find_type,
@@ -70,6 +72,7 @@ TEXT_FILE_TYPES = {
 SKIP_FILE_TYPE_ENTROPY_CHECKS = {".eml"}
 SKIP_DEMISTO_TYPE_ENTROPY_CHECKS = {"playbook-"}
 YML_FILE_EXTENSION = ".yml"
+PRINTABLE_CHARS = frozenset(string.printable)
 
 # disable-secrets-detection-start
 # secrets
@@ -101,11 +104,103 @@ DATES_REGEX = r"((\d{4}[/.-]\d{2}[/.-]\d{2})[T\s](\d{2}:?\d{2}:?\d{2}:?(\.\d{5,1
 UUID_REGEX = r"([\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{8,12})"
 # find any substring
 WHILEIST_REGEX = r"\S*{}\S*"
+# the generic, ioc and files white lists
+WhiteLists = Tuple[set, set, set]
 
 
 # disable-secrets-detection-end
 
 
+class WhitelistMatcher:
+    """Finds whether a string contains any of the whitelist strings, using an Aho-Corasick automaton.
+
+    The automaton is built once for a whitelist, after which every string is matched in a single pass over
+    its characters, regardless of the whitelist size.
+    """
+
+    def __init__(self, white_list: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terminal: List[bool] = [False]
+        for white_item in white_list:
+            if white_item:
+                self._add(white_item)
+        self._build_fail_links()
+
+    def _add(self, white_item: str) -> None:
+        node = 0
+        for char in white_item:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminal.append(False)
+                self._goto[node][char] = next_node
+            node = next_node
+        self._terminal[node] = True
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_child = self._goto[fail].get(char, 0)
+                self._fail[child] = fail_child if fail_child != child else 0
+                # a node is terminal if any whitelist string ends in it, including the suffixes reached by its fail link
+                self._terminal[child] = (
+                    self._terminal[child] or self._terminal[self._fail[child]]
+                )
+
+    def search(self, string_: str) -> bool:
+        goto, fail, terminal = self._goto, self._fail, self._terminal
+        node = 0
+        for char in string_:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if terminal[node]:
+                return True
+        return False
+
+
+@lru_cache(maxsize=32)
+def get_whitelist_matcher(
+    white_list: FrozenSet[str], lower: bool = True
+) -> WhitelistMatcher:
+    return WhitelistMatcher(
+        white_item.lower() if lower else white_item for white_item in white_list
+    )
+
+
+_worker_state: dict = {}
+
+
+def _init_secrets_worker(
+    validator: "SecretsValidator",
+    white_lists: Dict[Tuple[bool, str], WhiteLists],
+    ignore_entropy: bool,
+) -> None:
+    _worker_state.update(
+        validator=validator, white_lists=white_lists, ignore_entropy=ignore_entropy
+    )
+
+
+def _search_file_secrets(
+    file_path: str, white_lists_key: Tuple[bool, str]
+) -> Dict[int, List[str]]:
+    return _worker_state["validator"].search_file_secrets(
+        file_path,
+        is_pack=white_lists_key[0],
+        white_lists=_worker_state["white_lists"][white_lists_key],
+        ignore_entropy=_worker_state["ignore_entropy"],
+    )
+
+
 class SecretsValidator:
     def __init__(
         self,
@@ -115,6 +210,7 @@ class SecretsValidator:
         white_list_path="",
         input_path="",
         prev_ver=None,
+        workers: Optional[int] = 1,
     ):
         self.input_paths = input_path.split(",") if input_path else None
         self.configuration = configuration
@@ -122,6 +218,8 @@ class SecretsValidator:
         self.white_list_path = white_list_path
         self.ignore_entropy = ignore_entropy
         self.prev_ver = prev_ver
+        # number of processes scanning files in parallel, a process per CPU if None
+        self.workers = workers or cpu_count()
         if self.prev_ver and not self.prev_ver.startswith(DEMISTO_GIT_UPSTREAM):
             self.prev_ver = f"{DEMISTO_GIT_UPSTREAM}/" + self.prev_ver
 
@@ -243,80 +341,132 @@ class SecretsValidator:
         secret_to_location_mapping: DefaultDict[str, defaultdict] = defaultdict(
             lambda: defaultdict(list)
         )
+        # Get generic/ioc/files white list sets based on if pack or not, once per pack
+        white_lists: Dict[Tuple[bool, str], WhiteLists] = {}
+        file_white_list_keys = []
         for file_path in secrets_file_paths:
             # Get if file path in pack and pack name
-            is_pack = is_file_path_in_pack(file_path)
-            pack_name = get_pack_name(file_path)
-            # Get generic/ioc/files white list sets based on if pack or not
-            (
-                secrets_white_list,
-                ioc_white_list,
-                files_white_list,
-            ) = self.get_white_listed_items(is_pack, pack_name)
-            # Skip white listed files
-
-            if file_path in files_white_list:
-                logger.info(
-                    f"Skipping secrets detection for file: {file_path} as it is white listed"
+            key = (is_file_path_in_pack(file_path), get_pack_name(file_path))
+            if key not in white_lists:
+                white_lists[key] = self.get_white_listed_items(*key)
+            file_white_list_keys.append(key)
+
+        workers = min(self.workers, len(secrets_file_paths))
+        if workers > 1:
+            # the white lists are sent to every worker once, rather than with every file
+            with multiprocessing.Pool(
+                processes=workers,
+                initializer=_init_secrets_worker,
+                initargs=(self, white_lists, ignore_entropy),
+            ) as pool:
+                results = pool.starmap(
+                    _search_file_secrets,
+                    zip(secrets_file_paths, file_white_list_keys),
                 )
-                continue
-            # Init vars for current loop
-            file_name = Path(file_path).name
-            _, file_extension = os.path.splitext(file_path)
-            # get file contents
-            file_contents = self.get_file_contents(file_path, file_extension)
-            # if detected disable-secrets comments, removes the line/s
-            file_contents = self.remove_secrets_disabled_line(file_contents)
-            # in packs regard all items as regex as well, reset pack's whitelist in order to avoid repetition later
-            if is_pack:
-                file_contents = self.remove_whitelisted_items_from_file(
-                    file_contents, secrets_white_list
+        else:
+            results = [
+                self.search_file_secrets(
+                    file_path,
+                    is_pack=key[0],
+                    white_lists=white_lists[key],
+                    ignore_entropy=ignore_entropy,
                 )
+                for file_path, key in zip(secrets_file_paths, file_white_list_keys)
+            ]
 
-            yml_file_contents = self.get_related_yml_contents(file_path)
-            # Add all context output paths keywords to whitelist temporary
-            if file_extension == YML_FILE_EXTENSION or yml_file_contents:
-                temp_white_list = self.create_temp_white_list(
-                    yml_file_contents if yml_file_contents else file_contents
-                )
-                secrets_white_list = secrets_white_list.union(temp_white_list)
-            # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
-            for line_num, line in enumerate(file_contents.split("\n")):
-                # REGEX scanning for IOCs and false positive groups
-                regex_secrets, false_positives = self.regex_for_secrets(line)
-                for regex_secret in regex_secrets:
-                    if not any(
-                        ioc.lower() in regex_secret.lower() for ioc in ioc_white_list
-                    ):
-                        secret_to_location_mapping[file_path][line_num + 1].append(
-                            regex_secret
-                        )
-                # added false positives into white list array before testing the strings in line
+        for file_path, file_secrets in zip(secrets_file_paths, results):
+            for line_num, secrets in file_secrets.items():
+                secret_to_location_mapping[file_path][line_num].extend(secrets)
+        return secret_to_location_mapping
 
-                secrets_white_list = secrets_white_list.union(false_positives)
+    def search_file_secrets(
+        self,
+        file_path: str,
+        is_pack: bool,
+        white_lists: WhiteLists,
+        ignore_entropy: bool = False,
+    ) -> Dict[int, List[str]]:
+        """Returns potential secrets(sensitive data) found in a file
+        :param file_path: path of the file to search
+        :param is_pack: whether the file is in a pack
+        :param white_lists: the generic, ioc and files white lists of the file's pack
+        :param ignore_entropy: If True then will ignore running entropy algorithm for finding potential secrets
+
+        :return: dictionary(line number: (list)secrets) of the lines secrets were found in
+        """
+        secrets_white_list, ioc_white_list, files_white_list = white_lists
+        file_secrets: DefaultDict[int, List[str]] = defaultdict(list)
+        # Skip white listed files
+        if file_path in files_white_list:
+            logger.info(
+                f"Skipping secrets detection for file: {file_path} as it is white listed"
+            )
+            return {}
+        # Init vars for current loop
+        file_name = Path(file_path).name
+        _, file_extension = os.path.splitext(file_path)
+        # get file contents
+        file_contents = self.get_file_contents(file_path, file_extension)
+        # if detected disable-secrets comments, removes the line/s
+        file_contents = self.remove_secrets_disabled_line(file_contents)
+        # in packs regard all items as regex as well, reset pack's whitelist in order to avoid repetition later
+        if is_pack:
+            file_contents = self.remove_whitelisted_items_from_file(
+                file_contents, secrets_white_list
+            )
+
+        yml_file_contents = self.get_related_yml_contents(file_path)
+        white_list_matchers = [get_whitelist_matcher(frozenset(secrets_white_list))]
+        # Add all context output paths keywords to whitelist temporary
+        if file_extension == YML_FILE_EXTENSION or yml_file_contents:
+            temp_white_list = self.create_temp_white_list(
+                yml_file_contents if yml_file_contents else file_contents
+            )
+            white_list_matchers.append(WhitelistMatcher(temp_white_list))
+        # false positives are found line by line, they are few and matched one by one
+        false_positives_white_list: set = set()
+        # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
+        for line_num, line in enumerate(file_contents.split("\n")):
+            # REGEX scanning for IOCs and false positive groups
+            regex_secrets, false_positives = self.regex_for_secrets(line)
+            for regex_secret in regex_secrets:
+                if not any(
+                    ioc.lower() in regex_secret.lower() for ioc in ioc_white_list
+                ):
+                    file_secrets[line_num + 1].append(regex_secret)
+            # added false positives into white list array before testing the strings in line
+
+            false_positives_white_list.update(
+                false_positive.lower() for false_positive in false_positives
+            )
 
-                if not ignore_entropy:
-                    # due to nature of eml files, skip string by string secret detection - only regex
-                    if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or any(
-                        demisto_type in file_name
-                        for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS
+            if not ignore_entropy:
+                # due to nature of eml files, skip string by string secret detection - only regex
+                if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or any(
+                    demisto_type in file_name
+                    for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS
+                ):
+                    continue
+                line = self.remove_false_positives(line)
+                # compare the lower case of the strings against both generic whitelist & temp white list
+                candidates = []
+                for string_ in line.split():
+                    lower_string = string_.lower()
+                    if not any(
+                        matcher.search(lower_string) for matcher in white_list_matchers
+                    ) and not any(
+                        false_positive in lower_string
+                        for false_positive in false_positives_white_list
                     ):
-                        continue
-                    line = self.remove_false_positives(line)
-                    # calculate entropy for each string in the file
-                    for string_ in line.split():
-                        # compare the lower case of the string against both generic whitelist & temp white list
-                        if not any(
-                            white_list_string.lower() in string_.lower()
-                            for white_list_string in secrets_white_list
-                        ):
-                            entropy = self.calculate_shannon_entropy(string_)
-                            if entropy >= ENTROPY_THRESHOLD:
-                                secret_to_location_mapping[file_path][
-                                    line_num + 1
-                                ].append(string_)
+                        candidates.append(string_)
+                # calculate entropy for each string in the file
+                for string_, entropy in zip(
+                    candidates, self.calculate_shannon_entropies(candidates)
+                ):
+                    if entropy >= ENTROPY_THRESHOLD:
+                        file_secrets[line_num + 1].append(string_)
 
-        return secret_to_location_mapping
+        return dict(file_secrets)
 
     @staticmethod
     def remove_whitelisted_items_from_file(
@@ -331,7 +481,20 @@ class SecretsValidator:
         Returns:
             str: The file content with the whitelisted items removed.
         """
+        # removing every non-whitespace string containing a whitelisted item, in a single pass over the file
+        matcher = get_whitelist_matcher(
+            frozenset(item for item in secrets_white_list if item.split() == [item]),
+            lower=False,
+        )
+        file_content = re.sub(
+            r"\S+",
+            lambda match: "" if matcher.search(match.group()) else match.group(),
+            file_content,
+        )
+        # items which are empty or contain whitespace span several strings, so they are removed one by one
         for item in secrets_white_list:
+            if item.split() == [item]:
+                continue
             try:
                 file_content = re.sub(
                     WHILEIST_REGEX.format(re.escape(item)), "", file_content
@@ -440,6 +603,23 @@ class SecretsValidator:
                 entropy += -p_x * math.log(p_x, 2)
         return entropy
 
+    @staticmethod
+    def calculate_shannon_entropies(strings: List[str]) -> List[float]:
+        """Calculates the entropy of every string, the same as calculate_shannon_entropy.
+        The characters of every string are counted in a single pass, rather than once per printable character.
+        :param strings: the strings to calculate the entropy of.
+        :return: the entropy score of every string.
+        """
+        entropies = []
+        for data in strings:
+            entropy = 0.0
+            counts = Counter(data)
+            for char in PRINTABLE_CHARS.intersection(counts):
+                p_x = counts[char] / len(data)
+                entropy += -p_x * math.log(p_x, 2)
+            entropies.append(entropy)
+        return entropies
+
     def get_white_listed_items(self, is_pack, pack_name):
         (
             final_white_list,
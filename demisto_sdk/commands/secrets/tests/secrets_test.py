@@ -2,9 +2,11 @@ import os
 import shutil
 from pathlib import Path
 
+import pytest
+
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.legacy_git_tools import git_path
-from demisto_sdk.commands.secrets.secrets import SecretsValidator
+from demisto_sdk.commands.secrets.secrets import SecretsValidator, WhitelistMatcher
 
 
 def create_whitelist_secrets_file(
@@ -196,6 +198,51 @@ my_email = "fooo@someorg.com"
             4: ["fooo@someorg.com"]
         }
 
+    def test_search_potential_secrets__parallel(self, repo, mocker):
+        """
+        Given
+        - Three files of the same pack, containing secrets.
+
+        When
+        - Searching for secrets with two processes.
+
+        Then
+        - Ensure the white lists are loaded once for the pack.
+        - Ensure the secrets found are the same as the ones found sequentially.
+        """
+        create_empty_whitelist_secrets_file(
+            os.path.join(TestSecrets.TEMP_DIR, TestSecrets.WHITE_LIST_FILE_NAME)
+        )
+        validator = SecretsValidator(
+            is_circle=True,
+            white_list_path=os.path.join(
+                TestSecrets.TEMP_DIR, TestSecrets.WHITE_LIST_FILE_NAME
+            ),
+            workers=2,
+        )
+        pack = repo.create_pack("pack")
+        file_paths = []
+        for i in range(3):
+            integration = pack.create_integration(f"integration{i}")
+            integration.yml.write_dict(
+                {
+                    "deprecated": f"API_KEY = OIifdsnsjkgnj3254nkdfsjKNJD034{i} # secret \n"
+                    f"my_email = 'fooo{i}@someorg.com'"
+                }
+            )
+            file_paths.append(integration.yml.path)
+        get_white_listed_items = mocker.spy(validator, "get_white_listed_items")
+
+        secrets_found = validator.search_potential_secrets(file_paths)
+
+        assert get_white_listed_items.call_count == 1
+        validator.workers = 1
+        assert secrets_found == validator.search_potential_secrets(file_paths)
+        assert secrets_found[file_paths[2]][1] == [
+            "fooo2@someorg.com",
+            "OIifdsnsjkgnj3254nkdfsjKNJD0342",
+        ]
+
     def test_remove_white_list_regex(self):
         white_list = "155.165.45.232"
         file_contents = """
@@ -270,6 +317,47 @@ my_email = "fooo@someorg.com"
         entropy = self.validator.calculate_shannon_entropy(test_string)
         assert entropy == 2.0
 
+    def test_calculate_shannon_entropies(self):
+        """
+        Given
+        - Strings of low and high entropy, including non-printable characters.
+
+        When
+        - Calculating the entropies of all the strings together.
+
+        Then
+        - Ensure they equal the entropies calculated one by one.
+        """
+        strings = ["SADE", "OCSn7JGqKehoyIyMCm7gPFjKXpawXvh2M32", "a\x00b\u05d0", ""]
+        entropies = self.validator.calculate_shannon_entropies(strings)
+        assert entropies == pytest.approx(
+            [self.validator.calculate_shannon_entropy(string_) for string_ in strings]
+        )
+
+    @pytest.mark.parametrize(
+        "white_list, string_, expected",
+        [
+            ({"sha256", "uuid"}, "file.sha256", True),
+            ({"sha256", "uuid"}, "file.md5", False),
+            ({"abcd", "bcf"}, "xabcf", True),  # a match reached through a fail link
+            ({"abcde", "cd"}, "abcdx", True),  # a match inside a longer white list item
+            ({"abcde"}, "abcd", False),
+            (set(), "anything", False),
+        ],
+    )
+    def test_whitelist_matcher(self, white_list, string_, expected):
+        """
+        Given
+        - A white list, and a string.
+
+        When
+        - Searching the white list items in the string.
+
+        Then
+        - Ensure the string is matched only if it contains any of the white list items.
+        """
+        assert WhitelistMatcher(white_list).search(string_) is expected
+
     def test_get_packs_white_list(self):
         (
             final_white_list,
@@ -0,0 +1,74 @@
+from typing import Callable, Dict, List, Sequence, Set, TypeVar
+
+T = TypeVar("T")
+
+
+def group_by_locks(
+    tests: Sequence[T], get_locks: Callable[[T], Set[str]]
+) -> List[List[T]]:
+    """
+    Groups the tests which share a lock, directly or through other tests. The groups keep the order of the tests.
+    """
+    parents: Dict[int, int] = {}
+
+    def find(index: int) -> int:
+        while parents.setdefault(index, index) != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    lock_owners: Dict[str, int] = {}
+    for index, test in enumerate(tests):
+        for lock in get_locks(test):
+            if lock in lock_owners:
+                parents[find(index)] = find(lock_owners[lock])
+            else:
+                lock_owners[lock] = index
+
+    groups: Dict[int, List[T]] = {}
+    for index, test in enumerate(tests):
+        groups.setdefault(find(index), []).append(test)
+    return list(groups.values())
+
+
+def plan_shards(
+    tests: Sequence[T],
+    shards_count: int,
+    get_duration: Callable[[T], float],
+    get_locks: Callable[[T], Set[str]] = lambda test: set(),
+    can_run_on: Callable[[T, int], bool] = lambda test, shard: True,
+) -> List[List[T]]:
+    """
+    Assigns the tests to shards (servers), so all the shards finish at about the same time.
+
+    Uses longest-processing-time-first: the longest remaining test is assigned to the least loaded shard.
+    Tests sharing a lock can not run at the same time anyway, so they are assigned to the same shard as a single unit,
+    instead of waiting on each other from different shards.
+
+    Args:
+        tests: The tests to assign.
+        shards_count: The number of shards.
+        get_duration: Returns the expected duration of a test.
+        get_locks: Returns the locks a test holds while running.
+        can_run_on: Returns whether a test can run on a shard (by its index).
+
+    Returns:
+        The tests of every shard, in their original order.
+    """
+    loads = [0.0] * shards_count
+    shards: List[List[T]] = [[] for _ in range(shards_count)]
+    groups = group_by_locks(tests, get_locks)
+    durations = [sum(get_duration(test) for test in group) for group in groups]
+    for group_index in sorted(range(len(groups)), key=lambda index: -durations[index]):
+        group = groups[group_index]
+        candidates = [
+            shard
+            for shard in range(shards_count)
+            if all(can_run_on(test, shard) for test in group)
+        ] or list(range(shards_count))
+        shard = min(candidates, key=lambda index: loads[index])
+        loads[shard] += durations[group_index]
+        shards[shard].extend(group)
+
+    order = {id(test): index for index, test in enumerate(tests)}
+    return [sorted(shard, key=lambda test: order[id(test)]) for shard in shards]
@@ -1,6 +1,7 @@
 import logging  # noqa: TID251 # special case: parallel logging
 import os
 import re
+import statistics
 import sys
 import time
 import urllib.parse
@@ -11,7 +12,8 @@ from datetime import datetime, timezone
 from math import ceil
 from pathlib import Path
 from pprint import pformat
-from queue import Empty, Queue
+from queue import Queue
+from threading import Lock
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import demisto_client
@@ -49,6 +51,8 @@ from demisto_sdk.commands.test_content.mock_server import (
 from demisto_sdk.commands.test_content.ParallelLoggingManager import (
     ParallelLoggingManager,
 )
+from demisto_sdk.commands.test_content.ShardingPlanner import plan_shards
+from demisto_sdk.commands.test_content.TestScheduler import TestScheduler
 from demisto_sdk.commands.test_content.tools import (
     get_ui_url,
     is_redhat_instance,
@@ -213,6 +217,22 @@ class TestPlaybook:
         ]
         self.populate_test_suite()
 
+    @property
+    def integration_names_to_lock(self) -> Set[str]:
+        return {integration.name for integration in self.integrations_to_lock}
+
+    @property
+    def sets_server_keys(self) -> bool:
+        """
+        Whether any of the test's integrations is configured with server keys, which change the server configuration.
+        """
+        integration_names = {integration.name for integration in self.integrations}
+        return any(
+            "server_keys" in integration_configuration.params
+            for integration_configuration in self.build_context.secret_conf.integrations
+            if integration_configuration.name in integration_names
+        )
+
     def log_debug(self, message: str, real_time: bool = False):
         self.build_context.logging_module.debug(message, real_time)
         self.test_suite_system_out.append(message)
@@ -793,6 +813,8 @@ class BuildContext:
         )
         self.cloud_servers_path = kwargs.get("cloud_servers_path")
         self.use_retries_mechanism = kwargs.get("use_retries", False)
+        self.max_parallel_tests = kwargs.get("max_parallel_tests") or 1
+        self.shard_tests = kwargs.get("shard_tests", False)
         self.conf, self.secret_conf = self._load_conf_files(
             kwargs["conf"], kwargs["secret"]
         )
@@ -814,6 +836,7 @@ class BuildContext:
             kwargs["artifacts_path"],
             kwargs.get("service_account"),
             kwargs.get("artifacts_bucket"),
+            kwargs.get("durations_history"),
         )
         self.conf_unmockable_tests = self._get_unmockable_tests_from_conf()
         self.machine_assignment_json = get_json_file(kwargs["machine_assignment"])
@@ -828,7 +851,7 @@ class BuildContext:
         """
         Create servers object based on build type.
         """
-        return (
+        servers: List[ServerContext] = (
             [
                 CloudServerContext(
                     self,
@@ -850,6 +873,55 @@ class BuildContext:
                 for server_ip in self.instances_ips
             ]
         )
+        if self.shard_tests and not self.is_saas_server_type and len(servers) > 1:
+            self._shard_tests(servers)
+        return servers
+
+    def _shard_tests(self, servers: List["ServerContext"]):
+        """
+        Splits the tests between the servers (which would otherwise all run all the tests),
+        so the servers finish at about the same time, by the durations of the tests in previous builds.
+        Tests without a recorded duration are assumed to take the median duration (or their timeout, with no history).
+        The unmockable tests of a server run concurrently, so their durations are divided by 'max_parallel_tests'.
+        """
+        test_playbooks: List[TestPlaybook] = list(
+            servers[0].mockable_tests_to_run.queue
+        ) + list(servers[0].unmockable_tests_to_run.queue)
+        durations = self.tests_data_keeper.durations_history
+        median_duration = statistics.median(durations.values()) if durations else None
+
+        def get_duration(test_playbook: TestPlaybook) -> float:
+            duration = durations.get(
+                test_playbook.configuration.playbook_id,
+                median_duration or test_playbook.configuration.timeout,
+            )
+            if test_playbook.is_mockable:
+                return duration
+            return duration / self.max_parallel_tests
+
+        def can_run_on(test_playbook: TestPlaybook, server_index: int) -> bool:
+            return (
+                not test_playbook.configuration.runnable_on_docker_only
+                or servers[server_index].is_instance_using_docker
+            )
+
+        shards = plan_shards(
+            test_playbooks,
+            len(servers),
+            get_duration,
+            get_locks=lambda test_playbook: test_playbook.integration_names_to_lock,
+            can_run_on=can_run_on,
+        )
+        for server, shard in zip(servers, shards):
+            playbook_ids = {
+                test_playbook.configuration.playbook_id for test_playbook in shard
+            }
+            server.keep_tests(playbook_ids)
+            self.logging_module.info(
+                f"Assigned {len(playbook_ids)} tests to server {server.server_ip}, expected to take "
+                f"{sum(get_duration(test_playbook) for test_playbook in shard):.0f} seconds",
+                real_time=True,
+            )
 
     def _get_instances_ips(self) -> List[str]:
         """
@@ -998,12 +1070,12 @@ class ServerContext:
         self.client: Optional[DefaultApi] = None
         self.is_instance_using_docker = not is_redhat_instance(self.server_ip)
         self.executed_tests: Set[str] = set()
-        self.executed_in_current_round: Set[str] = set()
         self.prev_system_conf: dict = {}
 
         # --------------------------- Testing preparation -------------------------------
 
         self.use_retries_mechanism: bool = use_retries_mechanism
+        self.max_parallel_tests: int = build_context.max_parallel_tests
         self.unmockable_test_ids: Set[str] = set()
         self.filtered_tests: List[str] = []
         self.test_retries_queue: Queue = Queue()
@@ -1019,30 +1091,52 @@ class ServerContext:
 
     def _execute_tests(self, queue: Queue):
         """
-        Iterates the tests queue and executes them as long as there are tests to execute.
+        Executes the tests in the queue, running up to 'max_parallel_tests' of them concurrently.
         Before the tests execution starts we will reset the containers to make sure the proxy configuration is correct
         - We need it before the mockable tests because the server starts the python2 default container when it starts,
             and it has no proxy configurations.
         - We need it before the unmockable tests because at that point all containers will have the proxy configured,
             and we want to clean those configurations when testing unmockable playbooks
+        When tests run concurrently, tests with longer timeouts are started first (otherwise, the tests run in the
+        order of the queue). Tests sharing a locked integration do not run concurrently,
+        and mockable tests (which share the proxy) and tests setting server keys run alone.
+        Tests which could not be executed (their integrations are locked by another build) are executed again later.
         Args:
             queue: The queue to fetch tests to execute from
         """
         self.reset_containers()
-        while queue.unfinished_tasks:
-            try:
-                test_playbook: TestPlaybook = queue.get(block=False)
-                self._reset_tests_round_if_necessary(test_playbook, queue)
-            except Empty:
-                continue
-            self.configure_new_client()
-            if TestContext(
-                self.build_context, test_playbook, self.client, self
-            ).execute_test(self.proxy):
-                self.executed_tests.add(test_playbook.configuration.playbook_id)
-            else:
-                queue.put(test_playbook)
-            queue.task_done()
+        TestScheduler(
+            self._execute_test,
+            queue,
+            max_parallel_tests=self.max_parallel_tests,
+            get_priority=lambda test_playbook: -test_playbook.configuration.timeout
+            if self.max_parallel_tests > 1
+            else 0,
+            get_locks=lambda test_playbook: test_playbook.integration_names_to_lock,
+            is_exclusive=lambda test_playbook: test_playbook.is_mockable
+            or test_playbook.sets_server_keys,
+        ).run()
+
+    def _execute_test(self, test_playbook: TestPlaybook) -> bool:
+        """
+        Executes a test with a client of its own.
+        Returns:
+            True if the test was executed else False
+        """
+        client = self._create_client()
+        try:
+            executed = TestContext(
+                self.build_context, test_playbook, client, self
+            ).execute_test(self.proxy)
+        finally:
+            self._close_client(client)
+        if executed:
+            self.executed_tests.add(test_playbook.configuration.playbook_id)
+            self.build_context.tests_data_keeper.add_playbook_duration(
+                test_playbook.configuration.playbook_id,
+                (datetime.now(timezone.utc) - test_playbook.start_time).total_seconds(),
+            )
+        return executed
 
     def _execute_mockable_tests(self):
         """
@@ -1067,46 +1161,45 @@ class ServerContext:
     def _execute_failed_tests(self):
         self._execute_tests(self.test_retries_queue)
 
-    def _reset_tests_round_if_necessary(
-        self, test_playbook: TestPlaybook, queue_: Queue
-    ):
+    def keep_tests(self, playbook_ids: Set[str]):
         """
-        Checks if the string representation of the current test configuration is already in
-        the executed_in_current_round set.
-        If it is- it means we have already executed this test, and we have reached a round and there are tests that
-        were not able to be locked by this execution.
-        In that case we want to start a new round monitoring by emptying the 'executed_in_current_round' set and sleep
-        in order to let the tests be unlocked
-        Since this operation can be performed by multiple threads - this operation is protected by the queue's lock
+        Keeps only the given tests in the queues of the tests to run.
         Args:
-            test_playbook: Test playbook to check if has been executed in the current round
-            queue_: The queue from which the current tests are executed
-        """
-        queue_.mutex.acquire()
-        if str(test_playbook.configuration) in self.executed_in_current_round:
-            self.build_context.logging_module.info(
-                "all tests in the queue were executed, sleeping for 30 seconds to let locked tests get unlocked."
-            )
-            self.executed_in_current_round = {str(test_playbook.configuration)}
-            queue_.mutex.release()
-            time.sleep(30)
-            return
-        else:
-            self.executed_in_current_round.add(str(test_playbook.configuration))
-        queue_.mutex.release()
+            playbook_ids: The IDs of the test playbooks to keep.
+        """
+        for queue in (self.mockable_tests_to_run, self.unmockable_tests_to_run):
+            test_playbooks = []
+            while not queue.empty():
+                test_playbooks.append(queue.get())
+                queue.task_done()
+            for test_playbook in test_playbooks:
+                if test_playbook.configuration.playbook_id in playbook_ids:
+                    queue.put(test_playbook)
+        self.filtered_tests = [
+            playbook_id
+            for playbook_id in self.filtered_tests
+            if playbook_id in playbook_ids
+        ]
 
-    def configure_new_client(self):
-        if self.client:
-            self.client.api_client.pool.close()
-            self.client.api_client.pool.terminate()
-            del self.client
-        self.client = demisto_client.configure(
+    def _create_client(self) -> DefaultApi:
+        return demisto_client.configure(
             base_url=self.server_url,
             api_key=self.api_key,
             auth_id=self.auth_id,
             verify_ssl=False,
         )
 
+    @staticmethod
+    def _close_client(client: DefaultApi):
+        client.api_client.pool.close()
+        client.api_client.pool.terminate()
+
+    def configure_new_client(self):
+        if self.client:
+            self._close_client(self.client)
+            del self.client
+        self.client = self._create_client()
+
     @abstractmethod
     def reset_containers(self):
         pass
@@ -1613,6 +1706,7 @@ class TestResults:
         artifacts_path: str,
         service_account: str = None,
         artifacts_bucket: str = None,
+        durations_history_path: Optional[str] = None,
     ):
         self.succeeded_playbooks: List[str] = []
         self.failed_playbooks: Set[str] = set()
@@ -1627,6 +1721,50 @@ class TestResults:
         self.artifacts_path = Path(artifacts_path)
         self.service_account = service_account
         self.artifacts_bucket = artifacts_bucket
+        self.playbook_durations: Dict[str, List[float]] = {}
+        self._playbook_durations_lock = Lock()
+        self.durations_history_path = (
+            Path(durations_history_path) if durations_history_path else None
+        )
+        self.durations_history: Dict[str, float] = self._load_durations_history()
+
+    def _load_durations_history(self) -> Dict[str, float]:
+        if not self.durations_history_path or not self.durations_history_path.exists():
+            return {}
+        try:
+            return get_json_file(self.durations_history_path)
+        except Exception:
+            # a corrupted history is overwritten by the durations of the current build
+            return {}
+
+    def add_playbook_duration(self, playbook_id: str, duration: float):
+        """
+        Records the duration of an execution of a test playbook, keeping the durations of all its executions
+        (e.g. retries) apart.
+        """
+        with self._playbook_durations_lock:
+            self.playbook_durations.setdefault(playbook_id, []).append(duration)
+
+    def save_durations_history(self):
+        """
+        Updates the durations history file with the durations of the test playbooks executed in this build
+        (averaged over their executions), averaged with their previous durations.
+        """
+        if not self.durations_history_path or not self.playbook_durations:
+            return
+        durations_history = dict(self.durations_history)
+        for playbook_id, durations in self.playbook_durations.items():
+            duration = statistics.mean(durations)
+            previous_duration = durations_history.get(playbook_id)
+            durations_history[playbook_id] = round(
+                duration
+                if previous_duration is None
+                else (previous_duration + duration) / 2,
+                2,
+            )
+        self.durations_history_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.durations_history_path, "w") as durations_history_file:
+            json.dump(durations_history, durations_history_file, indent=4)
 
     def add_proxy_related_test_data(self, proxy):
         # Using multiple appends and not extend since append is guaranteed to be thread safe
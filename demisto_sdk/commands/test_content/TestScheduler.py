@@ -0,0 +1,177 @@
+import itertools
+import time
+from queue import Empty, Queue
+from threading import Condition, Thread, current_thread
+from typing import Any, Callable, Dict, List, Optional, Set
+
+LOCKED_TEST_RETRY_DELAY = 30
+
+
+class ScheduledTest:
+    def __init__(self, test: Any, priority: int, sequence: int, ready_at: float):
+        self.test = test
+        self.priority = priority
+        self.sequence = sequence
+        self.ready_at = ready_at
+
+
+class TestScheduler:
+    """
+    Runs the tests of a server, up to 'max_parallel_tests' of them concurrently.
+
+    Pending tests are started by their priority (lowest first), and then by the order they were added in.
+    A test is not started while a running test shares one of its locks (the integrations it locks),
+    and an exclusive test (e.g. one changing the server configuration) only runs alone.
+    A test which could not be executed (e.g. its integrations are locked by another build) is added back with a delay.
+    The workers wait on a condition until a test can be started, instead of polling the pending tests.
+    Tests put in the given queue, also while running (e.g. tests to retry), are added to the pending tests.
+
+    Example
+    -------
+    >>> scheduler = TestScheduler(execute_test, queue, max_parallel_tests=4, get_locks=lambda test: set(test.integrations))
+    >>> scheduler.put(test, priority=-test.timeout)
+    >>> scheduler.run()
+    """
+
+    def __init__(
+        self,
+        execute_test: Callable[[Any], bool],
+        queue: Optional[Queue] = None,
+        max_parallel_tests: int = 1,
+        get_priority: Callable[[Any], int] = lambda test: 0,
+        get_locks: Callable[[Any], Set[str]] = lambda test: set(),
+        is_exclusive: Callable[[Any], bool] = lambda test: False,
+        locked_test_retry_delay: float = LOCKED_TEST_RETRY_DELAY,
+    ):
+        """
+        Args:
+            execute_test: Executes a test, returns whether it was executed (False if it should be executed again later).
+            queue: A queue of tests to add to the pending tests.
+            max_parallel_tests: The maximal number of tests to run concurrently.
+            get_priority: Returns the priority of a test taken from the queue.
+            get_locks: Returns the locks a test holds while running.
+            is_exclusive: Returns whether a test must run while no other test is running.
+            locked_test_retry_delay: The seconds to wait before starting again a test which could not be executed.
+        """
+        self.execute_test = execute_test
+        self.queue = queue
+        self.max_parallel_tests = max(max_parallel_tests, 1)
+        self.get_priority = get_priority
+        self.get_locks = get_locks
+        self.is_exclusive = is_exclusive
+        self.locked_test_retry_delay = locked_test_retry_delay
+        self._condition = Condition()
+        self._pending: List[ScheduledTest] = []
+        self._running: Dict[int, ScheduledTest] = {}
+        self._sequence = itertools.count()
+
+    def put(self, test: Any, priority: int = 0, delay: float = 0) -> None:
+        """
+        Adds a test to run.
+        Args:
+            test: The test to add.
+            priority: The priority of the test, tests with a lower priority are started first.
+            delay: The seconds to wait before the test can be started.
+        """
+        with self._condition:
+            self._add(test, priority, delay)
+            self._condition.notify_all()
+
+    def _add(self, test: Any, priority: int, delay: float = 0) -> None:
+        self._pending.append(
+            ScheduledTest(
+                test, priority, next(self._sequence), time.monotonic() + delay
+            )
+        )
+
+    def _add_from_queue(self) -> None:
+        while self.queue is not None:
+            try:
+                test = self.queue.get(block=False)
+            except Empty:
+                return
+            self._add(test, self.get_priority(test))
+            self.queue.task_done()
+
+    def _can_start(self, scheduled_test: ScheduledTest) -> bool:
+        if not self._running:
+            return True
+        if len(self._running) >= self.max_parallel_tests or self.is_exclusive(
+            scheduled_test.test
+        ):
+            return False
+        locks = self.get_locks(scheduled_test.test)
+        for running in self._running.values():
+            if self.is_exclusive(running.test) or locks & self.get_locks(running.test):
+                return False
+        return True
+
+    def _get(self) -> Optional[ScheduledTest]:
+        """
+        Blocks until a test can be started and returns it, or returns None when there are no more tests to run.
+        """
+        with self._condition:
+            while True:
+                self._add_from_queue()
+                if not self._pending and not self._running:
+                    return None
+                now = time.monotonic()
+                ready = sorted(
+                    (
+                        scheduled_test
+                        for scheduled_test in self._pending
+                        if scheduled_test.ready_at <= now
+                    ),
+                    key=lambda scheduled_test: (
+                        scheduled_test.priority,
+                        scheduled_test.sequence,
+                    ),
+                )
+                for scheduled_test in ready:
+                    if self._can_start(scheduled_test):
+                        self._pending.remove(scheduled_test)
+                        self._running[scheduled_test.sequence] = scheduled_test
+                        return scheduled_test
+                # waking up when a running test is done, a test is added, or when the next delayed test is ready
+                delayed = [
+                    scheduled_test.ready_at - now
+                    for scheduled_test in self._pending
+                    if scheduled_test.ready_at > now
+                ]
+                self._condition.wait(min(delayed) if delayed else None)
+
+    def _done(self, scheduled_test: ScheduledTest, executed: bool) -> None:
+        with self._condition:
+            self._running.pop(scheduled_test.sequence)
+            if not executed:
+                self._add(
+                    scheduled_test.test,
+                    scheduled_test.priority,
+                    self.locked_test_retry_delay,
+                )
+            self._condition.notify_all()
+
+    def _work(self) -> None:
+        while scheduled_test := self._get():
+            executed = True
+            try:
+                executed = self.execute_test(scheduled_test.test)
+            finally:
+                self._done(scheduled_test, executed)
+
+    def run(self) -> None:
+        """
+        Runs all the tests, including the ones added while running, and returns when they are all done.
+        A single test runs in the calling thread, concurrent tests run in worker threads named after it.
+        """
+        if self.max_parallel_tests == 1:
+            self._work()
+            return
+        workers = [
+            Thread(target=self._work, name=f"{current_thread().name}-{index}")
+            for index in range(self.max_parallel_tests)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
@@ -122,6 +122,7 @@ def execute_test_content(**kwargs):
         build_context.isAMI, logging_manager
     )
     build_context.tests_data_keeper.create_result_files()
+    build_context.tests_data_keeper.save_durations_history()
 
     if kwargs["nightly"]:
         build_number = kwargs["build_number"]
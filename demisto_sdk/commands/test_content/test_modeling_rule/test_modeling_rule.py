@@ -1,10 +1,12 @@
 import logging  # noqa: TID251 # specific case, passed as argument to 3rd party
 import os
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
 from threading import Thread
 from time import sleep
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 import dateparser
@@ -74,6 +76,7 @@ from demisto_sdk.utils.utils import get_containing_pack
 CI_PIPELINE_ID = os.environ.get("CI_PIPELINE_ID")
 XSIAM_CLIENT_SLEEP_INTERVAL = 60
 XSIAM_CLIENT_RETRY_ATTEMPTS = 5
+DATASET_INGESTION_SLEEP_TIME = 30
 
 app = typer.Typer()
 
@@ -240,6 +243,14 @@ def xsiam_execute_query(xsiam_client: XsiamApiClient, query: str) -> List[dict]:
     return xsiam_client.get_xql_query_result(execution_id)
 
 
+def xsiam_stream_query(xsiam_client: XsiamApiClient, query: str) -> Iterator[dict]:
+    """Execute an XQL query and return an iterator over its results, which are fetched lazily.
+    Wrapper for XsiamApiClient.iter_xql_query_results() with retry logic.
+    """
+    execution_id = xsiam_client.start_xql_query(query)
+    return xsiam_client.iter_xql_query_results(execution_id)
+
+
 def xsiam_push_to_dataset(
     xsiam_client: XsiamApiClient, events_test_data: List[dict], rule: SingleModelingRule
 ) -> Dict[str, Any]:
@@ -259,7 +270,7 @@ def xsiam_get_installed_packs(xsiam_client: XsiamApiClient) -> List[Dict[str, An
 def verify_results(
     modeling_rule: ModelingRule,
     tested_dataset: str,
-    results: List[dict],
+    results: Iterable[dict],
     test_data: TestData,
 ) -> List[TestCase]:
     """Verify that the results of the XQL query match the expected values.
@@ -267,14 +278,24 @@ def verify_results(
     Args:
         modeling_rule: The modeling rule object parsed from the modeling rule file.
         tested_dataset (str): The dataset to verify result for.
-        results (List[dict]): The results of the XQL query.
+        results (Iterable[dict]): The results of the XQL query, consumed one at a time.
         test_data (init_test_data.TestData): The data parsed from the test data file.
 
     Returns:
         list[TestCase]: List of test cases for the results of the XQL query.
     """
-
-    if not results:
+    rule_relevant_data = [
+        data for data in test_data.data if data.dataset == tested_dataset
+    ]
+    expected_results_count = len(rule_relevant_data)
+    results_count = 0
+    # only the expected count of results is kept, so they are verified after their count is checked
+    buffered_results: List[dict] = []
+    for results_count, result in enumerate(results, start=1):
+        if results_count <= expected_results_count:
+            buffered_results.append(result)
+
+    if not results_count:
         logger.error(
             f"<red>{SYNTAX_ERROR_IN_MODELING_RULE}</red>",
         )
@@ -286,12 +307,9 @@ def verify_results(
         test_case.system_err = SYNTAX_ERROR_IN_MODELING_RULE
         return [test_case]
 
-    rule_relevant_data = [
-        data for data in test_data.data if data.dataset == tested_dataset
-    ]
-    if len(results) != len(rule_relevant_data):
+    if results_count != expected_results_count:
         err = (
-            f"Expected {len(test_data.data)} results, got {len(results)}. Verify that the event"
+            f"Expected {len(test_data.data)} results, got {results_count}. Verify that the event"
             " data used in your test data file meets the criteria of the modeling rule, e.g. the filter"
             " condition."
         )
@@ -306,10 +324,10 @@ def verify_results(
         return [test_case]
 
     test_cases = []
-    for i, result in enumerate(results, start=1):
+    for result_index, result in enumerate(buffered_results, start=1):
         td_event_id = result.pop(f"{tested_dataset}.test_data_event_id")
         msg = (
-            f"Modeling rule - {get_relative_path_to_content(modeling_rule.path)} {i}/{len(results)}"
+            f"Modeling rule - {get_relative_path_to_content(modeling_rule.path)} {result_index}/{expected_results_count}"
             f" test_data_event_id:{td_event_id}"
         )
         logger.info(
@@ -480,7 +498,10 @@ def validate_expected_values(
         logger.debug(query_info)
         validate_expected_values_test_case_system_out = [query_info]
         try:
-            results = retrying_caller(xsiam_execute_query, xsiam_client, query)
+            results = retrying_caller(xsiam_stream_query, xsiam_client, query)
+            verify_results_test_cases = verify_results(
+                modeling_rule, rule.dataset, results, test_data
+            )
         except requests.exceptions.RequestException:
             logger.error(
                 f"<red>{XQL_QUERY_ERROR_EXPLANATION}</red>",
@@ -490,9 +511,6 @@ def validate_expected_values(
                 Error("Failed to execute XQL query")
             ]
         else:
-            verify_results_test_cases = verify_results(
-                modeling_rule, rule.dataset, results, test_data
-            )
             validate_expected_values_test_cases.extend(verify_results_test_cases)
         validate_expected_values_test_case.system_out = "\n".join(
             validate_expected_values_test_case_system_out
@@ -621,7 +639,7 @@ def check_dataset_exists(
     xsiam_client: XsiamApiClient,
     retrying_caller: Retrying,
     dataset: str,
-    init_sleep_time: int = 30,
+    init_sleep_time: int = DATASET_INGESTION_SLEEP_TIME,
     print_errors: bool = True,
 ) -> TestCase:
     """Check if the dataset in the test data file exists in the tenant.
@@ -698,6 +716,50 @@ def check_dataset_exists(
     return dataset_set_test_case
 
 
+def get_events_test_data(rule: SingleModelingRule, test_data: TestData) -> List[dict]:
+    """Get the events of the test data to push to the dataset of the given rule."""
+    return [
+        {
+            **event_log.event_data,
+            "test_data_event_id": str(event_log.test_data_event_id),
+        }
+        for event_log in test_data.data
+        if isinstance(event_log.event_data, dict) and event_log.dataset == rule.dataset
+    ]
+
+
+def create_push_test_data_test_case(
+    mr: ModelingRule, system_errors: List[str], start_time: datetime
+) -> TestCase:
+    """Create the test case for pushing the test data of a modeling rule to the tenant.
+
+    Args:
+        mr (ModelingRule): Modeling rule object parsed from the modeling rule file.
+        system_errors (List[str]): The errors of pushing the test data, empty if it was pushed successfully.
+        start_time (datetime): The time the push started.
+    Returns:
+        TestCase: Test case for pushing the test data to the tenant.
+    """
+    push_test_data_test_case = TestCase(
+        f"Push test data to tenant {mr.path}",
+        classname="Push test data to tenant",
+    )
+    if system_errors:
+        logger.error(
+            f"<red>{FAILURE_TO_PUSH_EXPLANATION}</red>",
+        )
+        push_test_data_test_case.system_err = "\n".join(system_errors)
+        push_test_data_test_case.result += [Failure(FAILURE_TO_PUSH_EXPLANATION)]
+    else:
+        system_out = f"Test data pushed successfully for Modeling rule:{get_relative_path_to_content(mr.path)}"
+        push_test_data_test_case.system_out = system_out
+        logger.info(
+            f"<green>{system_out}</green>",
+        )
+    push_test_data_test_case.time = duration_since_start_time(start_time)
+    return push_test_data_test_case
+
+
 def push_test_data_to_tenant(
     xsiam_client: XsiamApiClient,
     retrying_caller: Retrying,
@@ -714,22 +776,10 @@ def push_test_data_to_tenant(
     Returns:
         TestCase: Test case for pushing the test data to the tenant.
     """
-    push_test_data_test_case = TestCase(
-        f"Push test data to tenant {mr.path}",
-        classname="Push test data to tenant",
-    )
     push_test_data_test_case_start_time = get_utc_now()
     system_errors = []
     for rule in mr.rules:
-        events_test_data = [
-            {
-                **event_log.event_data,
-                "test_data_event_id": str(event_log.test_data_event_id),
-            }
-            for event_log in test_data.data
-            if isinstance(event_log.event_data, dict)
-            and event_log.dataset == rule.dataset
-        ]
+        events_test_data = get_events_test_data(rule, test_data)
         logger.info(
             f"<cyan>Pushing test data for {rule.dataset} to tenant...</cyan>",
         )
@@ -744,22 +794,62 @@ def push_test_data_to_tenant(
                 f"<red>{system_err}</red>",
             )
 
-    if system_errors:
-        logger.error(
-            f"<red>{FAILURE_TO_PUSH_EXPLANATION}</red>",
-        )
-        push_test_data_test_case.system_err = "\n".join(system_errors)
-        push_test_data_test_case.result += [Failure(FAILURE_TO_PUSH_EXPLANATION)]
-    else:
-        system_out = f"Test data pushed successfully for Modeling rule:{get_relative_path_to_content(mr.path)}"
-        push_test_data_test_case.system_out = system_out
+    return create_push_test_data_test_case(
+        mr, system_errors, push_test_data_test_case_start_time
+    )
+
+
+def push_test_data_to_tenant_in_batch(
+    xsiam_client: XsiamApiClient,
+    retrying_caller: Retrying,
+    prepared_rules: List["PreparedModelingRule"],
+) -> List[TestCase]:
+    """Push the test data of all the given modeling rules to the tenant, in a single push per vendor and product.
+
+    Args:
+        xsiam_client (XsiamApiClient): Xsiam API client.
+        retrying_caller (tenacity.Retrying): The retrying caller object.
+        prepared_rules (List[PreparedModelingRule]): The modeling rules to push the test data of.
+    Returns:
+        List[TestCase]: Test case for pushing the test data of every modeling rule, in the order of the modeling rules.
+    """
+    start_time = get_utc_now()
+    pushes: Dict[Tuple[str, str], Tuple[SingleModelingRule, List[dict]]] = {}
+    for prepared_rule in prepared_rules:
+        for rule in prepared_rule.modeling_rule.rules:
+            _, events_test_data = pushes.setdefault(
+                (rule.vendor, rule.product), (rule, [])
+            )
+            events_test_data.extend(get_events_test_data(rule, prepared_rule.test_data))
+
+    failed_pushes = set()
+    for (vendor, product), (rule, events_test_data) in pushes.items():
         logger.info(
-            f"<green>{system_out}</green>",
+            f"<cyan>Pushing {len(events_test_data)} test data events for vendor {vendor} product {product} to tenant...</cyan>",
         )
-    push_test_data_test_case.time = duration_since_start_time(
-        push_test_data_test_case_start_time
-    )
-    return push_test_data_test_case
+        try:
+            retrying_caller(xsiam_push_to_dataset, xsiam_client, events_test_data, rule)
+        except requests.exceptions.RequestException:
+            failed_pushes.add((vendor, product))
+
+    push_test_data_test_cases = []
+    for prepared_rule in prepared_rules:
+        system_errors = []
+        for rule in prepared_rule.modeling_rule.rules:
+            if (rule.vendor, rule.product) in failed_pushes:
+                system_err = (
+                    f"Failed pushing test data to tenant for dataset {rule.dataset}"
+                )
+                system_errors.append(system_err)
+                logger.error(
+                    f"<red>{system_err}</red>",
+                )
+        push_test_data_test_cases.append(
+            create_push_test_data_test_case(
+                prepared_rule.modeling_rule, system_errors, start_time
+            )
+        )
+    return push_test_data_test_cases
 
 
 def verify_pack_exists_on_tenant(
@@ -956,6 +1046,64 @@ def verify_data_sets_exists(xsiam_client, retrying_caller, test_data):
     return datasets_test_case_ls
 
 
+def verify_data_sets_exists_in_batch(
+    xsiam_client: XsiamApiClient,
+    retrying_caller: Retrying,
+    prepared_rules: List["PreparedModelingRule"],
+    max_workers: int,
+) -> None:
+    """Wait once for the test data to be ingested, then check concurrently that the datasets of all the modeling rules exist.
+    Every modeling rule gets the test cases verify_data_sets_exists would have created for it.
+
+    Args:
+        xsiam_client (XsiamApiClient): Xsiam API client.
+        retrying_caller (tenacity.Retrying): The retrying caller object.
+        prepared_rules (List[PreparedModelingRule]): The modeling rules to check the datasets of.
+        max_workers (int): The maximal number of datasets to check concurrently.
+    """
+    datasets = sorted(
+        {
+            event_log.dataset
+            for prepared_rule in prepared_rules
+            for event_log in prepared_rule.test_data.data
+        }
+    )
+    logger.debug(
+        f"Sleeping for {DATASET_INGESTION_SLEEP_TIME} seconds before query for the datasets, to make sure the test data was ingested."
+    )
+    sleep(DATASET_INGESTION_SLEEP_TIME)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dataset_test_cases = dict(
+            zip(
+                datasets,
+                executor.map(
+                    lambda dataset: check_dataset_exists(
+                        xsiam_client, retrying_caller, dataset, init_sleep_time=0
+                    ),
+                    datasets,
+                ),
+            )
+        )
+    for prepared_rule in prepared_rules:
+        prepared_rule.test_suite.add_testcases(
+            [
+                deepcopy(dataset_test_cases[event_log.dataset])
+                for event_log in prepared_rule.test_data.data
+            ]
+        )
+
+
+class PreparedModelingRule:
+    """A modeling rule which passed the validations done before pushing its test data to the tenant."""
+
+    def __init__(
+        self, modeling_rule: ModelingRule, test_data: TestData, test_suite: TestSuite
+    ):
+        self.modeling_rule = modeling_rule
+        self.test_data = test_data
+        self.test_suite = test_suite
+
+
 def validate_modeling_rule(
     modeling_rule_directory: Path,
     xsiam_url: str,
@@ -982,6 +1130,176 @@ def validate_modeling_rule(
         xsiam_client (XsiamApiClient): The XSIAM client used to do API calls to the tenant.
         tenant_demisto_version (Version): The demisto version of the XSIAM tenant.
     """
+    prepared_rule = prepare_modeling_rule(
+        modeling_rule_directory,
+        xsiam_url,
+        retrying_caller,
+        push,
+        interactive,
+        ctx,
+        delete_existing_dataset,
+        is_nightly,
+        xsiam_client,
+        tenant_demisto_version,
+    )
+    if not isinstance(prepared_rule, PreparedModelingRule):
+        return prepared_rule
+    if push:
+        push_test_data_test_case = push_test_data_to_tenant(
+            xsiam_client,
+            retrying_caller,
+            prepared_rule.modeling_rule,
+            prepared_rule.test_data,
+        )
+        prepared_rule.test_suite.add_testcase(push_test_data_test_case)
+        if not push_test_data_test_case.is_passed:
+            return False, prepared_rule.test_suite
+        datasets_test_case = verify_data_sets_exists(
+            xsiam_client, retrying_caller, prepared_rule.test_data
+        )
+        prepared_rule.test_suite.add_testcases(datasets_test_case)
+    else:
+        logger.info(
+            '<cyan>The command flag "--no-push" was passed - skipping pushing of test data</cyan>',
+        )
+    return verify_prepared_modeling_rule(xsiam_client, retrying_caller, prepared_rule)
+
+
+def validate_modeling_rules_concurrently(
+    modeling_rule_directories: List[Path],
+    xsiam_url: str,
+    retrying_caller: Retrying,
+    push: bool,
+    interactive: bool,
+    ctx: typer.Context,
+    delete_existing_dataset: bool,
+    is_nightly: bool,
+    xsiam_client: XsiamApiClient,
+    tenant_demisto_version: Version,
+    max_workers: int,
+) -> List[Tuple[bool, Union[TestSuite, None]]]:
+    """Validate modeling rules in phases, instead of one after the other.
+    The modeling rules are prepared one after the other, then the test data of all of them is pushed in a single batch,
+    the ingestion of the test data is waited for once, and the XQL queries verifying the modeling rules run concurrently.
+
+    Args:
+        modeling_rule_directories (List[Path]): Paths to the modeling rule directories.
+        max_workers (int): The maximal number of XQL queries to run concurrently.
+        See validate_modeling_rule for the rest of the arguments.
+
+    Returns:
+        List[Tuple[bool, Union[TestSuite, None]]]: The result of validate_modeling_rule for every modeling rule, in their order.
+    """
+    results: Dict[int, Tuple[bool, Union[TestSuite, None]]] = {}
+    prepared_rules: Dict[int, PreparedModelingRule] = {}
+    for index, modeling_rule_directory in enumerate(modeling_rule_directories):
+        logger.info(
+            f"<cyan>[{index + 1}/{len(modeling_rule_directories)}] Prepare Test Modeling Rule: {get_relative_path_to_content(modeling_rule_directory)}</cyan>",
+        )
+        prepared_rule = prepare_modeling_rule(
+            modeling_rule_directory,
+            xsiam_url,
+            retrying_caller,
+            push,
+            interactive,
+            ctx,
+            delete_existing_dataset,
+            is_nightly,
+            xsiam_client,
+            tenant_demisto_version,
+        )
+        if isinstance(prepared_rule, PreparedModelingRule):
+            prepared_rules[index] = prepared_rule
+        else:
+            results[index] = prepared_rule
+
+    if push and prepared_rules:
+        push_test_data_test_cases = push_test_data_to_tenant_in_batch(
+            xsiam_client, retrying_caller, list(prepared_rules.values())
+        )
+        for index, push_test_data_test_case in zip(
+            list(prepared_rules), push_test_data_test_cases
+        ):
+            prepared_rules[index].test_suite.add_testcase(push_test_data_test_case)
+            if not push_test_data_test_case.is_passed:
+                results[index] = False, prepared_rules.pop(index).test_suite
+        if prepared_rules:
+            verify_data_sets_exists_in_batch(
+                xsiam_client,
+                retrying_caller,
+                list(prepared_rules.values()),
+                max_workers,
+            )
+    elif not push:
+        logger.info(
+            '<cyan>The command flag "--no-push" was passed - skipping pushing of test data</cyan>',
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results.update(
+            zip(
+                prepared_rules,
+                executor.map(
+                    lambda prepared_rule: verify_prepared_modeling_rule(
+                        xsiam_client, retrying_caller, prepared_rule
+                    ),
+                    prepared_rules.values(),
+                ),
+            )
+        )
+    return [results[index] for index in range(len(modeling_rule_directories))]
+
+
+def verify_prepared_modeling_rule(
+    xsiam_client: XsiamApiClient,
+    retrying_caller: Retrying,
+    prepared_rule: PreparedModelingRule,
+) -> Tuple[bool, TestSuite]:
+    """Verify the expected values of a prepared modeling rule, after its test data was pushed to the tenant.
+
+    Args:
+        xsiam_client (XsiamApiClient): The XSIAM client used to do API calls to the tenant.
+        retrying_caller (tenacity.Retrying): The retrying caller object.
+        prepared_rule (PreparedModelingRule): The prepared modeling rule.
+    """
+    logger.info(
+        "<cyan>Validating expected_values...</cyan>",
+    )
+    modeling_rule_test_suite = prepared_rule.test_suite
+    validate_expected_values_test_cases = validate_expected_values(
+        xsiam_client,
+        retrying_caller,
+        prepared_rule.modeling_rule,
+        prepared_rule.test_data,
+    )
+    modeling_rule_test_suite.add_testcases(validate_expected_values_test_cases)
+    if not modeling_rule_test_suite.errors and not modeling_rule_test_suite.failures:
+        logger.info(
+            "<green>All mappings validated successfully</green>",
+        )
+        return True, modeling_rule_test_suite
+    return False, modeling_rule_test_suite
+
+
+def prepare_modeling_rule(
+    modeling_rule_directory: Path,
+    xsiam_url: str,
+    retrying_caller: Retrying,
+    push: bool,
+    interactive: bool,
+    ctx: typer.Context,
+    delete_existing_dataset: bool,
+    is_nightly: bool,
+    xsiam_client: XsiamApiClient,
+    tenant_demisto_version: Version,
+) -> Union[Tuple[bool, Union[TestSuite, None]], PreparedModelingRule]:
+    """Run the validations of a modeling rule which are done before pushing its test data to the tenant.
+    See validate_modeling_rule for the arguments.
+
+    Returns:
+        PreparedModelingRule if the test data should be pushed and verified,
+        otherwise the result of validating the modeling rule.
+    """
     modeling_rule = ModelingRule(modeling_rule_directory.as_posix())
     modeling_rule_file_name = Path(modeling_rule.path).name
     containing_pack = get_containing_pack(modeling_rule)
@@ -1162,36 +1480,9 @@ def validate_modeling_rule(
                         modeling_rule_test_suite,
                         executed_command,
                     )
-                push_test_data_test_case = push_test_data_to_tenant(
-                    xsiam_client, retrying_caller, modeling_rule, test_data
-                )
-                modeling_rule_test_suite.add_testcase(push_test_data_test_case)
-                if not push_test_data_test_case.is_passed:
-                    return False, modeling_rule_test_suite
-                datasets_test_case = verify_data_sets_exists(
-                    xsiam_client, retrying_caller, test_data
-                )
-                modeling_rule_test_suite.add_testcases(datasets_test_case)
-            else:
-                logger.info(
-                    '<cyan>The command flag "--no-push" was passed - skipping pushing of test data</cyan>',
-                )
-            logger.info(
-                "<cyan>Validating expected_values...</cyan>",
-            )
-            validate_expected_values_test_cases = validate_expected_values(
-                xsiam_client, retrying_caller, modeling_rule, test_data
+            return PreparedModelingRule(
+                modeling_rule, test_data, modeling_rule_test_suite
             )
-            modeling_rule_test_suite.add_testcases(validate_expected_values_test_cases)
-            if (
-                not modeling_rule_test_suite.errors
-                and not modeling_rule_test_suite.failures
-            ):
-                logger.info(
-                    "<green>All mappings validated successfully</green>",
-                )
-                return True, modeling_rule_test_suite
-            return False, modeling_rule_test_suite
         else:
             logger.info(
                 "<green>test data config is ignored skipping the test data validation</green>",
@@ -1477,6 +1768,7 @@ class BuildContext:
         interactive: bool,
         delete_existing_dataset: bool,
         ctx: typer.Context,
+        max_concurrent_rules: int = 1,
     ):
         self.logging_module: ParallelLoggingManager = logging_module
         self.retrying_caller = create_retrying_caller(retry_attempts, sleep_interval)
@@ -1500,6 +1792,7 @@ class BuildContext:
         self.push = push
         self.interactive = interactive
         self.delete_existing_dataset = delete_existing_dataset
+        self.max_concurrent_rules = max_concurrent_rules
 
         # --------------------------- Machine preparation -------------------------------
 
@@ -1637,12 +1930,9 @@ class CloudServerContext:
             )
             xsiam_client = XsiamApiClient(xsiam_client_cfg)
             tenant_demisto_version: Version = xsiam_client.get_demisto_version()
-            for i, modeling_rule_directory in enumerate(self.tests, start=1):
-                logger.info(
-                    f"<cyan>[{i}/{len(self.tests)}] Test Modeling Rule: {get_relative_path_to_content(modeling_rule_directory)}</cyan>",
-                )
-                success, modeling_rule_test_suite = validate_modeling_rule(
-                    modeling_rule_directory,
+            if self.build_context.max_concurrent_rules > 1:
+                results = validate_modeling_rules_concurrently(
+                    self.tests,
                     # can ignore the types since if they are not set to str values an error occurs
                     self.base_url,  # type: ignore[arg-type]
                     self.build_context.retrying_caller,
@@ -1653,7 +1943,32 @@ class CloudServerContext:
                     self.build_context.is_nightly,
                     xsiam_client=xsiam_client,
                     tenant_demisto_version=tenant_demisto_version,
+                    max_workers=self.build_context.max_concurrent_rules,
                 )
+            else:
+                results = []
+                for i, modeling_rule_directory in enumerate(self.tests, start=1):
+                    logger.info(
+                        f"<cyan>[{i}/{len(self.tests)}] Test Modeling Rule: {get_relative_path_to_content(modeling_rule_directory)}</cyan>",
+                    )
+                    results.append(
+                        validate_modeling_rule(
+                            modeling_rule_directory,
+                            # can ignore the types since if they are not set to str values an error occurs
+                            self.base_url,  # type: ignore[arg-type]
+                            self.build_context.retrying_caller,
+                            self.build_context.push,
+                            self.build_context.interactive,
+                            self.build_context.ctx,
+                            self.build_context.delete_existing_dataset,
+                            self.build_context.is_nightly,
+                            xsiam_client=xsiam_client,
+                            tenant_demisto_version=tenant_demisto_version,
+                        )
+                    )
+            for modeling_rule_directory, (success, modeling_rule_test_suite) in zip(
+                self.tests, results
+            ):
                 if success:
                     logger.info(
                         f"<green>Test Modeling rule {get_relative_path_to_content(modeling_rule_directory)} passed</green>",
@@ -1791,6 +2106,18 @@ def test_modeling_rule(
         "-dd",
         help="Deletion of the existing dataset from the tenant. Default: False.",
     ),
+    max_concurrent_rules: int = typer.Option(
+        1,
+        "-mcr",
+        "--max_concurrent_rules",
+        min=1,
+        show_default=True,
+        help=(
+            "The maximal number of modeling rules to verify concurrently on a tenant. When greater than 1, the test "
+            "data of all the modeling rules is pushed in a single batch and its ingestion is waited for once, "
+            "before verifying the modeling rules concurrently."
+        ),
+    ),
     service_account: Optional[str] = typer.Option(
         None,
         "-sa",
@@ -1911,6 +2238,7 @@ def test_modeling_rule(
         interactive=interactive,
         delete_existing_dataset=delete_existing_dataset,
         ctx=ctx,
+        max_concurrent_rules=max_concurrent_rules,
         xsiam_url=xsiam_url,
         xsiam_token=xsiam_token,
         api_key=api_key,
@@ -130,6 +130,148 @@ class TestVerifyResults:
             test_suite.errors + test_suite.failures != 0
         ), "Test modeling rule should fail"
 
+    def test_verify_results_lazy_results_more_than_expected(self, mocker):
+        """
+        Given:
+            - Simulated query results for two events, given as a generator.
+            - Test data for one event.
+
+        When:
+            - Verifying the results.
+
+        Then:
+            - Verify all the results are consumed and a single failure reports their count.
+            - Verify the results are not verified against the test data, as their count does not match.
+        """
+        from demisto_sdk.commands.test_content.test_modeling_rule import (
+            test_modeling_rule,
+        )
+        from demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule import (
+            verify_results,
+        )
+        from demisto_sdk.commands.test_content.xsiam_tools.test_data import (
+            EventLog,
+            TestData,
+        )
+
+        tested_dataset = "vendor_product_raw"
+        query_results = (
+            {
+                "vendor_product_raw.test_data_event_id": str(DEFAULT_TEST_EVENT_ID),
+                "xdm.field1": "value1",
+            }
+            for _ in range(2)
+        )
+        test_data = TestData(
+            data=[
+                EventLog(
+                    test_data_event_id=DEFAULT_TEST_EVENT_ID,
+                    vendor="vendor",
+                    product="product",
+                    dataset=tested_dataset,
+                    event_data={},
+                    expected_values={"xdm.field1": "value1"},
+                )
+            ]
+        )
+
+        verify_against_test_data_mock = mocker.patch.object(
+            test_modeling_rule, "verify_results_against_test_data"
+        )
+        test_cases = verify_results(
+            ModelingRuleMock(), tested_dataset, query_results, test_data
+        )
+
+        assert len(test_cases) == 1
+        assert "Expected 1 results, got 2" in test_cases[0].result[0].message
+        assert next(query_results, None) is None
+        verify_against_test_data_mock.assert_not_called()
+
+
+class TestXqlQueryResults:
+    BASE_URL = "https://api-fake.com"
+
+    def get_client(self):
+        from demisto_sdk.commands.test_content.xsiam_tools.xsiam_client import (
+            XsiamApiClient,
+            XsiamApiClientConfig,
+        )
+
+        return XsiamApiClient(
+            XsiamApiClientConfig(
+                base_url=self.BASE_URL,
+                api_key="fake-api-key",
+                auth_id="fake-auth-id",
+                token="fake-token",
+            )
+        )
+
+    def test_iter_xql_query_results_polls_with_backoff(self, mocker, requests_mock):
+        """
+        Given:
+            - An xql query which is pending twice before it completes.
+
+        When:
+            - Iterating over the results of the query.
+
+        Then:
+            - Verify the status is polled again with a growing interval.
+            - Verify the results returned with the status are returned.
+        """
+        sleep_mock = mocker.patch(
+            "demisto_sdk.commands.test_content.xsiam_tools.xsiam_client.time.sleep"
+        )
+        pending = {"json": {"reply": {"status": "PENDING"}}, "status_code": 200}
+        requests_mock.post(
+            f"{self.BASE_URL}/public_api/v1/xql/get_query_results/",
+            [
+                pending,
+                pending,
+                {
+                    "json": {
+                        "reply": {
+                            "status": "SUCCESS",
+                            "results": {"data": [{"id": 1}, {"id": 2}]},
+                        }
+                    },
+                    "status_code": 200,
+                },
+            ],
+        )
+
+        results = self.get_client().iter_xql_query_results("execution-id")
+
+        assert list(results) == [{"id": 1}, {"id": 2}]
+        assert [call.args[0] for call in sleep_mock.call_args_list] == [1, 2]
+
+    def test_iter_xql_query_results_streams_large_results(self, requests_mock):
+        """
+        Given:
+            - A completed xql query with more results than returned with its status.
+
+        When:
+            - Iterating over the results of the query.
+
+        Then:
+            - Verify the results are read lazily from the results stream.
+        """
+        requests_mock.post(
+            f"{self.BASE_URL}/public_api/v1/xql/get_query_results/",
+            json={"reply": {"status": "SUCCESS", "results": {"stream_id": "stream"}}},
+        )
+        stream_mock = requests_mock.post(
+            f"{self.BASE_URL}/public_api/v1/xql/get_query_results_stream/",
+            text='{"id": 1}\n{"id": 2}\n',
+        )
+
+        results = self.get_client().iter_xql_query_results("execution-id")
+
+        assert not stream_mock.called
+        assert list(results) == [{"id": 1}, {"id": 2}]
+        assert stream_mock.last_request.json() == {
+            "request_data": {"stream_id": "stream", "is_gzip_compressed": False}
+        }
+
 
 @pytest.mark.parametrize(
     "epoc_time, with_ms, human_readable_time",
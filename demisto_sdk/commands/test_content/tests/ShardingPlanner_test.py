@@ -0,0 +1,69 @@
+from demisto_sdk.commands.test_content.ShardingPlanner import (
+    group_by_locks,
+    plan_shards,
+)
+
+DURATIONS = {"a": 100, "b": 60, "c": 50, "d": 40, "e": 10}
+
+
+def test_plan_shards_longest_processing_time_first():
+    """
+    Given:
+        - Tests with different durations and two shards.
+
+    When:
+        - Planning the shards.
+
+    Then:
+        - Ensure every longest remaining test is assigned to the least loaded shard.
+        - Ensure the tests of every shard keep their original order.
+    """
+    shards = plan_shards(list(DURATIONS), 2, DURATIONS.get)
+
+    assert shards == [["a", "d"], ["b", "c", "e"]]
+
+
+def test_plan_shards_keeps_tests_sharing_locks_together():
+    """
+    Given:
+        - Tests sharing locks, directly and through another test.
+
+    When:
+        - Planning the shards.
+
+    Then:
+        - Ensure the tests sharing locks are assigned to the same shard.
+    """
+    locks = {"a": set(), "b": {"x"}, "c": {"x", "y"}, "d": {"y"}, "e": set()}
+
+    assert group_by_locks(list(DURATIONS), locks.get) == [
+        ["a"],
+        ["b", "c", "d"],
+        ["e"],
+    ]
+    assert plan_shards(list(DURATIONS), 2, DURATIONS.get, get_locks=locks.get) == [
+        ["b", "c", "d"],
+        ["a", "e"],
+    ]
+
+
+def test_plan_shards_can_run_on():
+    """
+    Given:
+        - A test which can only run on the second shard.
+
+    When:
+        - Planning the shards.
+
+    Then:
+        - Ensure the test is assigned to the second shard, even though it's more loaded.
+    """
+    shards = plan_shards(
+        list(DURATIONS),
+        2,
+        DURATIONS.get,
+        can_run_on=lambda test, shard: test != "c" or shard == 1,
+    )
+
+    assert "c" in shards[1]
+    assert sorted(shards[0] + shards[1]) == sorted(DURATIONS)
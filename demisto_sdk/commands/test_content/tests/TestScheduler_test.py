@@ -0,0 +1,104 @@
+import time
+from threading import Lock
+
+from demisto_sdk.commands.test_content.TestScheduler import TestScheduler
+
+
+class ExecutionRecorder:
+    def __init__(self, not_executed_once: tuple = ()):
+        self.lock = Lock()
+        self.running: set = set()
+        self.overlaps: list = []
+        self.executed: list = []
+        self.not_executed_once = set(not_executed_once)
+
+    def execute_test(self, test: str) -> bool:
+        with self.lock:
+            if test in self.not_executed_once:
+                self.not_executed_once.remove(test)
+                return False
+            self.overlaps.append((test, set(self.running)))
+            self.running.add(test)
+        time.sleep(0.05)
+        with self.lock:
+            self.running.remove(test)
+            self.executed.append(test)
+        return True
+
+
+def test_scheduler_runs_tests_by_priority():
+    """
+    Given:
+        - Tests with different priorities and a single test to run at a time.
+
+    When:
+        - Running the scheduler.
+
+    Then:
+        - Ensure the tests are executed by their priority, and then by the order they were added in.
+    """
+    recorder = ExecutionRecorder()
+    scheduler = TestScheduler(recorder.execute_test)
+    scheduler.put("a", priority=0)
+    scheduler.put("b", priority=-1)
+    scheduler.put("c", priority=0)
+
+    scheduler.run()
+
+    assert recorder.executed == ["b", "a", "c"]
+
+
+def test_scheduler_honors_locks_and_exclusive_tests():
+    """
+    Given:
+        - Four tests to run concurrently, two of them sharing a lock and one exclusive test.
+
+    When:
+        - Running the scheduler.
+
+    Then:
+        - Ensure all the tests are executed.
+        - Ensure tests without shared locks run concurrently.
+        - Ensure the tests sharing a lock never overlap, and the exclusive test runs alone.
+    """
+    locks = {"a": {"integration"}, "b": {"integration"}, "c": set(), "d": set()}
+    recorder = ExecutionRecorder()
+    scheduler = TestScheduler(
+        recorder.execute_test,
+        max_parallel_tests=3,
+        get_locks=locks.get,
+        is_exclusive=lambda test: test == "d",
+    )
+    for test in locks:
+        scheduler.put(test)
+
+    scheduler.run()
+
+    assert sorted(recorder.executed) == ["a", "b", "c", "d"]
+    overlaps = dict(recorder.overlaps)
+    assert overlaps["c"] == {"a"}
+    assert "a" not in overlaps["b"]
+    assert not overlaps["d"]
+
+
+def test_scheduler_runs_not_executed_tests_again():
+    """
+    Given:
+        - A test which could not be executed on its first attempt.
+
+    When:
+        - Running the scheduler.
+
+    Then:
+        - Ensure the test is executed again after the other tests, once its delay has passed.
+    """
+    recorder = ExecutionRecorder(not_executed_once=("a",))
+    scheduler = TestScheduler(
+        recorder.execute_test, max_parallel_tests=2, locked_test_retry_delay=0.2
+    )
+    scheduler.put("a")
+    scheduler.put("b")
+
+    scheduler.run()
+
+    assert recorder.executed == ["b", "a"]
@@ -1,9 +1,15 @@
+from queue import Queue
+
+import pytest
+
 from demisto_sdk.commands.common.constants import TEST_PLAYBOOKS
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.test_content.mock_server import MITMProxy
 from demisto_sdk.commands.test_content.TestContentClasses import (
     BuildContext,
     OnPremServerContext,
     ServerContext,
+    TestResults,
 )
 from demisto_sdk.commands.test_content.tests.build_context_test import (
     generate_content_conf_json,
@@ -100,6 +106,11 @@ def test_execute_tests(mocker, tmp_path):
     assert next(iter(build_context.servers)).mockable_tests_to_run.all_tasks_done
     assert next(iter(build_context.servers)).unmockable_tests_to_run.all_tasks_done
 
+    # Validating the durations of the executed tests were recorded
+    assert set(build_context.tests_data_keeper.playbook_durations) == set(
+        filtered_tests
+    ) - {"skipped_playbook"}
+
     # Validating no failed playbooks
     assert not build_context.tests_data_keeper.failed_playbooks
 
@@ -108,6 +119,64 @@ def test_execute_tests(mocker, tmp_path):
     assert "skipped_playbook" in build_context.tests_data_keeper.skipped_tests
 
 
+def test_save_durations_history(tmp_path):
+    """
+    Given:
+        - A durations history with the durations of two tests.
+        - Durations recorded in the current build, of one of the tests (executed twice) and a new test.
+
+    When:
+        - Saving the durations history.
+
+    Then:
+        - Ensure the durations of the executions of the test are averaged, and not summed up,
+          and then averaged with its previous duration.
+        - Ensure the durations of the new and the not executed tests are kept.
+    """
+    durations_history_path = tmp_path / "durations.json"
+    durations_history_path.write_text(json.dumps({"test1": 100, "test2": 50}))
+    test_results = TestResults(
+        {}, str(tmp_path), durations_history_path=str(durations_history_path)
+    )
+    assert test_results.durations_history == {"test1": 100, "test2": 50}
+
+    test_results.add_playbook_duration("test1", 140)
+    test_results.add_playbook_duration("test1", 180)
+    test_results.add_playbook_duration("test3", 30)
+    test_results.save_durations_history()
+
+    assert json.loads(durations_history_path.read_text()) == {
+        "test1": 130,
+        "test2": 50,
+        "test3": 30,
+    }
+
+
+@pytest.mark.parametrize("max_parallel_tests, expected_priority", [(1, 0), (3, -600)])
+def test_execute_tests_priority(mocker, max_parallel_tests, expected_priority):
+    """
+    Given:
+        - A test playbook with a timeout of 600 seconds.
+
+    When:
+        - Executing the tests one at a time, or concurrently.
+
+    Then:
+        - Ensure tests with longer timeouts are started first only when the tests run concurrently,
+          and that otherwise the tests run in the order of the queue.
+    """
+    scheduler = mocker.patch(
+        "demisto_sdk.commands.test_content.TestContentClasses.TestScheduler"
+    )
+    server_context = mocker.MagicMock(max_parallel_tests=max_parallel_tests)
+    ServerContext._execute_tests(server_context, Queue())
+
+    get_priority = scheduler.call_args.kwargs["get_priority"]
+    test_playbook = mocker.MagicMock()
+    test_playbook.configuration.timeout = 600
+    assert get_priority(test_playbook) == expected_priority
+
+
 def generate_mocked_server_context(
     build_context: BuildContext, mocked_demisto_client: DemistoClientMock, mocker
 ) -> ServerContext:
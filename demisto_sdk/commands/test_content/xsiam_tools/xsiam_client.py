@@ -1,10 +1,11 @@
 import gzip
 import os
+import time
 from abc import ABC, abstractmethod
 from functools import lru_cache
 from pathlib import Path
 from pprint import pformat
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import urljoin
 
 import requests
@@ -19,6 +20,10 @@ from demisto_sdk.commands.common.tools import retry
 
 json = JSON_Handler()
 
+XQL_RESULTS_LIMIT = 1000
+XQL_POLL_INITIAL_INTERVAL = 1
+XQL_POLL_MAX_INTERVAL = 30
+
 
 class XsiamApiClientConfig(BaseModel):
     base_url: HttpUrl = Field(
@@ -282,29 +287,84 @@ class XsiamApiClient(XsiamApiInterface):
         response.raise_for_status()
 
     def get_xql_query_result(self, execution_id: str, timeout: int = 300):
+        return list(self.iter_xql_query_results(execution_id, timeout))
+
+    def iter_xql_query_results(
+        self, execution_id: str, timeout: int = 300
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Waits for the xql query to complete, and returns an iterator over its results.
+        Up to XQL_RESULTS_LIMIT results are returned with the query status, larger results are streamed lazily.
+
+        Args:
+            execution_id: The execution id of the query.
+            timeout: The seconds to wait for the query to complete.
+
+        Returns:
+            An iterator over the results of the query.
+        """
+        results = self._wait_for_xql_query_results(execution_id, timeout)
+        if stream_id := results.get("stream_id"):
+            return self._stream_xql_query_results(stream_id, timeout)
+        return iter(results.get("data") or [])
+
+    def _wait_for_xql_query_results(
+        self, execution_id: str, timeout: int
+    ) -> Dict[str, Any]:
+        """
+        Polls the status of the xql query until it is no longer pending, waiting longer between every poll.
+        """
         payload = json.dumps(
             {
                 "request_data": {
                     "query_id": execution_id,
-                    "pending_flag": False,
-                    "limit": 1000,
+                    "pending_flag": True,
+                    "limit": XQL_RESULTS_LIMIT,
                     "format": "json",
                 }
             }
         )
         endpoint = urljoin(self.base_url, "public_api/v1/xql/get_query_results/")
         logger.info(f"Getting xql query results: endpoint={endpoint}")
-        response = self._session.post(endpoint, data=payload, timeout=timeout)
-        logger.debug("Request completed to get xql query results")
-        data = response.json()
-        logger.debug(pformat(data))
+        deadline = time.monotonic() + timeout
+        poll_interval = XQL_POLL_INITIAL_INTERVAL
+        while True:
+            response = self._session.post(endpoint, data=payload, timeout=timeout)
+            logger.debug("Request completed to get xql query results")
+            data = response.json()
+            logger.debug(pformat(data))
+            status = data.get("reply", {}).get("status", "")
+            if response.status_code not in range(200, 300) or status != "PENDING":
+                break
+            if time.monotonic() + poll_interval > deadline:
+                raise Timeout(
+                    f"The xql query {execution_id} did not complete in {timeout} seconds"
+                )
+            logger.debug(
+                f"The xql query {execution_id} is pending, polling again in {poll_interval} seconds"
+            )
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, XQL_POLL_MAX_INTERVAL)
 
-        if (
-            response.status_code in range(200, 300)
-            and data.get("reply", {}).get("status", "") == "SUCCESS"
-        ):
-            return data.get("reply", {}).get("results", {}).get("data", [])
+        if response.status_code in range(200, 300) and status == "SUCCESS":
+            return data.get("reply", {}).get("results", {})
         response.raise_for_status()
+        return {}
+
+    def _stream_xql_query_results(
+        self, stream_id: str, timeout: int
+    ) -> Iterator[Dict[str, Any]]:
+        endpoint = urljoin(self.base_url, "public_api/v1/xql/get_query_results_stream/")
+        body = {"request_data": {"stream_id": stream_id, "is_gzip_compressed": False}}
+        logger.info(f"Streaming xql query results: endpoint={endpoint}")
+        response = self._session.post(endpoint, json=body, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+        finally:
+            response.close()
 
     def delete_dataset(self, dataset_id: str):
         endpoint = urljoin(self.base_url, "public_api/v1/xql/delete_dataset")
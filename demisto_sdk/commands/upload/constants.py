@@ -1,3 +1,5 @@
+from typing import FrozenSet, Tuple
+
 from demisto_sdk.commands.content_graph.common import ContentType
 
 MULTIPLE_ZIPPED_PACKS_FILE_STEM = "uploadable_packs"
@@ -7,3 +9,44 @@ CONTENT_TYPES_EXCLUDED_FROM_UPLOAD = {
     ContentType.TEST_PLAYBOOK,
     ContentType.TEST_SCRIPT,
 }
+
+DEFAULT_UPLOAD_MAX_WORKERS = 1  # uploading concurrently is opt-in, with --max-workers
+
+# When uploading item-by-item, a group is only uploaded after all the groups before it,
+# as its items may depend on theirs. The items of each group are uploaded concurrently.
+# Items of content types which are not listed here are uploaded last.
+UPLOAD_ORDER: Tuple[FrozenSet[ContentType], ...] = (
+    frozenset(
+        {
+            ContentType.INCIDENT_FIELD,
+            ContentType.INDICATOR_FIELD,
+            ContentType.GENERIC_FIELD,
+            ContentType.CASE_FIELD,
+            ContentType.LIST,
+        }
+    ),
+    frozenset(
+        {
+            ContentType.INCIDENT_TYPE,
+            ContentType.INDICATOR_TYPE,
+            ContentType.GENERIC_TYPE,
+            ContentType.LAYOUT,
+            ContentType.CASE_LAYOUT,
+            ContentType.MAPPER,
+            ContentType.CLASSIFIER,
+        }
+    ),
+    frozenset(
+        {
+            ContentType.SCRIPT,
+            ContentType.TEST_SCRIPT,
+            ContentType.INTEGRATION,
+        }
+    ),
+    frozenset(
+        {
+            ContentType.PLAYBOOK,
+            ContentType.TEST_PLAYBOOK,
+        }
+    ),
+)
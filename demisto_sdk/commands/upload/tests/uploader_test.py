@@ -1,4 +1,5 @@
 import shutil
+import tarfile
 import zipfile
 from builtins import len
 from io import BytesIO
@@ -23,6 +24,7 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.tools import src_root
+from demisto_sdk.commands.content_graph.common import ContentType
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
 from demisto_sdk.commands.content_graph.objects.dashboard import Dashboard
 from demisto_sdk.commands.content_graph.objects.incident_field import IncidentField
@@ -45,7 +47,7 @@ from demisto_sdk.commands.content_graph.tests.create_content_graph_test import (
     mock_pack,
 )
 from demisto_sdk.commands.test_content import tools
-from demisto_sdk.commands.upload import uploader
+from demisto_sdk.commands.upload import upload_delta, uploader
 from demisto_sdk.commands.upload.constants import MULTIPLE_ZIPPED_PACKS_FILE_STEM
 from demisto_sdk.commands.upload.upload import (
     MULTIPLE_ZIPPED_PACKS_FILE_NAME,
@@ -452,6 +454,134 @@ def test_upload_pack_with_tpb(demisto_client_configure, mocker, tmpdir):
     assert mocked_upload_method.call_count == len(expected_names)
 
 
+def test_upload_pack_item_by_item_order(demisto_client_configure, mocker, tmpdir):
+    """
+    Given
+        - A pack called DummyPack, with a content item failing to upload
+
+    When
+        - Uploading the pack item by item, with 4 concurrent uploads
+
+    Then
+        - Ensure fields are uploaded before types and layouts, which are uploaded before scripts and playbooks
+        - Ensure the failure is reported, and the other content items are reported as uploaded
+    """
+    mocker.patch.object(demisto_client, "configure", return_value="object")
+    mocker.patch.object(
+        IntegrationScript, "get_supported_native_images", return_value=[]
+    )
+    uploaded_content_types = []
+
+    def upload(self, **kwargs):
+        if self.path.name == "widget-ActiveIncidentsByRole.json":
+            raise ApiException(status=500, reason="Internal Server Error")
+        uploaded_content_types.append(self.content_type)
+
+    mocker.patch.object(ContentItem, "upload", upload)
+    path = Path(f"{git_path()}/demisto_sdk/tests/test_files/Packs/DummyPack")
+    uploader = Uploader(path, destination_zip_dir=tmpdir, max_workers=4)
+    mocker.patch.object(uploader, "client")
+    assert uploader.upload() == ERROR_RETURN_CODE
+
+    assert [
+        content_item.path.name
+        for content_item, _ in uploader._failed_upload_content_items
+    ] == ["widget-ActiveIncidentsByRole.json"]
+    assert len(uploader._successfully_uploaded_content_items) == 13
+
+    def positions(*content_types: ContentType) -> Set[int]:
+        return {
+            i
+            for i, content_type in enumerate(uploaded_content_types)
+            if content_type in content_types
+        }
+
+    assert max(positions(ContentType.INCIDENT_FIELD)) < min(
+        positions(ContentType.INCIDENT_TYPE, ContentType.LAYOUT)
+    )
+    assert max(positions(ContentType.INCIDENT_TYPE, ContentType.LAYOUT)) < min(
+        positions(ContentType.SCRIPT, ContentType.INTEGRATION)
+    )
+    assert max(positions(ContentType.SCRIPT, ContentType.INTEGRATION)) < min(
+        positions(ContentType.PLAYBOOK)
+    )
+
+
+def test_upload_pack_delta(demisto_client_configure, mocker, tmpdir):
+    """
+    Given
+        - A pack called DummyPack, which was already uploaded with --delta
+
+    When
+        - Uploading the pack item by item with --delta again, after one of its content items changed locally
+        - Uploading it again, after another content item changed on the server
+
+    Then
+        - Ensure only the changed content item is uploaded
+        - Ensure the other content items are reported as skipped
+    """
+    server_content = {}
+
+    def upload_content_item(self, *args, **kwargs):
+        server_content[self.object_id] = {"id": self.object_id, "version": -1}
+
+    def generic_request(path, method, **kwargs):
+        bundle = BytesIO()
+        with tarfile.open(fileobj=bundle, mode="w:gz") as tar:
+            for object_id, content in server_content.items():
+                data = json.dumps(content).encode()
+                info = tarfile.TarInfo(f"{object_id}.json")
+                info.size = len(data)
+                tar.addfile(info, BytesIO(data))
+        return MagicMock(closed=True, data=bundle.getvalue()), 200, {}
+
+    client = MagicMock()
+    client.api_client.configuration.host = "https://tenant"
+    client.generic_request.side_effect = generic_request
+    mocker.patch.object(demisto_client, "configure", return_value=client)
+    mocker.patch.object(
+        IntegrationScript, "get_supported_native_images", return_value=[]
+    )
+    mocker.patch.object(upload_delta, "UPLOAD_DELTA_DIR", Path(tmpdir, "delta"))
+    mocked_upload_method = mocker.patch.object(
+        ContentItem, "upload", autospec=True, side_effect=upload_content_item
+    )
+    path = Path(f"{git_path()}/demisto_sdk/tests/test_files/Packs/DummyPack")
+
+    assert Uploader(path, destination_zip_dir=tmpdir, delta=True).upload() == (
+        SUCCESS_RETURN_CODE
+    )
+    uploaded_count = mocked_upload_method.call_count
+    assert uploaded_count == 14
+
+    mocked_upload_method.reset_mock()
+    original_prepare_for_upload = Script.prepare_for_upload
+
+    def prepare_for_upload(self, *args, **kwargs):
+        data = original_prepare_for_upload(self, *args, **kwargs)
+        if self.object_id == "DummyScript":
+            data["comment"] = "changed"
+        return data
+
+    mocker.patch.object(Script, "prepare_for_upload", prepare_for_upload)
+    uploader = Uploader(path, destination_zip_dir=tmpdir, delta=True)
+    assert uploader.upload() == SUCCESS_RETURN_CODE
+
+    assert [
+        item.object_id for item in uploader._successfully_uploaded_content_items
+    ] == ["DummyScript"]
+    assert len(uploader.delta.skipped) == uploaded_count - 1
+
+    server_content["upload_test"]["version"] = 2
+    uploader = Uploader(path, destination_zip_dir=tmpdir, delta=True)
+    assert uploader.upload() == SUCCESS_RETURN_CODE
+
+    assert [
+        item.object_id for item in uploader._successfully_uploaded_content_items
+    ] == ["upload_test"]
+    assert len(uploader.delta.skipped) == uploaded_count - 1
+
+
 def test_upload_packs_from_configfile(demisto_client_configure, mocker):
     """
     Given
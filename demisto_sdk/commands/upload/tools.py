@@ -2,7 +2,8 @@ import contextlib
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from demisto_client.demisto_api.rest import ApiException
+from demisto_client.demisto_api.api_client import ApiClient
+from demisto_client.demisto_api.rest import ApiException, RESTClientObject
 
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
@@ -75,3 +76,18 @@ def parse_error_response(error: ApiException) -> str:
             return message
         return reason
     return str(error)
+
+
+def ensure_connection_pool_size(client: Any, size: int) -> None:
+    """
+    Makes sure the connection pool of a demisto_client holds at least `size` connections,
+    so that `size` concurrent requests reuse their connections rather than opening new ones.
+    """
+    api_client = getattr(client, "api_client", None)
+    if not isinstance(api_client, ApiClient):
+        return
+    configuration = api_client.configuration
+    if (configuration.connection_pool_maxsize or 0) >= size:
+        return
+    configuration.connection_pool_maxsize = size
+    api_client.rest_client = RESTClientObject(configuration)
@@ -0,0 +1,224 @@
+import tarfile
+from collections import defaultdict
+from hashlib import sha1
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+from typing import IO, Any, Dict, List, Optional, Union, cast
+
+from demisto_sdk.commands.common.constants import CACHE_DIR, MarketplaceVersions
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import (
+    get_file_details,
+    get_id,
+    safe_read_unicode,
+    sha1_dir,
+)
+from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
+from demisto_sdk.commands.content_graph.objects.pack import Pack
+
+UPLOAD_DELTA_DIR = CACHE_DIR / "upload_delta"
+
+
+class UploadDelta:
+    """Tracks which content was already uploaded to a server, so that unchanged content is not uploaded again.
+
+    The server does not expose hashes of its content, so the fingerprints of the content last uploaded
+    to every server (and marketplace) are kept on disk, and compared against the fingerprints of the local content.
+    Content which changed on the server since it was uploaded is uploaded again:
+    - A content item is only considered unchanged when its copy in the custom content bundle of the server
+      (fetched once for all the items) is the same as right after it was uploaded.
+    - A pack is only considered unchanged when the server reports the same version of it as installed.
+
+    Attributes:
+        skipped (list): The content items and packs which were not uploaded, as they are unchanged.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        marketplace: MarketplaceVersions,
+        delta_dir: Optional[Path] = None,
+    ) -> None:
+        self.client = client
+        self.marketplace = marketplace
+        host = getattr(
+            getattr(getattr(client, "api_client", None), "configuration", None),
+            "host",
+            "",
+        )
+        self.path = (
+            delta_dir or UPLOAD_DELTA_DIR
+        ) / f"{sha1(f'{host}|{marketplace}'.encode()).hexdigest()}.json"
+        self.skipped: List[Union[ContentItem, Pack]] = []
+        # {key: {"local": local fingerprint, "server": server fingerprint right after the upload}}
+        self._fingerprints: Dict[str, Dict[str, Optional[str]]] = self._load()
+        self._local_fingerprints: Dict[str, Optional[str]] = {}
+        self._installed_packs: Optional[Dict[str, str]] = None
+        self._server_fingerprints: Optional[Dict[str, str]] = None
+        self._server_fingerprints_fetched = False
+        self._uploaded_items: Dict[str, str] = {}  # key: object ID
+        self._lock = Lock()
+        self._server_lock = Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Optional[str]]]:
+        if not self.path.exists():
+            return {}
+        try:
+            fingerprints = json.loads(self.path.read_text())
+        except Exception as e:
+            logger.debug(f"Could not load the upload delta {self.path}: {e}")
+            return {}
+        # fingerprints saved by older versions have no server fingerprint, so their content is uploaded again
+        return {
+            key: value for key, value in fingerprints.items() if isinstance(value, dict)
+        }
+
+    def save(self) -> None:
+        """Records the server copies of the uploaded content items, and writes the fingerprints to disk."""
+        if self._uploaded_items:
+            # the server copies changed by the upload, so they are fetched again
+            with self._server_lock:
+                self._server_fingerprints_fetched = False
+            server_fingerprints = self.server_fingerprints or {}
+            for key, object_id in self._uploaded_items.items():
+                self._fingerprints[key]["server"] = server_fingerprints.get(object_id)
+            self._uploaded_items = {}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._fingerprints))
+        except Exception as e:
+            logger.debug(f"Could not write the upload delta {self.path}: {e}")
+
+    @property
+    def installed_packs(self) -> Dict[str, str]:
+        """The versions of the packs installed on the server, fetched once for all the packs."""
+        if self._installed_packs is None:
+            self._installed_packs = {}
+            try:
+                response = self.client.generic_request(
+                    "/contentpacks/metadata/installed", "GET", response_type="object"
+                )
+                self._installed_packs = {
+                    pack["id"]: pack.get("currentVersion", "")
+                    for pack in (response[0] or ())
+                }
+            except Exception as e:
+                logger.debug(f"Could not get the installed packs: {e}")
+        return self._installed_packs
+
+    @property
+    def server_fingerprints(self) -> Optional[Dict[str, str]]:
+        """
+        The fingerprints of the custom content items on the server by their IDs,
+        fetched once for all the items, or None if they could not be fetched.
+        """
+        with self._server_lock:
+            if not self._server_fingerprints_fetched:
+                self._server_fingerprints = self._fetch_server_fingerprints()
+                self._server_fingerprints_fetched = True
+            return self._server_fingerprints
+
+    def _fetch_server_fingerprints(self) -> Optional[Dict[str, str]]:
+        file_hashes: Dict[str, List[str]] = defaultdict(list)
+        try:
+            response = self.client.generic_request(
+                "/content/bundle", "GET", _preload_content=False
+            )[0]
+            # A response whose body was already loaded is closed, and can't be read as a stream
+            bundle = cast(
+                IO[bytes], BytesIO(response.data) if response.closed else response
+            )
+            with tarfile.open(fileobj=bundle, mode="r|*") as tar:
+                for file in tar:
+                    if not (extracted_file := tar.extractfile(file)):
+                        continue
+                    data = extracted_file.read()
+                    file_content = get_file_details(
+                        safe_read_unicode(data), full_file_path=file.name
+                    )
+                    if file_content and (object_id := get_id(file_content)):
+                        file_hashes[object_id].append(sha1(data).hexdigest())
+        except Exception as e:
+            logger.warning(
+                "Could not fetch the custom content of the server to detect content changed on it, "
+                f"so all the content items will be uploaded. Error: {e}"
+            )
+            return None
+        # items of different types may share an ID, and are compared together
+        return {
+            object_id: sha1("|".join(sorted(hashes)).encode()).hexdigest()
+            for object_id, hashes in file_hashes.items()
+        }
+
+    @staticmethod
+    def _key(content: Union[ContentItem, Pack]) -> str:
+        return f"{content.content_type}:{content.object_id}"
+
+    def fingerprint(self, content: Union[ContentItem, Pack], **kwargs) -> Optional[str]:
+        """
+        Returns the fingerprint of the content as uploaded to the marketplace, or None if it could not be computed.
+        A content item is fingerprinted after it is unified, and a pack by all of its files.
+        """
+        key = self._key(content)
+        if key not in self._local_fingerprints:
+            self._local_fingerprints[key] = self._fingerprint(content, **kwargs)
+        return self._local_fingerprints[key]
+
+    def _fingerprint(
+        self, content: Union[ContentItem, Pack], **kwargs
+    ) -> Optional[str]:
+        try:
+            if isinstance(content, Pack):
+                return sha1(
+                    f"{sha1_dir(content.path)}|{kwargs.get('tpb', False)}".encode()
+                ).hexdigest()
+            return sha1(
+                json.dumps(
+                    content.prepare_for_upload(current_marketplace=self.marketplace),
+                    sort_keys=True,
+                ).encode()
+            ).hexdigest()
+        except Exception as e:
+            logger.debug(f"Could not fingerprint {content.path}: {e}")
+            return None
+
+    def is_unchanged(self, content: Union[ContentItem, Pack], **kwargs) -> bool:
+        """
+        Returns whether the content is identical to the one last uploaded to the server.
+        Unchanged content is collected into `skipped`.
+        """
+        if (
+            isinstance(content, Pack)
+            and self.installed_packs.get(content.object_id) != content.current_version
+        ):
+            return False
+        fingerprint = self.fingerprint(content, **kwargs)
+        uploaded = self._fingerprints.get(self._key(content), {})
+        if fingerprint is None or uploaded.get("local") != fingerprint:
+            return False
+        if isinstance(content, ContentItem) and (
+            uploaded.get("server") is None
+            or (self.server_fingerprints or {}).get(content.object_id)
+            != uploaded["server"]
+        ):
+            logger.debug(
+                f"{content.content_type} {content.object_id} changed on the server since it was uploaded"
+            )
+            return False
+        with self._lock:
+            self.skipped.append(content)
+        logger.debug(
+            f"Skipping upload of unchanged {content.content_type} {content.object_id}"
+        )
+        return True
+
+    def mark_uploaded(self, content: Union[ContentItem, Pack], **kwargs) -> None:
+        """Records the fingerprint of the uploaded content. The server copy of a content item is recorded on save."""
+        if fingerprint := self.fingerprint(content, **kwargs):
+            key = self._key(content)
+            with self._lock:
+                self._fingerprints[key] = {"local": fingerprint, "server": None}
+                if isinstance(content, ContentItem):
+                    self._uploaded_items[key] = content.object_id
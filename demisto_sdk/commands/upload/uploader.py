@@ -41,12 +41,19 @@ from demisto_sdk.commands.content_graph.objects.exceptions import (
     FailedUploadMultipleException,
 )
 from demisto_sdk.commands.content_graph.objects.pack import Pack, upload_zip
-from demisto_sdk.commands.upload.constants import CONTENT_TYPES_EXCLUDED_FROM_UPLOAD
+from demisto_sdk.commands.upload.constants import (
+    CONTENT_TYPES_EXCLUDED_FROM_UPLOAD,
+    DEFAULT_UPLOAD_MAX_WORKERS,
+)
 from demisto_sdk.commands.upload.exceptions import (
     IncompatibleUploadVersionException,
     NotUploadableException,
 )
-from demisto_sdk.commands.upload.tools import parse_error_response
+from demisto_sdk.commands.upload.tools import (
+    ensure_connection_pool_size,
+    parse_error_response,
+)
+from demisto_sdk.commands.upload.upload_delta import UploadDelta
 
 SUCCESS_RETURN_CODE = 0
 ERROR_RETURN_CODE = 1
@@ -73,6 +80,8 @@ class Uploader:
         zip: bool = False,
         tpb: bool = False,
         destination_zip_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        delta: bool = False,
         **kwargs,
     ):
         self.path = None if input is None else Path(input)
@@ -80,6 +89,8 @@ class Uploader:
             (not insecure) if insecure else None
         )  # set to None so demisto_client will use env var DEMISTO_VERIFY_SSL
         self.client = demisto_client.configure(verify_ssl=verify)
+        self.max_workers = max_workers or DEFAULT_UPLOAD_MAX_WORKERS
+        ensure_connection_pool_size(self.client, self.max_workers)
 
         self._successfully_uploaded_content_items: List[Union[ContentItem, Pack]] = []
         self._successfully_uploaded_zipped_packs: List[str] = []
@@ -102,6 +113,9 @@ class Uploader:
         self.zip = zip  # -z flag
         self.tpb = tpb  # -tpb flag
         self.destination_zip_dir = destination_zip_dir
+        self.delta = (
+            UploadDelta(self.client, self.marketplace) if delta else None
+        )  # --delta flag
 
     def _upload_zipped(self, path: Path) -> bool:
         """
@@ -227,6 +241,9 @@ class Uploader:
                 success = self._upload_single(self.path)
         except KeyboardInterrupt:
             return ABORTED_RETURN_CODE
+        finally:
+            if self.delta:
+                self.delta.save()
 
         if self.failed_parsing and not any(
             (
@@ -235,6 +252,7 @@ class Uploader:
                 self._failed_upload_content_items,
                 self._failed_upload_version_mismatch,
                 self._failed_upload_zips,
+                self.delta and self.delta.skipped,
             )
         ):
             # Nothing was uploaded, nor collected as error
@@ -281,6 +299,12 @@ class Uploader:
         ):
             self._skipped_upload_marketplace_mismatch.append(content_item)
             return True
+        # packs uploaded item by item are compared item by item
+        delta = (
+            self.delta if isinstance(content_item, ContentItem) or self.zip else None
+        )
+        if delta and delta.is_unchanged(content_item, tpb=self.tpb):
+            return True
         try:
             content_item.upload(
                 client=self.client,
@@ -289,12 +313,21 @@ class Uploader:
                 zip=self.zip,  # only used for Packs
                 tpb=self.tpb,  # only used for Packs
                 destination_zip_dir=self.destination_zip_dir,  # only used for Packs
+                max_workers=self.max_workers,  # only used for Packs
+                delta=self.delta,  # only used for Packs
             )
+            if delta:
+                delta.mark_uploaded(content_item, tpb=self.tpb)
 
             # upon reaching this line, the upload is surely successful
             uploaded_successfully = parse_uploaded_successfully(
                 content_item=content_item, zip=self.zip, tpb=self.tpb
             )
+            if self.delta:
+                skipped = {id(item) for item in self.delta.skipped}
+                uploaded_successfully = [
+                    item for item in uploaded_successfully if id(item) not in skipped
+                ]
             self._successfully_uploaded_content_items.extend(uploaded_successfully)
             for item_uploaded_successfully in uploaded_successfully:
                 logger.debug(
@@ -457,6 +490,16 @@ class Uploader:
                 f"<yellow>SKIPPED UPLOADED DUE TO MARKETPLACE MISMATCH:\n{marketplace_mismatch_str}\n</yellow>"
             )
 
+        if self.delta and self.delta.skipped:
+            unchanged_str = tabulate(
+                ((item.path.name, item.content_type) for item in self.delta.skipped),
+                headers=["NAME", "TYPE"],
+                tablefmt="fancy_grid",
+            )
+            logger.info(
+                f"<yellow>SKIPPED UPLOAD OF UNCHANGED CONTENT:\n{unchanged_str}\n</yellow>"
+            )
+
         if self._failed_upload_version_mismatch:
             version_mismatch_str = tabulate(
                 (
@@ -0,0 +1,146 @@
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from demisto_sdk.commands.common.constants import ExecutionMode
+from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
+from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
+from demisto_sdk.commands.validate.validators.base_validator import (
+    BaseValidator,
+    is_error_ignored,
+    should_run_according_to_status,
+    should_run_on_deprecated,
+    should_run_on_execution_mode,
+)
+
+
+class ValidatorsDispatchIndex:
+    """Routes the content objects to the validators which should run on them.
+
+    Instead of calling should_run for every validator on every content object, the index is built once:
+    - The validators which run on every content type (and on the running execution mode) are computed once per type.
+    - The support level ignored errors are computed once per support level.
+    - The ignored errors of every content object are read once from its pack ignore file.
+    Validators which override should_run are still routed through their should_run.
+    """
+
+    def __init__(
+        self,
+        validators: List[BaseValidator],
+        ignorable_errors: List[str],
+        support_level_dict: dict,
+        execution_mode: Optional[ExecutionMode],
+    ):
+        self.validators = validators
+        self.ignorable_errors = ignorable_errors
+        self.ignorable_errors_set = frozenset(ignorable_errors)
+        self.support_level_dict = support_level_dict
+        self.support_level_ignored_errors: Dict[str, FrozenSet[str]] = {
+            support_level: frozenset(support_level_config.get("ignore", []))
+            for support_level, support_level_config in support_level_dict.items()
+        }
+        self.execution_mode = execution_mode
+        self._validators_by_content_type: Dict[type, List[BaseValidator]] = {}
+        self._ignored_errors_by_content_object: Dict[int, FrozenSet[str]] = {}
+
+    def get_validators(self, content_type: type) -> List[BaseValidator]:
+        """Return the validators that run on the given content type in the running execution mode.
+
+        Args:
+            content_type (type): The content object class.
+
+        Returns:
+            List[BaseValidator]: The validators, in their original order.
+        """
+        if content_type not in self._validators_by_content_type:
+            self._validators_by_content_type[content_type] = [
+                validator
+                for validator in self.validators
+                if issubclass(content_type, validator.get_content_types())
+                and should_run_on_execution_mode(
+                    validator.expected_execution_mode, self.execution_mode
+                )
+            ]
+        return self._validators_by_content_type[content_type]
+
+    def get_ignored_errors(self, content_object: BaseContent) -> FrozenSet[str]:
+        key = id(content_object)
+        if key not in self._ignored_errors_by_content_object:
+            self._ignored_errors_by_content_object[key] = frozenset(
+                content_object.ignored_errors  # type: ignore[attr-defined]
+            )
+        return self._ignored_errors_by_content_object[key]
+
+    def is_error_ignored(
+        self, validator: BaseValidator, content_object: BaseContent
+    ) -> bool:
+        if validator.error_code not in self.ignorable_errors_set:
+            return False
+        if validator.related_file_type:
+            return is_error_ignored(
+                validator.error_code,
+                self.ignorable_errors,
+                content_object,
+                validator.related_file_type,
+            )
+        return validator.error_code in self.get_ignored_errors(content_object)
+
+    def should_run(self, validator: BaseValidator, content_object: BaseContent) -> bool:
+        """Check whether to run the validator on a content object already routed to it by its content type.
+        Equivalent to BaseValidator.should_run, using the precomputed ignored errors.
+
+        Args:
+            validator (BaseValidator): The validator.
+            content_object (BaseContent): The content object.
+
+        Returns:
+            bool: True if the validation should run. Otherwise, return False.
+        """
+        if type(validator).should_run is not BaseValidator.should_run:
+            return validator.should_run(
+                content_item=content_object,
+                ignorable_errors=self.ignorable_errors,
+                support_level_dict=self.support_level_dict,
+                running_execution_mode=self.execution_mode,
+            )
+        return (
+            should_run_on_deprecated(validator.run_on_deprecated, content_object)
+            and should_run_according_to_status(
+                content_object.git_status, validator.expected_git_statuses
+            )
+            and not self.is_error_ignored(validator, content_object)
+            and not (
+                isinstance(content_object, ContentItem)
+                and validator.error_code
+                in self.support_level_ignored_errors.get(
+                    content_object.support, frozenset()
+                )
+            )
+        )
+
+    def iter_validators_to_run(
+        self, content_objects: Iterable[BaseContent]
+    ) -> Iterator[Tuple[BaseValidator, List[BaseContent]]]:
+        """
+        Yield the validators along with the content objects each of them should run on,
+        skipping validators with no content objects to run on.
+        The content objects are routed to the validators by their type once, while the rest of the conditions
+        are checked lazily, right before every validator runs, as fixing a previous validation may affect them.
+
+        Args:
+            content_objects (Iterable[BaseContent]): The content objects to run on.
+
+        Returns:
+            Iterator[Tuple[BaseValidator, List[BaseContent]]]: The validators and their content objects.
+        """
+        content_objects_by_validator: Dict[int, List[BaseContent]] = {
+            id(validator): [] for validator in self.validators
+        }
+        for content_object in content_objects:
+            for validator in self.get_validators(type(content_object)):
+                content_objects_by_validator[id(validator)].append(content_object)
+        for validator in self.validators:
+            if filtered_content_objects_for_validator := [
+                content_object
+                for content_object in content_objects_by_validator[id(validator)]
+                if self.should_run(validator, content_object)
+            ]:
+                yield validator, filtered_content_objects_for_validator
@@ -27,6 +27,10 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.common.content import Content
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parse_pool import (
+    is_parse_pool_session_open,
+    parse_pool,
+)
 from demisto_sdk.commands.common.tools import (
     detect_file_level,
     find_type_by_path,
@@ -45,6 +49,21 @@ from demisto_sdk.commands.content_graph.parsers.content_item import (
     NotAContentItemException,
 )
 
+# parsing fewer paths in the parse pool costs more than it saves
+MIN_PATHS_TO_PARSE_IN_POOL = 20
+
+
+def _parse_path(path: Path) -> Tuple[Path, Optional[BaseContent], Optional[type]]:
+    """Parses a content item, returning the type of the exception raised instead of raising it."""
+    try:
+        return (
+            path,
+            BaseContent.from_path(path, git_sha=None, raise_on_exception=True),
+            None,
+        )
+    except (NotAContentItemException, InvalidContentItemException) as e:
+        return path, None, type(e)
+
 
 class Initializer:
     """
@@ -472,20 +491,19 @@ class Initializer:
         related_files_main_items: Set[Path] = self.collect_related_files_main_items(
             files_set
         )
-        for file_path in related_files_main_items:
-            path: Path = Path(file_path)
-            try:
-                temp_obj = BaseContent.from_path(
-                    path, git_sha=None, raise_on_exception=True
-                )
-                if temp_obj is None:
-                    invalid_content_items.add(path)
-                else:
-                    basecontent_with_path_set.add(temp_obj)
-            except NotAContentItemException:
-                non_content_items.add(file_path)  # type: ignore[arg-type]
-            except InvalidContentItemException:
-                invalid_content_items.add(file_path)  # type: ignore[arg-type]
+        paths = [Path(file_path) for file_path in related_files_main_items]
+        if is_parse_pool_session_open() and len(paths) >= MIN_PATHS_TO_PARSE_IN_POOL:
+            with parse_pool() as pool:
+                results = pool.map(_parse_path, paths)
+        else:
+            results = [_parse_path(path) for path in paths]
+        for path, temp_obj, exception_type in results:
+            if exception_type and issubclass(exception_type, NotAContentItemException):
+                non_content_items.add(path)
+            elif exception_type or temp_obj is None:
+                invalid_content_items.add(path)
+            else:
+                basecontent_with_path_set.add(temp_obj)
         return basecontent_with_path_set, invalid_content_items, non_content_items
 
     def git_paths_to_basecontent_set(
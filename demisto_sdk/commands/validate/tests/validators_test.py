@@ -20,12 +20,14 @@ from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.content_graph.common import ContentType
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.content_graph.objects.integration import Integration
+from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.objects.script import Script
 from demisto_sdk.commands.content_graph.tests.test_tools import load_yaml
 from demisto_sdk.commands.validate.config_reader import (
     ConfigReader,
     ConfiguredValidations,
 )
+from demisto_sdk.commands.validate.dispatch_index import ValidatorsDispatchIndex
 from demisto_sdk.commands.validate.initializer import Initializer
 from demisto_sdk.commands.validate.tests.test_tools import (
     create_integration_object,
@@ -56,6 +58,9 @@ from demisto_sdk.commands.validate.validators.DO_validators.DO106_docker_image_i
 from demisto_sdk.commands.validate.validators.GR_validators.GR100_uses_items_not_in_market_place_all_files import (
     MarketplacesFieldValidatorAllFiles,
 )
+from demisto_sdk.commands.validate.validators.GR_validators.GR100_uses_items_not_in_market_place_list_files import (
+    MarketplacesFieldValidatorListFiles,
+)
 from demisto_sdk.commands.validate.validators.PA_validators.PA108_pack_metadata_name_not_valid import (
     PackMetadataNameValidator,
 )
@@ -934,3 +939,103 @@ def test_check_metadata_version_bump_on_content_changes(mocker, repo):
 
     # Assert the PA114 validation will run
     assert version_bump_validator
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_run_validations_concurrently(mocker, workers):
+    """
+    Given:
+        A ValidateManager object with three integrations, two of them with an id different from their name,
+        a CPU bound validator and an I/O bound validator.
+    When:
+        Calling run_validations with one worker and with several workers.
+    Then:
+        - Ensure the results of both validators are collected, in the order of the validators.
+    """
+    validate_manager = get_validate_manager(mocker)
+    validate_manager.workers = workers
+    validate_manager.configured_validations = ConfiguredValidations(
+        select=["BA101", "GR100"],
+        warning=[],
+        ignorable_errors=[],
+        support_level_dict={},
+    )
+    validate_manager.initializer.execution_mode = ExecutionMode.USE_GIT
+    io_bound_validator = MarketplacesFieldValidatorListFiles()
+    validate_manager.validators = [IDNameAllStatusesValidator(), io_bound_validator]
+    integrations = [
+        create_integration_object(paths=["name"], values=[name])
+        for name in ("name_0", "TestIntegration", "name_2")
+    ]
+    mocker.patch.object(
+        MarketplacesFieldValidatorListFiles,
+        "obtain_invalid_content_items",
+        return_value=[
+            ValidationResult(
+                validator=io_bound_validator,
+                message="error",
+                content_object=integrations[1],
+            )
+        ],
+    )
+    validate_manager.objects_to_run = integrations
+    mocker.patch.object(ResultWriter, "post_results", return_value=1)
+
+    assert validate_manager.run_validations() == 1
+    assert [
+        (result.validator.error_code, result.content_object.name)
+        for result in validate_manager.validation_results.validation_results
+    ] == [
+        ("BA101", "name_0"),
+        ("BA101", "name_2"),
+        ("GR100", "TestIntegration"),
+    ]
+
+
+def test_dispatch_index_equivalent_to_should_run(mocker):
+    """
+    Given:
+        All the validators, an integration, a script and a pack, with ignored errors and support level configuration.
+    When:
+        Routing the content objects to the validators using the ValidatorsDispatchIndex.
+    Then:
+        - Ensure every validator gets exactly the content objects its should_run approves, in their original order.
+    """
+    mocker.patch.object(Integration, "ignored_errors", ["BA101", "DO106"])
+    mocker.patch.object(Script, "ignored_errors", [])
+    mocker.patch.object(Pack, "ignored_errors", ["BA101"])
+    content_objects = [
+        create_integration_object(),
+        create_script_object(),
+        create_pack_object(),
+    ]
+    validators = get_all_validators()
+    ignorable_errors = ["BA101", "DO106", "IN122"]
+    support_level_dict = {"community": {"ignore": ["BA102", "SC105"]}}
+    content_objects[0].support = "community"
+    dispatch_index = ValidatorsDispatchIndex(
+        validators=validators,
+        ignorable_errors=ignorable_errors,
+        support_level_dict=support_level_dict,
+        execution_mode=ExecutionMode.USE_GIT,
+    )
+
+    expected_results = [
+        (validator, filtered_content_objects)
+        for validator in validators
+        if (
+            filtered_content_objects := [
+                content_object
+                for content_object in content_objects
+                if validator.should_run(
+                    content_item=content_object,
+                    ignorable_errors=ignorable_errors,
+                    support_level_dict=support_level_dict,
+                    running_execution_mode=ExecutionMode.USE_GIT,
+                )
+            ]
+        )
+    ]
+    assert list(dispatch_index.iter_validators_to_run(content_objects)) == (
+        expected_results
+    )
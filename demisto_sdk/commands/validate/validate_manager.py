@@ -1,5 +1,7 @@
+import multiprocessing
+from multiprocessing.pool import AsyncResult, ThreadPool
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from demisto_sdk.commands.common.constants import ExecutionMode
 from demisto_sdk.commands.common.logger import logger
@@ -8,6 +10,7 @@ from demisto_sdk.commands.validate.config_reader import (
     ConfigReader,
     ConfiguredValidations,
 )
+from demisto_sdk.commands.validate.dispatch_index import ValidatorsDispatchIndex
 from demisto_sdk.commands.validate.initializer import Initializer
 from demisto_sdk.commands.validate.validation_results import (
     ResultWriter,
@@ -20,6 +23,45 @@ from demisto_sdk.commands.validate.validators.base_validator import (
     get_all_validators,
 )
 
+# The state of the concurrent run, set before forking the worker processes so they inherit it instead of
+# having the validators and the content items pickled to them.
+_FORKED_CONTENT_OBJECTS: List[BaseContent] = []
+_FORKED_TASKS: List[Tuple[BaseValidator, List[int]]] = []
+
+
+def _obtain_invalid_content_items_in_process(
+    task_index: int,
+) -> List[Tuple[Optional[int], str, Optional[BaseContent]]]:
+    """Runs a single validator in a forked worker process.
+
+    Args:
+        task_index (int): The index of the validator task in _FORKED_TASKS.
+
+    Returns:
+        List[Tuple[Optional[int], str, Optional[BaseContent]]]: The (content object index, message, content object)
+            of every validation result. The content object is returned only if it isn't one of the forked
+            content objects, so the results are cheap to send back to the main process.
+    """
+    validator, content_object_indices = _FORKED_TASKS[task_index]
+    indices_by_id = {
+        id(content_object): index
+        for index, content_object in enumerate(_FORKED_CONTENT_OBJECTS)
+    }
+    validation_results = validator.obtain_invalid_content_items(
+        [_FORKED_CONTENT_OBJECTS[index] for index in content_object_indices]
+    )
+    results: List[Tuple[Optional[int], str, Optional[BaseContent]]] = []
+    for validation_result in validation_results:
+        index = indices_by_id.get(id(validation_result.content_object))
+        results.append(
+            (
+                index,
+                validation_result.message,
+                None if index is not None else validation_result.content_object,
+            )
+        )
+    return results
+
 
 class ValidateManager:
     def __init__(
@@ -31,8 +73,10 @@ class ValidateManager:
         allow_autofix=False,
         ignore_support_level=False,
         ignore: Optional[List[str]] = None,
+        workers: int = 1,
     ):
         self.ignore_support_level = ignore_support_level
+        self.workers = workers
         self.file_path = file_path
         self.allow_autofix = allow_autofix
         self.validation_results = validation_results
@@ -57,63 +101,39 @@ class ValidateManager:
             Running all the relevant validation on all the filtered files based on the should_run calculations,
             calling the fix method if the validation fail, has an autofix, and the allow_autofix flag is given,
             and calling the post_results at the end.
+            When running with more than one worker (and without autofix), the validators run concurrently
+            and their results are added in the validators order.
         Returns:
             int: the exit code to obtained from the calculations of post_results.
         """
         logger.info("Starting validate items.")
-        for validator in self.validators:
-            logger.debug(f"Starting execution for {validator.error_code} validator.")
-            if filtered_content_objects_for_validator := list(
-                filter(
-                    lambda content_object: validator.should_run(
-                        content_item=content_object,
-                        ignorable_errors=self.configured_validations.ignorable_errors,
-                        support_level_dict=self.configured_validations.support_level_dict,
-                        running_execution_mode=self.initializer.execution_mode,
-                    ),
-                    self.objects_to_run,
-                )
+        if self.workers > 1 and not self.allow_autofix:
+            # Fixes are kept serial, as a fix may change the content items the next validators run on.
+            validators_to_run = list(self.iter_validators_to_run())
+            for (
+                validator,
+                filtered_content_objects_for_validator,
+            ), validation_results in zip(
+                validators_to_run,
+                self.obtain_invalid_content_items_concurrently(validators_to_run),
             ):
-                validation_results: List[ValidationResult] = (
+                self.add_validation_results(
+                    validator,
+                    filtered_content_objects_for_validator,
+                    validation_results,
+                )
+        else:
+            for (
+                validator,
+                filtered_content_objects_for_validator,
+            ) in self.iter_validators_to_run():
+                self.add_validation_results(
+                    validator,
+                    filtered_content_objects_for_validator,
                     validator.obtain_invalid_content_items(
                         filtered_content_objects_for_validator
-                    )
-                )  # type: ignore
-                if (
-                    validator.expected_execution_mode == [ExecutionMode.ALL_FILES]
-                    and self.initializer.execution_mode == ExecutionMode.ALL_FILES
-                ):
-                    validation_results = [
-                        validation_result
-                        for validation_result in validation_results
-                        if validation_result.content_object
-                        in filtered_content_objects_for_validator
-                    ]
-                try:
-                    if self.allow_autofix and validator.is_auto_fixable:
-                        for validation_result in validation_results:
-                            try:
-                                self.validation_results.append_fix_results(
-                                    validator.fix(validation_result.content_object)  # type: ignore
-                                )
-                            except Exception:
-                                logger.error(
-                                    f"Could not fix {validation_result.validator.error_code} error for content item {str(validation_result.content_object.path)}"
-                                )
-                                self.validation_results.append_validation_results(
-                                    validation_result
-                                )
-                    else:
-                        self.validation_results.extend_validation_results(
-                            validation_results
-                        )
-                except Exception as e:
-                    validation_caught_exception_result = ValidationCaughtExceptionResult(
-                        message=f"Encountered an error when validating {validator.error_code} validator: {e}"
-                    )
-                    self.validation_results.append_validation_caught_exception_results(
-                        validation_caught_exception_result
-                    )
+                    ),  # type: ignore
+                )
         if BaseValidator.graph_interface:
             logger.info("Closing graph.")
             BaseValidator.graph_interface.close()
@@ -122,6 +142,174 @@ class ValidateManager:
             only_throw_warning=self.configured_validations.warning
         )
 
+    def iter_validators_to_run(
+        self,
+    ) -> Iterator[Tuple[BaseValidator, List[BaseContent]]]:
+        """
+        Yield the validators along with the content objects each of them should run on,
+        skipping validators with no content objects to run on.
+        The content objects are routed to the validators using a dispatch index built once per run.
+
+        Returns:
+            Iterator[Tuple[BaseValidator, List[BaseContent]]]: The validators and their filtered content objects.
+        """
+        dispatch_index = ValidatorsDispatchIndex(
+            validators=self.validators,
+            ignorable_errors=self.configured_validations.ignorable_errors,
+            support_level_dict=self.configured_validations.support_level_dict,
+            execution_mode=self.initializer.execution_mode,
+        )
+        for (
+            validator,
+            filtered_content_objects_for_validator,
+        ) in dispatch_index.iter_validators_to_run(self.objects_to_run):
+            logger.debug(f"Starting execution for {validator.error_code} validator.")
+            yield validator, filtered_content_objects_for_validator
+
+    def obtain_invalid_content_items_concurrently(
+        self, validators_to_run: List[Tuple[BaseValidator, List[BaseContent]]]
+    ) -> List[List[ValidationResult]]:
+        """
+        Run the given validators concurrently.
+        I/O bound validators (graph, docker hub) run in a thread pool, the rest run in a pool of forked processes.
+        The results are returned in the order of the given validators, regardless of the order they finished in.
+
+        Args:
+            validators_to_run (List[Tuple[BaseValidator, List[BaseContent]]]): The validators and their content objects.
+
+        Returns:
+            List[List[ValidationResult]]: The validation results of every validator.
+        """
+        global _FORKED_CONTENT_OBJECTS, _FORKED_TASKS
+
+        can_fork = "fork" in multiprocessing.get_all_start_methods()
+        content_objects = list(
+            {
+                id(content_object): content_object
+                for _, filtered_content_objects in validators_to_run
+                for content_object in filtered_content_objects
+            }.values()
+        )
+        indices_by_id = {
+            id(content_object): index
+            for index, content_object in enumerate(content_objects)
+        }
+        _FORKED_CONTENT_OBJECTS = content_objects
+        _FORKED_TASKS = [
+            (
+                validator,
+                [
+                    indices_by_id[id(content_object)]
+                    for content_object in filtered_content_objects
+                ],
+            )
+            for validator, filtered_content_objects in validators_to_run
+        ]
+        process_tasks = {
+            task_index
+            for task_index, (validator, _) in enumerate(validators_to_run)
+            if can_fork and not validator.is_io_bound
+        }
+        logger.debug(
+            f"Running {len(process_tasks)} validators in {self.workers} processes and "
+            f"{len(validators_to_run) - len(process_tasks)} validators in {self.workers} threads."
+        )
+        process_pool = (
+            # The process pool must be created before any thread is started, as the workers are forked.
+            multiprocessing.get_context("fork").Pool(processes=self.workers)
+            if process_tasks
+            else None
+        )
+        try:
+            with ThreadPool(processes=self.workers) as thread_pool:
+                async_results: Dict[int, AsyncResult] = {}
+                for task_index, (validator, filtered_content_objects) in enumerate(
+                    validators_to_run
+                ):
+                    if process_pool and task_index in process_tasks:
+                        async_results[task_index] = process_pool.apply_async(
+                            _obtain_invalid_content_items_in_process, (task_index,)
+                        )
+                    else:
+                        async_results[task_index] = thread_pool.apply_async(
+                            validator.obtain_invalid_content_items,
+                            (filtered_content_objects,),
+                        )
+                validators_results: List[List[ValidationResult]] = []
+                for task_index, (validator, _) in enumerate(validators_to_run):
+                    if task_index not in process_tasks:
+                        validators_results.append(async_results[task_index].get())
+                        continue
+                    validators_results.append(
+                        [
+                            ValidationResult(
+                                validator=validator,
+                                message=message,
+                                content_object=content_objects[index]
+                                if index is not None
+                                else content_object,
+                            )
+                            for index, message, content_object in async_results[
+                                task_index
+                            ].get()
+                        ]
+                    )
+                return validators_results
+        finally:
+            if process_pool:
+                process_pool.terminate()
+                process_pool.join()
+            _FORKED_CONTENT_OBJECTS, _FORKED_TASKS = [], []
+
+    def add_validation_results(
+        self,
+        validator: BaseValidator,
+        filtered_content_objects_for_validator: List[BaseContent],
+        validation_results: List[ValidationResult],
+    ):
+        """
+        Add the results of a single validator to the result writer,
+        calling the fix method on the failed content objects if needed.
+
+        Args:
+            validator (BaseValidator): The validator the results were obtained by.
+            filtered_content_objects_for_validator (List[BaseContent]): The content objects the validator ran on.
+            validation_results (List[ValidationResult]): The validation results of the validator.
+        """
+        if (
+            validator.expected_execution_mode == [ExecutionMode.ALL_FILES]
+            and self.initializer.execution_mode == ExecutionMode.ALL_FILES
+        ):
+            validation_results = [
+                validation_result
+                for validation_result in validation_results
+                if validation_result.content_object
+                in filtered_content_objects_for_validator
+            ]
+        try:
+            if self.allow_autofix and validator.is_auto_fixable:
+                for validation_result in validation_results:
+                    try:
+                        self.validation_results.append_fix_results(
+                            validator.fix(validation_result.content_object)  # type: ignore
+                        )
+                    except Exception:
+                        logger.error(
+                            f"Could not fix {validation_result.validator.error_code} error for content item {str(validation_result.content_object.path)}"
+                        )
+                        self.validation_results.append_validation_results(
+                            validation_result
+                        )
+            else:
+                self.validation_results.extend_validation_results(validation_results)
+        except Exception as e:
+            validation_caught_exception_result = ValidationCaughtExceptionResult(
+                message=f"Encountered an error when validating {validator.error_code} validator: {e}"
+            )
+            self.validation_results.append_validation_caught_exception_results(
+                validation_caught_exception_result
+            )
+
     def filter_validators(self) -> List[BaseValidator]:
         """
         Filter the validations by their error code
@@ -11,6 +11,8 @@ from demisto_sdk.commands.validate.validators.base_validator import (
 
 
 class DockerValidator(BaseValidator[ContentTypes], ABC):
+    is_io_bound = True
+
     def should_run(
         self,
         content_item: ContentTypes,
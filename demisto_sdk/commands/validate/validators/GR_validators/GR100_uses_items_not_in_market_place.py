@@ -87,6 +87,7 @@ class MarketplacesFieldValidator(BaseValidator[ContentTypes], ABC):
 
     related_field = "marketplaces"
     is_auto_fixable = False
+    is_io_bound = True
 
     def obtain_invalid_content_items_using_graph(
         self, content_items: Iterable[ContentTypes], validate_all_files=False
@@ -84,6 +84,7 @@ class IsUsingUnknownContentValidator(BaseValidator[ContentTypes], ABC):
     rationale = "Content items should only use existing content items."
     error_message = "Content item '{0}' is using content items: {1} which cannot be found in the repository."
     is_auto_fixable = False
+    is_io_bound = True
 
     def obtain_invalid_content_items_using_graph(
         self, content_items: Iterable[ContentTypes], validate_all_files: bool = False
@@ -25,6 +25,7 @@ class IsPackDisplayNameAlreadyExistsValidator(BaseValidator[ContentTypes], ABC):
     )
     related_field = ""
     is_auto_fixable = False
+    is_io_bound = True
     related_file_type = [RelatedFileType.JSON]
 
     def obtain_invalid_content_items_using_graph(
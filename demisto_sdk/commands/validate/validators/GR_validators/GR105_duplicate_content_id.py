@@ -85,6 +85,7 @@ class DuplicateContentIdValidator(BaseValidator[ContentTypes], ABC):
     error_message = "Duplicate ID '{}' found in {}"
     related_field = "id"
     is_auto_fixable = False
+    is_io_bound = True
 
     def obtain_invalid_content_items_using_graph(
         self, content_items: Iterable[ContentTypes], validate_all_files: bool
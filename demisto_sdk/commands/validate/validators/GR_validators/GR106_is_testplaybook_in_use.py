@@ -27,6 +27,7 @@ class IsTestPlaybookInUseValidator(BaseValidator[ContentTypes], ABC):
     error_message = "Test playbook '{}' is not linked to any content item. Make sure at least one integration, script or playbook mentions the test-playbook ID under the `tests:` key."
     related_field = "tests"
     is_auto_fixable = False
+    is_io_bound = True
 
     def obtain_invalid_content_items_using_graph(
         self, content_items: Iterable[ContentTypes], validate_all_files: bool
@@ -29,6 +29,7 @@ class DuplicatedScriptNameValidator(BaseValidator[ContentTypes], ABC):
     )
     related_field = "name"
     is_auto_fixable = False
+    is_io_bound = True
 
     def obtain_invalid_content_items_using_graph(
         self, content_items: Iterable[ContentTypes], validate_all_files
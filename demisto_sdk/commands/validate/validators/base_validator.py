@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
 from typing import (
     ClassVar,
     Generic,
@@ -83,6 +85,8 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
     is_auto_fixable: (ClassVar[bool]): Whether the validation has a fix or not.
     graph_interface: (ClassVar[ContentGraphInterface]): The graph interface.
     dockerhub_api_client (ClassVar[DockerHubClient): the docker hub api client.
+    is_io_bound (ClassVar[bool]): Whether the validation waits on the graph or the network rather than the CPU,
+        in which case it runs in a thread rather than in a process when validating with several workers.
     """
 
     error_code: ClassVar[str]
@@ -97,12 +101,11 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
     graph_interface: ClassVar[ContentGraphInterface] = None
     related_file_type: ClassVar[Optional[List[RelatedFileType]]] = None
     expected_execution_mode: ClassVar[Optional[List[ExecutionMode]]] = None
+    is_io_bound: ClassVar[bool] = False
+    _graph_lock: ClassVar[Lock] = Lock()
 
     def get_content_types(self):
-        args = (get_args(self.__orig_bases__[0]) or get_args(self.__orig_bases__[1]))[0]  # type: ignore
-        if isinstance(args, (BaseContent, BaseContentMetaclass)):
-            return args
-        return get_args(args)
+        return get_validator_content_types(type(self))
 
     def should_run(
         self,
@@ -166,13 +169,15 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
 
     @property
     def graph(self) -> ContentGraphInterface:
-        if not self.graph_interface:
-            logger.info("Graph validations were selected, will init graph")
-            BaseValidator.graph_interface = ContentGraphInterface()
-            update_content_graph(
-                BaseValidator.graph_interface,
-                use_git=True,
-            )
+        # graph validations may run concurrently, the graph should be initialized only once
+        with self._graph_lock:
+            if not self.graph_interface:
+                logger.info("Graph validations were selected, will init graph")
+                BaseValidator.graph_interface = ContentGraphInterface()
+                update_content_graph(
+                    BaseValidator.graph_interface,
+                    use_git=True,
+                )
         return self.graph_interface
 
     def __dir__(self):
@@ -191,6 +196,24 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
         return self.error_code[:2]
 
 
+@lru_cache(maxsize=None)
+def get_validator_content_types(validator_class: type):
+    """Return the content types a validator class runs on, as declared in its generic base.
+    Cached, as the reflection is costly and is done for every content item the validator may run on.
+
+    Args:
+        validator_class (type): The validator class.
+
+    Returns:
+        The content type class, or a tuple of the content types classes.
+    """
+    orig_bases = validator_class.__orig_bases__  # type: ignore[attr-defined]
+    args = (get_args(orig_bases[0]) or get_args(orig_bases[1]))[0]
+    if isinstance(args, (BaseContent, BaseContentMetaclass)):
+        return args
+    return get_args(args)
+
+
 def get_all_validators() -> List[BaseValidator]:
     validators = []
     for validator in BaseValidator.__subclasses__():
@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 import requests_mock
 import typer
+from junitparser import JUnitXml
 from typer.testing import CliRunner
 
 from demisto_sdk.commands.common.legacy_git_tools import git_path
@@ -1486,6 +1487,130 @@ class TestTheTestModelingRuleCommandMultipleRules:
         except typer.Exit:
             assert False, "No exception should be raised in this scenario."
 
+    def test_validate_modeling_rules_concurrently(
+        self, repo, monkeypatch, mocker, requests_mocker, tmp_path
+    ):
+        """
+        Given:
+            - Two modeling rules of the same vendor and product, with test data files.
+
+        When:
+            - The command is run with up to two modeling rules to verify concurrently.
+            - Testing both modeling rules is simulated to succeed.
+
+        Then:
+            - Verify the test data of both modeling rules is pushed in a single request.
+            - Verify the JUnit file has a test suite for every modeling rule.
+            - The command returns with a zero exit code.
+        """
+        from demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule import (
+            app as test_modeling_rule_cmd,
+        )
+        from demisto_sdk.commands.test_content.xsiam_tools.test_data import TestData
+
+        runner = CliRunner()
+        mocker.patch(
+            "demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule.sleep",
+            return_value=None,
+        )
+        fake_test_data = TestData.parse_file(TEST_DATA_FILE_PATH.as_posix())
+        event_ids = [
+            str(event_log.test_data_event_id) for event_log in fake_test_data.data
+        ]
+        mocker.patch(
+            "demisto_sdk.commands.test_content.xsiam_tools.test_data.uuid4",
+            side_effect=event_ids * 6,
+        )
+        modeling_rule_directories = []
+        for pack_name, modeling_rule_name in (
+            ("Pack1", DEFAULT_MODELING_RULE_NAME),
+            ("Pack2", DEFAULT_MODELING_RULE_NAME_2),
+        ):
+            pack = repo.create_pack(pack_name)
+            pack.create_modeling_rule(modeling_rule_name, rules=ONE_MODEL_RULE_TEXT)
+            modeling_rule_directory = Path(
+                pack._modeling_rules_path / modeling_rule_name
+            )
+            (
+                modeling_rule_directory / f"{modeling_rule_name}_testdata.json"
+            ).write_text(fake_test_data.json(indent=4))
+            modeling_rule_directories.append(modeling_rule_directory.as_posix())
+
+        id_key = f"{fake_test_data.data[0].dataset}.test_data_event_id"
+        junit_path = tmp_path / "junit.xml"
+        try:
+            with SetFakeXsiamClientEnvironmentVars() as fake_env_vars:
+                # Arrange
+                requests_mocker.get(
+                    f"{fake_env_vars.demisto_base_url}/xsoar/contentpacks/metadata/installed",
+                    json=[{"id": "Pack1"}, {"id": "Pack2"}],
+                )
+                push_mock = requests_mocker.post(
+                    f"{fake_env_vars.demisto_base_url}/logs/v1/xsiam",
+                    json={},
+                    status_code=200,
+                )
+                requests_mocker.post(
+                    f"{fake_env_vars.demisto_base_url}/public_api/v1/xql/start_xql_query/",
+                    json={"reply": "fake-execution-id"},
+                    status_code=200,
+                )
+
+                def get_query_results(data):
+                    return {
+                        "json": {
+                            "reply": {"status": "SUCCESS", "results": {"data": data}}
+                        },
+                        "status_code": 200,
+                    }
+
+                requests_mocker.post(
+                    f"{fake_env_vars.demisto_base_url}/public_api/v1/xql/get_query_results/",
+                    [
+                        # the event ids do not exist on the tenant for both modeling rules
+                        get_query_results([]),
+                        get_query_results([]),
+                        # the dataset exists
+                        get_query_results(["some-results"]),
+                        # the expected values of both modeling rules
+                        get_query_results(
+                            [
+                                {id_key: event_id, **event_log.expected_values}
+                                for event_id, event_log in zip(
+                                    event_ids, fake_test_data.data
+                                )
+                            ]
+                        ),
+                    ],
+                )
+                # Act
+                result = runner.invoke(
+                    test_modeling_rule_cmd,
+                    [
+                        *modeling_rule_directories,
+                        "--non-interactive",
+                        "--sleep_interval",
+                        "0",
+                        "--retry_attempts",
+                        "0",
+                        "--max_concurrent_rules",
+                        "2",
+                        "--junit-path",
+                        junit_path.as_posix(),
+                    ],
+                )
+                # Assert
+                assert result.exit_code == 0
+                assert push_mock.call_count == 1
+                test_suites = list(JUnitXml.fromfile(junit_path.as_posix()))
+                assert len(test_suites) == 2
+                assert not any(
+                    test_suite.errors or test_suite.failures
+                    for test_suite in test_suites
+                )
+        except typer.Exit:
+            assert False, "No exception should be raised in this scenario."
+
 
 class TestTheTestModelingRuleCommandInteractive:
     def test_no_testdata_file_exists(self, repo, monkeypatch, mocker, requests_mocker):